@@ -0,0 +1,5 @@
+"""
+The xmACIS2Py benchmark suites. Run them from the root of the repository, i.e. python -m benchmarks.bench_analysis
+
+(C) Eric J. Drewitz 2025-2026
+"""
@@ -0,0 +1,185 @@
+"""
+This file hosts the benchmark suite of xmacis2py.analysis_tools.analysis.
+
+Every public function of the analysis module is timed on synthetic station data (see xmacis2py.data_access.synthetic) at
+periods of 30 days, 1 year, 30 years and 150 years and for 1, 100 and 1,000 stations. The synthetic data ends on a fixed date,
+so every run benchmarks the same data.
+
+The stations are analyzed one after another, the way a batch of stations is processed. The time for N stations is the total time
+of the first N stations, so the station counts share one pass over the data. The peak memory is the peak of a single call
+(measured on the first station), which does not grow with the number of stations.
+
+The analysis cache is turned off while the suite runs and the sorted columns the order statistics share are cleared before
+every timed call, so every call does the full computation.
+
+Usage
+-----
+
+python -m benchmarks.bench_analysis                                   # The full suite compared against the baseline
+python -m benchmarks.bench_analysis --sizes 30d,1y --stations 1,100   # A quick run
+python -m benchmarks.bench_analysis --functions period_mean,running_sum
+python -m benchmarks.bench_analysis --save-baseline                   # Record a new baseline
+
+The exit status is 1 when a result regressed against the baseline.
+
+(C) Eric J. Drewitz 2025-2026
+"""
+
+import argparse as _argparse
+import sys as _sys
+import warnings as _warnings
+_warnings.filterwarnings('ignore')
+
+import xmacis2py.analysis_tools.analysis as _analysis
+import xmacis2py.analysis_tools.cache as _cache
+import xmacis2py.analysis_tools.order_statistics as _order_statistics
+import benchmarks.harness as _harness
+from xmacis2py.data_access.synthetic import(
+    station_ids as _station_ids,
+    synthetic_station as _synthetic_station
+)
+
+_end_date = '2024-12-31'
+
+_sizes = {
+    '30d':30,
+    '1y':365,
+    '30y':30 * 365,
+    '150y':150 * 365
+}
+
+_station_counts = [1, 100, 1000]
+
+_cases = {
+    'number_of_days_at_value':lambda df: _analysis.number_of_days_at_value(df, 'Maximum Temperature', 70),
+    'number_of_days_above_value':lambda df: _analysis.number_of_days_above_value(df, 'Maximum Temperature', 90),
+    'number_of_days_below_value':lambda df: _analysis.number_of_days_below_value(df, 'Minimum Temperature', 32),
+    'number_of_days_at_or_below_value':lambda df: _analysis.number_of_days_at_or_below_value(df, 'Minimum Temperature', 32),
+    'number_of_days_at_or_above_value':lambda df: _analysis.number_of_days_at_or_above_value(df, 'Precipitation', 'T'),
+    'number_of_missing_days':lambda df: _analysis.number_of_missing_days(df, 'Maximum Temperature'),
+    'period_mean':lambda df: _analysis.period_mean(df, 'Maximum Temperature', round_value=True, to_nearest=1),
+    'period_median':lambda df: _analysis.period_median(df, 'Maximum Temperature'),
+    'period_percentile':lambda df: _analysis.period_percentile(df, 'Maximum Temperature', percentile=0.9),
+    'period_standard_deviation':lambda df: _analysis.period_standard_deviation(df, 'Maximum Temperature'),
+    'period_mode':lambda df: _analysis.period_mode(df, 'Maximum Temperature'),
+    'period_variance':lambda df: _analysis.period_variance(df, 'Maximum Temperature'),
+    'period_skewness':lambda df: _analysis.period_skewness(df, 'Maximum Temperature'),
+    'period_kurtosis':lambda df: _analysis.period_kurtosis(df, 'Maximum Temperature'),
+    'period_maximum':lambda df: _analysis.period_maximum(df, 'Maximum Temperature'),
+    'period_minimum':lambda df: _analysis.period_minimum(df, 'Minimum Temperature'),
+    'period_sum':lambda df: _analysis.period_sum(df, 'Precipitation'),
+    'period_rankings':lambda df: _analysis.period_rankings(df, 'Maximum Temperature', rank_subset='first', first=5),
+    'period_window_rankings':lambda df: _analysis.period_window_rankings(df, 'Precipitation', window=3),
+    'running_sum':lambda df: _analysis.running_sum(df, 'Precipitation'),
+    'running_mean':lambda df: _analysis.running_mean(df, 'Average Temperature'),
+    'detrend_data':lambda df: _analysis.detrend_data(df.copy(), 'Maximum Temperature'),
+    'query':lambda df: _analysis.query(df).param('Maximum Temperature').mean().median().std().param('Precipitation').sum().count_above('T').collect()
+}
+
+def _split(text):
+    return [item.strip() for item in text.split(',') if item.strip() != '']
+
+def run(sizes=list(_sizes),
+        station_counts=_station_counts,
+        functions=list(_cases),
+        repeat=3,
+        memory=True,
+        progress=True):
+
+    """
+    This function runs the analysis benchmarks.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) sizes (String List) - Default=['30d', '1y', '30y', '150y']. The periods of data.
+
+    2) station_counts (Integer List) - Default=[1, 100, 1000]. The numbers of stations.
+
+    3) functions (String List) - Default=All. The analysis functions to benchmark.
+
+    4) repeat (Integer) - Default=3. The number of times each call is timed (the best time is kept).
+
+    5) memory (Boolean) - Default=True. When set to False, the peak memory is not measured.
+
+    6) progress (Boolean) - Default=True. When set to True, the progress is printed to stderr.
+
+    Returns
+    -------
+
+    A dictionary of results keyed by "{function} | {size} | {N} stations".
+    """
+
+    for size in sizes:
+        if size not in _sizes:
+            raise ValueError(f"Unknown size {size}. The sizes are {', '.join(_sizes)}.")
+    for function in functions:
+        if function not in _cases:
+            raise ValueError(f"Unknown function {function}.")
+
+    station_counts = sorted(station_counts)
+    cache_settings = _cache.cache_info()
+    _cache.disable_cache()
+
+    results = {}
+    try:
+        for size in sizes:
+
+            totals = {function:0.0 for function in functions}
+            errors = {function:None for function in functions}
+            peaks = {}
+
+            for i, station in enumerate(_station_ids(station_counts[-1])):
+
+                df = _synthetic_station(station, end_date=_end_date, days=_sizes[size])
+
+                for function in functions:
+                    if errors[function] != None:
+                        continue
+                    result = _harness.measure(lambda: _cases[function](df),
+                                              repeat=repeat,
+                                              memory=memory and i == 0,
+                                              setup=_order_statistics.clear)
+                    if result['error'] != None:
+                        errors[function] = result['error']
+                        continue
+                    totals[function] += result['seconds']
+                    if i == 0:
+                        peaks[function] = result['peak_kib']
+
+                count = i + 1
+                if count in station_counts:
+                    for function in functions:
+                        results[f"{function} | {size} | {count} stations"] = {
+                            'seconds':None if errors[function] != None else totals[function],
+                            'peak_kib':peaks.get(function),
+                            'error':errors[function]
+                        }
+                    if progress == True:
+                        print(f"Finished {size} x {count} stations", file=_sys.stderr)
+    finally:
+        if cache_settings['enabled'] == True:
+            _cache.enable_cache(maxsize=cache_settings['maxsize'])
+
+    return results
+
+def main(argv=None):
+
+    parser = _argparse.ArgumentParser(description='Benchmarks of xmacis2py.analysis_tools.analysis.')
+    parser.add_argument('--sizes', default=','.join(_sizes), help=f"The periods of data (default: {','.join(_sizes)}).")
+    parser.add_argument('--stations', default=','.join([str(n) for n in _station_counts]), help='The numbers of stations (default: 1,100,1000).')
+    parser.add_argument('--functions', default=','.join(_cases), help='The analysis functions to benchmark (default: all).')
+    _harness.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    results = run(sizes=_split(args.sizes),
+                  station_counts=[int(n) for n in _split(args.stations)],
+                  functions=_split(args.functions),
+                  repeat=args.repeat,
+                  memory=args.no_memory == False)
+
+    return _harness.finish('analysis', results, args)
+
+if __name__ == '__main__':
+    _sys.exit(main())
@@ -0,0 +1,344 @@
+"""
+This file hosts the rendering benchmark suite of xmacis2py.graphics.
+
+Every plot function of graphics.temperature and graphics.precipitation is run on synthetic station data
+(see xmacis2py.data_access.synthetic, passed in with the df argument so nothing is downloaded) for plot_type='bar' and 'line',
+with and without detrending and at several period lengths. Each product is timed end to end and by stage:
+
+1) data_prep - From the call to the first figure: the analysis of the data.
+
+2) artists - Building the figures (axes, bars, lines, text boxes), the 'figure' spans.
+
+3) layout - The bbox_inches='tight' layout pass (a draw without rendering and the tight bounding box).
+
+4) render - Rendering the figure with Agg at the tight bounding box.
+
+5) encode - Encoding the rendered image as a PNG.
+
+6) write - Writing the PNG file.
+
+7) other - The rest (closing the figures and the notifications).
+
+The stages are measured from the tracing spans of the product (see xmacis2py.utils.tracing) with Figure.savefig instrumented:
+the instrumented savefig does the same work as savefig(bbox_inches='tight') one step at a time. The end to end time is measured separately with nothing
+instrumented, so the stages add up to about the end to end time but not exactly. The peak memory is measured end to end.
+
+The graphics are written to a temporary folder that is removed afterwards (or to --output-dir).
+
+Usage
+-----
+
+python -m benchmarks.bench_graphics                                   # The full suite compared against the baseline
+python -m benchmarks.bench_graphics --sizes 30d --plot-types bar      # A quick run
+python -m benchmarks.bench_graphics --products plot_precipitation_summary,plot_maximum_temperature_summary
+python -m benchmarks.bench_graphics --save-baseline                   # Record a new baseline
+
+The exit status is 1 when a result regressed against the baseline.
+
+(C) Eric J. Drewitz 2025-2026
+"""
+
+import argparse as _argparse
+import contextlib as _contextlib
+import io as _io
+import shutil as _shutil
+import sys as _sys
+import tempfile as _tempfile
+import time as _time
+import warnings as _warnings
+import matplotlib as _mpl
+_mpl.use('Agg')
+import matplotlib.figure as _figure
+import matplotlib.image as _image
+import matplotlib.pyplot as _plt
+import numpy as _np
+_warnings.filterwarnings('ignore')
+
+import xmacis2py.graphics.temperature as _temperature
+import xmacis2py.graphics.precipitation as _precipitation
+import xmacis2py.utils.file_funcs as _file_funcs
+import xmacis2py.utils.tracing as _tracing
+import benchmarks.harness as _harness
+from xmacis2py.data_access.synthetic import synthetic_station as _synthetic_station
+
+_station = 'SYN00001'
+_end_date = '2024-12-31'
+
+_sizes = {
+    '30d':30,
+    '90d':90,
+    '1y':365,
+    '10y':10 * 365
+}
+
+_products = {
+    'plot_comprehensive_summary':_temperature.plot_comprehensive_summary,
+    'plot_maximum_temperature_summary':_temperature.plot_maximum_temperature_summary,
+    'plot_minimum_temperature_summary':_temperature.plot_minimum_temperature_summary,
+    'plot_average_temperature_summary':_temperature.plot_average_temperature_summary,
+    'plot_average_temperature_departure_summary':_temperature.plot_average_temperature_departure_summary,
+    'plot_heating_degree_day_summary':_temperature.plot_heating_degree_day_summary,
+    'plot_cooling_degree_day_summary':_temperature.plot_cooling_degree_day_summary,
+    'plot_growing_degree_day_summary':_temperature.plot_growing_degree_day_summary,
+    'plot_precipitation_summary':_precipitation.plot_precipitation_summary
+}
+
+# The precipitation summary is always a bar graph and is never detrended.
+_fixed_style = ['plot_precipitation_summary']
+
+_stages = ['data_prep', 'artists', 'layout', 'render', 'encode', 'write', 'other']
+
+_original_savefig = _figure.Figure.savefig
+
+class _Timeline:
+
+    """
+    This class splits each savefig into its layout, render and encode steps.
+    """
+
+    def __init__(self):
+
+        self.stages = {stage:0.0 for stage in _stages}
+
+    def savefig(self, fig, fname, *args, **kwargs):
+
+        start = _time.perf_counter()
+
+        dpi = kwargs.get('dpi', _mpl.rcParams['savefig.dpi'])
+        if dpi == 'figure':
+            dpi = fig.dpi
+
+        fig.draw_without_rendering()
+        bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(_mpl.rcParams['savefig.pad_inches'])
+        layout = _time.perf_counter()
+
+        raw = _io.BytesIO()
+        _original_savefig(fig, raw, format='rgba', dpi=dpi, bbox_inches=bbox)
+        width, height = int(bbox.width * dpi), int(bbox.height * dpi)
+        pixels = _np.frombuffer(raw.getbuffer(), dtype=_np.uint8).reshape(height, width, 4)
+        render = _time.perf_counter()
+
+        _image.imsave(fname, pixels, format='png', origin='upper', dpi=dpi)
+        encode = _time.perf_counter()
+
+        self.stages['layout'] += layout - start
+        self.stages['render'] += render - layout
+        self.stages['encode'] += encode - render
+
+@_contextlib.contextmanager
+def _instrumented(timeline):
+
+    """
+    This function instruments Figure.savefig for one run.
+    """
+
+    def savefig(fig, fname, *args, **kwargs):
+        return timeline.savefig(fig, fname, *args, **kwargs)
+
+    _figure.Figure.savefig = savefig
+    try:
+        yield
+    finally:
+        _figure.Figure.savefig = _original_savefig
+
+def _call(product,
+          df,
+          size,
+          plot_type,
+          detrend):
+
+    """
+    This function runs one product on the synthetic data.
+    """
+
+    kwargs = {
+        'product_type':f"Benchmark {size}",
+        'x_axis_day_interval':max(5, len(df) // 8),
+        'notifications':'off',
+        'df':df
+    }
+    if product not in _fixed_style:
+        kwargs['plot_type'] = plot_type
+        kwargs['detrend_series'] = detrend
+
+    with _contextlib.redirect_stdout(_io.StringIO()):
+        try:
+            _products[product](_station, **kwargs)
+        finally:
+            _plt.close('all')
+
+def _staged(product,
+            df,
+            size,
+            plot_type,
+            detrend):
+
+    """
+    This function runs one product with the stages instrumented.
+
+    Returns
+    -------
+
+    A dictionary of the time in seconds of each stage.
+    """
+
+    timeline = _Timeline()
+    with _tracing.recording() as recorder, _instrumented(timeline):
+        _call(product, df, size, plot_type, detrend)
+
+    stages = timeline.stages
+    spans = recorder.records
+    plot = [record for record in spans if record['kind'] == 'plot'][0]
+    figures = [record for record in spans if record['kind'] == 'figure']
+
+    if len(figures) > 0:
+        stages['data_prep'] = min([record['start'] for record in figures]) - plot['start']
+    else:
+        stages['data_prep'] = plot['duration']
+    stages['artists'] = sum([record['duration'] for record in figures])
+    stages['write'] = sum([record['duration'] for record in spans if record['kind'] == 'write'])
+    saving = sum([record['duration'] for record in spans if record['kind'] == 'savefig'])
+    stages['other'] = max(plot['duration'] - stages['data_prep'] - stages['artists'] - saving - stages['write'], 0)
+
+    return stages
+
+def _variants(products,
+              plot_types,
+              detrend_options):
+
+    """
+    This function lists the (product, plot_type, detrend) combinations to run.
+    """
+
+    variants = []
+    for product in products:
+        if product in _fixed_style:
+            variants.append((product, 'bar', False))
+            continue
+        for plot_type in plot_types:
+            for detrend in detrend_options:
+                variants.append((product, plot_type, detrend))
+
+    return variants
+
+def _split(text):
+    return [item.strip() for item in text.split(',') if item.strip() != '']
+
+def run(sizes=list(_sizes),
+        products=list(_products),
+        plot_types=['bar', 'line'],
+        detrend_options=[False, True],
+        repeat=3,
+        memory=True,
+        output_dir=None,
+        progress=True):
+
+    """
+    This function runs the rendering benchmarks.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) sizes (String List) - Default=['30d', '90d', '1y', '10y']. The periods of data.
+
+    2) products (String List) - Default=All. The plot functions to benchmark.
+
+    3) plot_types (String List) - Default=['bar', 'line']. The plot types.
+
+    4) detrend_options (Boolean List) - Default=[False, True]. Run without and/or with detrending.
+
+    5) repeat (Integer) - Default=3. The number of times each product is timed (the best time of each stage is kept).
+
+    6) memory (Boolean) - Default=True. When set to False, the peak memory is not measured.
+
+    7) output_dir (String) - Default=None. The folder the graphics are written to. When set to None, a temporary folder is used
+        and removed afterwards.
+
+    8) progress (Boolean) - Default=True. When set to True, the progress is printed to stderr.
+
+    Returns
+    -------
+
+    A dictionary of results keyed by "{product} | {plot_type} | {detrending} | {size} | {stage}" where the stages are
+    'total' (end to end) and the stages listed at the top of this file.
+    """
+
+    for size in sizes:
+        if size not in _sizes:
+            raise ValueError(f"Unknown size {size}. The sizes are {', '.join(_sizes)}.")
+    for product in products:
+        if product not in _products:
+            raise ValueError(f"Unknown product {product}.")
+
+    folder = output_dir
+    if folder == None:
+        folder = _tempfile.mkdtemp(prefix='xmacis2py-bench-')
+    saved_folder = _file_funcs.folder_modified
+    _file_funcs.folder_modified = folder.replace("\\", "/")
+
+    results = {}
+    try:
+        for size in sizes:
+
+            df = _synthetic_station(_station, end_date=_end_date, days=_sizes[size])
+
+            for product, plot_type, detrend in _variants(products, plot_types, detrend_options):
+
+                if detrend == True:
+                    name = f"{product} | {plot_type} | detrended | {size}"
+                else:
+                    name = f"{product} | {plot_type} | not detrended | {size}"
+
+                total = _harness.measure(lambda: _call(product, df, size, plot_type, detrend),
+                                         repeat=repeat,
+                                         memory=memory)
+                results[f"{name} | total"] = total
+
+                if total['error'] == None:
+                    best = None
+                    for i in range(max(repeat, 1)):
+                        stages = _staged(product, df, size, plot_type, detrend)
+                        if best == None:
+                            best = stages
+                        else:
+                            best = {stage:min(best[stage], stages[stage]) for stage in _stages}
+                    for stage in _stages:
+                        results[f"{name} | {stage}"] = {
+                            'seconds':best[stage],
+                            'peak_kib':None,
+                            'error':None
+                        }
+
+                if progress == True:
+                    print(f"Finished {name}", file=_sys.stderr)
+    finally:
+        _file_funcs.folder_modified = saved_folder
+        if output_dir == None:
+            _shutil.rmtree(folder, ignore_errors=True)
+
+    return results
+
+def main(argv=None):
+
+    parser = _argparse.ArgumentParser(description='Rendering benchmarks of xmacis2py.graphics.')
+    parser.add_argument('--sizes', default=','.join(_sizes), help=f"The periods of data (default: {','.join(_sizes)}).")
+    parser.add_argument('--products', default=','.join(_products), help='The plot functions to benchmark (default: all).')
+    parser.add_argument('--plot-types', default='bar,line', help='The plot types (default: bar,line).')
+    parser.add_argument('--detrend', default='off,on', help="Run without ('off') and/or with ('on') detrending (default: off,on).")
+    parser.add_argument('--output-dir', default=None, help='Keep the graphics in this folder instead of a temporary folder.')
+    _harness.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    results = run(sizes=_split(args.sizes),
+                  products=_split(args.products),
+                  plot_types=_split(args.plot_types),
+                  detrend_options=[option == 'on' for option in _split(args.detrend)],
+                  repeat=args.repeat,
+                  memory=args.no_memory == False,
+                  output_dir=args.output_dir)
+
+    return _harness.finish('graphics', results, args)
+
+if __name__ == '__main__':
+    _sys.exit(main())
@@ -0,0 +1,437 @@
+"""
+This file hosts the benchmark harness shared by the xmACIS2Py benchmark suites.
+
+The harness only uses the Python standard library so the suites run anywhere xmACIS2Py is installed:
+
+1) Time is measured with time.perf_counter as the best of several repeats with the garbage collector paused (the same approach as timeit).
+
+2) Peak memory is measured with tracemalloc in a separate call, so the tracing overhead never shows up in the times.
+
+3) Results are saved as a JSON baseline and later runs are compared against it. A result is flagged as a regression when it is slower
+   (or uses more memory) than the baseline by more than the tolerance. A case that worked in the baseline and now fails is also a regression.
+
+Results
+-------
+
+A dictionary keyed by the name of each measurement with the values {'seconds':float, 'peak_kib':float, 'error':None or String}.
+
+Baseline Store
+--------------
+
+benchmarks/baselines/{suite}.json
+
+(C) Eric J. Drewitz 2025-2026
+"""
+
+import gc as _gc
+import json as _json
+import os as _os
+import platform as _platform
+import sys as _sys
+import time as _time
+import tracemalloc as _tracemalloc
+import warnings as _warnings
+_warnings.filterwarnings('ignore')
+
+_baseline_folder = f"{_os.path.dirname(_os.path.abspath(__file__))}/baselines"
+
+def time_call(func,
+              repeat=3,
+              setup=None):
+
+    """
+    This function times a call.
+
+    Required Arguments:
+
+    1) func (Callable) - The call to time (takes no arguments).
+
+    Optional Arguments:
+
+    1) repeat (Integer) - Default=3. The number of times the call is timed. The best time is kept.
+
+    2) setup (Callable or None) - Default=None. Called (untimed) before every timed call, i.e. to empty a cache.
+
+    Returns
+    -------
+
+    The best time in seconds.
+    """
+
+    gc_enabled = _gc.isenabled()
+    _gc.disable()
+    try:
+        best = None
+        for i in range(max(repeat, 1)):
+            if setup != None:
+                setup()
+            start = _time.perf_counter()
+            func()
+            elapsed = _time.perf_counter() - start
+            if best == None or elapsed < best:
+                best = elapsed
+    finally:
+        if gc_enabled == True:
+            _gc.enable()
+
+    return best
+
+def peak_memory(func,
+                setup=None):
+
+    """
+    This function measures the peak memory allocated by a call.
+
+    Required Arguments:
+
+    1) func (Callable) - The call to measure (takes no arguments).
+
+    Optional Arguments:
+
+    1) setup (Callable or None) - Default=None. Called (unmeasured) before the call.
+
+    Returns
+    -------
+
+    The peak memory in KiB allocated while the call ran.
+    """
+
+    if setup != None:
+        setup()
+    _gc.collect()
+    already_tracing = _tracemalloc.is_tracing()
+    if already_tracing == False:
+        _tracemalloc.start()
+    _tracemalloc.reset_peak()
+    base = _tracemalloc.get_traced_memory()[0]
+    try:
+        func()
+        peak = _tracemalloc.get_traced_memory()[1]
+    finally:
+        if already_tracing == False:
+            _tracemalloc.stop()
+
+    return max(peak - base, 0) / 1024
+
+def measure(func,
+            repeat=3,
+            memory=True,
+            setup=None):
+
+    """
+    This function measures the time and peak memory of a call.
+
+    Errors are recorded instead of raised so one failing case does not stop a suite.
+
+    Required Arguments:
+
+    1) func (Callable) - The call to measure (takes no arguments).
+
+    Optional Arguments:
+
+    1) repeat (Integer) - Default=3. The number of times the call is timed. The best time is kept.
+
+    2) memory (Boolean) - Default=True. When set to False, the peak memory is not measured (reported as None).
+
+    3) setup (Callable or None) - Default=None. Called (neither timed nor measured) before every call, i.e. to empty a cache.
+
+    Returns
+    -------
+
+    A dictionary with the keys 'seconds', 'peak_kib' and 'error'.
+    """
+
+    try:
+        seconds = time_call(func, repeat=repeat, setup=setup)
+        if memory == True:
+            peak_kib = peak_memory(func, setup=setup)
+        else:
+            peak_kib = None
+    except Exception as e:
+        return {
+            'seconds':None,
+            'peak_kib':None,
+            'error':f"{type(e).__name__}: {e}"
+        }
+
+    return {
+        'seconds':seconds,
+        'peak_kib':peak_kib,
+        'error':None
+    }
+
+def environment():
+
+    """
+    This function describes the machine and the library versions a benchmark ran with.
+
+    Returns
+    -------
+
+    A dictionary of the machine, Python and library versions.
+    """
+
+    versions = {
+        'python':_platform.python_version(),
+        'machine':_platform.machine(),
+        'system':_platform.system(),
+        'processor':_platform.processor(),
+        'cpus':_os.cpu_count()
+    }
+
+    for name in ['xmacis2py', 'numpy', 'pandas', 'scipy', 'matplotlib']:
+        try:
+            from importlib.metadata import version as _version
+            versions[name] = _version(name)
+        except Exception as e:
+            versions[name] = None
+
+    return versions
+
+def baseline_path(suite):
+
+    """
+    This function returns the default baseline file of a suite.
+
+    Required Arguments:
+
+    1) suite (String) - The name of the suite (i.e. 'analysis').
+
+    Returns
+    -------
+
+    The file path: benchmarks/baselines/{suite}.json
+    """
+
+    return f"{_baseline_folder}/{suite}.json"
+
+def save_baseline(results,
+                  fname):
+
+    """
+    This function saves results as a baseline.
+
+    Required Arguments:
+
+    1) results (Dictionary) - The results of a suite.
+
+    2) fname (String) - The baseline file.
+
+    Returns
+    -------
+
+    None
+    """
+
+    folder = _os.path.dirname(_os.path.abspath(fname))
+    try:
+        _os.makedirs(folder)
+    except Exception as e:
+        pass
+
+    with open(f"{fname}.tmp", 'w') as f:
+        _json.dump({'environment':environment(), 'results':results}, f, indent=1, sort_keys=True)
+    _os.replace(f"{fname}.tmp", fname)
+
+def load_baseline(fname):
+
+    """
+    This function loads a baseline.
+
+    Required Arguments:
+
+    1) fname (String) - The baseline file.
+
+    Returns
+    -------
+
+    A dictionary with the keys 'environment' and 'results'.
+    """
+
+    with open(fname, 'r') as f:
+        return _json.load(f)
+
+def compare(results,
+            baseline,
+            time_tolerance=0.25,
+            memory_tolerance=0.25,
+            min_seconds=0.001,
+            min_kib=64):
+
+    """
+    This function compares results against a baseline and lists the regressions.
+
+    Required Arguments:
+
+    1) results (Dictionary) - The results of a suite.
+
+    2) baseline (Dictionary) - The baseline (as returned by load_baseline).
+
+    Optional Arguments:
+
+    1) time_tolerance (Float) - Default=0.25. A result is a time regression when it is more than 25% slower than the baseline.
+
+    2) memory_tolerance (Float) - Default=0.25. A result is a memory regression when its peak memory is more than 25% above the baseline.
+
+    3) min_seconds (Float) - Default=0.001. Time differences smaller than this are timer noise and never flagged.
+
+    4) min_kib (Float) - Default=64. Peak memory differences smaller than this (in KiB) are allocator noise and never flagged.
+
+    Returns
+    -------
+
+    A list of (name, kind, baseline value, new value) tuples where kind is 'time', 'memory' or 'error'.
+    """
+
+    regressions = []
+    for name, result in results.items():
+
+        old = baseline['results'].get(name)
+        if old == None:
+            continue
+
+        if result['error'] != None:
+            if old['error'] == None:
+                regressions.append((name, 'error', None, result['error']))
+            continue
+
+        if old['seconds'] != None and result['seconds'] > old['seconds'] * (1 + time_tolerance) and result['seconds'] - old['seconds'] > min_seconds:
+            regressions.append((name, 'time', old['seconds'], result['seconds']))
+
+        if old['peak_kib'] != None and result['peak_kib'] != None and result['peak_kib'] > old['peak_kib'] * (1 + memory_tolerance) and result['peak_kib'] - old['peak_kib'] > min_kib:
+            regressions.append((name, 'memory', old['peak_kib'], result['peak_kib']))
+
+    return regressions
+
+def _format_seconds(seconds):
+
+    if seconds == None:
+        return '-'
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.3f} s"
+
+def _format_kib(kib):
+
+    if kib == None:
+        return '-'
+    if kib < 1024:
+        return f"{kib:.1f} KiB"
+    return f"{kib / 1024:.1f} MiB"
+
+def report(results,
+           regressions=[],
+           stream=None):
+
+    """
+    This function prints a table of results and the regressions.
+
+    Required Arguments:
+
+    1) results (Dictionary) - The results of a suite.
+
+    Optional Arguments:
+
+    1) regressions (List) - Default=Blank List. The regressions returned by compare.
+
+    2) stream (File) - Default=None. Where the table is printed. When set to None, the table is printed to stdout.
+
+    Returns
+    -------
+
+    None
+    """
+
+    if stream == None:
+        stream = _sys.stdout
+
+    width = max([len(name) for name in results] + [4])
+    print(f"{'Case'.ljust(width)}  {'Time':>12}  {'Peak Memory':>12}", file=stream)
+    for name, result in results.items():
+        if result['error'] != None:
+            print(f"{name.ljust(width)}  ERROR {result['error']}", file=stream)
+        else:
+            print(f"{name.ljust(width)}  {_format_seconds(result['seconds']):>12}  {_format_kib(result['peak_kib']):>12}", file=stream)
+
+    if len(regressions) > 0:
+        print(f"\n{len(regressions)} regressions:", file=stream)
+        for name, kind, old, new in regressions:
+            if kind == 'time':
+                print(f"  {name}: time {_format_seconds(old)} -> {_format_seconds(new)} ({new / old:.2f}x)", file=stream)
+            elif kind == 'memory':
+                print(f"  {name}: peak memory {_format_kib(old)} -> {_format_kib(new)} ({new / old:.2f}x)", file=stream)
+            else:
+                print(f"  {name}: now fails with {new}", file=stream)
+
+def add_arguments(parser):
+
+    """
+    This function adds the command line options every suite shares.
+
+    Required Arguments:
+
+    1) parser (argparse.ArgumentParser) - The parser of the suite.
+
+    Returns
+    -------
+
+    None
+    """
+
+    parser.add_argument('--repeat', type=int, default=3, help='The number of times each call is timed (the best time is kept).')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the peak memory measurements.')
+    parser.add_argument('--baseline', default=None, help='The baseline file (default: benchmarks/baselines/{suite}.json).')
+    parser.add_argument('--save-baseline', action='store_true', help='Save the results as the baseline.')
+    parser.add_argument('--time-tolerance', type=float, default=0.25, help='The allowed slowdown before a result is flagged (0.25 = 25%%).')
+    parser.add_argument('--memory-tolerance', type=float, default=0.25, help='The allowed peak memory growth before a result is flagged.')
+    parser.add_argument('--output', default=None, help='Also save the results to this JSON file.')
+
+def finish(suite,
+           results,
+           args):
+
+    """
+    This function saves, compares and reports the results of a suite run from the command line.
+
+    Required Arguments:
+
+    1) suite (String) - The name of the suite.
+
+    2) results (Dictionary) - The results of the suite.
+
+    3) args (argparse.Namespace) - The parsed command line options.
+
+    Returns
+    -------
+
+    The exit status: 1 if there are regressions and 0 otherwise.
+    """
+
+    fname = args.baseline
+    if fname == None:
+        fname = baseline_path(suite)
+
+    regressions = []
+    if args.save_baseline == False and _os.path.exists(fname):
+        baseline = load_baseline(fname)
+        regressions = compare(results,
+                              baseline,
+                              time_tolerance=args.time_tolerance,
+                              memory_tolerance=args.memory_tolerance)
+        if baseline['environment'] != environment():
+            print(f"Note: the baseline {fname} was recorded on a different machine or with different library versions.", file=_sys.stderr)
+
+    report(results, regressions)
+
+    if args.output != None:
+        save_baseline(results, args.output)
+
+    if args.save_baseline == True:
+        save_baseline(results, fname)
+        print(f"\nSaved the baseline to {fname}")
+
+    if len(regressions) > 0:
+        return 1
+    return 0
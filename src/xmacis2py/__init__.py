@@ -17,8 +17,14 @@ import xmacis2py.graphics.temperature as temperature
 # This is the module to create xmACIS2 precipitation graphics
 import xmacis2py.graphics.precipitation as precipitation
 
+# This is the module to create multi-station xmACIS2 dashboards
+import xmacis2py.graphics.dashboard as dashboard
+
+# This is the module to create multi-page PDF reports of the xmACIS2 graphics
+import xmacis2py.graphics.report as report
+
 # This function wraps the xmACIS2 Data Client from the WxData Library into the xmACIS2Py Library.
-from xmacis2py.data_access.get_data import get_data
+from xmacis2py.data_access.get_data import get_data, get_data_async
 
 """
 Module
@@ -44,7 +50,10 @@ Functions:
 - period_minimum
 - period_sum
 - period_rankings
+- period_window_rankings
 - running_sum
 - running_mean
+- detrend_data
+- query
 """
 import xmacis2py.analysis_tools.analysis as analysis
\ No newline at end of file
@@ -1 +1,5 @@
-import xmacis2py.analysis_tools.analysis as analysis
\ No newline at end of file
+import xmacis2py.analysis_tools.analysis as analysis
+import xmacis2py.analysis_tools.degree_days as degree_days
+import xmacis2py.analysis_tools.cache as cache
+import xmacis2py.analysis_tools.order_statistics as order_statistics
+import xmacis2py.analysis_tools.sketch as sketch
\ No newline at end of file
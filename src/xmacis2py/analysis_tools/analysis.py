@@ -20,8 +20,11 @@ Analysis Tools:
 - period_minimum
 - period_sum
 - period_rankings
+- period_window_rankings
 - running_sum
 - running_mean
+- detrend_data
+- query
 
 (C) Eric J. Drewitz 2025-2026
 """
@@ -30,7 +33,12 @@ import warnings as _warnings
 import numpy as _np
 import pandas as _pd
 import math as _math
+import bisect as _bisect
 from scipy import signal as _signal
+from xmacis2py.analysis_tools.cache import memoize as _memoize
+from xmacis2py.analysis_tools.query import AnalysisQuery as _AnalysisQuery
+from xmacis2py.analysis_tools.order_statistics import sorted_column as _sorted_column
+from xmacis2py.utils.tracing import traced as _traced
 _warnings.filterwarnings('ignore')
 
 def _round_down(value, to_nearest):
@@ -90,6 +98,8 @@ def _round_up(value,
     
     return new_value
 
+@_traced('analysis')
+@_memoize
 def number_of_days_at_value(df,
                             parameter,
                             value):
@@ -148,6 +158,8 @@ def number_of_days_at_value(df,
     return count
 
 
+@_traced('analysis')
+@_memoize
 def number_of_days_above_value(df,
                                parameter,
                                value):
@@ -206,6 +218,8 @@ def number_of_days_above_value(df,
     return count
 
 
+@_traced('analysis')
+@_memoize
 def number_of_days_below_value(df,
                                parameter,
                                value):
@@ -263,6 +277,8 @@ def number_of_days_below_value(df,
 
     return count
 
+@_traced('analysis')
+@_memoize
 def number_of_days_at_or_below_value(df,
                                parameter,
                                value):
@@ -320,6 +336,8 @@ def number_of_days_at_or_below_value(df,
 
     return count
 
+@_traced('analysis')
+@_memoize
 def number_of_days_at_or_above_value(df,
                                     parameter,
                                     value):
@@ -377,6 +395,8 @@ def number_of_days_at_or_above_value(df,
 
     return count
 
+@_traced('analysis')
+@_memoize
 def number_of_missing_days(df,
                            parameter):
     
@@ -422,6 +442,8 @@ def number_of_missing_days(df,
     return nan_counts
 
 
+@_traced('analysis')
+@_memoize
 def period_mean(df,
                 parameter,
                 round_value=False,
@@ -513,6 +535,8 @@ def period_mean(df,
     return var
         
         
+@_traced('analysis')
+@_memoize
 def period_median(df,
                 parameter,
                 round_value=False,
@@ -568,13 +592,7 @@ def period_median(df,
     """
     data_type = data_type.lower()
     
-    try:
-        df = df.replace({0.001:_np.NaN})
-    except Exception as e:
-        df = df.infer_objects(copy=False)
-        df.replace(0.001, _np.nan, inplace=True)
-    
-    var = df[parameter].median()
+    var = _sorted_column(df, parameter).quantile(0.5)
     if round_value == True:
         if data_type == 'integer':
             if round_up == True:
@@ -603,6 +621,8 @@ def period_median(df,
                 var = float(var)
     return var
 
+@_traced('analysis')
+@_memoize
 def period_percentile(df,
                     parameter,
                     round_value=False,
@@ -612,7 +632,7 @@ def period_percentile(df,
                     percentile=0.25):
     
     """
-    This function finds the period median for the specified parameter
+    This function finds the period percentile for the specified parameter
     
     Required Arguments:
     
@@ -631,8 +651,9 @@ def period_percentile(df,
     4) data_type (String) - Default='float'. The data type of the returned data.
         Set data_type='integer' if the user prefers to return an integer type rather than a float type.
 
-    5) percentile (Float) - Default=0.25 (25th Percentile). A value between 0 and 1 that represents the percentile.
+    5) percentile (Float or List) - Default=0.25 (25th Percentile). A value between 0 and 1 that represents the percentile.
         (i.e. 0.25 = 25th percentile, 0.75 = 75th percentile). 
+        Pass a list (i.e. [0.05, 0.25, 0.75, 0.95]) to find several percentiles from one sort of the data.
     
     Types of Rounding
     -----------------
@@ -658,17 +679,21 @@ def period_percentile(df,
     Returns
     -------
     
-    The period user-specified percentile for the variable of interest.    
+    The period user-specified percentile for the variable of interest.
+    If a list of percentiles is passed in, a list of the percentiles in the same order.
     """
-    data_type = data_type.lower()
+    if isinstance(percentile, (list, tuple)):
+        return [period_percentile(df,
+                                  parameter,
+                                  round_value=round_value,
+                                  round_up=round_up,
+                                  to_nearest=to_nearest,
+                                  data_type=data_type,
+                                  percentile=p) for p in percentile]
     
-    try:
-        df = df.replace({0.001:_np.NaN})
-    except Exception as e:
-        df = df.infer_objects(copy=False)
-        df.replace(0.001, _np.nan, inplace=True)
+    data_type = data_type.lower()
     
-    var = df[parameter].quantile(percentile)
+    var = _sorted_column(df, parameter).quantile(percentile)
     if round_value == True:
         if data_type == 'integer':
             if round_up == True:
@@ -698,6 +723,8 @@ def period_percentile(df,
     return var
 
         
+@_traced('analysis')
+@_memoize
 def period_standard_deviation(df,
                                 parameter,
                                 round_value=False,
@@ -789,6 +816,8 @@ def period_standard_deviation(df,
     return var
         
         
+@_traced('analysis')
+@_memoize
 def period_mode(df,
                 parameter,
                 round_value=False,
@@ -844,13 +873,7 @@ def period_mode(df,
     """
     data_type = data_type.lower()
     
-    try:
-        df = df.replace({0.001:_np.NaN})
-    except Exception as e:
-        df = df.infer_objects(copy=False)
-        df.replace(0.001, _np.nan, inplace=True)
-    
-    var = df[parameter].mode()
+    var = _pd.Series(_sorted_column(df, parameter).modes(), dtype=float)
     
     modes = len(var)
     
@@ -896,6 +919,8 @@ def period_mode(df,
     return var
         
         
+@_traced('analysis')
+@_memoize
 def period_variance(df,
                 parameter,
                 round_value=False,
@@ -986,6 +1011,8 @@ def period_variance(df,
                 var = float(var)
     return var
         
+@_traced('analysis')
+@_memoize
 def period_skewness(df,
                 parameter,
                 round_value=False,
@@ -1077,6 +1104,8 @@ def period_skewness(df,
     return var
         
         
+@_traced('analysis')
+@_memoize
 def period_kurtosis(df,
                     parameter,
                     round_value=False,
@@ -1168,6 +1197,8 @@ def period_kurtosis(df,
     return var
         
 
+@_traced('analysis')
+@_memoize
 def period_maximum(df,
                 parameter,
                 round_value=False,
@@ -1258,6 +1289,8 @@ def period_maximum(df,
                 var = float(var)
     return var
         
+@_traced('analysis')
+@_memoize
 def period_minimum(df,
                 parameter,
                 round_value=False,
@@ -1349,6 +1382,8 @@ def period_minimum(df,
     return var
 
 
+@_traced('analysis')
+@_memoize
 def period_sum(df,
                parameter,
                round_value=False,
@@ -1439,6 +1474,8 @@ def period_sum(df,
                 var = float(var)
     return var
    
+@_traced('analysis')
+@_memoize
 def period_rankings(df,
                     parameter,
                     ascending=False,
@@ -1493,79 +1530,142 @@ def period_rankings(df,
     A Pandas.DataFrame organized by user specified ranking system.
     """
     
-    df = df.sort_values([parameter], ascending=ascending)
+    column = _sorted_column(df, parameter)
     
-    if rank_subset == None:
-        
-        ranked = []
-        dates = []
-        for i in range(0, len(df[date_name]), 1):
-            ranked.append(df[parameter].iloc[i])
-            dates.append(df[date_name].iloc[i])
+    indices = column.rank_indices(rank_subset=rank_subset,
+                                  first=first,
+                                  last=last,
+                                  between=between,
+                                  ascending=ascending)
+    
+    ranked_df = _pd.DataFrame()
+    ranked_df[date_name] = _pd.to_datetime(df[date_name].iloc[indices]).to_numpy()
+    ranked_df[parameter] = column.values[indices]
             
-        ranked_df = _pd.DataFrame(ranked)
-        dates_df = _pd.DataFrame(dates)
+    return ranked_df              
         
-        df = _pd.DataFrame()
-        df[date_name] = dates_df
-        df[parameter] = ranked_df
-                   
+
+@_traced('analysis')
+@_memoize
+def period_window_rankings(df,
+                           parameter,
+                           window=3,
+                           statistic='sum',
+                           ascending=False,
+                           first=5,
+                           max_missing=0,
+                           date_name='Date'):
+
+    """
+    This function ranks the non-overlapping N-day windows in the period.
+    This is useful when asked a question like "What were the 5 wettest 3-day periods on record?"
+
+    Every window total is found from a single cumulative-sum pass over the data so the cost does not grow with the window length.
+    The windows are then ranked and taken greedily so that no two returned windows share a day.
+
+    Required Arguments:
+
+    1) df (Pandas.DataFrame) - The Pandas.DataFrame of xmACIS2 data.
+
+    2) parameter (String) - The parameter of interest.
+
+    Parameter List
+    --------------
+
+    'Maximum Temperature'
+    'Minimum Temperature'
+    'Average Temperature',
+    'Average Temperature Departure'
+    'Heating Degree Days'
+    'Cooling Degree Days'
+    'Precipitation'
+    'Snowfall'
+    'Snow Depth'
+    'Growing Degree Days'
+
+    Optional Arguments:
+
+    1) window (Integer) - Default=3. The length of each window in days (i.e. window=3 for the wettest 72 hours).
+
+    2) statistic (String) - Default='sum'. Options are 'sum' and 'mean'.
+        Use 'sum' for totals (i.e. precipitation) and 'mean' for averages (i.e. the hottest 7-day stretch).
+
+    3) ascending (Boolean) - Default=False. The default setting ranks from high to low values.
+        To rank from low to high values (i.e. the coldest 7-day stretch), set ascending=True.
+
+    4) first (Integer) - Default=5. The number of windows to return.
+
+    5) max_missing (Integer) - Default=0. The maximum number of missing days a window may contain and still be ranked.
+        Missing days are skipped in the sum and the mean.
+
+    6) date_name (String) - Default='Date'. The variable name for Date.
+
+    Returns
+    -------
+
+    A Pandas.DataFrame with the start date, end date and window sum or mean of each of the top ranked windows.
+    The columns are f"Start {date_name}", f"End {date_name}" and {parameter}.
+    """
+    statistic = statistic.lower()
+
+    if window < 1:
+        raise ValueError("window must be a positive integer.")
+
+    if statistic not in ['sum', 'mean']:
+        raise ValueError("statistic must be either 'sum' or 'mean'.")
+
+    values = df[parameter].to_numpy(dtype=float, na_value=_np.nan)
+    values = _np.where(values == 0.001, 0, values)
+    valid = ~_np.isnan(values)
+
+    sums = _np.concatenate(([0], _np.cumsum(_np.where(valid, values, 0))))
+    counts = _np.concatenate(([0], _np.cumsum(valid)))
+
+    window_sums = sums[window:] - sums[:-window]
+    window_counts = counts[window:] - counts[:-window]
+
+    eligible = (window_counts > 0) & ((window - window_counts) <= max_missing)
+    starts = _np.flatnonzero(eligible)
+
+    if statistic == 'sum':
+        scores = window_sums[starts]
     else:
-        
-        rank_subset = rank_subset.lower()
-        if rank_subset == 'first':
-            ranked = []
-            dates = []
-            for i in range(0, first, 1):
-                ranked.append(df[parameter].iloc[i])
-                dates.append(_pd.to_datetime(df[date_name].iloc[i]))
-                
-            ranked_df = _pd.DataFrame(ranked)
-            dates_df = _pd.DataFrame(dates)
-            
-            df = _pd.DataFrame()
-            df[date_name] = dates_df
-            df[parameter] = ranked_df
-                
-        elif rank_subset == 'last':
-            ranked = []
-            dates = []
-            nan_count = number_of_missing_days(df,
-                                   parameter)
-
-            last = last + nan_count + 1
-            last = last * -1
-            
-            for i in range(-1, last, -1):
-                ranked.append(df[parameter].iloc[i])
-                dates.append(df[date_name].iloc[i])
-                
-            ranked_df = _pd.DataFrame(ranked)
-            dates_df = _pd.DataFrame(dates)
-            
-            df = _pd.DataFrame()
-            df[date_name] = dates_df
-            df[parameter] = ranked_df
-            
-        else:
-            ranked = []
-            dates = []
-            for i in range(between[0], between[1], 1):
-                ranked.append(df[parameter].iloc[i])
-                dates.append(df[date_name].iloc[i])
-                
-            ranked_df = _pd.DataFrame(ranked)
-            dates_df = _pd.DataFrame(dates)
-            
-            df = _pd.DataFrame()
-            df[date_name] = dates_df
-            df[parameter] = ranked_df  
+        scores = window_sums[starts] / window_counts[starts]
 
-    df = df.dropna()
-            
-    return df              
-        
+    # Differencing the running sums leaves floating point residue (i.e. 3.4699999999), this trims it.
+    scores = _np.round(scores, 8)
 
+    if ascending == True:
+        order = _np.argsort(scores, kind='stable')
+    else:
+        order = _np.argsort(-scores, kind='stable')
+
+    chosen = []
+    chosen_scores = []
+    for i in order:
+        start = starts[i]
+        position = _bisect.bisect_left(chosen, start)
+        if position > 0 and start - chosen[position - 1] < window:
+            continue
+        if position < len(chosen) and chosen[position] - start < window:
+            continue
+        chosen.insert(position, start)
+        chosen_scores.append((start, scores[i]))
+        if len(chosen_scores) == first:
+            break
+
+    dates = _pd.to_datetime(df[date_name]).reset_index(drop=True)
+
+    ranked_df = _pd.DataFrame()
+    ranked_df[f"Start {date_name}"] = [dates.iloc[s] for s, v in chosen_scores]
+    ranked_df[f"End {date_name}"] = [dates.iloc[s + window - 1] for s, v in chosen_scores]
+    ranked_df[parameter] = [float(v) for s, v in chosen_scores]
+
+    return ranked_df
+
+
+@_traced('analysis')
+@_memoize
 def running_sum(df, 
                 parameter,
                 interpolation_limit=3):
@@ -1601,6 +1701,8 @@ def running_sum(df,
     return sums
 
 
+@_traced('analysis')
+@_memoize
 def running_mean(df, 
                  parameter,
                  interpolation_limit=3):
@@ -1634,6 +1736,7 @@ def running_mean(df,
         
     return running_means
 
+@_traced('analysis')
 def detrend_data(df,
                  parameter,
                  detrend_type='linear'):
@@ -1680,10 +1783,41 @@ def detrend_data(df,
     if count > 0:
         df = df.interpolate(limit=count)
 
-        df = df.fillna(method='ffill').fillna(method='bfill')
+        df = df.ffill().bfill()
             
         df[var_name] = _signal.detrend(df[parameter], type=detrend_type)
     else:
         df[var_name] = _signal.detrend(df[parameter], type=detrend_type)
     
     return df
+
+def query(df,
+          date_name='Date'):
+
+    """
+    This function starts a deferred query that collects many statistics and computes them in as few passes over the data as possible.
+
+    The statistics are only recorded until collect() is called. On collect(), the work for each column is planned so that the
+    missing/trace masks, the moments (mean, standard deviation, variance, skewness and kurtosis), the sort used by the median,
+    percentiles and mode and the sort order used by the rankings are each computed once and shared.
+
+    Example:
+
+    results = query(df).param('Precipitation').sum().max().rank(first=5).count_above('T').collect()
+
+    Required Arguments:
+
+    1) df (Pandas.DataFrame) - The Pandas.DataFrame of xmACIS2 data.
+
+    Optional Arguments:
+
+    1) date_name (String) - Default='Date'. The variable name for Date.
+
+    Returns
+    -------
+
+    An AnalysisQuery. Chain param(parameter) and the statistics onto it and call collect() for a dictionary of
+    {parameter: {statistic name: value}}.
+    """
+
+    return _AnalysisQuery(df, date_name=date_name)
@@ -0,0 +1,254 @@
+"""
+This file hosts the opt-in memoization layer for the xmACIS2Py analysis tools.
+
+The graphics call the same statistics on the same data many times (i.e. period_mean of 'Maximum Temperature' is called by both
+plot_comprehensive_summary and plot_maximum_temperature_summary). When the cache is enabled, each analysis result is stored under
+a key made from a cheap content hash of the column(s) the function reads plus the call arguments, so a repeated call on identical data
+is answered without recomputing.
+
+The cache is bounded and evicts the least recently used result when it is full.
+
+The cache is off by default.
+
+Cache Tools:
+
+- enable_cache
+- disable_cache
+- clear_cache
+- cache_info
+- column_fingerprint
+
+(C) Eric J. Drewitz 2025-2026
+"""
+
+import copy as _copy
+import functools as _functools
+import hashlib as _hashlib
+import inspect as _inspect
+import threading as _threading
+import numpy as _np
+import pandas as _pd
+import xmacis2py.utils.tracing as _tracing
+
+from collections import OrderedDict as _OrderedDict
+
+_lock = _threading.Lock()
+_entries = _OrderedDict()
+_settings = {
+    'enabled':False,
+    'maxsize':256
+}
+_stats = {
+    'hits':0,
+    'misses':0
+}
+
+def enable_cache(maxsize=256):
+
+    """
+    This function turns on memoization of the xmACIS2Py analysis tools.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) maxsize (Integer) - Default=256. The maximum number of results kept.
+        When the cache is full, the least recently used result is evicted.
+
+    Returns
+    -------
+
+    None
+    """
+
+    if maxsize < 1:
+        raise ValueError("maxsize must be a positive integer.")
+
+    with _lock:
+        _settings['enabled'] = True
+        _settings['maxsize'] = maxsize
+        while len(_entries) > maxsize:
+            _entries.popitem(last=False)
+
+def disable_cache():
+
+    """
+    This function turns off memoization of the xmACIS2Py analysis tools and empties the cache.
+
+    Required Arguments: None
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    None
+    """
+
+    with _lock:
+        _settings['enabled'] = False
+        _entries.clear()
+
+def clear_cache():
+
+    """
+    This function empties the cache and resets the hit and miss counters.
+
+    Required Arguments: None
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    None
+    """
+
+    with _lock:
+        _entries.clear()
+        _stats['hits'] = 0
+        _stats['misses'] = 0
+
+def cache_info():
+
+    """
+    This function reports the state of the cache.
+
+    Required Arguments: None
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    A dictionary with the keys 'enabled', 'hits', 'misses', 'size' and 'maxsize'.
+    """
+
+    with _lock:
+        return {
+            'enabled':_settings['enabled'],
+            'hits':_stats['hits'],
+            'misses':_stats['misses'],
+            'size':len(_entries),
+            'maxsize':_settings['maxsize']
+        }
+
+def column_fingerprint(series):
+
+    """
+    This function returns a cheap content hash of a column.
+
+    Numeric and datetime columns are hashed straight from their underlying buffer.
+    Other columns fall back to Pandas' row hashing.
+
+    Required Arguments:
+
+    1) series (Pandas.Series) - The column to fingerprint.
+
+    Returns
+    -------
+
+    The fingerprint as a hexadecimal string.
+    """
+
+    digest = _hashlib.blake2b(digest_size=16)
+
+    values = series.to_numpy()
+    if values.dtype == object:
+        digest.update(b'object')
+        values = _pd.util.hash_pandas_object(series, index=False).to_numpy()
+    else:
+        digest.update(str(values.dtype).encode())
+
+    values = _np.ascontiguousarray(values)
+    digest.update(str(values.shape).encode())
+    digest.update(values.view(_np.uint8).data)
+
+    return digest.hexdigest()
+
+def _freeze(value):
+
+    """
+    This function converts a call argument into a hashable value for the cache key.
+
+    Required Arguments:
+
+    1) value (Any) - The call argument.
+
+    Returns
+    -------
+
+    A hashable version of the value.
+    """
+
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    elif isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    else:
+        return value
+
+def memoize(func):
+
+    """
+    This function is a decorator that memoizes an analysis function of the form func(df, parameter, ...).
+
+    The key is the function name, the parameter name, the fingerprint of df[parameter] (and of df[date_name] when the function
+    takes a date_name argument) and the remaining call arguments. When the cache is disabled, the function is called directly.
+
+    Mutable results (i.e. Pandas.DataFrame or lists) are copied on the way in and out of the cache so callers cannot change a cached result.
+
+    Required Arguments:
+
+    1) func (Function) - The analysis function.
+
+    Returns
+    -------
+
+    The wrapped function.
+    """
+
+    signature = _inspect.signature(func)
+    uses_dates = 'date_name' in signature.parameters
+
+    @_functools.wraps(func)
+    def wrapper(*args, **kwargs):
+
+        if _settings['enabled'] == False:
+            return func(*args, **kwargs)
+
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        df = arguments.pop('df')
+        parameter = arguments['parameter']
+
+        try:
+            fingerprints = [column_fingerprint(df[parameter])]
+            if uses_dates == True:
+                fingerprints.append(column_fingerprint(df[arguments['date_name']]))
+            key = (func.__name__, tuple(fingerprints), _freeze(arguments))
+            hash(key)
+        except Exception as e:
+            return func(*args, **kwargs)
+
+        with _lock:
+            if key in _entries:
+                _entries.move_to_end(key)
+                _stats['hits'] += 1
+                _tracing.annotate(cache='hit')
+                return _copy.copy(_entries[key])
+            _stats['misses'] += 1
+        _tracing.annotate(cache='miss')
+
+        result = func(*args, **kwargs)
+
+        with _lock:
+            _entries[key] = _copy.copy(result)
+            _entries.move_to_end(key)
+            while len(_entries) > _settings['maxsize']:
+                _entries.popitem(last=False)
+
+        return result
+
+    return wrapper
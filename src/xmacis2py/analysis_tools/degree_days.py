@@ -0,0 +1,409 @@
+"""
+This file hosts functions that recompute degree days from the daily maximum and minimum temperatures in the xmACIS2 Datasets.
+
+The xmACIS2 service only returns degree days for fixed base temperatures.
+These functions compute heating, cooling and growing degree days for any number of base temperatures (and growing degree day caps) at once
+by broadcasting the daily temperatures against every base/cap combination in a single vectorized pass.
+
+Recomputed columns are named after the service columns with the base and cap appended:
+
+'Heating Degree Days Base 60'
+'Cooling Degree Days Base 70'
+'Growing Degree Days Base 50 Cap 86'
+
+These column names can be passed as the parameter to the xmACIS2Py analysis tools and to the degree day graphics.
+
+Degree Day Tools:
+
+- degree_day_column_name
+- is_degree_day_column
+- degree_day_matrix
+- add_degree_day_columns
+- accumulated_degree_days
+- season_totals
+
+(C) Eric J. Drewitz 2025-2026
+"""
+
+import re as _re
+import warnings as _warnings
+import numpy as _np
+import pandas as _pd
+_warnings.filterwarnings('ignore')
+
+from xmacis2py.utils.tracing import traced as _traced
+
+_kinds = {
+    'heating':'Heating Degree Days',
+    'cooling':'Cooling Degree Days',
+    'growing':'Growing Degree Days'
+}
+
+_column_pattern = _re.compile(r"^(Heating|Cooling|Growing) Degree Days Base (-?[0-9.]+)(?: Cap (-?[0-9.]+))?$")
+
+def _format_number(value):
+
+    """
+    This function formats a base or cap temperature for a column name (i.e. 50.0 ---> '50', 32.5 ---> '32.5').
+
+    Required Arguments:
+
+    1) value (Integer or Float) - The base or cap temperature.
+
+    Returns
+    -------
+
+    The value as a string.
+    """
+
+    value = float(value)
+    if value.is_integer():
+        return str(int(value))
+    else:
+        return str(value)
+
+def degree_day_column_name(kind,
+                           base,
+                           cap=None):
+
+    """
+    This function returns the column name for a recomputed degree day series.
+
+    Required Arguments:
+
+    1) kind (String) - The type of degree days. Options are 'heating', 'cooling' and 'growing'.
+
+    2) base (Integer or Float) - The base temperature [°F].
+
+    Optional Arguments:
+
+    1) cap (Integer, Float or None) - Default=None. The upper temperature cap [°F] for growing degree days.
+
+    Returns
+    -------
+
+    The column name (i.e. 'Growing Degree Days Base 50 Cap 86').
+    """
+
+    kind = kind.lower()
+    if kind not in _kinds.keys():
+        raise ValueError("kind must be 'heating', 'cooling' or 'growing'.")
+
+    name = f"{_kinds[kind]} Base {_format_number(base)}"
+    if cap != None:
+        name = f"{name} Cap {_format_number(cap)}"
+
+    return name
+
+def _parse_column_name(name):
+
+    """
+    This function parses a recomputed degree day column name into its kind, base and cap.
+
+    Required Arguments:
+
+    1) name (String) - The column name (i.e. 'Growing Degree Days Base 50 Cap 86').
+
+    Returns
+    -------
+
+    A tuple of (kind, base, cap) or None if the name is not a recomputed degree day column.
+    """
+
+    match = _column_pattern.match(name)
+    if match == None:
+        return None
+
+    kind = match.group(1).lower()
+    base = float(match.group(2))
+    if match.group(3) != None:
+        cap = float(match.group(3))
+    else:
+        cap = None
+
+    return kind, base, cap
+
+def is_degree_day_column(name,
+                         kind=None):
+
+    """
+    This function checks if a name is a degree day column: a service column (i.e. 'Heating Degree Days') or a recomputed column
+    (i.e. 'Heating Degree Days Base 60').
+
+    Required Arguments:
+
+    1) name (String) - The column name.
+
+    Optional Arguments:
+
+    1) kind (String or None) - Default=None. When set to 'heating', 'cooling' or 'growing', the column must also be of that type.
+
+    Returns
+    -------
+
+    True if the name is a degree day column (of the kind) and False otherwise.
+    """
+
+    if isinstance(name, str) == False:
+        return False
+
+    if name in _kinds.values():
+        column_kind = [key for key, value in _kinds.items() if value == name][0]
+    else:
+        parsed = _parse_column_name(name)
+        if parsed == None:
+            return False
+        column_kind = parsed[0]
+
+    if kind != None and column_kind != kind.lower():
+        return False
+
+    return True
+
+@_traced('analysis')
+def degree_day_matrix(df,
+                      kind='heating',
+                      bases=[65],
+                      caps=[None],
+                      round_value=False,
+                      date_name='Date'):
+
+    """
+    This function computes degree days for every combination of base temperature and cap at once.
+
+    The daily temperatures are broadcast against all of the base temperatures (and caps) so the whole matrix is
+    computed in one vectorized pass rather than one pass per base temperature.
+
+    Heating Degree Days = max(0, base - (Tmax + Tmin) / 2)
+    Cooling Degree Days = max(0, (Tmax + Tmin) / 2 - base)
+    Growing Degree Days = max(0, (Tmax' + Tmin') / 2 - base) where Tmax and Tmin are limited to the range [base, cap]
+
+    A day is missing (NaN) when either the maximum or minimum temperature is missing.
+
+    Required Arguments:
+
+    1) df (Pandas.DataFrame) - The Pandas.DataFrame of xmACIS2 data.
+
+    Optional Arguments:
+
+    1) kind (String) - Default='heating'. The type of degree days. Options are 'heating', 'cooling' and 'growing'.
+
+    2) bases (List) - Default=[65]. The base temperatures [°F].
+
+    3) caps (List) - Default=[None]. The upper temperature caps [°F]. Only used for growing degree days.
+        None means no cap. Every base is combined with every cap (i.e. bases=[40, 50] and caps=[86, None] make 4 columns).
+
+    4) round_value (Boolean) - Default=False. When set to True, the degree days are rounded to the nearest whole number like the xmACIS2 service.
+
+    5) date_name (String) - Default='Date'. The variable name for Date.
+
+    Returns
+    -------
+
+    A Pandas.DataFrame with the dates and one column per base/cap combination.
+    """
+
+    kind = kind.lower()
+    if kind not in _kinds.keys():
+        raise ValueError("kind must be 'heating', 'cooling' or 'growing'.")
+
+    if kind != 'growing':
+        caps = [None]
+
+    combinations = [(base, cap) for base in bases for cap in caps]
+    base_row = _np.array([float(base) for base, cap in combinations])[None, :]
+    cap_row = _np.array([_np.inf if cap == None else float(cap) for base, cap in combinations])[None, :]
+
+    tmax = df['Maximum Temperature'].to_numpy(dtype=float, na_value=_np.nan)[:, None]
+    tmin = df['Minimum Temperature'].to_numpy(dtype=float, na_value=_np.nan)[:, None]
+
+    if kind == 'growing':
+        tmax = _np.clip(tmax, base_row, cap_row)
+        tmin = _np.clip(tmin, base_row, cap_row)
+
+    mean = (tmax + tmin) / 2
+
+    if kind == 'heating':
+        matrix = base_row - mean
+    else:
+        matrix = mean - base_row
+
+    matrix = _np.maximum(matrix, 0)
+
+    if round_value == True:
+        # Round half up so 0.5 ---> 1 like the xmACIS2 service rather than numpy's round half to even.
+        matrix = _np.floor(matrix + 0.5)
+
+    names = [degree_day_column_name(kind, base, cap) for base, cap in combinations]
+
+    matrix_df = _pd.DataFrame(matrix, columns=names, index=df.index)
+    matrix_df.insert(0, date_name, df[date_name])
+
+    return matrix_df
+
+@_traced('analysis')
+def add_degree_day_columns(df,
+                           columns,
+                           round_value=False):
+
+    """
+    This function adds recomputed degree day columns to the xmACIS2 dataframe by name.
+
+    Required Arguments:
+
+    1) df (Pandas.DataFrame) - The Pandas.DataFrame of xmACIS2 data.
+
+    2) columns (String or List) - The column name(s) to add (i.e. 'Heating Degree Days Base 60' or
+        ['Growing Degree Days Base 40', 'Growing Degree Days Base 50 Cap 86']).
+        Columns that are already in the dataframe are left as they are.
+
+    Optional Arguments:
+
+    1) round_value (Boolean) - Default=False. When set to True, the degree days are rounded to the nearest whole number like the xmACIS2 service.
+
+    Returns
+    -------
+
+    A copy of the Pandas.DataFrame with the recomputed degree day columns added.
+    """
+
+    if type(columns) == type('String'):
+        columns = [columns]
+
+    df = df.copy()
+
+    for name in columns:
+        if name in df.columns:
+            continue
+        parsed = _parse_column_name(name)
+        if parsed == None:
+            raise ValueError(f"{name} is not a recomputed degree day column. Expected a name like 'Growing Degree Days Base 50 Cap 86'.")
+        kind, base, cap = parsed
+        matrix_df = degree_day_matrix(df,
+                                      kind=kind,
+                                      bases=[base],
+                                      caps=[cap],
+                                      round_value=round_value)
+        df[name] = matrix_df.iloc[:, 1].to_numpy()
+
+    return df
+
+def _season_ids(dates,
+                season_start):
+
+    """
+    This function labels each date with the year its season started in.
+
+    Required Arguments:
+
+    1) dates (Pandas.Series) - The dates.
+
+    2) season_start (String) - The first day of the season in the format 'mm-dd'.
+
+    Returns
+    -------
+
+    A numpy array of season start years.
+    """
+
+    dates = _pd.to_datetime(dates)
+    month, day = [int(i) for i in season_start.split('-')]
+
+    before_start = (dates.dt.month < month) | ((dates.dt.month == month) & (dates.dt.day < day))
+
+    return (dates.dt.year - before_start.astype(int)).to_numpy()
+
+@_traced('analysis')
+def accumulated_degree_days(df,
+                            parameters,
+                            season_start='01-01',
+                            date_name='Date'):
+
+    """
+    This function computes the accumulated (season to date) degree days, resetting to zero at the start of each season.
+
+    Missing days do not add to the total.
+
+    Required Arguments:
+
+    1) df (Pandas.DataFrame) - The Pandas.DataFrame of xmACIS2 data.
+
+    2) parameters (String or List) - The degree day column(s) to accumulate.
+        These can be the service columns (i.e. 'Heating Degree Days') or recomputed columns (i.e. 'Heating Degree Days Base 60').
+        Recomputed columns that are not in the dataframe yet are added first.
+
+    Optional Arguments:
+
+    1) season_start (String) - Default='01-01'. The first day of the season in the format 'mm-dd'.
+        The heating season is commonly taken to start on '07-01'.
+
+    2) date_name (String) - Default='Date'. The variable name for Date.
+
+    Returns
+    -------
+
+    A copy of the Pandas.DataFrame with an f"{parameter} Accumulated" column added for each parameter.
+    """
+
+    if type(parameters) == type('String'):
+        parameters = [parameters]
+
+    df = add_degree_day_columns(df, [p for p in parameters if p not in df.columns])
+
+    seasons = _season_ids(df[date_name], season_start)
+
+    for parameter in parameters:
+        df[f"{parameter} Accumulated"] = df[parameter].fillna(0).groupby(seasons).cumsum().to_numpy()
+
+    return df
+
+@_traced('analysis')
+def season_totals(df,
+                  parameters,
+                  season_start='01-01',
+                  date_name='Date'):
+
+    """
+    This function totals the degree days for each season.
+
+    Required Arguments:
+
+    1) df (Pandas.DataFrame) - The Pandas.DataFrame of xmACIS2 data.
+
+    2) parameters (String or List) - The degree day column(s) to total.
+        These can be the service columns (i.e. 'Heating Degree Days') or recomputed columns (i.e. 'Heating Degree Days Base 60').
+        Recomputed columns that are not in the dataframe yet are added first.
+
+    Optional Arguments:
+
+    1) season_start (String) - Default='01-01'. The first day of the season in the format 'mm-dd'.
+        The heating season is commonly taken to start on '07-01'.
+
+    2) date_name (String) - Default='Date'. The variable name for Date.
+
+    Returns
+    -------
+
+    A Pandas.DataFrame with one row per season.
+    The columns are 'Season Start', 'Missing Days' (the most missing days of any parameter) and the total of each parameter.
+    """
+
+    if type(parameters) == type('String'):
+        parameters = [parameters]
+
+    df = add_degree_day_columns(df, [p for p in parameters if p not in df.columns])
+
+    seasons = _season_ids(df[date_name], season_start)
+    month, day = [int(i) for i in season_start.split('-')]
+
+    grouped = df[parameters].groupby(seasons)
+    totals = grouped.sum(min_count=1)
+    missing = grouped.agg(lambda x: x.isna().sum()).max(axis=1)
+
+    totals_df = _pd.DataFrame()
+    totals_df['Season Start'] = [_pd.Timestamp(int(year), month, day) for year in totals.index]
+    totals_df['Missing Days'] = missing.to_numpy().astype(int)
+    for parameter in parameters:
+        totals_df[parameter] = totals[parameter].to_numpy()
+
+    return totals_df
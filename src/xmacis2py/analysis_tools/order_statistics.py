@@ -0,0 +1,225 @@
+"""
+This file hosts the sorted column that the xmACIS2Py order statistics share.
+
+period_median, period_percentile, period_mode and period_rankings (and the median, percentile, mode and rank statistics of a query)
+all need the column in sorted order. Rather than each of them sorting (or hashing) the column again, the column is sorted once and the
+result is kept in a small cache keyed by the content hash of the column, so every order statistic on the same data reuses one sort.
+
+Order Statistic Tools:
+
+- sorted_column
+- clear
+- SortedColumn
+
+(C) Eric J. Drewitz 2025-2026
+"""
+
+import math as _math
+import threading as _threading
+import numpy as _np
+
+from collections import OrderedDict as _OrderedDict
+from xmacis2py.analysis_tools.cache import column_fingerprint as _column_fingerprint
+
+_lock = _threading.Lock()
+_entries = _OrderedDict()
+_maxsize = 8
+
+class SortedColumn:
+
+    """
+    This class holds one sort of an xmACIS2 column and answers the order statistics from it.
+
+    Attributes
+    ----------
+
+    values (Numpy.Array) - The column as floats with missing days as NaN (read-only).
+
+    order (Numpy.Array) - The indices that sort the column from low to high with the missing days last (read-only).
+
+    sorted_values (Numpy.Array) - The sorted values used for the period statistics, with the missing days and trace amounts left out
+        like the other period_* analysis tools (read-only).
+
+    missing (Integer) - The number of missing days.
+
+    Methods
+    -------
+
+    quantile(percentile) - The percentile(s) with linear interpolation. percentile is a value between 0 and 1 or a list of values.
+
+    modes() - A list of the mode(s).
+
+    rank_indices(rank_subset=None, first=5, last=5, between=[], ascending=False) - The row positions of the rankings
+        period_rankings returns.
+    """
+
+    def __init__(self,
+                 values):
+
+        self.values = _np.array(values, dtype=float)
+        self.order = _np.argsort(self.values, kind='stable')
+
+        ordered = self.values[self.order]
+        keep = ~_np.isnan(ordered)
+        self.missing = int(len(keep) - keep.sum())
+        self._valid_order = self.order[keep]
+        self.sorted_values = ordered[keep & (ordered != 0.001)]
+        self._descending_order = None
+
+        for array in [self.values, self.order, self._valid_order, self.sorted_values]:
+            array.setflags(write=False)
+
+    def quantile(self,
+                 percentile):
+
+        """
+        This method finds the percentile(s) of the column with linear interpolation (the Pandas default).
+
+        Required Arguments:
+
+        1) percentile (Float or List) - A value between 0 and 1 or a list of values.
+
+        Returns
+        -------
+
+        The percentile as a float or a list of floats when a list is passed in.
+        """
+
+        if isinstance(percentile, (list, tuple, _np.ndarray)):
+            return [self.quantile(p) for p in percentile]
+
+        count = len(self.sorted_values)
+        if count == 0:
+            return _np.nan
+
+        position = (count - 1) * float(percentile)
+        lower = int(_math.floor(position))
+        upper = min(lower + 1, count - 1)
+        fraction = position - lower
+
+        return float(self.sorted_values[lower] + (self.sorted_values[upper] - self.sorted_values[lower]) * fraction)
+
+    def modes(self):
+
+        """
+        This method finds the mode(s) of the column from the run lengths of the sorted values.
+
+        Returns
+        -------
+
+        A list of the mode(s) from low to high.
+        """
+
+        if len(self.sorted_values) == 0:
+            return []
+
+        starts = _np.flatnonzero(_np.concatenate(([True], self.sorted_values[1:] != self.sorted_values[:-1])))
+        lengths = _np.diff(_np.concatenate((starts, [len(self.sorted_values)])))
+
+        return [float(v) for v in self.sorted_values[starts[lengths == lengths.max()]]]
+
+    def rank_indices(self,
+                     rank_subset=None,
+                     first=5,
+                     last=5,
+                     between=[],
+                     ascending=False):
+
+        """
+        This method finds the row positions of a ranking of the column.
+
+        The rankings are the same as period_rankings: the missing days are dropped, 'first' is the top values, 'last' is the bottom values
+        (listed from the very bottom up) and 'between' is a slice of the full ranking.
+
+        Optional Arguments:
+
+        1) rank_subset (String or None) - Default=None. Options are None, 'first', 'last' and 'between'.
+
+        2) first (Integer) - Default=5. The number of top values.
+
+        3) last (Integer) - Default=5. The number of bottom values.
+
+        4) between (Integer List) - Default=Blank List. The start and end places of a custom ranking.
+
+        5) ascending (Boolean) - Default=False. The default setting ranks from high to low values.
+
+        Returns
+        -------
+
+        A numpy array of row positions.
+        """
+
+        if ascending == True:
+            ranked = self._valid_order
+        else:
+            # Reversing the ascending sort would list tied values latest date first. Like the Pandas sort period_rankings used
+            # before, tied values stay in date order (earliest first).
+            if self._descending_order is None:
+                descending = self._valid_order[_np.lexsort((self._valid_order, -self.values[self._valid_order]))]
+                descending.setflags(write=False)
+                self._descending_order = descending
+            ranked = self._descending_order
+
+        if rank_subset == None:
+            return ranked
+
+        rank_subset = rank_subset.lower()
+        if rank_subset == 'first':
+            return ranked[:first]
+        elif rank_subset == 'last':
+            return ranked[::-1][:last]
+        else:
+            return ranked[between[0]:between[1]]
+
+def sorted_column(df,
+                  parameter):
+
+    """
+    This function returns the sorted column for a parameter, sorting it only if the same data has not been sorted recently.
+
+    Required Arguments:
+
+    1) df (Pandas.DataFrame) - The Pandas.DataFrame of xmACIS2 data.
+
+    2) parameter (String) - The parameter of interest.
+
+    Returns
+    -------
+
+    A SortedColumn.
+    """
+
+    series = df[parameter]
+    key = _column_fingerprint(series)
+
+    with _lock:
+        if key in _entries:
+            _entries.move_to_end(key)
+            return _entries[key]
+
+    column = SortedColumn(series.to_numpy(dtype=float, na_value=_np.nan))
+
+    with _lock:
+        _entries[key] = column
+        while len(_entries) > _maxsize:
+            _entries.popitem(last=False)
+
+    return column
+
+def clear():
+
+    """
+    This function empties the cache of sorted columns, so the next order statistic on any column sorts it again.
+
+    Required Arguments: None
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    None
+    """
+
+    with _lock:
+        _entries.clear()
@@ -0,0 +1,396 @@
+"""
+This file hosts the deferred query API for the xmACIS2Py analysis tools.
+
+The function-per-statistic analysis tools each make their own pass over a column (and most copy the whole dataframe first).
+A query records the statistics the user asks for and only runs them on collect(), where the work for each column is planned
+so that every pass is shared:
+
+1) The column is read and the missing/trace masks are built once.
+
+2) The moments (mean, standard deviation, variance, skewness and kurtosis) share one pass over the deviations from the mean.
+
+3) The median, percentiles, mode and rankings share one sort of the column
+   (the same sorted column that period_median, period_percentile, period_mode and period_rankings reuse).
+
+Example
+-------
+
+results = analysis.query(df).param('Precipitation').sum().max().rank(first=5).count_above('T').collect()
+
+results['Precipitation']['sum']
+results['Precipitation']['rank_first_5']
+
+The values match the corresponding analysis tools (i.e. trace amounts are left out of the period statistics but counted by
+count_above('T'), exactly as in period_sum and number_of_days_above_value).
+
+(C) Eric J. Drewitz 2025-2026
+"""
+
+import math as _math
+import numpy as _np
+import pandas as _pd
+
+from xmacis2py.analysis_tools.order_statistics import sorted_column as _sorted_column
+
+_moment_ops = ['mean', 'std', 'var', 'skew', 'kurt']
+_order_ops = ['median', 'percentile', 'mode']
+_count_ops = {
+    'count_at':_np.equal,
+    'count_above':_np.greater,
+    'count_below':_np.less,
+    'count_at_or_above':_np.greater_equal,
+    'count_at_or_below':_np.less_equal
+}
+
+def _threshold(value):
+
+    """
+    This function converts a count threshold to a number ('T' ---> 0.001 like the number_of_days_* analysis tools).
+
+    Required Arguments:
+
+    1) value (String, Integer or Float) - The threshold.
+
+    Returns
+    -------
+
+    The threshold as a float.
+    """
+
+    try:
+        value = value.upper()
+    except Exception as e:
+        pass
+
+    if value == 'T':
+        value = 0.001
+
+    return float(value)
+
+def _moments(values):
+
+    """
+    This function computes the mean, variance, skewness and kurtosis of a column in one pass over the deviations from the mean.
+    The estimators are the same bias-corrected ones Pandas uses.
+
+    Required Arguments:
+
+    1) values (Numpy.Array) - The non-missing values.
+
+    Returns
+    -------
+
+    A dictionary with the keys 'mean', 'std', 'var', 'skew' and 'kurt'.
+    """
+
+    count = len(values)
+    results = dict.fromkeys(_moment_ops, _np.nan)
+    if count == 0:
+        return results
+
+    mean = values.mean()
+    deviations = values - mean
+    squared = deviations * deviations
+    m2 = squared.sum()
+    m3 = (squared * deviations).sum()
+    m4 = (squared * squared).sum()
+
+    results['mean'] = float(mean)
+
+    if count > 1:
+        results['var'] = float(m2 / (count - 1))
+        results['std'] = _math.sqrt(results['var'])
+
+    if count > 2:
+        if m2 == 0:
+            results['skew'] = 0.0
+        else:
+            results['skew'] = float((count * (count - 1) ** 0.5 / (count - 2)) * (m3 / m2 ** 1.5))
+
+    if count > 3:
+        denominator = (count - 2) * (count - 3) * m2 ** 2
+        if denominator == 0:
+            results['kurt'] = 0.0
+        else:
+            adjustment = 3 * (count - 1) ** 2 / ((count - 2) * (count - 3))
+            results['kurt'] = float(count * (count + 1) * (count - 1) * m4 / denominator - adjustment)
+
+    return results
+
+class AnalysisQuery:
+
+    """
+    This class records the statistics requested for one or more parameters of an xmACIS2 dataframe and computes them all at once
+    on collect().
+
+    Create a query with xmacis2py.analysis_tools.analysis.query(df).
+
+    Methods
+    -------
+
+    param(parameter) - Selects the parameter the following statistics apply to.
+
+    mean(), median(), mode(), std(), var(), skew(), kurt(), max(), min(), sum(), missing()
+
+    percentile(percentile) - percentile is a value between 0 and 1 or a list of values.
+
+    count_at(value), count_above(value), count_below(value), count_at_or_above(value), count_at_or_below(value)
+        For precipitation, value='T' counts all days where at least a trace occurred.
+
+    rank(first=None, last=None, between=None, ascending=False) - The same rankings as period_rankings.
+
+    explain() - Returns a description of the passes collect() will make.
+
+    collect() - Computes everything and returns a dictionary of {parameter: {statistic: value}}.
+
+    Every statistic method also accepts name= to override the key it is returned under.
+    """
+
+    def __init__(self,
+                 df,
+                 date_name='Date'):
+
+        self._df = df
+        self._date_name = date_name
+        self._plan = {}
+        self._parameter = None
+
+    def param(self,
+              parameter):
+
+        """
+        This method selects the parameter the following statistics apply to.
+
+        Required Arguments:
+
+        1) parameter (String) - The parameter of interest.
+
+        Returns
+        -------
+
+        The query.
+        """
+
+        if parameter not in self._df.columns:
+            raise KeyError(f"{parameter} is not a column in the dataframe.")
+
+        self._parameter = parameter
+        self._plan.setdefault(parameter, [])
+
+        return self
+
+    def _add(self,
+             op,
+             name,
+             **options):
+
+        if self._parameter == None:
+            raise ValueError("Select a parameter with param() before adding statistics.")
+
+        self._plan[self._parameter].append((op, name, options))
+
+        return self
+
+    def mean(self, name='mean'):
+        return self._add('mean', name)
+
+    def std(self, name='std'):
+        return self._add('std', name)
+
+    def var(self, name='var'):
+        return self._add('var', name)
+
+    def skew(self, name='skew'):
+        return self._add('skew', name)
+
+    def kurt(self, name='kurt'):
+        return self._add('kurt', name)
+
+    def max(self, name='max'):
+        return self._add('max', name)
+
+    def min(self, name='min'):
+        return self._add('min', name)
+
+    def sum(self, name='sum'):
+        return self._add('sum', name)
+
+    def missing(self, name='missing'):
+        return self._add('missing', name)
+
+    def median(self, name='median'):
+        return self._add('percentile', name, percentile=0.5)
+
+    def mode(self, name='mode'):
+        return self._add('mode', name)
+
+    def percentile(self,
+                   percentile,
+                   name=None):
+
+        if isinstance(percentile, (list, tuple)):
+            for p in percentile:
+                self.percentile(p)
+            return self
+
+        if name == None:
+            name = f"percentile_{percentile}"
+
+        return self._add('percentile', name, percentile=float(percentile))
+
+    def count_at(self, value, name=None):
+        return self._add('count_at', name or f"count_at_{value}", value=_threshold(value))
+
+    def count_above(self, value, name=None):
+        return self._add('count_above', name or f"count_above_{value}", value=_threshold(value))
+
+    def count_below(self, value, name=None):
+        return self._add('count_below', name or f"count_below_{value}", value=_threshold(value))
+
+    def count_at_or_above(self, value, name=None):
+        return self._add('count_at_or_above', name or f"count_at_or_above_{value}", value=_threshold(value))
+
+    def count_at_or_below(self, value, name=None):
+        return self._add('count_at_or_below', name or f"count_at_or_below_{value}", value=_threshold(value))
+
+    def rank(self,
+             first=None,
+             last=None,
+             between=None,
+             ascending=False,
+             name=None):
+
+        if first != None:
+            subset, default_name = 'first', f"rank_first_{first}"
+        elif last != None:
+            subset, default_name = 'last', f"rank_last_{last}"
+        elif between != None:
+            subset, default_name = 'between', f"rank_between_{between[0]}_{between[1]}"
+        else:
+            subset, default_name = None, 'rank_all'
+
+        if ascending == True:
+            default_name = f"{default_name}_ascending"
+
+        return self._add('rank',
+                         name or default_name,
+                         subset=subset,
+                         first=first,
+                         last=last,
+                         between=between,
+                         ascending=ascending)
+
+    def _passes(self,
+                ops):
+
+        """
+        This method lists the shared passes needed for one parameter's statistics.
+        """
+
+        kinds = set(op for op, name, options in ops)
+        passes = ['read column and build missing/trace masks']
+        if kinds & set(_moment_ops):
+            passes.append('moments (one pass over deviations from the mean)')
+        if kinds & set(['max', 'min', 'sum']):
+            passes.append('max/min/sum (reductions over the non-missing values)')
+        if kinds & set(_order_ops + ['rank']):
+            passes.append('sort column (shared by median, percentiles, mode and rankings)')
+        for op in sorted(kinds & set(_count_ops.keys())):
+            passes.append(f"{op} (one comparison per threshold)")
+
+        return passes
+
+    def explain(self):
+
+        """
+        This method describes the passes collect() will make over each column.
+
+        Returns
+        -------
+
+        The plan as a string.
+        """
+
+        lines = []
+        for parameter, ops in self._plan.items():
+            lines.append(f"{parameter}: {', '.join(name for op, name, options in ops)}")
+            for p in self._passes(ops):
+                lines.append(f"    - {p}")
+
+        return '\n'.join(lines)
+
+    def _rank(self,
+              column,
+              parameter,
+              options):
+
+        """
+        This method slices the shared sort order into the same rankings period_rankings returns.
+        """
+
+        indices = column.rank_indices(rank_subset=options['subset'],
+                                      first=options['first'],
+                                      last=options['last'],
+                                      between=options['between'],
+                                      ascending=options['ascending'])
+
+        ranked_df = _pd.DataFrame()
+        ranked_df[self._date_name] = _pd.to_datetime(self._df[self._date_name].iloc[indices]).to_numpy()
+        ranked_df[parameter] = column.values[indices]
+
+        return ranked_df
+
+    def collect(self):
+
+        """
+        This method computes every recorded statistic.
+
+        Returns
+        -------
+
+        A dictionary of {parameter: {statistic name: value}}.
+        """
+
+        results = {}
+
+        for parameter, ops in self._plan.items():
+
+            kinds = set(op for op, name, options in ops)
+
+            values = self._df[parameter].to_numpy(dtype=float, na_value=_np.nan)
+            missing = _np.isnan(values)
+            statistics = values[~missing & (values != 0.001)]
+
+            moments = None
+            if kinds & set(_moment_ops):
+                moments = _moments(statistics)
+
+            sorted_values = None
+            if kinds & set(_order_ops + ['rank']):
+                sorted_values = _sorted_column(self._df, parameter)
+
+            column = {}
+            for op, name, options in ops:
+                if op in _moment_ops:
+                    column[name] = moments[op]
+                elif op == 'max':
+                    column[name] = float(statistics.max()) if len(statistics) > 0 else _np.nan
+                elif op == 'min':
+                    column[name] = float(statistics.min()) if len(statistics) > 0 else _np.nan
+                elif op == 'sum':
+                    column[name] = float(statistics.sum())
+                elif op == 'missing':
+                    column[name] = int(missing.sum())
+                elif op == 'percentile':
+                    column[name] = sorted_values.quantile(options['percentile'])
+                elif op == 'mode':
+                    modes = sorted_values.modes()
+                    column[name] = modes[0] if len(modes) == 1 else modes
+                elif op in _count_ops.keys():
+                    column[name] = int(_count_ops[op](values, options['value']).sum())
+                elif op == 'rank':
+                    column[name] = self._rank(sorted_values, parameter, options)
+
+            results[parameter] = column
+
+        return results
@@ -0,0 +1,571 @@
+"""
+This file hosts a mergeable quantile sketch for percentiles over very long or multi-station records.
+
+period_percentile needs the whole column in memory. For station-pooled distributions
+(i.e. the 95th percentile of daily maximum temperature across 500 stations x 100 years) a sketch is built for each station,
+the sketches are merged and the percentiles are answered from the merged sketch, so only one station is ever in memory.
+
+The sketch is a fixed-resolution histogram: every value is snapped to the nearest multiple of the resolution and counted.
+This suits the xmACIS2 data well because the service already reports every parameter on a fixed grid
+(whole degrees, whole degree days, hundredths of an inch of precipitation, tenths of an inch of snowfall and whole inches of snow depth).
+
+Error Bounds
+------------
+
+1) Every percentile is within resolution / 2 of the exact percentile (linear interpolation, the same as period_percentile).
+
+2) When the data is already reported on the resolution grid (the default resolutions below), the percentiles are exact.
+
+3) Merging is exact: the merged sketch is identical to a sketch built from all of the data at once.
+
+Memory is bounded by (largest value - smallest value) / resolution counters, no matter how many days are added.
+
+Default Resolutions
+-------------------
+
+'Maximum Temperature' ---> 1
+'Minimum Temperature' ---> 1
+'Average Temperature' ---> 0.5
+'Average Temperature Departure' ---> 0.5
+'Heating Degree Days' ---> 1
+'Cooling Degree Days' ---> 1
+'Growing Degree Days' ---> 1
+'Precipitation' ---> 0.01
+'Snowfall' ---> 0.1
+'Snow Depth' ---> 1
+
+Sketch Tools:
+
+- QuantileSketch
+- build_sketch
+- merge_sketches
+- save_station_sketch
+- load_station_sketch
+- pooled_sketch
+
+(C) Eric J. Drewitz 2025-2026
+"""
+
+import math as _math
+import os as _os
+import time as _time
+import warnings as _warnings
+import numpy as _np
+import pandas as _pd
+_warnings.filterwarnings('ignore')
+
+from xmacis2py.utils.file_funcs import update_csv_file_paths as _update_csv_file_paths
+
+_default_resolutions = {
+    'Maximum Temperature':1,
+    'Minimum Temperature':1,
+    'Average Temperature':0.5,
+    'Average Temperature Departure':0.5,
+    'Heating Degree Days':1,
+    'Cooling Degree Days':1,
+    'Growing Degree Days':1,
+    'Precipitation':0.01,
+    'Snowfall':0.1,
+    'Snow Depth':1
+}
+
+class QuantileSketch:
+
+    """
+    This class is a mergeable fixed-resolution quantile sketch.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) resolution (Float) - Default=1. The grid the values are snapped to. The percentiles are within resolution / 2 of the exact values.
+
+    2) max_bins (Integer) - Default=1000000. The most counters the sketch may hold. Guards against a resolution that is far too fine
+        for the range of the data.
+
+    Methods
+    -------
+
+    update(values) - Adds values to the sketch. NaN values are skipped.
+
+    merge(other) - Adds the counts of another sketch with the same resolution to this sketch.
+
+    quantile(percentile) - The percentile(s) with linear interpolation. percentile is a value between 0 and 1 or a list of values.
+
+    save(path) - Saves the sketch as a .npz file.
+
+    QuantileSketch.load(path) - Loads a sketch saved with save().
+
+    Attributes
+    ----------
+
+    count (Integer) - The number of values in the sketch.
+    """
+
+    def __init__(self,
+                 resolution=1,
+                 max_bins=1000000):
+
+        if resolution <= 0:
+            raise ValueError("resolution must be greater than 0.")
+
+        self.resolution = float(resolution)
+        self.max_bins = int(max_bins)
+        self._offset = 0
+        self._counts = _np.zeros(0, dtype=_np.int64)
+
+    @property
+    def count(self):
+        return int(self._counts.sum())
+
+    def _grow(self,
+              low,
+              high):
+
+        """
+        This method widens the counters to cover the bins low through high.
+        """
+
+        if len(self._counts) == 0:
+            new_low, new_high = low, high
+        else:
+            new_low = min(low, self._offset)
+            new_high = max(high, self._offset + len(self._counts) - 1)
+
+        size = new_high - new_low + 1
+        if size > self.max_bins:
+            raise ValueError(f"The sketch would need {size} bins which is more than max_bins={self.max_bins}. Use a coarser resolution.")
+
+        if len(self._counts) == 0:
+            self._counts = _np.zeros(size, dtype=_np.int64)
+        elif new_low != self._offset or size != len(self._counts):
+            counts = _np.zeros(size, dtype=_np.int64)
+            start = self._offset - new_low
+            counts[start:start + len(self._counts)] = self._counts
+            self._counts = counts
+
+        self._offset = new_low
+
+    def update(self,
+               values):
+
+        """
+        This method adds values to the sketch.
+
+        Required Arguments:
+
+        1) values (Array-Like) - The values. NaN values are skipped.
+
+        Returns
+        -------
+
+        The sketch.
+        """
+
+        values = _np.asarray(values, dtype=float).ravel()
+        values = values[~_np.isnan(values)]
+        if len(values) == 0:
+            return self
+
+        bins = _np.rint(values / self.resolution).astype(_np.int64)
+        self._grow(int(bins.min()), int(bins.max()))
+        self._counts += _np.bincount(bins - self._offset, minlength=len(self._counts))
+
+        return self
+
+    def merge(self,
+              other):
+
+        """
+        This method adds the counts of another sketch to this sketch.
+
+        Required Arguments:
+
+        1) other (QuantileSketch) - A sketch with the same resolution.
+
+        Returns
+        -------
+
+        The sketch.
+        """
+
+        if other.resolution != self.resolution:
+            raise ValueError(f"Cannot merge a sketch with resolution {other.resolution} into a sketch with resolution {self.resolution}.")
+
+        if len(other._counts) == 0:
+            return self
+
+        self._grow(other._offset, other._offset + len(other._counts) - 1)
+        start = other._offset - self._offset
+        self._counts[start:start + len(other._counts)] += other._counts
+
+        return self
+
+    def _value(self,
+               cumulative,
+               rank):
+
+        """
+        This method returns the value of the rank-th smallest item (0-based).
+        """
+
+        bin_index = int(_np.searchsorted(cumulative, rank, side='right'))
+
+        return (self._offset + bin_index) * self.resolution
+
+    def quantile(self,
+                 percentile):
+
+        """
+        This method finds the percentile(s) of the values in the sketch with linear interpolation (the Pandas default).
+
+        Required Arguments:
+
+        1) percentile (Float or List) - A value between 0 and 1 or a list of values.
+
+        Returns
+        -------
+
+        The percentile as a float or a list of floats when a list is passed in.
+        """
+
+        if isinstance(percentile, (list, tuple, _np.ndarray)):
+            return [self.quantile(p) for p in percentile]
+
+        count = self.count
+        if count == 0:
+            return _np.nan
+
+        cumulative = _np.cumsum(self._counts)
+
+        position = (count - 1) * float(percentile)
+        lower = int(_math.floor(position))
+        upper = min(lower + 1, count - 1)
+        fraction = position - lower
+
+        lower_value = self._value(cumulative, lower)
+        upper_value = self._value(cumulative, upper)
+
+        return round(lower_value + (upper_value - lower_value) * fraction, 10)
+
+    def save(self,
+             path):
+
+        """
+        This method saves the sketch as a .npz file.
+
+        Required Arguments:
+
+        1) path (String) - The file path.
+
+        Returns
+        -------
+
+        None
+        """
+
+        _np.savez(path,
+                  resolution=self.resolution,
+                  max_bins=self.max_bins,
+                  offset=self._offset,
+                  counts=self._counts)
+
+    @classmethod
+    def load(cls,
+             path):
+
+        """
+        This method loads a sketch saved with save().
+
+        Required Arguments:
+
+        1) path (String) - The file path.
+
+        Returns
+        -------
+
+        A QuantileSketch.
+        """
+
+        with _np.load(path) as data:
+            sketch = cls(resolution=float(data['resolution']),
+                         max_bins=int(data['max_bins']))
+            sketch._offset = int(data['offset'])
+            sketch._counts = data['counts'].astype(_np.int64)
+
+        return sketch
+
+def build_sketch(df,
+                 parameter,
+                 resolution=None):
+
+    """
+    This function builds a quantile sketch of a parameter.
+
+    Trace amounts are left out like period_percentile.
+
+    Required Arguments:
+
+    1) df (Pandas.DataFrame) - The Pandas.DataFrame of xmACIS2 data.
+
+    2) parameter (String) - The parameter of interest.
+
+    Optional Arguments:
+
+    1) resolution (Float or None) - Default=None. The grid the values are snapped to.
+        When set to None, the default resolution for the parameter is used (see the Default Resolutions above).
+
+    Returns
+    -------
+
+    A QuantileSketch.
+    """
+
+    if resolution == None:
+        resolution = _default_resolutions.get(parameter, 1)
+
+    values = df[parameter].to_numpy(dtype=float, na_value=_np.nan)
+    values = values[values != 0.001]
+
+    return QuantileSketch(resolution=resolution).update(values)
+
+def merge_sketches(sketches):
+
+    """
+    This function merges sketches into a new sketch.
+
+    Required Arguments:
+
+    1) sketches (List) - A list of QuantileSketch objects with the same resolution.
+
+    Returns
+    -------
+
+    A new QuantileSketch with the counts of all of the sketches.
+    """
+
+    sketches = list(sketches)
+    if len(sketches) == 0:
+        raise ValueError("At least one sketch is needed.")
+
+    merged = QuantileSketch(resolution=sketches[0].resolution,
+                            max_bins=sketches[0].max_bins)
+    for sketch in sketches:
+        merged.merge(sketch)
+
+    return merged
+
+def _sketch_path(station,
+                 parameter,
+                 tag,
+                 path):
+
+    """
+    This function returns the file path of a persisted station sketch.
+    """
+
+    if path == 'default':
+        path = _update_csv_file_paths(station.upper(), 'Cache')
+    else:
+        try:
+            _os.makedirs(path)
+        except Exception as e:
+            pass
+
+    if tag != None:
+        fname = f"{station.upper()} {parameter} {tag}.npz"
+    else:
+        fname = f"{station.upper()} {parameter}.npz"
+
+    return f"{path}/{fname}"
+
+def save_station_sketch(sketch,
+                        station,
+                        parameter,
+                        tag=None,
+                        path='default'):
+
+    """
+    This function saves a station's sketch with the station's cached data.
+
+    The StationCache removes the saved sketches of a station whenever it downloads days of the station again, so a sketch never outlives
+    the data it was built from.
+
+    Required Arguments:
+
+    1) sketch (QuantileSketch) - The sketch.
+
+    2) station (String) - The station ID.
+
+    3) parameter (String) - The parameter of the sketch.
+
+    Optional Arguments:
+
+    1) tag (String or None) - Default=None. An extra label for the file name (i.e. the period of record '1900-01-01 2025-12-31').
+
+    2) path (String) - Default='default'. If set to 'default' the path will be "ACIS Data/{station}/Cache" (the folder of the StationCache).
+
+    Returns
+    -------
+
+    The file path of the saved sketch.
+    """
+
+    fname = _sketch_path(station, parameter, tag, path)
+    sketch.save(fname)
+
+    return fname
+
+def _saved_sketch_fresh(fname,
+                        end_date,
+                        now):
+
+    """
+    This function applies the freshness policy of the StationCache to a saved sketch that was built without a cache.
+
+    The sketch file is written right after its data is downloaded, so its modification time is the download time. A sketch whose period
+    ended within the horizon when it was downloaded holds days xmACIS2 can still revise, and it expires after the time to live.
+    """
+
+    from xmacis2py.data_access.station_cache import _horizon_days, _ttl
+
+    fetched = _os.path.getmtime(fname)
+    end = _pd.Timestamp(end_date).timestamp()
+    revisable = (fetched - end) <= _horizon_days * 86400
+    expired = (now - fetched) > _ttl
+
+    return (revisable and expired) == False
+
+def load_station_sketch(station,
+                        parameter,
+                        tag=None,
+                        path='default'):
+
+    """
+    This function loads a station's saved sketch.
+
+    Required Arguments:
+
+    1) station (String) - The station ID.
+
+    2) parameter (String) - The parameter of the sketch.
+
+    Optional Arguments:
+
+    1) tag (String or None) - Default=None. The extra label the sketch was saved with.
+
+    2) path (String) - Default='default'. If set to 'default' the path will be "ACIS Data/{station}/Cache" (the folder of the StationCache).
+
+    Returns
+    -------
+
+    The QuantileSketch or None if no sketch has been saved.
+    """
+
+    fname = _sketch_path(station, parameter, tag, path)
+    if _os.path.exists(fname) == False:
+        return None
+
+    return QuantileSketch.load(fname)
+
+def pooled_sketch(stations,
+                  parameter,
+                  start_date,
+                  end_date,
+                  resolution=None,
+                  use_saved=True,
+                  save=True,
+                  proxies=None,
+                  notifications='off',
+                  cache=None):
+
+    """
+    This function builds one sketch for a parameter pooled across many stations.
+
+    The stations are downloaded one at a time. Each station's sketch is saved with the station's cached data and the sketches are merged,
+    so only one station's data is ever held in memory. Stations that already have a saved sketch for the same period are not downloaded again.
+
+    When a StationCache is passed, the data comes from the cache and a saved sketch is only reused while its whole period is fresh in the cache.
+    Otherwise the cache downloads the expired days, which removes the station's saved sketches, and the sketch is rebuilt from the refreshed data.
+    Without a StationCache the same policy is applied to the saved sketch itself: a sketch whose period was within the horizon (60 days) of its
+    download is rebuilt once it is older than the time to live (6 hours).
+
+    Required Arguments:
+
+    1) stations (List) - The station IDs.
+
+    2) parameter (String) - The parameter of interest.
+
+    3) start_date (String) - The start date in the format 'YYYY-mm-dd'.
+
+    4) end_date (String) - The end date in the format 'YYYY-mm-dd'.
+
+    Optional Arguments:
+
+    1) resolution (Float or None) - Default=None. The grid the values are snapped to.
+        When set to None, the default resolution for the parameter is used.
+
+    2) use_saved (Boolean) - Default=True. When set to True, saved station sketches for the same period are reused.
+
+    3) save (Boolean) - Default=True. When set to True, each station's sketch is saved.
+
+    4) proxies (dict or None) - Default=None. If the user is using proxy server(s), the user must change the following:
+
+       proxies=None ---> proxies={
+                           'http':'http://url',
+                           'https':'https://url'
+                        }
+
+    5) notifications (String) - Default='off'. Passed to get_data.
+
+    6) cache (StationCache or None) - Default=None. When set, the stations are read through the cache and the sketches are saved in the cache's folders.
+
+    Returns
+    -------
+
+    The merged QuantileSketch. Call quantile() on it for the pooled percentiles.
+    """
+
+    from xmacis2py.data_access.get_data import get_data as _get_data
+
+    if resolution == None:
+        resolution = _default_resolutions.get(parameter, 1)
+
+    tag = f"{start_date} {end_date} {resolution}"
+    merged = QuantileSketch(resolution=resolution)
+
+    for station in stations:
+        if cache != None:
+            path = cache.folder(station)
+        else:
+            path = 'default'
+
+        sketch = None
+        if use_saved == True:
+            if cache != None:
+                if cache.fresh(station, start_date=start_date, end_date=end_date) == True:
+                    sketch = load_station_sketch(station, parameter, tag=tag, path=path)
+            else:
+                fname = _sketch_path(station, parameter, tag, path)
+                if _os.path.exists(fname) == True and _saved_sketch_fresh(fname, end_date, _time.time()) == True:
+                    sketch = QuantileSketch.load(fname)
+
+        if sketch == None:
+            if cache != None:
+                df = cache.get(station,
+                               start_date=start_date,
+                               end_date=end_date)
+            else:
+                df = _get_data(station,
+                               start_date=start_date,
+                               end_date=end_date,
+                               proxies=proxies,
+                               notifications=notifications)
+            sketch = build_sketch(df, parameter, resolution=resolution)
+            del df
+            if save == True:
+                save_station_sketch(sketch, station, parameter, tag=tag, path=path)
+
+        merged.merge(sketch)
+
+    return merged
@@ -0,0 +1,563 @@
+"""
+This file hosts the xmacis2py command line tool.
+
+Commands
+--------
+
+xmacis2py serve - Runs the headless render service (see xmacis2py.service).
+
+xmacis2py report - Renders the graphics products of many stations into a single multi-page PDF file in ACIS Reports
+    (see xmacis2py.graphics.report).
+
+xmacis2py render - Downloads the data of many stations and renders the graphics products of each station in parallel.
+
+    The data is downloaded with --fetch-jobs threads (the downloads wait on the network) and the graphics are rendered with --jobs
+    processes (rendering keeps a core busy), so the two are set separately. A station's products are rendered as soon as its data
+    arrives, while the other stations are still downloading. The render processes are started by a fork server (spawned where there is
+    none) rather than forked, since forking while the download threads hold locks can leave a worker stuck on a copied lock.
+
+    With --skip-up-to-date, a product is skipped when it was already rendered from the same data with the same options and its files
+    still exist. The data of each rendered product is recorded in ACIS Graphics/render_manifest.json.
+
+    The exit status is 1 when a station or product failed and 0 otherwise.
+
+Usage
+-----
+
+xmacis2py render --stations stations.txt --products all --start 2025-01-01 --end 2025-03-31 --jobs 16
+xmacis2py render --stations KRAL,KONT,KSAN --products maximum_temperature,precipitation --days 90
+xmacis2py render --stations stations.txt --skip-up-to-date --metrics /var/lib/node_exporter/textfile/xmacis2py.prom
+xmacis2py report --stations stations.txt --start 2025-10-01 --end 2025-10-31 --title "Inland Empire October 2025"
+
+The stations file lists station IDs separated by commas, spaces or new lines. Lines starting with # are comments.
+
+(C) Eric J. Drewitz 2025-2026
+"""
+
+import argparse as _argparse
+import concurrent.futures as _futures
+import contextlib as _contextlib
+import hashlib as _hashlib
+import io as _io
+import json as _json
+import multiprocessing as _multiprocessing
+import os as _os
+import sys as _sys
+import time as _time
+import traceback as _traceback
+import warnings as _warnings
+_warnings.filterwarnings('ignore')
+
+from xmacis2py.graphics.products import _products, _fixed_style, read_products
+
+_manifest_name = 'render_manifest.json'
+
+def read_stations(stations):
+
+    """
+    This function reads the station IDs of the --stations option.
+
+    Required Arguments:
+
+    1) stations (String) - A file listing station IDs or a comma separated list of station IDs.
+
+    Returns
+    -------
+
+    A list of upper case station IDs without duplicates, in the order they are listed.
+    """
+
+    if _os.path.isfile(stations):
+        with open(stations, 'r') as f:
+            lines = [line.split('#')[0] for line in f]
+        text = ' '.join(lines)
+    elif '.' in stations or '/' in stations or '\\' in stations:
+        raise FileNotFoundError(f"The stations file {stations} does not exist.")
+    else:
+        text = stations
+
+    ids = []
+    for station in text.replace(',', ' ').split():
+        station = station.strip().upper()
+        if station != '' and station not in ids:
+            ids.append(station)
+
+    return ids
+
+def data_fingerprint(df):
+
+    """
+    This function returns a hash of the contents of a Pandas.DataFrame.
+    """
+
+    import pandas as _pd
+
+    values = _pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+    return _hashlib.blake2b(values.tobytes(), digest_size=16).hexdigest()
+
+def _init_worker(folder,
+                 metrics_file):
+
+    """
+    This function sets up a render process.
+    """
+
+    import matplotlib as _mpl
+    _mpl.use('Agg')
+
+    import xmacis2py.utils.file_funcs as _file_funcs
+    _file_funcs.folder_modified = folder
+
+    if metrics_file != None:
+        import xmacis2py.utils.metrics as _metrics
+        _metrics.enable_metrics(metrics_file)
+
+def _render(station,
+            product,
+            df,
+            kwargs):
+
+    """
+    This function renders one product of one station in a render process.
+
+    Returns
+    -------
+
+    A dictionary with the keys 'seconds', 'files' and 'error'.
+    """
+
+    import matplotlib.pyplot as _plt
+    import xmacis2py.graphics.temperature as _temperature
+    import xmacis2py.graphics.precipitation as _precipitation
+    import xmacis2py.utils.tracing as _tracing
+
+    module, function, label = _products[product]
+    if module == 'temperature':
+        plot = getattr(_temperature, function)
+    else:
+        plot = getattr(_precipitation, function)
+
+    start = _time.perf_counter()
+    error = None
+    # The command reports the progress, so the messages of the plot functions are not printed.
+    with _tracing.recording() as recorder, _contextlib.redirect_stdout(_io.StringIO()):
+        try:
+            plot(station, df=df, **kwargs)
+        except Exception as e:
+            error = ''.join(_traceback.format_exception_only(type(e), e)).strip()
+        finally:
+            _plt.close('all')
+
+    files = [record['path'] for record in recorder.records if record['kind'] == 'write']
+
+    return {
+        'seconds':_time.perf_counter() - start,
+        'files':files,
+        'error':error
+    }
+
+class _Manifest:
+
+    """
+    This class records the data and files of every rendered product so products rendered from the same data can be skipped.
+    """
+
+    def __init__(self, fname):
+
+        self.fname = fname
+        try:
+            with open(fname, 'r') as f:
+                self.entries = _json.load(f)
+        except Exception as e:
+            self.entries = {}
+
+    def up_to_date(self,
+                   key,
+                   fingerprint):
+
+        entry = self.entries.get(key)
+        if entry == None or entry['data'] != fingerprint or len(entry['files']) == 0:
+            return False
+
+        return all([_os.path.exists(fname) for fname in entry['files']])
+
+    def record(self,
+               key,
+               fingerprint,
+               files):
+
+        self.entries[key] = {
+            'data':fingerprint,
+            'files':files,
+            'rendered':_time.strftime('%Y-%m-%dT%H:%M:%S')
+        }
+
+    def save(self):
+
+        with open(f"{self.fname}.tmp", 'w') as f:
+            _json.dump(self.entries, f, indent=1, sort_keys=True)
+        _os.replace(f"{self.fname}.tmp", self.fname)
+
+def _window_label(args):
+
+    if args.start != None:
+        return f"{args.start} to {args.end}"
+
+    return f"{args.days} Day"
+
+def _fetch(station,
+           args,
+           proxies,
+           cache):
+
+    """
+    This function downloads the data of one station.
+    """
+
+    if cache != None:
+        if args.start != None:
+            return cache.get(station, start_date=args.start, end_date=args.end)
+        return cache.get(station, from_when=args.from_when, time_delta=args.days)
+
+    from xmacis2py.data_access.get_data import get_data as _get_data
+
+    if args.start != None:
+        return _get_data(station, start_date=args.start, end_date=args.end, proxies=proxies, notifications='off')
+
+    return _get_data(station, from_when=args.from_when, time_delta=args.days, proxies=proxies, notifications='off')
+
+def _plot_kwargs(product,
+                 args,
+                 proxies):
+
+    """
+    This function returns the keyword arguments of a plot function for the command line options.
+    """
+
+    kwargs = {
+        'product_type':f"{_products[product][2]} {_window_label(args)} Summary",
+        'proxies':proxies,
+        'notifications':'off'
+    }
+    if args.x_axis_day_interval != None:
+        kwargs['x_axis_day_interval'] = args.x_axis_day_interval
+    if product not in _fixed_style:
+        kwargs['plot_type'] = args.plot_type
+        kwargs['detrend_series'] = args.detrend
+
+    return kwargs
+
+def _progress(args,
+              done,
+              total,
+              text):
+
+    if args.quiet == False:
+        print(f"[{done}/{total}] {text}", file=_sys.stderr, flush=True)
+
+def render(args):
+
+    """
+    This function runs the render command.
+
+    Required Arguments:
+
+    1) args (argparse.Namespace) - The parsed options of the render command.
+
+    Returns
+    -------
+
+    The exit status: 1 if a station or product failed and 0 otherwise.
+    """
+
+    import xmacis2py.utils.file_funcs as _file_funcs
+
+    stations = read_stations(args.stations)
+    products = read_products(args.products)
+    if len(stations) == 0:
+        print("No stations to render.", file=_sys.stderr)
+        return 1
+    if (args.start == None) != (args.end == None):
+        print("Pass both --start and --end, or neither.", file=_sys.stderr)
+        return 1
+
+    if args.output_dir != None:
+        _file_funcs.folder_modified = _os.path.abspath(args.output_dir).replace("\\", "/")
+    folder = _file_funcs.folder_modified
+
+    proxies = None
+    if args.proxy != None:
+        proxies = {
+            'http':args.proxy,
+            'https':args.proxy
+        }
+
+    cache = None
+    if args.cache == True:
+        from xmacis2py.data_access.station_cache import StationCache as _StationCache
+        cache = _StationCache(proxies=proxies)
+
+    if args.metrics != None:
+        import xmacis2py.utils.metrics as _metrics
+        _metrics.enable_metrics(args.metrics, reset=True)
+
+    try:
+        _os.makedirs(f"{folder}/ACIS Graphics")
+    except Exception as e:
+        pass
+    manifest = _Manifest(f"{folder}/ACIS Graphics/{_manifest_name}")
+
+    total = len(stations) * len(products)
+    done = 0
+    counts = {
+        'rendered':0,
+        'skipped':0,
+        'failed':0
+    }
+    failures = []
+    started = _time.perf_counter()
+
+    if 'forkserver' in _multiprocessing.get_all_start_methods():
+        context = _multiprocessing.get_context('forkserver')
+    else:
+        context = _multiprocessing.get_context('spawn')
+
+    with _futures.ThreadPoolExecutor(max_workers=args.fetch_jobs) as fetchers, \
+         _futures.ProcessPoolExecutor(max_workers=args.jobs,
+                                      mp_context=context,
+                                      initializer=_init_worker,
+                                      initargs=(folder, args.metrics)) as renderers:
+
+        pending = {}
+        for station in stations:
+            pending[fetchers.submit(_fetch, station, args, proxies, cache)] = ('fetch', station, None, None)
+
+        while len(pending) > 0:
+
+            finished, _ = _futures.wait(list(pending), return_when=_futures.FIRST_COMPLETED)
+
+            for future in finished:
+
+                stage, station, product, key = pending.pop(future)
+
+                if stage == 'fetch':
+                    try:
+                        df = future.result()
+                    except Exception as e:
+                        error = ''.join(_traceback.format_exception_only(type(e), e)).strip()
+                        for product in products:
+                            done += 1
+                            counts['failed'] += 1
+                            failures.append((station, product, f"Download failed: {error}"))
+                            _progress(args, done, total, f"{station} {product} failed (download)")
+                        continue
+
+                    fingerprint = data_fingerprint(df)
+                    for product in products:
+                        kwargs = _plot_kwargs(product, args, proxies)
+                        key = f"{station} | {product} | {_window_label(args)} | {_json.dumps(kwargs, sort_keys=True, default=str)}"
+                        if args.skip_up_to_date == True and manifest.up_to_date(key, fingerprint) == True:
+                            done += 1
+                            counts['skipped'] += 1
+                            _progress(args, done, total, f"{station} {product} up to date")
+                            continue
+                        render_future = renderers.submit(_render, station, product, df, kwargs)
+                        pending[render_future] = ('render', station, product, (key, fingerprint))
+
+                else:
+                    done += 1
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = {
+                            'seconds':0.0,
+                            'files':[],
+                            'error':''.join(_traceback.format_exception_only(type(e), e)).strip()
+                        }
+
+                    if result['error'] != None:
+                        counts['failed'] += 1
+                        failures.append((station, product, result['error']))
+                        _progress(args, done, total, f"{station} {product} failed")
+                    else:
+                        counts['rendered'] += 1
+                        manifest.record(key[0], key[1], result['files'])
+                        _progress(args, done, total, f"{station} {product} rendered in {result['seconds']:.1f} s")
+
+    manifest.save()
+
+    # Writes the metrics file one last time and removes the exporter, so later work in this process is not counted.
+    if args.metrics != None:
+        _metrics.disable_metrics()
+
+    print(f"Rendered {counts['rendered']}, skipped {counts['skipped']} and failed {counts['failed']} of {total} products "
+          f"for {len(stations)} stations in {_time.perf_counter() - started:.1f} s.")
+    if len(failures) > 0:
+        print(f"\nFailures:")
+        for station, product, error in failures:
+            print(f"  {station} {product}: {error}")
+        return 1
+
+    return 0
+
+def report(args):
+
+    """
+    This function runs the report command.
+
+    Required Arguments:
+
+    1) args (argparse.Namespace) - The parsed options of the report command.
+
+    Returns
+    -------
+
+    The exit status: 1 if a station or product failed and 0 otherwise.
+    """
+
+    import xmacis2py.utils.file_funcs as _file_funcs
+
+    stations = read_stations(args.stations)
+    products = read_products(args.products)
+    if len(stations) == 0:
+        print("No stations for the report.", file=_sys.stderr)
+        return 1
+    if (args.start == None) != (args.end == None):
+        print("Pass both --start and --end, or neither.", file=_sys.stderr)
+        return 1
+
+    if args.output_dir != None:
+        _file_funcs.folder_modified = _os.path.abspath(args.output_dir).replace("\\", "/")
+
+    proxies = None
+    if args.proxy != None:
+        proxies = {
+            'http':args.proxy,
+            'https':args.proxy
+        }
+
+    import matplotlib as _mpl
+    _mpl.use('Agg')
+    from xmacis2py.graphics.report import build_report as _build_report
+
+    started = _time.perf_counter()
+    result = _build_report(stations,
+                           products=products,
+                           title=args.title if args.title != None else 'default',
+                           filename=args.filename if args.filename != None else 'default',
+                           start_date=args.start,
+                           end_date=args.end,
+                           from_when=args.from_when,
+                           time_delta=args.days,
+                           proxies=proxies,
+                           fetch_jobs=args.fetch_jobs,
+                           dashboards=args.no_dashboards == False,
+                           create_ranking_table=args.no_tables == False,
+                           plot_type=args.plot_type,
+                           detrend_series=args.detrend,
+                           x_axis_day_interval=args.x_axis_day_interval if args.x_axis_day_interval != None else 5)
+
+    print(f"Wrote {result['pages']} pages for {len(stations)} stations in {_time.perf_counter() - started:.1f} s.")
+    if len(result['failures']) > 0:
+        print(f"\nFailures:")
+        for station, product, error in result['failures']:
+            print(f"  {station} {product}: {error}")
+        return 1
+
+    return 0
+
+def main(argv=None):
+
+    """
+    This function is the entry point of the xmacis2py command.
+
+    Optional Arguments:
+
+    1) argv (String List) - Default=None. The command line arguments. When set to None, the arguments of the process are used.
+
+    Returns
+    -------
+
+    The exit status.
+    """
+
+    parser = _argparse.ArgumentParser(prog='xmacis2py', description='xmACIS2Py command line tools.')
+    commands = parser.add_subparsers(dest='command')
+
+    renderer = commands.add_parser('render', help='Render the graphics products of many stations.')
+    renderer.add_argument('--stations', required=True, help='A file listing station IDs, or a comma separated list of station IDs.')
+    renderer.add_argument('--products', default='all', help=f"'all' or a comma separated list of: {', '.join(_products)}.")
+    renderer.add_argument('--start', default=None, help='The start date (YYYY-mm-dd). Pass with --end.')
+    renderer.add_argument('--end', default=None, help='The end date (YYYY-mm-dd). Pass with --start.')
+    renderer.add_argument('--days', type=int, default=30, help='Without --start and --end, the number of days ending at --from-when (default: 30).')
+    renderer.add_argument('--from-when', default=None, help='Without --start and --end, the last day (default: yesterday).')
+    renderer.add_argument('--jobs', type=int, default=_os.cpu_count(), help='The number of render processes (default: the number of CPUs).')
+    renderer.add_argument('--fetch-jobs', type=int, default=8, help='The number of concurrent downloads (default: 8).')
+    renderer.add_argument('--plot-type', default='bar', choices=['bar', 'line'], help='The plot type (default: bar).')
+    renderer.add_argument('--detrend', action='store_true', help='Detrend the data.')
+    renderer.add_argument('--x-axis-day-interval', type=int, default=None, help='The number of days between the date labels.')
+    renderer.add_argument('--skip-up-to-date', action='store_true', help='Skip products already rendered from the same data with the same options.')
+    renderer.add_argument('--cache', action='store_true', help='Download through the station cache (ACIS Data/{station}/Cache).')
+    renderer.add_argument('--output-dir', default=None, help='The folder the ACIS Graphics folder is created in (default: the current folder).')
+    renderer.add_argument('--proxy', default=None, help='A proxy server URL for the downloads.')
+    renderer.add_argument('--metrics', default=None, help='Write Prometheus metrics of the run to this file.')
+    renderer.add_argument('--quiet', action='store_true', help='Only print the summary.')
+
+    server = commands.add_parser('serve', help='Run the render service (see xmacis2py.service).')
+    server.add_argument('--host', default='127.0.0.1', help='The address to listen on (default: 127.0.0.1, this machine only).')
+    server.add_argument('--port', type=int, default=8787, help='The port to listen on (default: 8787).')
+    server.add_argument('--workers', type=int, default=None, help='The number of worker processes (default: the number of CPUs up to 4).')
+    server.add_argument('--no-warm', action='store_true', help='Skip the warm-up graphic of each worker.')
+    server.add_argument('--proxy', default=None, help='A proxy server URL for the downloads.')
+    server.add_argument('--timeout', type=float, default=120, help='The number of seconds a request may take (default: 120).')
+
+    reporter = commands.add_parser('report', help='Render the graphics products of many stations into one PDF report.')
+    reporter.add_argument('--stations', required=True, help='A file listing station IDs, or a comma separated list of station IDs.')
+    reporter.add_argument('--products', default='all', help=f"'all' or a comma separated list of: {', '.join(_products)}.")
+    reporter.add_argument('--start', default=None, help='The start date (YYYY-mm-dd). Pass with --end.')
+    reporter.add_argument('--end', default=None, help='The end date (YYYY-mm-dd). Pass with --start.')
+    reporter.add_argument('--days', type=int, default=30, help='Without --start and --end, the number of days ending at --from-when (default: 30).')
+    reporter.add_argument('--from-when', default=None, help='Without --start and --end, the last day (default: yesterday).')
+    reporter.add_argument('--fetch-jobs', type=int, default=8, help='The number of concurrent downloads (default: 8).')
+    reporter.add_argument('--title', default=None, help='The title on the cover page.')
+    reporter.add_argument('--filename', default=None, help='The file name of the report without .pdf (default: the title).')
+    reporter.add_argument('--no-dashboards', action='store_true', help='Leave out the station dashboards.')
+    reporter.add_argument('--no-tables', action='store_true', help='Leave out the stats tables.')
+    reporter.add_argument('--plot-type', default='bar', choices=['bar', 'line'], help='The plot type (default: bar).')
+    reporter.add_argument('--detrend', action='store_true', help='Detrend the data.')
+    reporter.add_argument('--x-axis-day-interval', type=int, default=None, help='The number of days between the date labels.')
+    reporter.add_argument('--output-dir', default=None, help='The folder the ACIS Reports folder is created in (default: the current folder).')
+    reporter.add_argument('--proxy', default=None, help='A proxy server URL for the downloads.')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'serve':
+        from xmacis2py.service import RenderService as _RenderService
+        proxies = None
+        if args.proxy != None:
+            proxies = {
+                'http':args.proxy,
+                'https':args.proxy
+            }
+        _RenderService(host=args.host,
+                       port=args.port,
+                       workers=args.workers,
+                       warm=args.no_warm == False,
+                       proxies=proxies,
+                       timeout=args.timeout).serve_forever()
+        return 0
+
+    if args.command in ['render', 'report']:
+        if args.from_when == None:
+            from xmacis2py.data_access.get_data import _yesterday
+            args.from_when = _yesterday
+        if args.command == 'report':
+            return report(args)
+        return render(args)
+
+    parser.print_help()
+    return 1
+
+if __name__ == '__main__':
+    _sys.exit(main())
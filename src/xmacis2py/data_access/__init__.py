@@ -1 +1,8 @@
-from xmacis2py.data_access.get_data import get_data
\ No newline at end of file
+from xmacis2py.data_access.get_data import get_data, get_data_async, set_async_concurrency_limit
+from xmacis2py.data_access.period_of_record import get_period_of_record
+from xmacis2py.data_access.station_cache import StationCache
+import xmacis2py.data_access.compact as compact
+import xmacis2py.data_access.archive as archive
+import xmacis2py.data_access.shared as shared
+import xmacis2py.data_access.replay as replay
+import xmacis2py.data_access.synthetic as synthetic
\ No newline at end of file
@@ -0,0 +1,275 @@
+"""
+This file hosts the memory-mapped station archive.
+
+Each station is stored as one fixed-width binary file per parameter (little-endian float64, one value per day with missing days as NaN
+and trace amounts as 0.001 exactly like get_data) plus a small JSON header with the date of the first value (the origin).
+Since every day has a fixed position, the row of any date is (date - origin) in days and no dates are stored at all.
+
+Opening an archive only reads the header. The parameter files are opened with numpy.memmap, so a date window is a zero-copy view
+of the file and only the pages that are touched are read from disk. Many worker processes that open the same archive share the
+operating system's page cache instead of each parsing its own CSV file.
+
+Archive Layout
+--------------
+
+ACIS Data/{station}/Archive/archive.json
+ACIS Data/{station}/Archive/{parameter}.f8
+
+Archive Tools:
+
+- write_archive
+- open_archive
+- StationArchive
+
+(C) Eric J. Drewitz 2025-2026
+"""
+
+import json as _json
+import os as _os
+import warnings as _warnings
+import numpy as _np
+import pandas as _pd
+_warnings.filterwarnings('ignore')
+
+from xmacis2py.utils.file_funcs import update_csv_file_paths as _update_csv_file_paths
+
+_dtype = '<f8'
+_header_name = 'archive.json'
+
+def _archive_path(station,
+                  path):
+
+    """
+    This function returns the directory of a station archive.
+    """
+
+    if path == 'default':
+        return _update_csv_file_paths(station.upper(), 'Archive')
+
+    try:
+        _os.makedirs(path)
+    except Exception as e:
+        pass
+
+    return path
+
+def _file_name(parameter):
+
+    """
+    This function returns the file name of a parameter in the archive.
+    """
+
+    return f"{parameter}.f8"
+
+def write_archive(df,
+                  station,
+                  path='default',
+                  date_name='Date'):
+
+    """
+    This function writes a Pandas.DataFrame of xmACIS2 data to a station archive, replacing any existing archive.
+
+    Days that are not in the dataframe are stored as missing, so the archive always has one value per day from the first
+    to the last date. Each file is written to a temporary name and renamed into place, and the header is written last,
+    so processes that already have the archive open keep reading the old files.
+
+    Required Arguments:
+
+    1) df (Pandas.DataFrame) - The Pandas.DataFrame of xmACIS2 data.
+
+    2) station (String) - The station ID.
+
+    Optional Arguments:
+
+    1) path (String) - Default='default'. If set to 'default' the path will be "ACIS Data/{station}/Archive".
+
+    2) date_name (String) - Default='Date'. The name of the column with the dates.
+
+    Returns
+    -------
+
+    The directory of the archive.
+    """
+
+    path = _archive_path(station, path)
+
+    dates = _pd.to_datetime(df[date_name]).to_numpy().astype('datetime64[D]')
+    if len(dates) == 0:
+        raise ValueError("Cannot write an archive from an empty dataframe.")
+
+    origin = dates.min()
+    length = int((dates.max() - origin).astype(int)) + 1
+    positions = (dates - origin).astype(_np.int64)
+
+    parameters = [column for column in df.columns if column != date_name]
+
+    for parameter in parameters:
+        values = _np.full(length, _np.nan, dtype=_dtype)
+        values[positions] = _pd.to_numeric(df[parameter], errors='coerce').to_numpy(dtype=float, na_value=_np.nan)
+
+        fname = f"{path}/{_file_name(parameter)}"
+        values.tofile(f"{fname}.tmp")
+        _os.replace(f"{fname}.tmp", fname)
+
+    header = {
+        'station':station.upper(),
+        'origin':str(origin),
+        'length':length,
+        'dtype':_dtype,
+        'parameters':parameters
+    }
+
+    with open(f"{path}/{_header_name}.tmp", 'w') as f:
+        _json.dump(header, f, indent=4)
+    _os.replace(f"{path}/{_header_name}.tmp", f"{path}/{_header_name}")
+
+    return path
+
+def open_archive(station,
+                 path='default'):
+
+    """
+    This function opens a station archive.
+
+    Required Arguments:
+
+    1) station (String) - The station ID.
+
+    Optional Arguments:
+
+    1) path (String) - Default='default'. If set to 'default' the path will be "ACIS Data/{station}/Archive".
+
+    Returns
+    -------
+
+    A StationArchive.
+    """
+
+    path = _archive_path(station, path)
+    fname = f"{path}/{_header_name}"
+    if _os.path.exists(fname) == False:
+        raise FileNotFoundError(f"There is no archive for {station.upper()} at {path}.")
+
+    with open(fname, 'r') as f:
+        header = _json.load(f)
+
+    return StationArchive(path, header)
+
+class StationArchive:
+
+    """
+    This class is an open station archive. Create one with open_archive().
+
+    Attributes
+    ----------
+
+    station (String) - The station ID.
+
+    origin (Pandas.Timestamp) - The date of the first value.
+
+    end (Pandas.Timestamp) - The date of the last value.
+
+    length (Integer) - The number of days.
+
+    parameters (List) - The parameters in the archive.
+
+    Methods
+    -------
+
+    column(parameter) - The whole record of a parameter as a read-only numpy.memmap.
+
+    window(start_date=None, end_date=None, parameters=None, date_name='Date') - A Pandas.DataFrame of a date window
+        whose parameter columns are zero-copy views of the archive. It can be passed to any of the analysis tools.
+    """
+
+    def __init__(self,
+                 path,
+                 header):
+
+        self.path = path
+        self.station = header['station']
+        self.origin = _pd.Timestamp(header['origin'])
+        self.length = int(header['length'])
+        self.end = self.origin + _pd.Timedelta(days=self.length - 1)
+        self.parameters = list(header['parameters'])
+        self._dtype = header['dtype']
+        self._columns = {}
+
+    def column(self,
+               parameter):
+
+        """
+        This method opens the whole record of a parameter.
+
+        Required Arguments:
+
+        1) parameter (String) - The parameter of interest.
+
+        Returns
+        -------
+
+        A read-only numpy.memmap with one value per day starting at the origin.
+        """
+
+        if parameter not in self.parameters:
+            raise KeyError(f"{parameter} is not in the archive for {self.station}.")
+
+        if parameter not in self._columns:
+            self._columns[parameter] = _np.memmap(f"{self.path}/{_file_name(parameter)}",
+                                                  dtype=self._dtype,
+                                                  mode='r',
+                                                  shape=(self.length,))
+
+        return self._columns[parameter]
+
+    def _position(self,
+                  date,
+                  default):
+
+        """
+        This method converts a date into a row of the archive.
+        """
+
+        if date == None:
+            return default
+
+        return (_pd.Timestamp(date) - self.origin).days
+
+    def window(self,
+               start_date=None,
+               end_date=None,
+               parameters=None,
+               date_name='Date'):
+
+        """
+        This method returns a date window of the archive.
+
+        Optional Arguments:
+
+        1) start_date (String or Datetime) - Default=None. The first date of the window. When set to None, the window starts at the origin.
+
+        2) end_date (String or Datetime) - Default=None. The last date of the window (inclusive). When set to None, the window ends at the
+            last date of the archive.
+
+        3) parameters (List or None) - Default=None. The parameters to include. When set to None, every parameter is included.
+
+        4) date_name (String) - Default='Date'. The name of the column with the dates.
+
+        Returns
+        -------
+
+        A Pandas.DataFrame whose parameter columns are read-only views of the archive (nothing is copied or read until it is used).
+        """
+
+        start = min(max(self._position(start_date, 0), 0), self.length)
+        end = min(max(self._position(end_date, self.length - 1) + 1, start), self.length)
+
+        if parameters == None:
+            parameters = self.parameters
+
+        columns = {}
+        columns[date_name] = _pd.date_range(self.origin + _pd.Timedelta(days=start), periods=end - start, freq='D')
+        for parameter in parameters:
+            columns[parameter] = self.column(parameter)[start:end]
+
+        return _pd.DataFrame(columns, copy=False)
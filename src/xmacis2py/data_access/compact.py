@@ -0,0 +1,222 @@
+"""
+This file hosts the compact in-memory form of the xmACIS2 Pandas.DataFrame.
+
+get_data returns every parameter as float64 with missing days as NaN and trace amounts as 0.001.
+The compact form holds the same data in about a quarter of the memory:
+
+1) Parameters that are always whole numbers (temperatures, degree days and snow depth) are stored as nullable 16-bit integers (Int16).
+
+2) All other parameters (i.e. precipitation, snowfall and fractional departures) are stored as 32-bit floats.
+
+3) The dates are stored as datetime64.
+
+4) Missing ('M') and trace ('T') days are recorded as bit flags in two 16-bit columns, 'Missing Flags' and 'Trace Flags', with one bit
+   per parameter (bit 0 is 'Maximum Temperature' and so on in the order of the parameters below). Missing values are also left as
+   NA in the parameter columns and trace amounts are stored as 0.
+
+0.001 cannot be stored exactly in a 32-bit float, so the trace flags are what preserve the trace amounts. The analysis tools expect the
+standard form: call expand_dataframe() before running the analysis tools on a compact dataframe.
+
+Parameter Order
+---------------
+
+0) 'Maximum Temperature'
+1) 'Minimum Temperature'
+2) 'Average Temperature'
+3) 'Average Temperature Departure'
+4) 'Heating Degree Days'
+5) 'Cooling Degree Days'
+6) 'Precipitation'
+7) 'Snowfall'
+8) 'Snow Depth'
+9) 'Growing Degree Days'
+
+Compact Tools:
+
+- compact_dataframe
+- expand_dataframe
+- flag_mask
+
+(C) Eric J. Drewitz 2025-2026
+"""
+
+import warnings as _warnings
+import numpy as _np
+import pandas as _pd
+_warnings.filterwarnings('ignore')
+
+_parameters = ['Maximum Temperature',
+               'Minimum Temperature',
+               'Average Temperature',
+               'Average Temperature Departure',
+               'Heating Degree Days',
+               'Cooling Degree Days',
+               'Precipitation',
+               'Snowfall',
+               'Snow Depth',
+               'Growing Degree Days']
+
+_int16_min = _np.iinfo(_np.int16).min
+_int16_max = _np.iinfo(_np.int16).max
+
+def _is_compact(df):
+
+    """
+    This function checks if a dataframe is in the compact form.
+    """
+
+    return 'Missing Flags' in df.columns and 'Trace Flags' in df.columns
+
+def compact_dataframe(df,
+                      date_name='Date'):
+
+    """
+    This function converts a Pandas.DataFrame of xmACIS2 data into the compact form.
+
+    Required Arguments:
+
+    1) df (Pandas.DataFrame) - The Pandas.DataFrame of xmACIS2 data (as returned by get_data).
+
+    Optional Arguments:
+
+    1) date_name (String) - Default='Date'. The name of the column with the dates.
+
+    Returns
+    -------
+
+    A compact Pandas.DataFrame. Columns that are not xmACIS2 parameters are kept as they are.
+    """
+
+    if _is_compact(df):
+        return df
+
+    compact = _pd.DataFrame(index=df.index)
+    missing_flags = _np.zeros(len(df), dtype=_np.uint16)
+    trace_flags = _np.zeros(len(df), dtype=_np.uint16)
+
+    for column in df.columns:
+
+        if column == date_name:
+            compact[column] = _pd.to_datetime(df[column])
+            continue
+
+        if column not in _parameters:
+            compact[column] = df[column]
+            continue
+
+        bit = _np.uint16(1 << _parameters.index(column))
+        values = df[column].to_numpy(dtype=float, na_value=_np.nan)
+        missing = _np.isnan(values)
+        trace = values == 0.001
+
+        missing_flags[missing] |= bit
+        trace_flags[trace] |= bit
+
+        values = _np.where(trace, 0, values)
+        valid = values[~missing]
+
+        if len(valid) == 0 or (_np.all(valid == _np.round(valid)) and valid.min() >= _int16_min and valid.max() <= _int16_max):
+            compact[column] = _pd.arrays.IntegerArray(_np.where(missing, 0, values).astype(_np.int16), missing)
+        else:
+            compact[column] = values.astype(_np.float32)
+
+    compact['Missing Flags'] = missing_flags
+    compact['Trace Flags'] = trace_flags
+
+    return compact
+
+def expand_dataframe(df,
+                     date_name='Date'):
+
+    """
+    This function converts a compact Pandas.DataFrame back into the standard form get_data returns
+    (float64 parameters with missing days as NaN, trace amounts as 0.001 and the dates as datetime64).
+
+    The 32-bit floats are rounded to 4 decimal places on the way back, which restores the xmACIS2 values exactly.
+
+    Required Arguments:
+
+    1) df (Pandas.DataFrame) - The compact Pandas.DataFrame.
+
+    Optional Arguments:
+
+    1) date_name (String) - Default='Date'. The name of the column with the dates.
+
+    Returns
+    -------
+
+    A Pandas.DataFrame in the standard form.
+    """
+
+    if _is_compact(df) == False:
+        return df
+
+    missing_flags = df['Missing Flags'].to_numpy()
+    trace_flags = df['Trace Flags'].to_numpy()
+
+    expanded = _pd.DataFrame(index=df.index)
+
+    for column in df.columns:
+
+        if column in ['Missing Flags', 'Trace Flags']:
+            continue
+
+        if column == date_name:
+            expanded[column] = _pd.to_datetime(df[column])
+            continue
+
+        if column not in _parameters:
+            expanded[column] = df[column]
+            continue
+
+        bit = _np.uint16(1 << _parameters.index(column))
+        values = _np.round(df[column].to_numpy(dtype=float, na_value=_np.nan), 4)
+        values[(trace_flags & bit) != 0] = 0.001
+        values[(missing_flags & bit) != 0] = _np.nan
+
+        expanded[column] = values
+
+    return expanded
+
+def flag_mask(df,
+              parameter,
+              flag='M'):
+
+    """
+    This function returns the days flagged as missing or trace for a parameter.
+
+    Works on both the compact and the standard form.
+
+    Required Arguments:
+
+    1) df (Pandas.DataFrame) - The Pandas.DataFrame of xmACIS2 data.
+
+    2) parameter (String) - The parameter of interest.
+
+    Optional Arguments:
+
+    1) flag (String) - Default='M'. 'M' for missing days and 'T' for trace days.
+
+    Returns
+    -------
+
+    A boolean numpy array with one value per row.
+    """
+
+    flag = flag.upper()
+    if flag not in ['M', 'T']:
+        raise ValueError("flag must be 'M' or 'T'.")
+
+    if _is_compact(df) == True and parameter in _parameters:
+        bit = _np.uint16(1 << _parameters.index(parameter))
+        if flag == 'M':
+            flags = df['Missing Flags'].to_numpy()
+        else:
+            flags = df['Trace Flags'].to_numpy()
+        return (flags & bit) != 0
+
+    values = df[parameter].to_numpy(dtype=float, na_value=_np.nan)
+    if flag == 'M':
+        return _np.isnan(values)
+    else:
+        return values == 0.001
@@ -8,10 +8,18 @@ For more information on the xmACIS2 Client in the WxData Library, visit: https:/
 (C) Eric J. Drewitz 2025-2026
 """
 
+import asyncio as _asyncio
+import functools as _functools
+import threading as _threading
 import warnings as _warnings
+import weakref as _weakref
 _warnings.filterwarnings('ignore')
 # Imports the WxData library
 from wxdata import client as _client
+import xmacis2py.data_access.single_flight as _single_flight
+import xmacis2py.utils.tracing as _tracing
+from xmacis2py.data_access.compact import compact_dataframe as _compact_dataframe
+from concurrent.futures import CancelledError as _CancelledError
 from datetime import(
     datetime as _datetime,
     timedelta as _timedelta
@@ -35,8 +43,145 @@ else:
     else:
         _yesterday = f"{_year}-{_month}-0{_day}" 
 
+_async_lock = _threading.Lock()
+_async_settings = {
+    'limit':8
+}
+_async_semaphores = _weakref.WeakKeyDictionary()
+_async_tasks = set()
 
+def _run_flight(future,
+                key,
+                station,
+                start,
+                end,
+                proxies,
+                notifications):
 
+    """
+    This function makes the upstream request of a flight, hands the result (or the exception) to everyone waiting on it
+    and removes the flight.
+
+    Required Arguments:
+
+    1) future (concurrent.futures.Future) - The flight.
+
+    2) key (Tuple) - The key from single_flight.flight_key().
+
+    3) station (String) - The station ID.
+
+    4) start (Pandas.Timestamp) - The first date of the flight.
+
+    5) end (Pandas.Timestamp) - The last date of the flight.
+
+    6) proxies (dict or None) - The proxies.
+
+    7) notifications (String) - Passed to the xmACIS2 client.
+
+    Returns
+    -------
+
+    None
+    """
+
+    try:
+        with _tracing.span('fetch', station=station.upper()) as span:
+            df = _client.get_xmacis_data(station,
+                                         start_date=start.strftime('%Y-%m-%d'),
+                                         end_date=end.strftime('%Y-%m-%d'),
+                                         proxies=proxies,
+                                         notifications=notifications)
+            span.set(rows=len(df))
+        future.set_result(df)
+    except BaseException as e:
+        future.set_exception(e)
+    finally:
+        _single_flight.finish(key, start, end, future)
+
+def _flight_task(loop,
+                 executor,
+                 future,
+                 key,
+                 station,
+                 start,
+                 end,
+                 proxies,
+                 notifications):
+
+    """
+    This function starts the asyncio task that makes the upstream request of a flight.
+
+    The task may end before _run_flight() runs (i.e. it is cancelled while waiting for the semaphore when the event loop shuts down).
+    The flight is then settled with the error (a CancelledError when the task was cancelled) and removed, so the callers waiting on it
+    and later requests for the same station are never stranded. A claim lock makes sure only one of the two settles the flight.
+
+    Returns
+    -------
+
+    The asyncio.Task.
+    """
+
+    claim = _threading.Lock()
+
+    def flight():
+        if claim.acquire(blocking=False) == False:
+            return
+        _run_flight(future, key, station, start, end, proxies, notifications)
+
+    def settle(task):
+        _async_tasks.discard(task)
+        if claim.acquire(blocking=False) == False:
+            return
+        if task.cancelled() == True:
+            error = _CancelledError(f"The request for {station.upper()} was cancelled before it started.")
+        else:
+            error = task.exception()
+            if error == None:
+                error = _CancelledError(f"The request for {station.upper()} ended before it started.")
+        future.set_exception(error)
+        _single_flight.finish(key, start, end, future)
+
+    task = loop.create_task(_limited(loop, executor, flight))
+    _async_tasks.add(task)
+    task.add_done_callback(settle)
+
+    return task
+
+def _coalesced_fetch(station,
+                     window,
+                     proxies,
+                     notifications):
+
+    """
+    This function downloads a window of xmACIS2 data through the single-flight layer so that concurrent requests
+    for the same station and window (or a window inside an in-flight request) share one upstream request.
+
+    Required Arguments:
+
+    1) station (String) - The station ID.
+
+    2) window (Tuple) - The (start, end) dates from single_flight.resolve_dates().
+
+    3) proxies (dict or None) - The proxies.
+
+    4) notifications (String) - Passed to the xmACIS2 client.
+
+    Returns
+    -------
+
+    The caller's own copy of the Pandas.DataFrame of the window.
+    """
+
+    start, end = window
+    key = _single_flight.flight_key(station, proxies)
+    future, leader = _single_flight.join(key, start, end)
+
+    if leader == True:
+        _run_flight(future, key, station, start, end, proxies, notifications)
+
+    return _single_flight.slice_window(future.result(), start, end)
+
+@_tracing.traced('get_data', labels=['station'])
 def get_data(station,
             start_date=None,
             end_date=None,
@@ -47,8 +192,10 @@ def get_data(station,
             to_csv=False,
             path='default',
             filename='default',
-            notifications='on'):
-    
+            notifications='on',
+            compact=False,
+            coalesce=True):
+
     """
     This function is a client that downloads user-specified xmACIS2 data and returns a Pandas.DataFrame
     The user can also save the data as a CSV file in a specified location
@@ -92,9 +239,16 @@ def get_data(station,
        filename. 
        
     10) notifications (String) - Default='on'. When set to 'on' a print statement to the user will tell the user their file saved to the path
-        they specified. 
-        
-        
+        they specified.
+
+    11) compact (Boolean) - Default=False. When set to True, the data is returned in the compact form
+        (16-bit integers and 32-bit floats with missing and trace days recorded as bit flags) which uses about a quarter of the memory.
+        Use xmacis2py.data_access.compact.expand_dataframe() to convert it back before running the analysis tools.
+
+    12) coalesce (Boolean) - Default=True. When set to True, concurrent calls (from threads or asyncio tasks) for the same station and
+        window, or for a window inside a request that is already in flight, share one upstream request and each receive their own copy of the data.
+        Calls with to_csv=True or clear_recycle_bin=True are never coalesced.
+
     Returns
     -------
     
@@ -102,16 +256,167 @@ def get_data(station,
     """
     
     
-    df = _client.get_xmacis_data(station,
-                    start_date=start_date,
-                    end_date=end_date,
-                    from_when=from_when,
-                    time_delta=time_delta,
-                    proxies=proxies,
-                    clear_recycle_bin=clear_recycle_bin,
-                    to_csv=to_csv,
-                    path=path,
-                    filename=filename,
-                    notifications=notifications)
-    
+    window = None
+    if coalesce == True and to_csv == False and clear_recycle_bin == False:
+        window = _single_flight.resolve_dates(start_date, end_date, from_when, time_delta)
+
+    if window != None:
+        df = _coalesced_fetch(station, window, proxies, notifications)
+    else:
+        with _tracing.span('fetch', station=station.upper()) as span:
+            df = _client.get_xmacis_data(station,
+                            start_date=start_date,
+                            end_date=end_date,
+                            from_when=from_when,
+                            time_delta=time_delta,
+                            proxies=proxies,
+                            clear_recycle_bin=clear_recycle_bin,
+                            to_csv=to_csv,
+                            path=path,
+                            filename=filename,
+                            notifications=notifications)
+            span.set(rows=len(df))
+
+    if compact == True:
+        df = _compact_dataframe(df)
+
+    return df
+
+def set_async_concurrency_limit(limit=8):
+
+    """
+    This function sets how many upstream xmACIS2 requests get_data_async may have running at once (per event loop).
+    Requests beyond the limit wait their turn, which gives the caller backpressure instead of a burst of upstream requests.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) limit (Integer) - Default=8. The maximum number of upstream requests at once.
+
+    Returns
+    -------
+
+    None
+    """
+
+    if limit < 1:
+        raise ValueError("limit must be a positive integer.")
+
+    with _async_lock:
+        _async_settings['limit'] = limit
+        _async_semaphores.clear()
+
+def _async_semaphore(loop):
+
+    """
+    This function returns the semaphore that limits the upstream requests of an event loop.
+    """
+
+    with _async_lock:
+        if loop not in _async_semaphores:
+            _async_semaphores[loop] = _asyncio.Semaphore(_async_settings['limit'])
+        return _async_semaphores[loop]
+
+async def _limited(loop,
+                   executor,
+                   func):
+
+    """
+    This coroutine runs a blocking function in the executor once the event loop's semaphore allows it.
+
+    The semaphore is held until the function returns, even if the awaiting task is cancelled, since the blocking
+    xmACIS2 client cannot be interrupted once it has started.
+    """
+
+    semaphore = _async_semaphore(loop)
+    await semaphore.acquire()
+    try:
+        running = loop.run_in_executor(executor, func)
+    except BaseException as e:
+        semaphore.release()
+        raise
+    running.add_done_callback(lambda f: semaphore.release())
+
+    return await _asyncio.shield(running)
+
+async def get_data_async(station,
+                         start_date=None,
+                         end_date=None,
+                         from_when=_yesterday,
+                         time_delta=30,
+                         proxies=None,
+                         clear_recycle_bin=False,
+                         to_csv=False,
+                         path='default',
+                         filename='default',
+                         notifications='on',
+                         compact=False,
+                         coalesce=True,
+                         executor=None):
+
+    """
+    This coroutine is the asyncio version of get_data. It downloads user-specified xmACIS2 data and returns a Pandas.DataFrame
+    without blocking the event loop.
+
+    The blocking xmACIS2 client runs in an executor. At most set_async_concurrency_limit() upstream requests run at once per event loop
+    (8 by default) and concurrent requests for the same station and window share one upstream request with get_data and other tasks.
+
+    Cancelling the task stops it from waiting right away. An upstream request that has already started still runs to completion
+    (the blocking client cannot be interrupted) and its result is handed to any other callers waiting on it. When the request itself
+    is cancelled before it starts (i.e. the event loop shuts down while it waits for its turn), the callers waiting on it get a
+    CancelledError and the next request for the station starts a new one.
+
+    Required Arguments:
+
+    1) station (String) - The 4 letter station ID (i.e. KRAL for Riverside Municipal Airport in Riverside, CA)
+
+    Optional Arguments:
+
+    1) start_date through 12) coalesce - The same as get_data.
+
+    13) executor (concurrent.futures.Executor or None) - Default=None. The executor the blocking client runs in.
+        When set to None, the event loop's default executor is used.
+
+    Returns
+    -------
+
+    A Pandas.DataFrame of the xmACIS2 climate data the user specifies
+    """
+
+    loop = _asyncio.get_running_loop()
+
+    window = None
+    if coalesce == True and to_csv == False and clear_recycle_bin == False:
+        window = _single_flight.resolve_dates(start_date, end_date, from_when, time_delta)
+
+    if window == None:
+        return await _limited(loop, executor, _functools.partial(get_data,
+                                                                 station,
+                                                                 start_date=start_date,
+                                                                 end_date=end_date,
+                                                                 from_when=from_when,
+                                                                 time_delta=time_delta,
+                                                                 proxies=proxies,
+                                                                 clear_recycle_bin=clear_recycle_bin,
+                                                                 to_csv=to_csv,
+                                                                 path=path,
+                                                                 filename=filename,
+                                                                 notifications=notifications,
+                                                                 compact=compact,
+                                                                 coalesce=False))
+
+    start, end = window
+    key = _single_flight.flight_key(station, proxies)
+    future, leader = _single_flight.join(key, start, end)
+
+    if leader == True:
+        # The flight runs in its own task so cancelling this caller does not strand the other callers waiting on it.
+        _flight_task(loop, executor, future, key, station, start, end, proxies, notifications)
+
+    df = _single_flight.slice_window(await _asyncio.wrap_future(future), start, end)
+
+    if compact == True:
+        df = _compact_dataframe(df)
+
     return df
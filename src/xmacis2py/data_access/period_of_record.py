@@ -0,0 +1,251 @@
+"""
+This file hosts the resumable chunked downloader for long periods of record.
+
+Pulling 100+ years of daily data in one get_data call is slow and fails as a whole on any hiccup.
+get_period_of_record splits the range into chunks (by default decades aligned to the calendar, i.e. 1900-1909, 1910-1919, ...),
+downloads the chunks concurrently with retries and saves each completed chunk as a CSV file in the local store.
+If the download is interrupted, running it again only downloads the chunks that are not saved yet.
+The chunks are then stitched into one series that is checked for duplicate and missing dates.
+
+Chunk Store
+-----------
+
+ACIS Data/{station}/Chunks/{station} {start} {end}.csv
+
+(C) Eric J. Drewitz 2025-2026
+"""
+
+import os as _os
+import time as _time
+import warnings as _warnings
+import pandas as _pd
+_warnings.filterwarnings('ignore')
+
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+from xmacis2py.data_access.get_data import get_data as _get_data
+from xmacis2py.utils.file_funcs import update_csv_file_paths as _update_csv_file_paths
+
+def _chunk_ranges(start,
+                  end,
+                  chunk_years):
+
+    """
+    This function splits a date range into chunks aligned to multiples of chunk_years (i.e. decades).
+
+    Required Arguments:
+
+    1) start (Pandas.Timestamp) - The first date.
+
+    2) end (Pandas.Timestamp) - The last date.
+
+    3) chunk_years (Integer) - The length of the chunks in years.
+
+    Returns
+    -------
+
+    A list of (start, end) Pandas.Timestamp tuples.
+    """
+
+    chunks = []
+    chunk_start = start
+    while chunk_start <= end:
+        next_year = (chunk_start.year // chunk_years + 1) * chunk_years
+        chunk_end = min(_pd.Timestamp(year=next_year, month=1, day=1) - _pd.Timedelta(days=1), end)
+        chunks.append((chunk_start, chunk_end))
+        chunk_start = chunk_end + _pd.Timedelta(days=1)
+
+    return chunks
+
+def _chunk_path(path,
+                station,
+                start,
+                end):
+
+    """
+    This function returns the file path of a saved chunk.
+    """
+
+    return f"{path}/{station} {start.strftime('%Y-%m-%d')} {end.strftime('%Y-%m-%d')}.csv"
+
+def _validate_chunk(df,
+                    start,
+                    end,
+                    date_name='Date'):
+
+    """
+    This function checks that a downloaded chunk has dates and that every date is inside the chunk.
+    Days the chunk is missing are caught by the gap check after the chunks are stitched.
+
+    Returns
+    -------
+
+    None. Raises a ValueError if the chunk is not valid.
+    """
+
+    if date_name not in df.columns:
+        raise ValueError(f"The chunk {start.date()} to {end.date()} has no {date_name} column.")
+
+    dates = _pd.to_datetime(df[date_name])
+    if len(dates) > 0 and (dates.min() < start or dates.max() > end):
+        raise ValueError(f"The chunk {start.date()} to {end.date()} has dates outside the chunk.")
+
+def _download_chunk(station,
+                    start,
+                    end,
+                    fname,
+                    retries,
+                    backoff,
+                    proxies):
+
+    """
+    This function downloads one chunk with retries and saves it to the chunk store.
+
+    The chunk is written to a temporary file and renamed into place, so a saved chunk is always complete.
+
+    Returns
+    -------
+
+    The Pandas.DataFrame of the chunk.
+    """
+
+    for attempt in range(retries + 1):
+        try:
+            df = _get_data(station,
+                           start_date=start.strftime('%Y-%m-%d'),
+                           end_date=end.strftime('%Y-%m-%d'),
+                           proxies=proxies,
+                           notifications='off')
+            _validate_chunk(df, start, end)
+            break
+        except Exception as e:
+            if attempt == retries:
+                raise
+            _time.sleep(backoff * 2 ** attempt)
+
+    df.to_csv(f"{fname}.tmp", index=False)
+    _os.replace(f"{fname}.tmp", fname)
+
+    return df
+
+def get_period_of_record(station,
+                         start_date,
+                         end_date,
+                         chunk_years=10,
+                         max_workers=4,
+                         retries=3,
+                         backoff=2,
+                         proxies=None,
+                         path='default',
+                         strict=False,
+                         notifications='on'):
+
+    """
+    This function downloads a long period of record in chunks and returns one Pandas.DataFrame.
+
+    Completed chunks are saved to the chunk store, so an interrupted download resumes where it left off.
+
+    Required Arguments:
+
+    1) station (String) - The 4 letter station ID (i.e. KRAL for Riverside Municipal Airport in Riverside, CA)
+
+    2) start_date (String or Datetime) - The start date in the format 'YYYY-mm-dd' or as a datetime object.
+
+    3) end_date (String or Datetime) - The end date in the format 'YYYY-mm-dd' or as a datetime object.
+
+    Optional Arguments:
+
+    1) chunk_years (Integer) - Default=10. The length of the chunks in years. The chunks are aligned to multiples of chunk_years.
+
+    2) max_workers (Integer) - Default=4. The number of chunks downloaded at once.
+
+    3) retries (Integer) - Default=3. The number of times a failed chunk is retried.
+
+    4) backoff (Float) - Default=2. The wait in seconds before the first retry. The wait doubles with each retry.
+
+    5) proxies (dict or None) - Default=None. If the user is using proxy server(s), the user must change the following:
+
+       proxies=None ---> proxies={
+                           'http':'http://url',
+                           'https':'https://url'
+                        }
+
+    6) path (String) - Default='default'. The chunk store. If set to 'default' the path will be "ACIS Data/{station}/Chunks".
+
+    7) strict (Boolean) - Default=False. When set to True, a ValueError is raised if the stitched series is missing any dates.
+        When set to False, the missing dates are added as missing days (NaN).
+
+    8) notifications (String) - Default='on'. When set to 'on' the progress of the chunks is printed.
+
+    Returns
+    -------
+
+    A Pandas.DataFrame of the xmACIS2 climate data with one row per day from start_date to end_date.
+
+    Raises a RuntimeError listing the chunks that still failed after the retries. The chunks that did download are kept,
+    so calling the function again only downloads the failed chunks.
+    """
+
+    station = station.upper()
+    start = _pd.Timestamp(start_date).normalize()
+    end = _pd.Timestamp(end_date).normalize()
+    if end < start:
+        raise ValueError("end_date must be on or after start_date.")
+
+    if path == 'default':
+        path = _update_csv_file_paths(station, 'Chunks')
+    else:
+        try:
+            _os.makedirs(path)
+        except Exception as e:
+            pass
+
+    chunks = _chunk_ranges(start, end, chunk_years)
+    frames = {}
+    pending = []
+    for chunk in chunks:
+        fname = _chunk_path(path, station, chunk[0], chunk[1])
+        if _os.path.exists(fname):
+            frames[chunk] = _pd.read_csv(fname)
+        else:
+            pending.append((chunk, fname))
+
+    if notifications == 'on':
+        print(f"{station}: {len(chunks) - len(pending)} of {len(chunks)} chunks already saved. Downloading {len(pending)} chunks.")
+
+    failures = []
+    if len(pending) > 0:
+        with _ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for chunk, fname in pending:
+                futures[chunk] = executor.submit(_download_chunk, station, chunk[0], chunk[1], fname, retries, backoff, proxies)
+
+            for chunk, future in futures.items():
+                try:
+                    frames[chunk] = future.result()
+                    if notifications == 'on':
+                        print(f"{station}: Saved chunk {chunk[0].date()} to {chunk[1].date()}")
+                except Exception as e:
+                    failures.append(f"{chunk[0].date()} to {chunk[1].date()} ({e})")
+
+    if len(failures) > 0:
+        raise RuntimeError(f"{station}: {len(failures)} chunks failed: " + "; ".join(failures))
+
+    df = _pd.concat([frames[chunk] for chunk in chunks], ignore_index=True)
+
+    dates = _pd.to_datetime(df['Date'])
+    df = df[~dates.duplicated(keep='last')]
+    dates = _pd.to_datetime(df['Date'])
+
+    full_range = _pd.date_range(start, end, freq='D')
+    gaps = full_range.difference(_pd.DatetimeIndex(dates))
+    if len(gaps) > 0:
+        if strict == True:
+            raise ValueError(f"{station}: {len(gaps)} dates are missing from the period of record (first missing date: {gaps[0].date()}).")
+        if notifications == 'on':
+            print(f"{station}: {len(gaps)} dates are missing from the period of record and were added as missing days.")
+
+    df = df.set_index(_pd.DatetimeIndex(dates)).reindex(full_range)
+    df['Date'] = full_range
+    df = df.reset_index(drop=True)
+
+    return df
@@ -0,0 +1,349 @@
+"""
+This file hosts the record/replay stand-in for the xmACIS2 service, for load testing and benchmarks on an offline machine.
+
+ReplayServer is a small local HTTP server (Python standard library only) that the xmACIS2 client reaches through the proxies argument
+of get_data, so no code has to be changed to point at it:
+
+1) mode='record' - Every request is forwarded to the real xmACIS2 service and the response is saved as a fixture file.
+
+2) mode='replay' - Every request is answered from the fixture files. Requests without a fixture get an HTTP 404,
+   or synthetic data for the requested station and dates when synthetic=True (no fixtures needed at all).
+
+The server can add latency (a fixed delay plus random jitter) and inject errors (a fraction of the requests answered with an
+HTTP error) so that fetch concurrency, caching and retries can be benchmarked. The random draws use a seeded generator, so a run
+with the same seed and the same order of requests is repeatable.
+
+Example
+-------
+
+with ReplayServer(mode='record') as server:
+    get_data('KRAL', start_date='2020-01-01', end_date='2020-12-31', proxies=server.proxies)
+
+with ReplayServer(latency=0.25, error_rate=0.05) as server:
+    df = get_data('KRAL', start_date='2020-01-01', end_date='2020-12-31', proxies=server.proxies)
+
+Fixture Store
+-------------
+
+ACIS Data/Replay/Fixtures/{station} {start} {end} {hash}.json
+
+(C) Eric J. Drewitz 2025-2026
+"""
+
+import hashlib as _hashlib
+import json as _json
+import os as _os
+import random as _random
+import threading as _threading
+import time as _time
+import urllib.error as _urllib_error
+import urllib.request as _urllib_request
+import warnings as _warnings
+_warnings.filterwarnings('ignore')
+
+from http.server import(
+    BaseHTTPRequestHandler as _BaseHTTPRequestHandler,
+    ThreadingHTTPServer as _ThreadingHTTPServer
+)
+from urllib.parse import urlsplit as _urlsplit
+import xmacis2py.data_access.synthetic as _synthetic
+from xmacis2py.utils.file_funcs import update_csv_file_paths as _update_csv_file_paths
+
+_upstream = 'http://data.rcc-acis.org'
+
+def fixture_name(body):
+
+    """
+    This function returns the fixture file name of an xmACIS2 request.
+
+    Required Arguments:
+
+    1) body (Dictionary) - The JSON body of the request.
+
+    Returns
+    -------
+
+    The file name.
+    """
+
+    digest = _hashlib.blake2b(_json.dumps(body, sort_keys=True).encode(), digest_size=6).hexdigest()
+
+    return f"{str(body.get('sid', 'unknown')).upper()} {body.get('sdate', '')} {body.get('edate', '')} {digest}.json"
+
+class _Handler(_BaseHTTPRequestHandler):
+
+    """
+    This class answers the requests the xmACIS2 client sends to the stand-in.
+    """
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self,
+              status,
+              payload):
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self):
+
+        server = self.server.replay
+        endpoint = _urlsplit(self.path).path
+        raw = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+        try:
+            body = _json.loads(raw)
+        except Exception as e:
+            body = {}
+
+        server._wait()
+        status, payload = server._answer(endpoint, raw, body)
+        self._send(status, payload)
+
+class ReplayServer:
+
+    """
+    This class is a local stand-in for the xmACIS2 service that records and replays responses.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) mode (String) - Default='replay'. 'record' forwards the requests to xmACIS2 and saves the responses. 'replay' answers from the fixtures.
+
+    2) path (String) - Default='default'. The fixture directory. If set to 'default' the path will be "ACIS Data/Replay/Fixtures".
+
+    3) latency (Float) - Default=0. A delay in seconds added to every response.
+
+    4) jitter (Float) - Default=0. A random delay between 0 and jitter seconds added on top of the latency.
+
+    5) error_rate (Float) - Default=0. The fraction of requests answered with an HTTP error instead of data.
+
+    6) error_status (Integer) - Default=500. The HTTP status of the injected errors.
+
+    7) seed (Integer) - Default=0. The seed of the random latency and errors.
+
+    8) host (String) - Default='127.0.0.1'. The address the server listens on.
+
+    9) port (Integer) - Default=0. The port the server listens on. 0 picks a free port.
+
+    10) upstream (String) - Default='http://data.rcc-acis.org'. The xmACIS2 service used in record mode.
+
+    11) synthetic (Boolean) - Default=False. When set to True, replay requests without a fixture are answered with synthetic data
+        for the requested station and dates (see xmacis2py.data_access.synthetic).
+
+    Attributes
+    ----------
+
+    url (String) - The address of the running server.
+
+    proxies (Dictionary) - The proxies to pass to get_data so its requests go to the stand-in.
+
+    Methods
+    -------
+
+    start() - Starts the server in a background thread.
+
+    stop() - Stops the server.
+
+    stats() - A dictionary with the number of 'requests', 'replayed', 'recorded', 'synthesized', 'not_found' and 'errors_injected'.
+
+    The class is also a context manager that starts the server on entry and stops it on exit.
+    """
+
+    def __init__(self,
+                 mode='replay',
+                 path='default',
+                 latency=0,
+                 jitter=0,
+                 error_rate=0,
+                 error_status=500,
+                 seed=0,
+                 host='127.0.0.1',
+                 port=0,
+                 upstream=_upstream,
+                 synthetic=False):
+
+        if mode not in ['record', 'replay']:
+            raise ValueError("mode must be 'record' or 'replay'.")
+
+        if path == 'default':
+            path = _update_csv_file_paths('Replay', 'Fixtures')
+        else:
+            try:
+                _os.makedirs(path)
+            except Exception as e:
+                pass
+
+        self.mode = mode
+        self.path = path
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.host = host
+        self.port = port
+        self.upstream = upstream.rstrip('/')
+        self.synthetic = synthetic
+        self.seed = seed
+        self._random = _random.Random(seed)
+        self._lock = _threading.Lock()
+        self._server = None
+        self._thread = None
+        self._stats = {
+            'requests':0,
+            'replayed':0,
+            'recorded':0,
+            'synthesized':0,
+            'not_found':0,
+            'errors_injected':0
+        }
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def proxies(self):
+        return {
+            'http':self.url,
+            'https':self.url
+        }
+
+    def _count(self,
+               name):
+
+        with self._lock:
+            self._stats[name] += 1
+
+    def _wait(self):
+
+        """
+        This method applies the latency and jitter of one response.
+        """
+
+        with self._lock:
+            delay = self.latency + self._random.uniform(0, self.jitter)
+
+        if delay > 0:
+            _time.sleep(delay)
+
+    def _answer(self,
+                endpoint,
+                raw,
+                body):
+
+        """
+        This method returns the (status, payload) of one request.
+        """
+
+        self._count('requests')
+
+        with self._lock:
+            inject = self.error_rate > 0 and self._random.random() < self.error_rate
+        if inject == True:
+            self._count('errors_injected')
+            return self.error_status, b'Injected error'
+
+        fname = f"{self.path}/{fixture_name(body)}"
+
+        if self.mode == 'replay':
+            if _os.path.exists(fname) == False and self.synthetic == True:
+                df = _synthetic.synthetic_station(str(body.get('sid', 'SYN00001')),
+                                                  start_date=body.get('sdate'),
+                                                  end_date=body.get('edate'),
+                                                  seed=self.seed)
+                self._count('synthesized')
+                return 200, _synthetic.to_acis_response(df)
+            if _os.path.exists(fname) == False:
+                self._count('not_found')
+                return 404, _json.dumps({'error':f"No fixture for {fixture_name(body)}"}).encode()
+            with open(fname, 'rb') as f:
+                payload = f.read()
+            self._count('replayed')
+            return 200, payload
+
+        request = _urllib_request.Request(f"{self.upstream}{endpoint}",
+                                          data=raw,
+                                          headers={'Content-Type':'application/json'},
+                                          method='POST')
+        try:
+            with _urllib_request.urlopen(request, timeout=300) as response:
+                status, payload = response.status, response.read()
+        except _urllib_error.HTTPError as e:
+            return e.code, e.read()
+
+        if status == 200:
+            with open(f"{fname}.tmp", 'wb') as f:
+                f.write(payload)
+            _os.replace(f"{fname}.tmp", fname)
+            self._count('recorded')
+
+        return status, payload
+
+    def start(self):
+
+        """
+        This method starts the server in a background thread.
+
+        Returns
+        -------
+
+        The server.
+        """
+
+        if self._server != None:
+            return self
+
+        self._server = _ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._server.daemon_threads = True
+        self._server.replay = self
+        self.port = self._server.server_address[1]
+        self._thread = _threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+        return self
+
+    def stop(self):
+
+        """
+        This method stops the server.
+
+        Returns
+        -------
+
+        None
+        """
+
+        if self._server == None:
+            return
+
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+
+    def stats(self):
+
+        """
+        This method reports the requests the server has answered.
+
+        Returns
+        -------
+
+        A dictionary with the keys 'requests', 'replayed', 'recorded', 'synthesized', 'not_found' and 'errors_injected'.
+        """
+
+        with self._lock:
+            return dict(self._stats)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
@@ -0,0 +1,270 @@
+"""
+This file hosts the shared memory handoff of xmACIS2 data to process pool workers.
+
+Passing a Pandas.DataFrame to a process pool pickles a full copy of it into every task. Instead, the parent process places the columns
+of the dataframe in one multiprocessing.shared_memory block with share_dataframe() and passes the small, picklable spec of the block
+to the workers. Each worker calls attach_dataframe(spec) and gets a Pandas.DataFrame whose columns are read-only, zero-copy views of
+the shared block, so 32 workers rendering products for the same station hold one copy of the data between them.
+
+A worker keeps a block attached until detach_dataframe() or detach_all() is called, so attaching the same block again for the next
+task is free. The parent process owns the block and frees it with SharedDataFrame.close() once the workers are done.
+
+Example
+-------
+
+with shared.share_dataframe(get_data('KRAL', start_date='1991-01-01', end_date='2020-12-31')) as block:
+    with ProcessPoolExecutor(32) as pool:
+        results = list(pool.map(worker, [block.spec] * 100))
+
+def worker(spec):
+    df = shared.attach_dataframe(spec)
+    return analysis.period_mean(df, 'Maximum Temperature')
+
+Shared Memory Tools:
+
+- share_dataframe
+- attach_dataframe
+- detach_dataframe
+- detach_all
+- SharedDataFrame
+
+(C) Eric J. Drewitz 2025-2026
+"""
+
+import os as _os
+import threading as _threading
+import warnings as _warnings
+import numpy as _np
+import pandas as _pd
+_warnings.filterwarnings('ignore')
+
+from multiprocessing import resource_tracker as _resource_tracker
+from multiprocessing import shared_memory as _shared_memory
+
+_lock = _threading.Lock()
+_attached = {}
+_alignment = 8
+
+def _column_values(series):
+
+    """
+    This function returns the values of a column as a plain numpy array that can be placed in shared memory.
+    Numeric and datetime columns keep their dtype. All other columns are converted to float64 (i.e. nullable integers).
+    """
+
+    values = series.to_numpy()
+    if values.dtype.kind in 'biufM':
+        return _np.ascontiguousarray(values)
+
+    return _pd.to_numeric(series, errors='coerce').to_numpy(dtype=float, na_value=_np.nan)
+
+class SharedDataFrame:
+
+    """
+    This class owns a shared memory block holding the columns of a Pandas.DataFrame. Create one with share_dataframe().
+
+    Attributes
+    ----------
+
+    spec (Dictionary) - The picklable description of the block to pass to the workers.
+
+    name (String) - The name of the shared memory block.
+
+    nbytes (Integer) - The size of the block in bytes.
+
+    Methods
+    -------
+
+    close() - Frees the shared memory block. Call it once every worker is done with the block.
+
+    The class is also a context manager that closes the block on exit.
+    """
+
+    def __init__(self,
+                 block,
+                 spec):
+
+        self._block = block
+        self.spec = spec
+        self.name = spec['name']
+        self.nbytes = spec['nbytes']
+
+    def close(self):
+
+        """
+        This method frees the shared memory block.
+        """
+
+        if self._block == None:
+            return
+
+        self._block.close()
+        try:
+            self._block.unlink()
+        except FileNotFoundError as e:
+            pass
+        self._block = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+def share_dataframe(df,
+                    columns=None,
+                    date_name='Date'):
+
+    """
+    This function copies the columns of a Pandas.DataFrame into one shared memory block.
+
+    Required Arguments:
+
+    1) df (Pandas.DataFrame) - The Pandas.DataFrame of xmACIS2 data.
+
+    Optional Arguments:
+
+    1) columns (List or None) - Default=None. The columns to share. When set to None, every column is shared.
+
+    2) date_name (String) - Default='Date'. The name of the column with the dates. The dates are shared as datetime64.
+
+    Returns
+    -------
+
+    A SharedDataFrame. Pass its spec to the workers.
+    """
+
+    if columns == None:
+        columns = list(df.columns)
+
+    arrays = []
+    layout = []
+    offset = 0
+    for column in columns:
+        if column == date_name:
+            values = _np.ascontiguousarray(_pd.to_datetime(df[column]).to_numpy())
+        else:
+            values = _column_values(df[column])
+        offset = -(-offset // _alignment) * _alignment
+        layout.append({
+            'column':column,
+            'dtype':values.dtype.str,
+            'offset':offset,
+            'length':len(values)
+        })
+        arrays.append(values)
+        offset += values.nbytes
+
+    block = _shared_memory.SharedMemory(create=True, size=max(offset, 1))
+    for values, entry in zip(arrays, layout):
+        target = _np.ndarray(len(values), dtype=values.dtype, buffer=block.buf, offset=entry['offset'])
+        target[:] = values
+
+    spec = {
+        'name':block.name,
+        'nbytes':offset,
+        'length':len(df),
+        'columns':layout
+    }
+
+    return SharedDataFrame(block, spec)
+
+def _open_block(name):
+
+    """
+    This function attaches to an existing shared memory block without handing its cleanup to this process.
+    """
+
+    try:
+        return _shared_memory.SharedMemory(name=name, track=False)
+    except TypeError as e:
+        pass
+
+    # Before Python 3.13 attaching registers the block with the resource tracker of this process, which would unlink the block
+    # (and report it as leaked) when this process exits while the owner is still using it.
+    block = _shared_memory.SharedMemory(name=name)
+    if _os.name == 'posix':
+        _resource_tracker.unregister(block._name, 'shared_memory')
+
+    return block
+
+def attach_dataframe(spec,
+                     columns=None):
+
+    """
+    This function rebuilds a Pandas.DataFrame from a shared memory block in a worker process.
+
+    Nothing is copied: every column is a read-only view of the shared block.
+
+    Required Arguments:
+
+    1) spec (Dictionary) - The spec of a SharedDataFrame.
+
+    Optional Arguments:
+
+    1) columns (List or None) - Default=None. The columns to include. When set to None, every shared column is included.
+
+    Returns
+    -------
+
+    A Pandas.DataFrame.
+    """
+
+    name = spec['name']
+    with _lock:
+        if name not in _attached:
+            _attached[name] = _open_block(name)
+        block = _attached[name]
+
+    data = {}
+    for entry in spec['columns']:
+        if columns != None and entry['column'] not in columns:
+            continue
+        values = _np.ndarray(entry['length'], dtype=_np.dtype(entry['dtype']), buffer=block.buf, offset=entry['offset'])
+        values.setflags(write=False)
+        data[entry['column']] = values
+
+    return _pd.DataFrame(data, copy=False)
+
+def detach_dataframe(spec):
+
+    """
+    This function releases this process's attachment to a shared memory block.
+    Dataframes attached from the block must no longer be in use.
+
+    Required Arguments:
+
+    1) spec (Dictionary) - The spec of a SharedDataFrame.
+
+    Returns
+    -------
+
+    None
+    """
+
+    with _lock:
+        block = _attached.pop(spec['name'], None)
+
+    if block != None:
+        try:
+            block.close()
+        except BufferError as e:
+            pass
+
+def detach_all():
+
+    """
+    This function releases every shared memory block attached in this process.
+    Dataframes attached from the blocks must no longer be in use.
+
+    Returns
+    -------
+
+    None
+    """
+
+    with _lock:
+        names = list(_attached.keys())
+
+    for name in names:
+        detach_dataframe({'name':name})
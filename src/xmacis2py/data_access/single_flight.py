@@ -0,0 +1,210 @@
+"""
+This file hosts the request coalescing (single-flight) for get_data.
+
+When many callers ask for the same station at the same time (i.e. 50 users opening KLAX after a storm), only the first caller
+(the leader) makes the upstream xmACIS2 request. Every caller that arrives while that request is in flight, for the same window or
+for any window inside it, waits for the leader's request and receives its own copy of the rows of its window.
+Requests for windows that are not covered by an in-flight request start their own flight.
+
+Each flight is a concurrent.futures.Future, so the same flight can be waited on from threads (Future.result()) and from
+asyncio tasks (asyncio.wrap_future()).
+
+Single Flight Tools:
+
+- resolve_dates
+- flight_key
+- join
+- finish
+- slice_window
+- in_flight
+
+(C) Eric J. Drewitz 2025-2026
+"""
+
+import threading as _threading
+import warnings as _warnings
+import pandas as _pd
+_warnings.filterwarnings('ignore')
+
+from concurrent.futures import Future as _Future
+
+_lock = _threading.Lock()
+_flights = {}
+
+def resolve_dates(start_date,
+                  end_date,
+                  from_when,
+                  time_delta):
+
+    """
+    This function resolves the get_data date arguments into the first and last date of the request
+    (the same way the xmACIS2 client does).
+
+    Required Arguments:
+
+    1) start_date (String, Datetime or None) - The start date.
+
+    2) end_date (String, Datetime or None) - The end date.
+
+    3) from_when (String, Datetime or None) - The date to count back from when start_date and end_date are None.
+
+    4) time_delta (Integer or None) - The number of days to count back from from_when.
+
+    Returns
+    -------
+
+    A tuple of (start, end) as Pandas.Timestamp objects or None if the dates cannot be resolved.
+    """
+
+    try:
+        if start_date == None and end_date == None:
+            if from_when == None or time_delta == None:
+                return None
+            end = _pd.Timestamp(from_when).normalize()
+            start = end - _pd.Timedelta(days=time_delta)
+        else:
+            if start_date == None or end_date == None:
+                return None
+            start = _pd.Timestamp(start_date).normalize()
+            end = _pd.Timestamp(end_date).normalize()
+    except Exception as e:
+        return None
+
+    return start, end
+
+def flight_key(station,
+               proxies=None):
+
+    """
+    This function returns the key that requests must share to be coalesced: the station and the proxies used to reach xmACIS2.
+
+    Required Arguments:
+
+    1) station (String) - The station ID.
+
+    Optional Arguments:
+
+    1) proxies (dict or None) - Default=None. The proxies.
+
+    Returns
+    -------
+
+    A hashable key.
+    """
+
+    if proxies == None:
+        return (station.upper(), None)
+
+    return (station.upper(), tuple(sorted(proxies.items())))
+
+def join(key,
+         start,
+         end):
+
+    """
+    This function joins an in-flight request that covers the window or starts a new flight.
+
+    Required Arguments:
+
+    1) key (Tuple) - The key from flight_key().
+
+    2) start (Pandas.Timestamp) - The first date of the window.
+
+    3) end (Pandas.Timestamp) - The last date of the window.
+
+    Returns
+    -------
+
+    A tuple of (future, leader). When leader is True, the caller must make the upstream request, set the result (or exception)
+    of the future and call finish(). Otherwise the caller only waits for the future.
+    """
+
+    with _lock:
+        for flight_start, flight_end, future in _flights.get(key, []):
+            if flight_start <= start and flight_end >= end:
+                return future, False
+
+        future = _Future()
+        future.set_running_or_notify_cancel()
+        _flights.setdefault(key, []).append((start, end, future))
+
+    return future, True
+
+def finish(key,
+           start,
+           end,
+           future):
+
+    """
+    This function removes a flight once the leader is done with it. Later requests start a new flight.
+
+    Required Arguments:
+
+    1) key (Tuple) - The key from flight_key().
+
+    2) start (Pandas.Timestamp) - The first date of the flight.
+
+    3) end (Pandas.Timestamp) - The last date of the flight.
+
+    4) future (concurrent.futures.Future) - The flight.
+
+    Returns
+    -------
+
+    None
+    """
+
+    with _lock:
+        flights = _flights.get(key, [])
+        flights[:] = [flight for flight in flights if flight[2] is not future]
+        if len(flights) == 0:
+            _flights.pop(key, None)
+
+def slice_window(df,
+                 start,
+                 end,
+                 date_name='Date'):
+
+    """
+    This function returns a caller's own copy of the rows of its window from the result of a shared flight.
+
+    Required Arguments:
+
+    1) df (Pandas.DataFrame) - The result of the flight.
+
+    2) start (Pandas.Timestamp) - The first date of the window.
+
+    3) end (Pandas.Timestamp) - The last date of the window.
+
+    Optional Arguments:
+
+    1) date_name (String) - Default='Date'. The name of the column with the dates.
+
+    Returns
+    -------
+
+    A Pandas.DataFrame.
+    """
+
+    if date_name not in df.columns or len(df) == 0:
+        return df.copy()
+
+    dates = _pd.to_datetime(df[date_name])
+    if dates.iloc[0] >= start and dates.iloc[-1] <= end:
+        return df.copy()
+
+    return df[(dates >= start) & (dates <= end)].reset_index(drop=True)
+
+def in_flight():
+
+    """
+    This function reports the number of upstream requests currently in flight.
+
+    Returns
+    -------
+
+    The number of in-flight requests.
+    """
+
+    with _lock:
+        return sum(len(flights) for flights in _flights.values())
@@ -0,0 +1,401 @@
+"""
+This file hosts the local station cache with a time-aware freshness policy.
+
+The values xmACIS2 reports for the last several weeks can still be revised, while older data is effectively permanent.
+A plain cache either serves stale recent numbers or downloads everything again. The station cache keeps, for every cached day,
+the time it was downloaded and applies a freshness policy:
+
+1) Days that were already older than the horizon (60 days by default) when they were downloaded never expire.
+
+2) All other days expire once their download is older than the time to live (6 hours by default). A day that was downloaded while it
+   was still recent is downloaded again after the time to live, and the new copy is permanent once the day is older than the horizon.
+
+A request is answered from the cache when every day of its window is cached and fresh. Otherwise only the days that are missing
+or expired (usually the recent tail) are downloaded and merged into the cache.
+
+Cache Store
+-----------
+
+ACIS Data/{station}/Cache/{station}.csv (the xmACIS2 columns plus a 'Fetched' column with the download time of each day)
+
+ACIS Data/{station}/Cache/*.npz (the station's quantile sketches from pooled_sketch, removed whenever days of the station are downloaded again
+so they are rebuilt from the refreshed data)
+
+(C) Eric J. Drewitz 2025-2026
+"""
+
+import glob as _glob
+import os as _os
+import threading as _threading
+import time as _time
+import warnings as _warnings
+import numpy as _np
+import pandas as _pd
+import xmacis2py.utils.tracing as _tracing
+_warnings.filterwarnings('ignore')
+
+from xmacis2py.data_access.get_data import get_data as _get_data
+from xmacis2py.data_access.single_flight import resolve_dates as _resolve_dates
+from xmacis2py.utils.file_funcs import update_csv_file_paths as _update_csv_file_paths
+
+_fetched_name = 'Fetched'
+_horizon_days = 60
+_ttl = 21600
+_yesterday = (_pd.Timestamp.now().normalize() - _pd.Timedelta(days=1)).strftime('%Y-%m-%d')
+
+def _spans(dates):
+
+    """
+    This function groups sorted dates into runs of consecutive days.
+
+    Required Arguments:
+
+    1) dates (Pandas.DatetimeIndex) - The sorted dates.
+
+    Returns
+    -------
+
+    A list of (start, end) Pandas.Timestamp tuples.
+    """
+
+    if len(dates) == 0:
+        return []
+
+    breaks = _np.flatnonzero(_np.diff(dates.values).astype('timedelta64[D]').astype(_np.int64) > 1)
+    starts = _np.concatenate(([0], breaks + 1))
+    ends = _np.concatenate((breaks, [len(dates) - 1]))
+
+    return [(dates[i], dates[j]) for i, j in zip(starts, ends)]
+
+class StationCache:
+
+    """
+    This class is a local cache of xmACIS2 station data with a time-aware freshness policy.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) horizon_days (Integer) - Default=60. Days that were older than this many days when they were downloaded are permanent.
+        Newer days can still be revised by xmACIS2.
+
+    2) ttl (Float) - Default=21600 (6 hours). The time to live in seconds of the days that are not permanent.
+
+    3) path (String) - Default='default'. If set to 'default' each station is cached at "ACIS Data/{station}/Cache".
+
+    4) proxies (dict or None) - Default=None. If the user is using proxy server(s), the user must change the following:
+
+       proxies=None ---> proxies={
+                           'http':'http://url',
+                           'https':'https://url'
+                        }
+
+    Methods
+    -------
+
+    get(station, start_date=None, end_date=None, from_when=yesterday, time_delta=30) - The data of a window, downloading only the days that are
+        missing from the cache or expired. The dates work the same way as get_data.
+
+    fresh(station, start_date=None, end_date=None, from_when=yesterday, time_delta=30) - True when every day of the window is cached and fresh,
+        so get() would not download anything.
+
+    folder(station) - The folder of a station's cache.
+
+    invalidate(station) - Removes a station from the cache.
+
+    stats() - A dictionary with the number of 'hits' (requests answered from the cache), 'refreshes' (requests that downloaded days)
+        and 'days_downloaded'.
+    """
+
+    def __init__(self,
+                 horizon_days=_horizon_days,
+                 ttl=_ttl,
+                 path='default',
+                 proxies=None):
+
+        self.horizon_days = horizon_days
+        self.ttl = ttl
+        self.path = path
+        self.proxies = proxies
+        self._frames = {}
+        self._locks = {}
+        self._lock = _threading.Lock()
+        self._stats = {
+            'hits':0,
+            'refreshes':0,
+            'days_downloaded':0
+        }
+
+    def _file(self,
+              station):
+
+        """
+        This method returns the file path of a station's cache.
+        """
+
+        if self.path == 'default':
+            path = _update_csv_file_paths(station, 'Cache')
+        else:
+            path = f"{self.path}/{station}"
+            try:
+                _os.makedirs(path)
+            except Exception as e:
+                pass
+
+        return f"{path}/{station}.csv"
+
+    def folder(self,
+               station):
+
+        """
+        This method returns the folder of a station's cache. The station's quantile sketches are saved here as well.
+
+        Required Arguments:
+
+        1) station (String) - The station ID.
+
+        Returns
+        -------
+
+        The folder path.
+        """
+
+        return _os.path.dirname(self._file(station.upper()))
+
+    def _remove_sketches(self,
+                         station):
+
+        """
+        This method removes the saved quantile sketches of a station so they are rebuilt from the refreshed data.
+        """
+
+        for fname in _glob.glob(f"{_glob.escape(self.folder(station))}/*.npz"):
+            try:
+                _os.remove(fname)
+            except Exception as e:
+                pass
+
+    def _count(self,
+               name,
+               value):
+
+        with self._lock:
+            self._stats[name] += value
+
+    def _station_lock(self,
+                      station):
+
+        with self._lock:
+            if station not in self._locks:
+                self._locks[station] = _threading.Lock()
+            return self._locks[station]
+
+    def _load(self,
+              station):
+
+        """
+        This method returns a station's cached data indexed by date, reading the cache file the first time.
+        """
+
+        if station not in self._frames:
+            fname = self._file(station)
+            if _os.path.exists(fname):
+                df = _pd.read_csv(fname)
+                df.index = _pd.DatetimeIndex(_pd.to_datetime(df['Date']))
+            else:
+                df = None
+            self._frames[station] = df
+
+        return self._frames[station]
+
+    def _save(self,
+              station,
+              df):
+
+        """
+        This method saves a station's cached data. The file is written to a temporary name and renamed into place.
+        The station's saved sketches no longer match the data and are removed.
+        """
+
+        self._frames[station] = df
+        fname = self._file(station)
+        df.to_csv(f"{fname}.tmp", index=False)
+        _os.replace(f"{fname}.tmp", fname)
+        self._remove_sketches(station)
+
+    def _stale(self,
+               df,
+               now):
+
+        """
+        This method finds the cached days that have expired under the freshness policy.
+
+        A day is permanent only when it was already older than the horizon at the time it was downloaded.
+        """
+
+        fetched = df[_fetched_name].to_numpy(dtype=float)
+        dates = df.index.values.astype('datetime64[s]').astype(_np.int64)
+        revisable = (fetched - dates) <= self.horizon_days * 86400
+        expired = (now - fetched) > self.ttl
+
+        return revisable & expired
+
+    def get(self,
+            station,
+            start_date=None,
+            end_date=None,
+            from_when=_yesterday,
+            time_delta=30):
+
+        """
+        This method returns the data of a window, downloading only the days that are missing from the cache or expired.
+
+        Required Arguments:
+
+        1) station (String) - The 4 letter station ID (i.e. KRAL for Riverside Municipal Airport in Riverside, CA)
+
+        Optional Arguments:
+
+        1) start_date (String or Datetime) - Default=None. The start date.
+
+        2) end_date (String or Datetime) - Default=None. The end date.
+
+        3) from_when (String or Datetime) - Default=Yesterday. When start_date and end_date are None, the window ends at from_when.
+
+        4) time_delta (Integer) - Default=30. When start_date and end_date are None, the window starts time_delta days before from_when.
+
+        Returns
+        -------
+
+        A Pandas.DataFrame of the xmACIS2 climate data in the same form as get_data.
+        """
+
+        station = station.upper()
+        window = _resolve_dates(start_date, end_date, from_when, time_delta)
+        if window == None:
+            raise ValueError("Pass start_date and end_date, or from_when and time_delta.")
+        start, end = window
+
+        with _tracing.span('station_cache', station=station) as span:
+            with self._station_lock(station):
+
+                now = _time.time()
+                df = self._load(station)
+                requested = _pd.date_range(start, end, freq='D')
+
+                if df is None:
+                    needed = requested
+                else:
+                    cached = df.index[~self._stale(df, now)]
+                    needed = requested.difference(cached)
+
+                if len(needed) == 0:
+                    self._count('hits', 1)
+                    span.set(cache='hit')
+                else:
+                    self._count('refreshes', 1)
+                    span.set(cache='miss')
+                    frames = []
+                    for span_start, span_end in _spans(needed):
+                        fetched = _get_data(station,
+                                            start_date=span_start.strftime('%Y-%m-%d'),
+                                            end_date=span_end.strftime('%Y-%m-%d'),
+                                            proxies=self.proxies,
+                                            notifications='off')
+                        fetched[_fetched_name] = now
+                        fetched.index = _pd.DatetimeIndex(_pd.to_datetime(fetched['Date']))
+                        frames.append(fetched)
+                        self._count('days_downloaded', len(fetched))
+
+                    if df is not None:
+                        frames.insert(0, df)
+                    df = _pd.concat(frames)
+                    df = df[~df.index.duplicated(keep='last')].sort_index()
+                    self._save(station, df)
+
+        window_df = df[(df.index >= start) & (df.index <= end)].drop(columns=[_fetched_name]).reset_index(drop=True)
+        window_df['Date'] = _pd.to_datetime(window_df['Date'])
+
+        return window_df
+
+    def fresh(self,
+              station,
+              start_date=None,
+              end_date=None,
+              from_when=_yesterday,
+              time_delta=30):
+
+        """
+        This method checks whether a window can be answered from the cache without downloading anything.
+
+        Required Arguments:
+
+        1) station (String) - The 4 letter station ID (i.e. KRAL for Riverside Municipal Airport in Riverside, CA)
+
+        Optional Arguments:
+
+        1) start_date (String or Datetime) - Default=None. The start date.
+
+        2) end_date (String or Datetime) - Default=None. The end date.
+
+        3) from_when (String or Datetime) - Default=Yesterday. When start_date and end_date are None, the window ends at from_when.
+
+        4) time_delta (Integer) - Default=30. When start_date and end_date are None, the window starts time_delta days before from_when.
+
+        Returns
+        -------
+
+        True when every day of the window is cached and fresh, otherwise False.
+        """
+
+        station = station.upper()
+        window = _resolve_dates(start_date, end_date, from_when, time_delta)
+        if window == None:
+            raise ValueError("Pass start_date and end_date, or from_when and time_delta.")
+        start, end = window
+
+        with self._station_lock(station):
+            df = self._load(station)
+            if df is None:
+                return False
+            cached = df.index[~self._stale(df, _time.time())]
+
+        return len(_pd.date_range(start, end, freq='D').difference(cached)) == 0
+
+    def invalidate(self,
+                   station):
+
+        """
+        This method removes a station from the cache (both in memory and on disk), including its saved sketches.
+
+        Required Arguments:
+
+        1) station (String) - The station ID.
+
+        Returns
+        -------
+
+        None
+        """
+
+        station = station.upper()
+        with self._station_lock(station):
+            self._frames.pop(station, None)
+            fname = self._file(station)
+            if _os.path.exists(fname):
+                _os.remove(fname)
+            self._remove_sketches(station)
+
+    def stats(self):
+
+        """
+        This method reports how the cache has been used.
+
+        Returns
+        -------
+
+        A dictionary with the keys 'hits', 'refreshes' and 'days_downloaded'.
+        """
+
+        with self._lock:
+            return dict(self._stats)
@@ -0,0 +1,295 @@
+"""
+This file hosts the synthetic station data generator for benchmarks and offline profiling.
+
+synthetic_station returns a Pandas.DataFrame shaped exactly like get_data (the same columns in the same order, datetime64 dates,
+float64 values with missing days as NaN and trace amounts as 0.001). The data is made to behave like real station data:
+
+1) Temperatures follow a seasonal cycle with persistent (autocorrelated) day-to-day anomalies and a varying diurnal range.
+   Maximum and minimum temperatures are whole degrees and the average is their mean, like xmACIS2.
+
+2) The departure, heating, cooling and growing degree days are derived from the temperatures the same way xmACIS2 derives them
+   (base 65 for heating and cooling, base 50 with an 86 cap for growing degree days).
+
+3) Precipitation falls in wet spells with a seasonal wet-day frequency and skewed amounts in hundredths of an inch.
+   Some dry days report a trace.
+
+4) Snow falls on cold wet days, builds a snow pack and melts on warm days.
+
+5) Missing days occur both as scattered single values and as runs of whole missing days.
+
+Every station has its own climate drawn from its station ID and the seed, so the same station ID and seed always give the same data
+no matter how many stations are generated or in what order.
+
+Synthetic Tools:
+
+- synthetic_station
+- synthetic_stations
+- station_ids
+- to_acis_response
+
+(C) Eric J. Drewitz 2025-2026
+"""
+
+import hashlib as _hashlib
+import json as _json
+import warnings as _warnings
+import numpy as _np
+import pandas as _pd
+_warnings.filterwarnings('ignore')
+
+from scipy import(
+    signal as _signal,
+    stats as _stats
+)
+
+_columns = ['Date',
+            'Maximum Temperature',
+            'Minimum Temperature',
+            'Average Temperature',
+            'Average Temperature Departure',
+            'Heating Degree Days',
+            'Cooling Degree Days',
+            'Precipitation',
+            'Snowfall',
+            'Snow Depth',
+            'Growing Degree Days']
+
+_decimals = {
+    'Average Temperature':1,
+    'Average Temperature Departure':1,
+    'Precipitation':2,
+    'Snowfall':1
+}
+
+_yesterday = (_pd.Timestamp.now().normalize() - _pd.Timedelta(days=1)).strftime('%Y-%m-%d')
+
+def station_ids(count):
+
+    """
+    This function returns synthetic station IDs.
+
+    Required Arguments:
+
+    1) count (Integer) - The number of station IDs.
+
+    Returns
+    -------
+
+    A list of station IDs (i.e. ['SYN00001', 'SYN00002', ...]).
+    """
+
+    return [f"SYN{i:05d}" for i in range(1, count + 1)]
+
+def _generator(station,
+               seed):
+
+    """
+    This function returns the random generator of a station (seeded from the station ID and the seed).
+    """
+
+    digest = _hashlib.blake2b(f"{station.upper()} {seed}".encode(), digest_size=8).digest()
+
+    return _np.random.default_rng(int.from_bytes(digest, 'little'))
+
+def _red_noise(rng,
+               size,
+               persistence):
+
+    """
+    This function returns autocorrelated (AR(1)) noise with unit variance.
+    """
+
+    noise = rng.standard_normal(size) * _np.sqrt(1 - persistence ** 2)
+
+    return _signal.lfilter([1], [1, -persistence], noise)
+
+def _round_half_up(values):
+    return _np.floor(values + 0.5)
+
+def synthetic_station(station='SYN00001',
+                      start_date=None,
+                      end_date=None,
+                      days=30,
+                      seed=0,
+                      missing_rate=0.01,
+                      trace_rate=0.05):
+
+    """
+    This function generates synthetic station data shaped like get_data.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) station (String) - Default='SYN00001'. The station ID. Each station ID has its own climate.
+
+    2) start_date (String or Datetime) - Default=None. The start date. When set to None, the data starts days before end_date.
+
+    3) end_date (String or Datetime) - Default=None. The end date. When set to None, the data ends yesterday.
+
+    4) days (Integer) - Default=30. The number of days when start_date is None (i.e. 30 for a month or 150*365 for 150 years).
+
+    5) seed (Integer) - Default=0. The seed. The same station ID and seed always give the same data.
+
+    6) missing_rate (Float) - Default=0.01. The fraction of missing values. Half are scattered single values and half are runs of missing days.
+
+    7) trace_rate (Float) - Default=0.05. The fraction of dry days that report a trace of precipitation.
+
+    Returns
+    -------
+
+    A Pandas.DataFrame shaped like get_data.
+    """
+
+    if end_date == None:
+        end_date = _yesterday
+    end = _pd.Timestamp(end_date).normalize()
+    if start_date == None:
+        start = end - _pd.Timedelta(days=days - 1)
+    else:
+        start = _pd.Timestamp(start_date).normalize()
+
+    dates = _pd.date_range(start, end, freq='D')
+    n = len(dates)
+    rng = _generator(station, seed)
+
+    # The station's climate
+    annual_mean = rng.uniform(40, 75)
+    amplitude = rng.uniform(5, 25)
+    diurnal_range = rng.uniform(12, 30)
+    anomaly_sd = rng.uniform(4, 8)
+    wet_frequency = rng.uniform(0.1, 0.4)
+    wet_phase = rng.uniform(0, 365)
+    wet_amount = rng.uniform(0.15, 0.5)
+
+    phase = 2 * _np.pi * (dates.dayofyear.to_numpy() - 105) / 365.25
+    normal = annual_mean + amplitude * _np.sin(phase)
+
+    # Temperatures
+    average = normal + anomaly_sd * _red_noise(rng, n, 0.7)
+    spread = _np.maximum(diurnal_range + 3 * rng.standard_normal(n), 2)
+    maximum = _round_half_up(average + spread / 2)
+    minimum = _np.minimum(_round_half_up(average - spread / 2), maximum)
+    average = (maximum + minimum) / 2
+
+    departure = _np.round(average - normal, 1)
+    heating = _np.maximum(_round_half_up(65 - average), 0)
+    cooling = _np.maximum(_round_half_up(average - 65), 0)
+    growing = _np.maximum(_round_half_up((_np.clip(maximum, 50, 86) + _np.clip(minimum, 50, 86)) / 2 - 50), 0)
+
+    # Precipitation in wet spells
+    probability = _np.clip(wet_frequency * (1 + 0.5 * _np.sin(2 * _np.pi * (dates.dayofyear.to_numpy() - wet_phase) / 365.25)), 0.01, 0.95)
+    wet = _red_noise(rng, n, 0.5) > _stats.norm.ppf(1 - probability)
+    precipitation = _np.where(wet, _np.maximum(_np.round(rng.gamma(0.75, wet_amount / 0.75, n), 2), 0.01), 0.0)
+    precipitation[~wet & (rng.random(n) < trace_rate)] = 0.001
+
+    # Snow
+    cold = maximum <= 35
+    snowfall = _np.where(cold & wet, _np.round(precipitation * rng.uniform(8, 15, n), 1), 0.0)
+    snowfall[cold & (precipitation == 0.001)] = 0.001
+
+    depth = _np.zeros(n)
+    pack = 0.0
+    new_snow = _np.where(snowfall == 0.001, 0, snowfall)
+    melt = _np.maximum(maximum - 32, 0) * 0.2
+    for i in range(n):
+        pack = max(pack + 0.5 * new_snow[i] - melt[i] - 0.05 * pack, 0.0)
+        depth[i] = pack
+    snow_depth = _round_half_up(depth)
+    snow_depth[(depth > 0) & (snow_depth == 0)] = 0.001
+
+    values = _np.column_stack([maximum,
+                               minimum,
+                               average,
+                               departure,
+                               heating,
+                               cooling,
+                               precipitation,
+                               snowfall,
+                               snow_depth,
+                               growing])
+
+    # Missing days: scattered single values and runs of whole days
+    if missing_rate > 0 and n > 0:
+        values[rng.random(values.shape) < missing_rate / 2] = _np.nan
+
+        run_length = 5
+        starts = _np.flatnonzero(rng.random(n) < missing_rate / 2 / run_length)
+        rows = _np.zeros(n, dtype=bool)
+        for start_row in starts:
+            rows[start_row:start_row + rng.geometric(1 / run_length)] = True
+        values[rows] = _np.nan
+
+        # Values derived from the temperatures are missing when a temperature is missing
+        temperature_missing = _np.isnan(values[:, 0]) | _np.isnan(values[:, 1])
+        for column in ['Average Temperature', 'Average Temperature Departure', 'Heating Degree Days', 'Cooling Degree Days', 'Growing Degree Days']:
+            values[temperature_missing, _columns.index(column) - 1] = _np.nan
+
+    data = {'Date':dates}
+    for i, column in enumerate(_columns[1:]):
+        data[column] = values[:, i]
+    df = _pd.DataFrame(data)
+
+    return df
+
+def synthetic_stations(count=1,
+                       start_date=None,
+                       end_date=None,
+                       days=30,
+                       seed=0,
+                       missing_rate=0.01,
+                       trace_rate=0.05):
+
+    """
+    This function generates synthetic data for many stations, one station at a time.
+
+    It is a generator, so 10,000 stations x 150 years never have to be in memory at once.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) count (Integer) - Default=1. The number of stations.
+
+    2) start_date through 7) trace_rate - The same as synthetic_station.
+
+    Returns
+    -------
+
+    A generator of (station ID, Pandas.DataFrame) tuples.
+    """
+
+    for station in station_ids(count):
+        yield station, synthetic_station(station,
+                                         start_date=start_date,
+                                         end_date=end_date,
+                                         days=days,
+                                         seed=seed,
+                                         missing_rate=missing_rate,
+                                         trace_rate=trace_rate)
+
+def to_acis_response(df):
+
+    """
+    This function converts a Pandas.DataFrame shaped like get_data into the JSON response of the xmACIS2 StnData service
+    (values as strings with 'M' for missing and 'T' for trace), so it can be served to the xmACIS2 client (i.e. by the ReplayServer).
+
+    Required Arguments:
+
+    1) df (Pandas.DataFrame) - The Pandas.DataFrame shaped like get_data.
+
+    Returns
+    -------
+
+    The response as bytes.
+    """
+
+    columns = [_pd.to_datetime(df['Date']).dt.strftime('%Y-%m-%d').tolist()]
+    for column in _columns[1:]:
+        values = df[column].to_numpy(dtype=float, na_value=_np.nan)
+        decimals = _decimals.get(column, 0)
+        text = [f"{value:.{decimals}f}" for value in values]
+        text = _np.where(_np.isnan(values), 'M', _np.where(values == 0.001, 'T', text))
+        columns.append(text.tolist())
+
+    return _json.dumps({'data':[list(row) for row in zip(*columns)]}).encode()
@@ -1,2 +1,5 @@
 import xmacis2py.graphics.temperature as temperature
 import xmacis2py.graphics.precipitation as precipitation
+import xmacis2py.graphics.dashboard as dashboard
+import xmacis2py.graphics.report as report
+import xmacis2py.graphics.products as products
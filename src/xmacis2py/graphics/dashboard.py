@@ -0,0 +1,336 @@
+"""
+This file hosts the functions that plot one parameter for many stations on a single dashboard (small multiples).
+
+Each station gets a small panel on a grid. All panels share the date axis (and by default the y-axis), the style and the text setup,
+so a regional dashboard of 20-50 stations is one figure and one draw instead of 20-50 separate summaries.
+
+The data of all the stations is stacked into one batched array (stations x days) on a common date index and the panel statistics
+are computed for all the stations at once.
+
+Example
+-------
+
+from xmacis2py.graphics.dashboard import plot_station_dashboard
+
+plot_station_dashboard(['KRAL', 'KONT', 'KSBD', 'KPSP'],
+                       parameter='Maximum Temperature')
+
+Dashboard Functions:
+
+- stack_stations
+- plot_station_dashboard
+
+(C) Eric J. Drewitz 2025-2026
+"""
+import concurrent.futures as _futures
+import math as _math
+import matplotlib as _mpl
+import matplotlib.dates as _md
+import matplotlib.pyplot as _plt
+import numpy as _np
+import pandas as _pd
+import warnings as _warnings
+_warnings.filterwarnings('ignore')
+
+import xmacis2py.utils.tracing as _tracing
+
+from xmacis2py.utils.file_funcs import update_dashboard_file_paths as _update_dashboard_file_paths
+from xmacis2py.utils.file_funcs import save_figure as _save_figure
+from xmacis2py.data_access.get_data import get_data as _get_data
+from xmacis2py.data_access.get_data import _yesterday
+
+_mpl.rcParams['font.weight'] = 'bold'
+_mpl.rcParams['xtick.labelsize'] = 7
+_mpl.rcParams['ytick.labelsize'] = 7
+_mpl.rcParams['font.size'] = 6
+
+_props = dict(boxstyle='round', facecolor='wheat', alpha=1)
+
+# The color, the units, the number of decimal places and if the panel statistics are totals (True) or max/min/mean (False).
+_parameters = {
+    'Maximum Temperature':('red', '°F', 0, False),
+    'Minimum Temperature':('red', '°F', 0, False),
+    'Average Temperature':('red', '°F', 0, False),
+    'Average Temperature Departure':('red', '°F', 1, False),
+    'Heating Degree Days':('blue', 'HDD', 0, True),
+    'Cooling Degree Days':('red', 'CDD', 0, True),
+    'Growing Degree Days':('green', 'GDD', 0, True),
+    'Precipitation':('green', 'IN', 2, True),
+}
+
+def _format(value,
+            decimals):
+
+    """
+    This function formats a panel statistic.
+    """
+
+    if _np.isnan(value) == True:
+        return 'M'
+    if decimals == 0:
+        return f"{int(round(value, 0))}"
+
+    return f"{round(value, decimals):.{decimals}f}"
+
+def stack_stations(data,
+                   parameter='Maximum Temperature'):
+
+    """
+    This function stacks one parameter of many stations into one batched array on a common date index.
+
+    Days a station has no data for are NaN.
+
+    Required Arguments:
+
+    1) data (Dictionary) - The data of each station: {station:Pandas.DataFrame}. The order of the stations is kept.
+
+    Optional Arguments:
+
+    1) parameter (String) - Default='Maximum Temperature'. The column of the data to stack.
+
+    Returns
+    -------
+
+    A tuple (stations, dates, values): the list of the stations, the common dates (Pandas.DatetimeIndex) and
+    a float array with one row per station and one column per date.
+    """
+
+    stations = list(data.keys())
+    columns = {}
+    for station in stations:
+        df = data[station]
+        columns[station] = _pd.Series(_pd.to_numeric(df[parameter], errors='coerce').to_numpy(dtype='float64'),
+                                      index=_pd.to_datetime(df['Date']))
+
+    frame = _pd.concat(columns, axis=1).sort_index()
+    values = frame.to_numpy(dtype='float64').T.copy()
+
+    return stations, frame.index, values
+
+def _fetch(stations,
+           fetch_jobs,
+           **kwargs):
+
+    """
+    This function downloads the data of the stations in parallel.
+    """
+
+    with _futures.ThreadPoolExecutor(max_workers=max(1, min(fetch_jobs, len(stations)))) as pool:
+        futures = {station:pool.submit(_get_data, station, **kwargs) for station in stations}
+
+        return {station:futures[station].result() for station in stations}
+
+@_tracing.traced('plot')
+def plot_station_dashboard(stations,
+                           parameter='Maximum Temperature',
+                           product_type='30 Day Dashboard',
+                           name='default',
+                           start_date=None,
+                           end_date=None,
+                           from_when=_yesterday,
+                           time_delta=30,
+                           proxies=None,
+                           notifications='off',
+                           fetch_jobs=8,
+                           columns='default',
+                           share_y=True,
+                           plot_type='bar',
+                           shade_anomaly=True,
+                           show_mean=True,
+                           x_axis_day_interval='default',
+                           x_axis_date_format='%m/%d',
+                           data=None):
+
+    """
+    This function plots a dashboard showing one parameter for many stations on a grid of small panels for a given time period.
+
+    Required Arguments:
+
+    1) stations (String List) - The identifiers of the ACIS2 stations. The panels follow the order of the list.
+
+    Optional Arguments:
+
+    1) parameter (String) - Default='Maximum Temperature'. The parameter on the dashboard:
+
+       'Maximum Temperature', 'Minimum Temperature', 'Average Temperature', 'Average Temperature Departure',
+       'Heating Degree Days', 'Cooling Degree Days', 'Growing Degree Days' or 'Precipitation'
+
+    2) product_type (String) - Default='30 Day Dashboard'. The type of product.
+
+    3) name (String) - Default='default'. The file name of the dashboard (without .png). If set to 'default' the file name is
+       "{number of stations} Stations {first station}-{last station}".
+
+    4) start_date (String or Datetime) - Default=None. For users who want specific start and end dates for their analysis,
+        they can either be passed in as a string in the format of 'YYYY-mm-dd' or as a datetime object.
+
+    5) end_date (String or Datetime) - Default=None. For users who want specific start and end dates for their analysis,
+        they can either be passed in as a string in the format of 'YYYY-mm-dd' or as a datetime object.
+
+    6) from_when (String or Datetime) - Default=Yesterday. Default value is yesterday's date.
+       Dates can either be passed in as a string in the format of 'YYYY-mm-dd' or as a datetime object.
+
+    7) time_delta (Integer) - Default=30. If from_when is NOT None, time_delta represents how many days IN THE PAST
+       from the time 'from_when.' (e.g. From January 31st back 30 days)
+
+    8) proxies (dict or None) - Default=None. If the user is using proxy server(s), the user must change the following:
+
+       proxies=None ---> proxies={
+                           'http':'http://url',
+                           'https':'https://url'
+                        }
+
+    9) notifications (String) - Default='off'. The notifications setting passed to get_data for each station.
+
+    10) fetch_jobs (Integer) - Default=8. The number of stations downloaded at the same time.
+
+    11) columns (Integer or String) - Default='default'. The number of panels in each row of the grid.
+        If set to 'default' the grid is as close to square as possible.
+
+    12) share_y (Boolean) - Default=True. When set to True, all panels share one y-axis so the stations can be compared.
+        When set to False, each panel is scaled to its own station.
+
+    13) plot_type (String) - Default='bar'. Options are 'bar' and 'line'.
+
+    14) shade_anomaly (Boolean) - Default=True. For plot_type='line', shades the values above the period mean of the station in red
+        and the values below in blue.
+
+    15) show_mean (Boolean) - Default=True. When set to True, the period mean of each station is drawn as a dashed line.
+
+    16) x_axis_day_interval (Integer or String) - Default='default'. The amount of days the x-axis tick marks are spaced apart.
+        If set to 'default' each panel has about 4 date ticks.
+
+    17) x_axis_date_format (String) - Default='%m/%d'. The datetime format as a string.
+        For more information regarding datetime string formats: https://docs.python.org/3/library/datetime.html#:~:text=Notes-,%25a,-Weekday%20as%20locale%E2%80%99s
+
+    18) data (Dictionary, Tuple or None) - Default=None. Data that is already downloaded: either {station:Pandas.DataFrame}
+        or the batched (stations, dates, values) tuple from stack_stations(). When data is passed, nothing is downloaded and
+        the stations of the data are plotted.
+
+    Returns
+    -------
+
+    A graphic showing the parameter for each station saved to {path}/{name}.png in the folder
+    f:ACIS Graphics/DASHBOARDS/{product_type}/{parameter}
+    """
+
+    if parameter not in _parameters.keys():
+        raise ValueError(f"{parameter} is not a dashboard parameter. Options are: {', '.join(_parameters.keys())}")
+
+    if data is None:
+        data = _fetch([station.upper() for station in stations],
+                      fetch_jobs,
+                      start_date=start_date,
+                      end_date=end_date,
+                      from_when=from_when,
+                      time_delta=time_delta,
+                      proxies=proxies,
+                      notifications=notifications)
+
+    if isinstance(data, tuple) == True:
+        stations, dates, values = data
+        values = _np.asarray(values, dtype='float64')
+    else:
+        stations, dates, values = stack_stations(data, parameter=parameter)
+
+    stations = [station.upper() for station in stations]
+    if len(stations) == 0:
+        raise ValueError("The dashboard needs at least one station.")
+
+    color, units, decimals, totals = _parameters[parameter]
+
+    # The statistics of every panel in one pass over the batched array.
+    counts = _np.sum(_np.isnan(values) == False, axis=1)
+    missing = len(dates) - counts
+    maxima = _np.nanmax(values, axis=1)
+    minima = _np.nanmin(values, axis=1)
+    means = _np.nanmean(values, axis=1)
+    sums = _np.nansum(values, axis=1)
+
+    if columns == 'default':
+        columns = int(_math.ceil(_math.sqrt(len(stations))))
+    columns = max(1, min(int(columns), len(stations)))
+    rows = int(_math.ceil(len(stations) / columns))
+
+    height = 1.7 * rows + 0.8
+    fig, axes = _plt.subplots(rows,
+                              columns,
+                              sharex=True,
+                              sharey=share_y,
+                              squeeze=False,
+                              figsize=(2.8 * columns, height))
+    figure_span = _tracing.start('figure')
+    fig.set_facecolor('aliceblue')
+    fig.subplots_adjust(top=1 - (0.8 if columns >= 5 else 1.0) / height, hspace=0.35, wspace=0.05 if share_y == True else 0.25)
+
+    # Narrow grids put the period of record on a second line so the title fits over the panels.
+    separator = '   ' if columns >= 5 else '\n'
+    fig.suptitle(f"{parameter} {product_type} [{units}]   {len(stations)} Stations{separator}Period Of Record: {dates[0].strftime('%m/%d/%Y')} - {dates[-1].strftime('%m/%d/%Y')}",
+                 fontsize=14 if columns >= 5 else 10,
+                 y=1 - 0.2 / height,
+                 fontweight='bold',
+                 bbox=_props)
+
+    if x_axis_day_interval == 'default':
+        x_axis_day_interval = max(1, int(_math.ceil(len(dates) / 4)))
+
+    # The axes are shared, so the date ticks are set once for the whole grid.
+    first = axes[0][0]
+    first.xaxis.set_major_locator(_md.DayLocator(interval=x_axis_day_interval))
+    first.xaxis.set_major_formatter(_md.DateFormatter(x_axis_date_format))
+
+    # With every value missing there is nothing to scale to, so the panels keep the default limits.
+    if share_y == True and counts.sum() > 0:
+        if totals == True:
+            first.set_ylim(0, _np.nanmax(values) + (0.05 if decimals == 2 else 2))
+        else:
+            first.set_ylim(_np.nanmin(values) - 5, _np.nanmax(values) + 5)
+
+    for i, ax in enumerate(axes.flat):
+
+        if i >= len(stations):
+            ax.set_visible(False)
+            continue
+
+        series = values[i]
+        mean = means[i]
+
+        if plot_type == 'bar':
+            ax.bar(dates, series, color=color, zorder=1, alpha=0.3)
+        else:
+            if shade_anomaly == False or _np.isnan(mean) == True:
+                ax.plot(dates, series, color='black', zorder=1, alpha=0.3)
+            else:
+                ax.fill_between(dates, mean, series, color='red', alpha=0.3, where=(series > mean), interpolate=True)
+                ax.fill_between(dates, mean, series, color='blue', alpha=0.3, where=(series < mean), interpolate=True)
+
+        if show_mean == True and _np.isnan(mean) == False:
+            ax.axhline(mean, color='black', linestyle='--', linewidth=0.8, alpha=0.5, zorder=2)
+
+        if share_y == False and counts[i] > 0:
+            if totals == True:
+                ax.set_ylim(0, maxima[i] + (0.05 if decimals == 2 else 2))
+            else:
+                ax.set_ylim(minima[i] - 5, maxima[i] + 5)
+
+        if totals == True:
+            stats = f"TOTAL: {_format(sums[i] if counts[i] > 0 else _np.nan, decimals)}  MAX: {_format(maxima[i], decimals)}"
+        else:
+            stats = f"MAX: {_format(maxima[i], decimals)}  MIN: {_format(minima[i], decimals)}  MEAN: {_format(mean, decimals)}"
+        if missing[i] > 0:
+            stats = f"{stats}  M: {missing[i]}"
+
+        ax.text(0.0, 1.04, stations[i], fontsize=7, fontweight='bold', va='bottom', transform=ax.transAxes, bbox=_props)
+        ax.text(1.0, 1.04, stats, fontsize=5, fontweight='bold', va='bottom', ha='right', transform=ax.transAxes)
+
+        # Panels with no panel below them (the last row or above an empty slot) show the dates.
+        if i + columns >= len(stations):
+            ax.tick_params(labelbottom=True)
+
+    path = _update_dashboard_file_paths(product_type, parameter)
+    if name == 'default':
+        name = f"{len(stations)} Stations {stations[0]}-{stations[-1]}"
+    fname = f"{name}.png"
+    figure_span.end()
+    _save_figure(fig, path, fname)
+    _plt.close(fig)
+    print(f"Saved {fname} to {path}")
@@ -14,7 +14,10 @@ import pandas as _pd
 import warnings as _warnings
 _warnings.filterwarnings('ignore')
 
+import xmacis2py.utils.tracing as _tracing
+
 from xmacis2py.utils.file_funcs import update_image_file_paths as _update_image_file_paths
+from xmacis2py.utils.file_funcs import save_figure as _save_figure
 from xmacis2py.data_access.get_data import get_data as _get_data
 from matplotlib.ticker import MaxNLocator as _MaxNLocator
 
@@ -64,6 +67,7 @@ else:
     else:
         _yesterday = f"{_year}-{_month}-0{_day}"   
     
+@_tracing.traced('plot')
 def plot_precipitation_summary(station, 
                                product_type='Precipitation 30 Day Summary',
                                start_date=None,
@@ -83,7 +87,8 @@ def plot_precipitation_summary(station,
                                create_ranking_table=True,
                                bar_label_fontsize=6,
                                only_label_bars_greater_than_0=True,
-                               hide_bar_labels=False):
+                               hide_bar_labels=False,
+                               df=None):
     
     """
     This function plots a graphic showing the Precipitation Summary for a given station for a given time period. 
@@ -148,6 +153,10 @@ def plot_precipitation_summary(station,
     19) hide_bar_labels (Boolean) - Default=False. To hide the bar labels, set to True. This is useful for users who do not want to 
         display the precipitation amounts on top of each bar and only want the graph without the labels to reduce potential clutter.
     
+    20) df (Pandas.DataFrame or None) - Default=None. The xmACIS2 data to plot. When set to None, the data is downloaded with get_data
+        using the arguments above. Pass a Pandas.DataFrame shaped like get_data (i.e. from the StationCache or synthetic_station)
+        to plot it without downloading.
+    
     Returns
     -------
     
@@ -156,17 +165,20 @@ def plot_precipitation_summary(station,
 
     _mpl.rcParams['font.size'] = bar_label_fontsize
 
-    df = _get_data(station,
-            start_date=start_date,
-            end_date=end_date,
-            from_when=from_when,
-            time_delta=time_delta,
-            proxies=proxies,
-            clear_recycle_bin=clear_recycle_bin,
-            to_csv=to_csv,
-            path=path,
-            filename=filename,
-            notifications=notifications)
+    if df is None:
+        df = _get_data(station,
+                start_date=start_date,
+                end_date=end_date,
+                from_when=from_when,
+                time_delta=time_delta,
+                proxies=proxies,
+                clear_recycle_bin=clear_recycle_bin,
+                to_csv=to_csv,
+                path=path,
+                filename=filename,
+                notifications=notifications)
+    else:
+        df = df.copy()
 
     missing = _analysis.number_of_missing_days(df,
                            'Precipitation')
@@ -212,6 +224,7 @@ def plot_precipitation_summary(station,
         
         
     fig = _plt.figure(figsize=(12,8))
+    figure_span = _tracing.start('figure')
     fig.set_facecolor('aliceblue')
 
     fig.suptitle(f"{station.upper()} Precipitation Summary [IN]   Period Of Record: {df['Date'].iloc[0].strftime('%m/%d/%Y')} - {df['Date'].iloc[-1].strftime('%m/%d/%Y')}", 
@@ -283,7 +296,8 @@ def plot_precipitation_summary(station,
                                        running_type='Sum')
         
     fname = f"{station.upper()} {product_type}.png"
-    fig.savefig(f"{img_path}/{fname}", bbox_inches='tight')
+    figure_span.end()
+    _save_figure(fig, img_path, fname)
     _plt.close(fig)
     print(f"Saved {fname} to {img_path}")
         
@@ -291,6 +305,7 @@ def plot_precipitation_summary(station,
         
         _plt.axis('off')
         fig = _plt.figure(figsize=(12,8))
+        figure_span = _tracing.start('figure')
         fig.set_facecolor('aliceblue')
         
         fig.text(0, 1, 
@@ -308,6 +323,7 @@ Standard Deviation: {standard_deviation}   Variance: {variance}   Skewness: {ske
 
     
     fname = f"{station.upper()} Stats Table.png"
-    fig.savefig(f"{img_path}/{fname}", bbox_inches='tight')
+    figure_span.end()
+    _save_figure(fig, img_path, fname)
     _plt.close(fig)
     print(f"Saved {fname} to {img_path}")
\ No newline at end of file
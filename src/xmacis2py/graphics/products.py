@@ -0,0 +1,57 @@
+"""
+This file hosts the registry of the graphics products of a station.
+
+The command line tool (xmacis2py.cli), the render service (xmacis2py.service) and the report builder (xmacis2py.graphics.report)
+all read their products from here.
+
+Each product name maps to (module, function, label): the module in xmacis2py.graphics, the plot function of that module and the
+label used in the file paths, reports and metrics.
+
+Product Functions:
+
+- read_products
+
+(C) Eric J. Drewitz 2025-2026
+"""
+import warnings as _warnings
+_warnings.filterwarnings('ignore')
+
+_products = {
+    'comprehensive':('temperature', 'plot_comprehensive_summary', 'Comprehensive'),
+    'maximum_temperature':('temperature', 'plot_maximum_temperature_summary', 'Maximum Temperature'),
+    'minimum_temperature':('temperature', 'plot_minimum_temperature_summary', 'Minimum Temperature'),
+    'average_temperature':('temperature', 'plot_average_temperature_summary', 'Average Temperature'),
+    'average_temperature_departure':('temperature', 'plot_average_temperature_departure_summary', 'Average Temperature Departure'),
+    'heating_degree_days':('temperature', 'plot_heating_degree_day_summary', 'Heating Degree Days'),
+    'cooling_degree_days':('temperature', 'plot_cooling_degree_day_summary', 'Cooling Degree Days'),
+    'growing_degree_days':('temperature', 'plot_growing_degree_day_summary', 'Growing Degree Days'),
+    'precipitation':('precipitation', 'plot_precipitation_summary', 'Precipitation')
+}
+
+# The precipitation summary is always a bar graph and is never detrended.
+_fixed_style = ['precipitation']
+
+def read_products(products):
+
+    """
+    This function reads a list of product names (i.e. the --products option of the command line tool).
+
+    Required Arguments:
+
+    1) products (String) - 'all' or a comma separated list of product names.
+
+    Returns
+    -------
+
+    A list of product names.
+    """
+
+    if products.strip().lower() == 'all':
+        return list(_products)
+
+    names = [product.strip().lower() for product in products.split(',') if product.strip() != '']
+    for name in names:
+        if name not in _products:
+            raise ValueError(f"Unknown product {name}. The products are: {', '.join(_products)}.")
+
+    return names
@@ -0,0 +1,314 @@
+"""
+This file hosts the report builder that renders the graphics products of many stations into a single multi-page PDF file.
+
+Every graphic and stats table of the plot functions becomes a page of the report instead of a PNG file. The report is written
+with one matplotlib PdfPages file, so each font is embedded once for the whole report (as a subsetted TrueType font) and shared
+by all the pages, and each page is written to the file as soon as it is drawn.
+
+The report has:
+
+1) A cover page - The title, the period of record, the stations and the products.
+
+2) The station dashboards (optional) - One page per product showing all the stations (see xmacis2py.graphics.dashboard).
+
+3) The products of each station - The graphic and the stats table of each product, station by station.
+
+4) A failures page - Only when the data of a station could not be downloaded or a product failed.
+
+The reports are saved to ACIS Reports.
+
+Example
+-------
+
+from xmacis2py.graphics.report import build_report
+
+build_report(['KRAL', 'KONT', 'KSBD'],
+             title='Inland Empire October 2025',
+             start_date='2025-10-01',
+             end_date='2025-10-31')
+
+Report Functions:
+
+- build_report
+
+(C) Eric J. Drewitz 2025-2026
+"""
+import concurrent.futures as _futures
+import contextlib as _contextlib
+import io as _io
+import textwrap as _textwrap
+import traceback as _traceback
+import matplotlib as _mpl
+import matplotlib.pyplot as _plt
+import warnings as _warnings
+_warnings.filterwarnings('ignore')
+
+import xmacis2py.utils.tracing as _tracing
+import xmacis2py.graphics.temperature as _temperature
+import xmacis2py.graphics.precipitation as _precipitation
+import xmacis2py.graphics.dashboard as _dashboard
+
+from matplotlib.backends.backend_pdf import PdfPages as _PdfPages
+from xmacis2py.utils.file_funcs import capture_figures as _capture_figures
+from xmacis2py.utils.file_funcs import update_report_file_paths as _update_report_file_paths
+from xmacis2py.data_access.get_data import get_data as _get_data
+from xmacis2py.data_access.get_data import _yesterday
+from xmacis2py.graphics.products import _products, _fixed_style, read_products
+
+try:
+    from datetime import(
+        datetime as _datetime,
+        UTC as _UTC
+    )
+except Exception as e:
+    from datetime import datetime as _datetime
+
+_props = dict(boxstyle='round', facecolor='wheat', alpha=1)
+
+# Type 42 embeds the fonts as TrueType fonts holding only the glyphs the report uses.
+_pdf_settings = {
+    'pdf.fonttype':42,
+    'pdf.compression':6
+}
+
+def _utc_now():
+
+    try:
+        return _datetime.now(_UTC)
+    except Exception as e:
+        return _datetime.utcnow()
+
+def _error_text(e):
+
+    return ''.join(_traceback.format_exception_only(type(e), e)).strip()
+
+def _text_page(pdf,
+               title,
+               lines):
+
+    """
+    This function adds a page of text (the cover and the failures) to the report.
+    """
+
+    fig = _plt.figure(figsize=(12,8))
+    fig.set_facecolor('aliceblue')
+    fig.text(0.5, 0.93, title, fontsize=18, fontweight='bold', ha='center', va='top', bbox=_props)
+    fig.text(0.05, 0.82, '\n'.join(lines), fontsize=10, fontweight='bold', va='top', family='monospace')
+
+    created = _utc_now()
+    fig.text(0.05,
+             0.03,
+             f"Report Created with xmACIS2Py (C) Eric J. Drewitz {created.strftime('%Y')} | Data Source: xmACIS2 | Report Creation Time: {created.strftime('%Y-%m-%d %H:%MZ')}",
+             fontsize=6,
+             fontweight='bold',
+             bbox=_props)
+
+    pdf.savefig(fig)
+    _plt.close(fig)
+
+def build_report(stations,
+                 products='all',
+                 title='default',
+                 filename='default',
+                 start_date=None,
+                 end_date=None,
+                 from_when=_yesterday,
+                 time_delta=30,
+                 proxies=None,
+                 fetch_jobs=8,
+                 dashboards=True,
+                 create_ranking_table=True,
+                 plot_type='bar',
+                 detrend_series=False,
+                 x_axis_day_interval=5,
+                 data=None):
+
+    """
+    This function renders the graphics products of a set of stations into a single multi-page PDF report.
+
+    Each graphic and stats table is a page of the report and no PNG files are saved. A station whose data cannot be downloaded and
+    a product that fails are skipped and listed on the last page of the report.
+
+    Required Arguments:
+
+    1) stations (String List) - The identifiers of the ACIS2 stations. The stations are in the report in the order of the list.
+
+    Optional Arguments:
+
+    1) products (String or String List) - Default='all'. 'all' or the names of the products (the same names as the xmacis2py render command):
+
+       'comprehensive', 'maximum_temperature', 'minimum_temperature', 'average_temperature', 'average_temperature_departure',
+       'heating_degree_days', 'cooling_degree_days', 'growing_degree_days', 'precipitation'
+
+    2) title (String) - Default='default'. The title on the cover page. If set to 'default' the title is
+       "xmACIS2 Climate Report {number of stations} Stations".
+
+    3) filename (String) - Default='default'. The file name of the report (without .pdf). If set to 'default' the file name is the title.
+
+    4) start_date (String or Datetime) - Default=None. For users who want specific start and end dates for their analysis,
+        they can either be passed in as a string in the format of 'YYYY-mm-dd' or as a datetime object.
+
+    5) end_date (String or Datetime) - Default=None. For users who want specific start and end dates for their analysis,
+        they can either be passed in as a string in the format of 'YYYY-mm-dd' or as a datetime object.
+
+    6) from_when (String or Datetime) - Default=Yesterday. Default value is yesterday's date.
+       Dates can either be passed in as a string in the format of 'YYYY-mm-dd' or as a datetime object.
+
+    7) time_delta (Integer) - Default=30. If from_when is NOT None, time_delta represents how many days IN THE PAST
+       from the time 'from_when.' (e.g. From January 31st back 30 days)
+
+    8) proxies (dict or None) - Default=None. If the user is using proxy server(s), the user must change the following:
+
+       proxies=None ---> proxies={
+                           'http':'http://url',
+                           'https':'https://url'
+                        }
+
+    9) fetch_jobs (Integer) - Default=8. The number of stations downloaded at the same time.
+
+    10) dashboards (Boolean) - Default=True. When set to True, a station dashboard of each product (except the comprehensive summary)
+        is added after the cover page.
+
+    11) create_ranking_table (Boolean) - Default=True. When set to True, the stats table of each product is added after its graphic.
+
+    12) plot_type (String) - Default='bar'. Options are 'bar' and 'line'. The precipitation summary is always a bar graph.
+
+    13) detrend_series (Boolean) - Default=False. When set to True, the data is detrended. The precipitation summary is never detrended.
+
+    14) x_axis_day_interval (Integer) - Default=5. The amount of days the x-axis tick marks are spaced apart.
+
+    15) data (Dictionary or None) - Default=None. Data that is already downloaded: {station:Pandas.DataFrame}.
+        When data is passed, nothing is downloaded and the stations of the data are in the report.
+
+    Returns
+    -------
+
+    A dictionary with the keys 'file' (the path of the PDF file), 'pages' (the number of pages) and
+    'failures' (a list of (station, product, error) tuples).
+    """
+
+    if isinstance(products, str) == True:
+        products = read_products(products)
+    else:
+        products = read_products(','.join(products))
+
+    if start_date != None and end_date != None:
+        window = f"{start_date} to {end_date}"
+    else:
+        window = f"{time_delta} Day"
+
+    failures = []
+    if data is None:
+        stations = [station.upper() for station in stations]
+        data = {}
+        with _futures.ThreadPoolExecutor(max_workers=max(1, min(fetch_jobs, len(stations)))) as pool:
+            futures = {station:pool.submit(_get_data,
+                                           station,
+                                           start_date=start_date,
+                                           end_date=end_date,
+                                           from_when=from_when,
+                                           time_delta=time_delta,
+                                           proxies=proxies,
+                                           notifications='off') for station in stations}
+            for station in stations:
+                try:
+                    data[station] = futures[station].result()
+                except Exception as e:
+                    failures.append((station, 'data', f"Download failed: {_error_text(e)}"))
+    else:
+        data = {station.upper():df for station, df in data.items()}
+        stations = list(data.keys())
+
+    if title == 'default':
+        title = f"xmACIS2 Climate Report {len(stations)} Stations"
+    if filename == 'default':
+        filename = title
+
+    path = _update_report_file_paths()
+    fname = f"{filename}.pdf"
+
+    pages = [0]
+
+    def sink(fig, png_path, png_fname):
+        pdf.savefig(fig, bbox_inches='tight')
+        pages[0] += 1
+
+    def render(plot, *args, **kwargs):
+        # The plot functions print where each PNG file would have been saved, so their messages are not printed.
+        try:
+            with _contextlib.redirect_stdout(_io.StringIO()):
+                plot(*args, **kwargs)
+        finally:
+            _plt.close('all')
+
+    with _tracing.span('report', file=fname, path=f"{path}/{fname}"), \
+         _mpl.rc_context(_pdf_settings), \
+         _PdfPages(f"{path}/{fname}", metadata={'Title':title, 'Author':'xmACIS2Py', 'Subject':f"xmACIS2 {window} Summaries"}) as pdf, \
+         _capture_figures(sink):
+
+        dates = [df['Date'] for df in data.values() if len(df) > 0]
+        if len(dates) > 0:
+            period = f"{min([d.iloc[0] for d in dates]).strftime('%m/%d/%Y')} - {max([d.iloc[-1] for d in dates]).strftime('%m/%d/%Y')}"
+        else:
+            period = 'No Data'
+
+        lines = [f"Period Of Record: {period}", '', f"Stations ({len(stations)}):"]
+        lines.extend(_textwrap.wrap(', '.join(stations), width=100))
+        lines.extend(['', f"Products ({len(products)}):"])
+        lines.extend(_textwrap.wrap(', '.join([_products[product][2] for product in products]), width=100))
+        _text_page(pdf, title, lines)
+        pages[0] += 1
+
+        if dashboards == True and len(data) > 0:
+            for product in products:
+                label = _products[product][2]
+                if label not in _dashboard._parameters.keys():
+                    continue
+                try:
+                    render(_dashboard.plot_station_dashboard,
+                           None,
+                           parameter=label,
+                           product_type=f"{window} Dashboard",
+                           plot_type=plot_type if product not in _fixed_style else 'bar',
+                           data=data)
+                except Exception as e:
+                    failures.append(('DASHBOARD', product, _error_text(e)))
+
+        for station in stations:
+            if station not in data.keys():
+                continue
+            for product in products:
+                module, function, label = _products[product]
+                plot = getattr(_temperature if module == 'temperature' else _precipitation, function)
+
+                kwargs = {
+                    'product_type':f"{label} {window} Summary",
+                    'notifications':'off',
+                    'x_axis_day_interval':x_axis_day_interval,
+                    'df':data[station]
+                }
+                if product != 'comprehensive':
+                    kwargs['create_ranking_table'] = create_ranking_table
+                if product not in _fixed_style:
+                    kwargs['plot_type'] = plot_type
+                    kwargs['detrend_series'] = detrend_series
+
+                try:
+                    render(plot, station, **kwargs)
+                except Exception as e:
+                    failures.append((station, product, _error_text(e)))
+
+        if len(failures) > 0:
+            lines = []
+            for station, product, error in failures:
+                lines.extend(_textwrap.wrap(f"{station} {product}: {error}", width=100, subsequent_indent='    '))
+            _text_page(pdf, f"Failures ({len(failures)})", lines)
+            pages[0] += 1
+
+    print(f"Saved {fname} to {path}")
+
+    return {
+        'file':f"{path}/{fname}",
+        'pages':pages[0],
+        'failures':failures
+    }
@@ -11,8 +11,12 @@ import pandas as _pd
 import warnings as _warnings
 _warnings.filterwarnings('ignore')
 import xmacis2py.analysis_tools.analysis as _analysis
+import xmacis2py.analysis_tools.degree_days as _degree_days
+
+import xmacis2py.utils.tracing as _tracing
 
 from xmacis2py.utils.file_funcs import update_image_file_paths as _update_image_file_paths
+from xmacis2py.utils.file_funcs import save_figure as _save_figure
 from xmacis2py.data_access.get_data import get_data as _get_data
 from matplotlib.ticker import MaxNLocator as _MaxNLocator
 
@@ -64,6 +68,7 @@ else:
     else:
         _yesterday = f"{_year}-{_month}-0{_day}"   
     
+@_tracing.traced('plot')
 def plot_comprehensive_summary(station, 
                                product_type='Comprehensive 30 Day Summary',
                                start_date=None,
@@ -84,7 +89,8 @@ def plot_comprehensive_summary(station,
                                detrend_type='linear',
                                plot_type='bar',
                                shade_anomaly=True,
-                               cooling_degree_days=True):
+                               cooling_degree_days=True,
+                               df=None):
 
     """
     This function plots a graphic showing the Temperature Summary for a given station for a given time period. 
@@ -154,7 +160,11 @@ def plot_comprehensive_summary(station,
         
     20) shade_anomaly (Boolean) - Default=True. For line plots, users can shade the area under the curve. Set to False to not shade under the curve. 
     
-    21) cooling_degree_days (Boolean) - Default=True. Set to False to display Heating Degrees instead of Cooling Degree Days. 
+    21) cooling_degree_days (Boolean) - Default=True. Set to False to display Heating Degrees instead of Cooling Degree Days.
+    
+    22) df (Pandas.DataFrame or None) - Default=None. The xmACIS2 data to plot. When set to None, the data is downloaded with get_data
+        using the arguments above. Pass a Pandas.DataFrame shaped like get_data (i.e. from the StationCache or synthetic_station)
+        to plot it without downloading.
     
     Returns
     -------
@@ -164,17 +174,20 @@ def plot_comprehensive_summary(station,
     
     plot_type = plot_type.lower()
 
-    df = _get_data(station,
-            start_date=start_date,
-            end_date=end_date,
-            from_when=from_when,
-            time_delta=time_delta,
-            proxies=proxies,
-            clear_recycle_bin=clear_recycle_bin,
-            to_csv=to_csv,
-            path=path,
-            filename=filename,
-            notifications=notifications)
+    if df is None:
+        df = _get_data(station,
+                start_date=start_date,
+                end_date=end_date,
+                from_when=from_when,
+                time_delta=time_delta,
+                proxies=proxies,
+                clear_recycle_bin=clear_recycle_bin,
+                to_csv=to_csv,
+                path=path,
+                filename=filename,
+                notifications=notifications)
+    else:
+        df = df.copy()
 
     maxt_missing = _analysis.number_of_missing_days(df,
                            'Maximum Temperature')
@@ -331,6 +344,7 @@ def plot_comprehensive_summary(station,
                     data_type='integer')
     
     fig = _plt.figure(figsize=(14,12))
+    figure_span = _tracing.start('figure')
     fig.set_facecolor('aliceblue')
 
     fig.suptitle(f"{station.upper()} Temperature Summary\nPeriod Of Record: {df['Date'].iloc[0].strftime('%m/%d/%Y')} - {df['Date'].iloc[-1].strftime('%m/%d/%Y')}", 
@@ -912,11 +926,13 @@ def plot_comprehensive_summary(station,
                                        detrend_type, 
                                        running_type='Mean')
     fname = f"{station.upper()} {product_type}.png"
-    fig.savefig(f"{img_path}/{fname}", bbox_inches='tight')
+    figure_span.end()
+    _save_figure(fig, img_path, fname)
     _plt.close(fig)
     print(f"Saved {fname} to {img_path}")
     
     
+@_tracing.traced('plot')
 def plot_maximum_temperature_summary(station, 
                                product_type='Maximum Temperature 30 Day Summary',
                                start_date=None,
@@ -937,7 +953,8 @@ def plot_maximum_temperature_summary(station,
                                detrend_type='linear',
                                create_ranking_table=True,
                                plot_type='bar',
-                               shade_anomaly=True):
+                               shade_anomaly=True,
+                               df=None):
     
     """
     This function plots a graphic showing the Maximum Temperature Summary for a given station for a given time period. 
@@ -1005,8 +1022,12 @@ def plot_maximum_temperature_summary(station,
     19) plot_type (String) - Default='bar'. Options are 'bar' and 'line'. For long periods (years), a line graph looks better, though for shorter periods (month), 
         a bar graph looks more aesthetic. 
         
-    20) shade_anomaly (Boolean) - Default=True. For line plots, users can shade the area under the curve. Set to False to not shade under the curve. 
-
+    20) shade_anomaly (Boolean) - Default=True. For line plots, users can shade the area under the curve. Set to False to not shade under the curve.
+    
+    21) df (Pandas.DataFrame or None) - Default=None. The xmACIS2 data to plot. When set to None, the data is downloaded with get_data
+        using the arguments above. Pass a Pandas.DataFrame shaped like get_data (i.e. from the StationCache or synthetic_station)
+        to plot it without downloading.
+    
     Returns
     -------
     
@@ -1016,17 +1037,20 @@ def plot_maximum_temperature_summary(station,
     plot_type = plot_type.lower()
 
 
-    df = _get_data(station,
-            start_date=start_date,
-            end_date=end_date,
-            from_when=from_when,
-            time_delta=time_delta,
-            proxies=proxies,
-            clear_recycle_bin=clear_recycle_bin,
-            to_csv=to_csv,
-            path=path,
-            filename=filename,
-            notifications=notifications)     
+    if df is None:
+        df = _get_data(station,
+                start_date=start_date,
+                end_date=end_date,
+                from_when=from_when,
+                time_delta=time_delta,
+                proxies=proxies,
+                clear_recycle_bin=clear_recycle_bin,
+                to_csv=to_csv,
+                path=path,
+                filename=filename,
+                notifications=notifications)
+    else:
+        df = df.copy()
 
     missing = _analysis.number_of_missing_days(df,
                            'Maximum Temperature')
@@ -1150,6 +1174,7 @@ def plot_maximum_temperature_summary(station,
             
         
     fig = _plt.figure(figsize=(12,8))
+    figure_span = _tracing.start('figure')
     fig.set_facecolor('aliceblue')
 
     ax = fig.add_subplot(1, 1, 1)
@@ -1344,7 +1369,8 @@ def plot_maximum_temperature_summary(station,
                                        detrend_type, 
                                        running_type='Mean')
     fname = f"{station.upper()} {product_type}.png"
-    fig.savefig(f"{img_path}/{fname}", bbox_inches='tight')
+    figure_span.end()
+    _save_figure(fig, img_path, fname)
     _plt.close(fig)
     print(f"Saved {fname} to {img_path}")
         
@@ -1352,6 +1378,7 @@ def plot_maximum_temperature_summary(station,
         
         _plt.axis('off')
         fig = _plt.figure(figsize=(12,8))
+        figure_span = _tracing.start('figure')
         fig.set_facecolor('aliceblue')
         
         if detrend_series == True:
@@ -1397,12 +1424,14 @@ Standard Deviation: {standard_deviation}   Variance: {variance}   Skewness: {ske
                                        detrend_type, 
                                        running_type='Mean')
         fname = f"{station.upper()} Stats Table.png"
-        fig.savefig(f"{path}/{fname}", bbox_inches='tight')
+        figure_span.end()
+        _save_figure(fig, path, fname)
         _plt.close(fig)
         print(f"Saved {fname} to {path}")
     
     
     
+@_tracing.traced('plot')
 def plot_minimum_temperature_summary(station, 
                                product_type='Minimum Temperature 30 Day Summary',
                                start_date=None,
@@ -1423,7 +1452,8 @@ def plot_minimum_temperature_summary(station,
                                detrend_type='linear',
                                create_ranking_table=True,
                                plot_type='bar',
-                               shade_anomaly=True):
+                               shade_anomaly=True,
+                               df=None):
     
     """
     This function plots a graphic showing the Minimum Temperature Summary for a given station for a given time period. 
@@ -1491,7 +1521,11 @@ def plot_minimum_temperature_summary(station,
     19) plot_type (String) - Default='bar'. Options are 'bar' and 'line'. For long periods (years), a line graph looks better, though for shorter periods (month), 
         a bar graph looks more aesthetic. 
         
-    20) shade_anomaly (Boolean) - Default=True. For line plots, users can shade the area under the curve. Set to False to not shade under the curve. 
+    20) shade_anomaly (Boolean) - Default=True. For line plots, users can shade the area under the curve. Set to False to not shade under the curve.
+    
+    21) df (Pandas.DataFrame or None) - Default=None. The xmACIS2 data to plot. When set to None, the data is downloaded with get_data
+        using the arguments above. Pass a Pandas.DataFrame shaped like get_data (i.e. from the StationCache or synthetic_station)
+        to plot it without downloading.
     
     Returns
     -------
@@ -1502,17 +1536,20 @@ def plot_minimum_temperature_summary(station,
     plot_type = plot_type.lower()
 
 
-    df = _get_data(station,
-            start_date=start_date,
-            end_date=end_date,
-            from_when=from_when,
-            time_delta=time_delta,
-            proxies=proxies,
-            clear_recycle_bin=clear_recycle_bin,
-            to_csv=to_csv,
-            path=path,
-            filename=filename,
-            notifications=notifications)     
+    if df is None:
+        df = _get_data(station,
+                start_date=start_date,
+                end_date=end_date,
+                from_when=from_when,
+                time_delta=time_delta,
+                proxies=proxies,
+                clear_recycle_bin=clear_recycle_bin,
+                to_csv=to_csv,
+                path=path,
+                filename=filename,
+                notifications=notifications)
+    else:
+        df = df.copy()
 
     missing = _analysis.number_of_missing_days(df,
                            'Minimum Temperature')
@@ -1636,6 +1673,7 @@ def plot_minimum_temperature_summary(station,
             
         
     fig = _plt.figure(figsize=(12,8))
+    figure_span = _tracing.start('figure')
     fig.set_facecolor('aliceblue')
 
     ax = fig.add_subplot(1, 1, 1)
@@ -1825,7 +1863,8 @@ def plot_minimum_temperature_summary(station,
                                        detrend_type, 
                                        running_type='Mean')
     fname = f"{station.upper()} {product_type}.png"
-    fig.savefig(f"{img_path}/{fname}", bbox_inches='tight')
+    figure_span.end()
+    _save_figure(fig, img_path, fname)
     _plt.close(fig)
     print(f"Saved {fname} to {img_path}")
         
@@ -1833,6 +1872,7 @@ def plot_minimum_temperature_summary(station,
         
         _plt.axis('off')
         fig = _plt.figure(figsize=(12,8))
+        figure_span = _tracing.start('figure')
         fig.set_facecolor('aliceblue')
         
         if detrend_series == True:
@@ -1878,10 +1918,12 @@ Standard Deviation: {standard_deviation}   Variance: {variance}   Skewness: {ske
                                        detrend_type, 
                                        running_type='Mean')
         fname = f"{station.upper()} Stats Table.png"
-        fig.savefig(f"{path}/{fname}", bbox_inches='tight')
+        figure_span.end()
+        _save_figure(fig, path, fname)
         _plt.close(fig)
         print(f"Saved {fname} to {path}")
         
+@_tracing.traced('plot')
 def plot_average_temperature_departure_summary(station, 
                                product_type='Average Temperature Departure Departure 30 Day Summary',
                                start_date=None,
@@ -1902,7 +1944,8 @@ def plot_average_temperature_departure_summary(station,
                                detrend_type='linear',
                                create_ranking_table=True,
                                plot_type='bar',
-                               shade_anomaly=True):
+                               shade_anomaly=True,
+                               df=None):
     
     """
     This function plots a graphic showing the Average Temperature Departure Summary for a given station for a given time period. 
@@ -1970,7 +2013,11 @@ def plot_average_temperature_departure_summary(station,
     19) plot_type (String) - Default='bar'. Options are 'bar' and 'line'. For long periods (years), a line graph looks better, though for shorter periods (month), 
         a bar graph looks more aesthetic. 
         
-    20) shade_anomaly (Boolean) - Default=True. For line plots, users can shade the area under the curve. Set to False to not shade under the curve. 
+    20) shade_anomaly (Boolean) - Default=True. For line plots, users can shade the area under the curve. Set to False to not shade under the curve.
+    
+    21) df (Pandas.DataFrame or None) - Default=None. The xmACIS2 data to plot. When set to None, the data is downloaded with get_data
+        using the arguments above. Pass a Pandas.DataFrame shaped like get_data (i.e. from the StationCache or synthetic_station)
+        to plot it without downloading.
     
     Returns
     -------
@@ -1981,17 +2028,20 @@ def plot_average_temperature_departure_summary(station,
     plot_type = plot_type.lower()
 
 
-    df = _get_data(station,
-            start_date=start_date,
-            end_date=end_date,
-            from_when=from_when,
-            time_delta=time_delta,
-            proxies=proxies,
-            clear_recycle_bin=clear_recycle_bin,
-            to_csv=to_csv,
-            path=path,
-            filename=filename,
-            notifications=notifications)     
+    if df is None:
+        df = _get_data(station,
+                start_date=start_date,
+                end_date=end_date,
+                from_when=from_when,
+                time_delta=time_delta,
+                proxies=proxies,
+                clear_recycle_bin=clear_recycle_bin,
+                to_csv=to_csv,
+                path=path,
+                filename=filename,
+                notifications=notifications)
+    else:
+        df = df.copy()
 
     missing = _analysis.number_of_missing_days(df,
                            'Average Temperature Departure')
@@ -2121,6 +2171,7 @@ def plot_average_temperature_departure_summary(station,
             
         
     fig = _plt.figure(figsize=(12,8))
+    figure_span = _tracing.start('figure')
     fig.set_facecolor('aliceblue')
 
     ax = fig.add_subplot(1, 1, 1)
@@ -2318,7 +2369,8 @@ def plot_average_temperature_departure_summary(station,
                                        detrend_type, 
                                        running_type='Mean')
     fname = f"{station.upper()} {product_type}.png"
-    fig.savefig(f"{img_path}/{fname}", bbox_inches='tight')
+    figure_span.end()
+    _save_figure(fig, img_path, fname)
     _plt.close(fig)
     print(f"Saved {fname} to {img_path}")
         
@@ -2326,6 +2378,7 @@ def plot_average_temperature_departure_summary(station,
         
         _plt.axis('off')
         fig = _plt.figure(figsize=(12,8))
+        figure_span = _tracing.start('figure')
         fig.set_facecolor('aliceblue')
         
         if detrend_series == True:
@@ -2371,10 +2424,12 @@ Standard Deviation: {standard_deviation}   Variance: {variance}   Skewness: {ske
                                        detrend_type, 
                                        running_type='Mean')
         fname = f"{station.upper()} Stats Table.png"
-        fig.savefig(f"{path}/{fname}", bbox_inches='tight')
+        figure_span.end()
+        _save_figure(fig, path, fname)
         _plt.close(fig)
         print(f"Saved {fname} to {path}")
     
+@_tracing.traced('plot')
 def plot_average_temperature_summary(station, 
                                product_type='Average Temperature 30 Day Summary',
                                start_date=None,
@@ -2395,7 +2450,8 @@ def plot_average_temperature_summary(station,
                                detrend_type='linear',
                                create_ranking_table=True,
                                plot_type='bar',
-                               shade_anomaly=True):
+                               shade_anomaly=True,
+                               df=None):
     
     """
     This function plots a graphic showing the Average Temperature Summary for a given station for a given time period. 
@@ -2463,7 +2519,11 @@ def plot_average_temperature_summary(station,
     19) plot_type (String) - Default='bar'. Options are 'bar' and 'line'. For long periods (years), a line graph looks better, though for shorter periods (month), 
         a bar graph looks more aesthetic. 
         
-    20) shade_anomaly (Boolean) - Default=True. For line plots, users can shade the area under the curve. Set to False to not shade under the curve. 
+    20) shade_anomaly (Boolean) - Default=True. For line plots, users can shade the area under the curve. Set to False to not shade under the curve.
+    
+    21) df (Pandas.DataFrame or None) - Default=None. The xmACIS2 data to plot. When set to None, the data is downloaded with get_data
+        using the arguments above. Pass a Pandas.DataFrame shaped like get_data (i.e. from the StationCache or synthetic_station)
+        to plot it without downloading.
     
     Returns
     -------
@@ -2474,17 +2534,20 @@ def plot_average_temperature_summary(station,
     plot_type = plot_type.lower()
 
 
-    df = _get_data(station,
-            start_date=start_date,
-            end_date=end_date,
-            from_when=from_when,
-            time_delta=time_delta,
-            proxies=proxies,
-            clear_recycle_bin=clear_recycle_bin,
-            to_csv=to_csv,
-            path=path,
-            filename=filename,
-            notifications=notifications)     
+    if df is None:
+        df = _get_data(station,
+                start_date=start_date,
+                end_date=end_date,
+                from_when=from_when,
+                time_delta=time_delta,
+                proxies=proxies,
+                clear_recycle_bin=clear_recycle_bin,
+                to_csv=to_csv,
+                path=path,
+                filename=filename,
+                notifications=notifications)
+    else:
+        df = df.copy()
 
     missing = _analysis.number_of_missing_days(df,
                            'Average Temperature')
@@ -2614,6 +2677,7 @@ def plot_average_temperature_summary(station,
             
         
     fig = _plt.figure(figsize=(12,8))
+    figure_span = _tracing.start('figure')
     fig.set_facecolor('aliceblue')
 
     ax = fig.add_subplot(1, 1, 1)
@@ -2807,7 +2871,8 @@ def plot_average_temperature_summary(station,
                                        detrend_type, 
                                        running_type='Mean')
     fname = f"{station.upper()} {product_type}.png"
-    fig.savefig(f"{img_path}/{fname}", bbox_inches='tight')
+    figure_span.end()
+    _save_figure(fig, img_path, fname)
     _plt.close(fig)
     print(f"Saved {fname} to {img_path}")
         
@@ -2815,6 +2880,7 @@ def plot_average_temperature_summary(station,
         
         _plt.axis('off')
         fig = _plt.figure(figsize=(12,8))
+        figure_span = _tracing.start('figure')
         fig.set_facecolor('aliceblue')
         
         if detrend_series == True:
@@ -2860,12 +2926,14 @@ Standard Deviation: {standard_deviation}   Variance: {variance}   Skewness: {ske
                                        detrend_type, 
                                        running_type='Mean')
         fname = f"{station.upper()} Stats Table.png"
-        fig.savefig(f"{path}/{fname}", bbox_inches='tight')
+        figure_span.end()
+        _save_figure(fig, path, fname)
         _plt.close(fig)
         print(f"Saved {fname} to {path}")
     
 
     
+@_tracing.traced('plot')
 def plot_heating_degree_day_summary(station, 
                                product_type='Heating Degree Days 30 Day Summary',
                                start_date=None,
@@ -2886,7 +2954,9 @@ def plot_heating_degree_day_summary(station,
                                detrend_type='linear',
                                create_ranking_table=True,
                                plot_type='bar',
-                               shade_anomaly=True):
+                               shade_anomaly=True,
+                               parameter='Heating Degree Days',
+                               df=None):
     
     """
     This function plots a graphic showing the Heating Degree Day Summary for a given station for a given time period. 
@@ -2956,6 +3026,16 @@ def plot_heating_degree_day_summary(station,
         
     20) shade_anomaly (Boolean) - Default=True. For line plots, users can shade the area under the curve. Set to False to not shade under the curve. 
     
+    21) parameter (String) - Default='Heating Degree Days'. The degree day column to plot. 
+        To plot degree days for a different base temperature, pass a recomputed degree day column name 
+        (i.e. 'Heating Degree Days Base 60'). 
+        Recomputed columns are computed from the maximum and minimum temperatures with xmacis2py.analysis_tools.degree_days.
+        A name that is not a heating degree day column raises a ValueError.
+    
+    22) df (Pandas.DataFrame or None) - Default=None. The xmACIS2 data to plot. When set to None, the data is downloaded with get_data
+        using the arguments above. Pass a Pandas.DataFrame shaped like get_data (i.e. from the StationCache or synthetic_station)
+        to plot it without downloading.
+    
     Returns
     -------
     
@@ -2965,68 +3045,81 @@ def plot_heating_degree_day_summary(station,
     plot_type = plot_type.lower()
 
 
-    df = _get_data(station,
-            start_date=start_date,
-            end_date=end_date,
-            from_when=from_when,
-            time_delta=time_delta,
-            proxies=proxies,
-            clear_recycle_bin=clear_recycle_bin,
-            to_csv=to_csv,
-            path=path,
-            filename=filename,
-            notifications=notifications)     
+    if _degree_days.is_degree_day_column(parameter, kind='heating') == False:
+        raise ValueError(f"{parameter} is not a heating degree day column. Pass 'Heating Degree Days' or a recomputed column like 'Heating Degree Days Base 60'.")
+
+    if df is None:
+        df = _get_data(station,
+                start_date=start_date,
+                end_date=end_date,
+                from_when=from_when,
+                time_delta=time_delta,
+                proxies=proxies,
+                clear_recycle_bin=clear_recycle_bin,
+                to_csv=to_csv,
+                path=path,
+                filename=filename,
+                notifications=notifications)
+    else:
+        df = df.copy()
+
+    if parameter not in df.columns:
+        df = _degree_days.add_degree_day_columns(df, parameter)
+
+    detrended_parameter = f"{parameter} Detrended"
+    # The stats table keeps the singular 'Degree Day' title of the service columns (i.e. 'Heating Degree Day Summary').
+    table_label = parameter.replace('Degree Days', 'Degree Day', 1)
 
     missing = _analysis.number_of_missing_days(df,
-                           'Heating Degree Days')
+                           parameter)
     
     if detrend_series == True:
         
         df = _analysis.detrend_data(df,
-                 'Heating Degree Days',
+                 parameter,
                  detrend_type=detrend_type)
         
         maxima = _analysis.period_maximum(df,
-                    'Heating Degree Days Detrended')
+                    detrended_parameter)
         
         mean = _analysis.period_mean(df,
-                    'Heating Degree Days Detrended',
+                    detrended_parameter,
                     round_value=True,
                     to_nearest=0,
                     data_type='integer')
         
         minima = _analysis.period_minimum(df,
-                    'Heating Degree Days Detrended',
+                    detrended_parameter,
                     round_value=True,
                     to_nearest=0,
                     data_type='integer')
         
         standard_deviation = _analysis.period_standard_deviation(df,
-                                                        'Heating Degree Days Detrended',
+                                                        detrended_parameter,
                                                         round_value=True,
                                                         to_nearest=1,
                                                         data_type='float')
         
         variance = _analysis.period_variance(df,
-                                    'Heating Degree Days Detrended',
+                                    detrended_parameter,
                                     round_value=True,
                                     to_nearest=1,
                                     data_type='float')
         
         skewness = _analysis.period_skewness(df,
-                                    'Heating Degree Days Detrended',
+                                    detrended_parameter,
                                     round_value=True,
                                     to_nearest=1,
                                     data_type='float')
         
         kurtosis = _analysis.period_kurtosis(df,
-                                    'Heating Degree Days Detrended',
+                                    detrended_parameter,
                                     round_value=True,
                                     to_nearest=1,
                                     data_type='float')
         
         top5 = _analysis.period_rankings(df,
-                                'Heating Degree Days Detrended',
+                                detrended_parameter,
                                 ascending=False,
                                 rank_subset='first',
                                 first=5,
@@ -3035,7 +3128,7 @@ def plot_heating_degree_day_summary(station,
                                 date_name='Date')
         
         bot5 = _analysis.period_rankings(df,
-                                'Heating Degree Days Detrended',
+                                detrended_parameter,
                                 ascending=False,
                                 rank_subset='last',
                                 first=5,
@@ -3047,46 +3140,46 @@ def plot_heating_degree_day_summary(station,
     else:
     
         maxima = _analysis.period_maximum(df,
-                    'Heating Degree Days')
+                    parameter)
         
         mean = _analysis.period_mean(df,
-                    'Heating Degree Days',
+                    parameter,
                     round_value=True,
                     to_nearest=0,
                     data_type='integer')
         
         minima = _analysis.period_minimum(df,
-                    'Heating Degree Days',
+                    parameter,
                     round_value=True,
                     to_nearest=0,
                     data_type='integer')
         
         standard_deviation = _analysis.period_standard_deviation(df,
-                                                        'Heating Degree Days',
+                                                        parameter,
                                                         round_value=True,
                                                         to_nearest=1,
                                                         data_type='float')
         
         variance = _analysis.period_variance(df,
-                                    'Heating Degree Days',
+                                    parameter,
                                     round_value=True,
                                     to_nearest=1,
                                     data_type='float')
         
         skewness = _analysis.period_skewness(df,
-                                    'Heating Degree Days',
+                                    parameter,
                                     round_value=True,
                                     to_nearest=1,
                                     data_type='float')
         
         kurtosis = _analysis.period_kurtosis(df,
-                                    'Heating Degree Days',
+                                    parameter,
                                     round_value=True,
                                     to_nearest=1,
                                     data_type='float')
         
         top5 = _analysis.period_rankings(df,
-                                'Heating Degree Days',
+                                parameter,
                                 ascending=False,
                                 rank_subset='first',
                                 first=5,
@@ -3095,7 +3188,7 @@ def plot_heating_degree_day_summary(station,
                                 date_name='Date')
         
         bot5 = _analysis.period_rankings(df,
-                                'Heating Degree Days',
+                                parameter,
                                 ascending=False,
                                 rank_subset='last',
                                 first=5,
@@ -3105,12 +3198,13 @@ def plot_heating_degree_day_summary(station,
             
         
     fig = _plt.figure(figsize=(12,8))
+    figure_span = _tracing.start('figure')
     fig.set_facecolor('aliceblue')
 
     ax = fig.add_subplot(1, 1, 1)
     ax.yaxis.set_major_locator(_MaxNLocator(integer=True))
     ax.xaxis.set_major_formatter(_md.DateFormatter(x_axis_date_format))
-    fig.suptitle(f"{station.upper()} Heating Degree Days Summary    Period Of Record: {df['Date'].iloc[0].strftime('%m/%d/%Y')} - {df['Date'].iloc[-1].strftime('%m/%d/%Y')}", 
+    fig.suptitle(f"{station.upper()} {parameter} Summary    Period Of Record: {df['Date'].iloc[0].strftime('%m/%d/%Y')} - {df['Date'].iloc[-1].strftime('%m/%d/%Y')}", 
                  fontsize=14, 
                  y=1.06, 
                  fontweight='bold', 
@@ -3119,7 +3213,7 @@ def plot_heating_degree_day_summary(station,
     if detrend_series == False:
         ax.text(0.0008, 
                 1.07, 
-                f"MAX: {int(round(_np.nanmax(df['Heating Degree Days']), 0))}", 
+                f"MAX: {int(round(_np.nanmax(df[parameter]), 0))}", 
                 fontsize=9, 
                 fontweight='bold', 
                 color='white', 
@@ -3127,7 +3221,7 @@ def plot_heating_degree_day_summary(station,
                 bbox=_warm)
         ax.text(0.175, 
                 1.07, 
-                f"MIN: {int(round(_np.nanmin(df['Heating Degree Days']), 0))}", 
+                f"MIN: {int(round(_np.nanmin(df[parameter]), 0))}", 
                 fontsize=9, 
                 fontweight='bold', 
                 color='white', 
@@ -3135,40 +3229,40 @@ def plot_heating_degree_day_summary(station,
                 bbox=_cool)
         ax.text(0.35, 
                 1.07, 
-                f"MEAN: {int(round(_np.nanmean(df['Heating Degree Days']), 0))}", 
+                f"MEAN: {int(round(_np.nanmean(df[parameter]), 0))}", 
                 fontsize=9, 
                 fontweight='bold', 
                 color='white', 
                 transform=ax.transAxes, 
                 bbox=_gray)
         ax.text(0.875, 1.01, f"NO DETRENDING", fontsize=8, fontweight='bold', bbox=_props, transform=ax.transAxes)
-        if _np.nanmin(df['Heating Degree Days']) >= 5:
-            ax.set_ylim((_np.nanmin(df['Heating Degree Days']) - 5), (_np.nanmax(df['Heating Degree Days']) + 5))
+        if _np.nanmin(df[parameter]) >= 5:
+            ax.set_ylim((_np.nanmin(df[parameter]) - 5), (_np.nanmax(df[parameter]) + 5))
         else:
-            ax.set_ylim(0, (_np.nanmax(df['Heating Degree Days']) + 5))
+            ax.set_ylim(0, (_np.nanmax(df[parameter]) + 5))
         ax.xaxis.set_major_locator(_md.DayLocator(interval=x_axis_day_interval))
         if plot_type == 'bar':
-            ax.bar(df['Date'], df['Heating Degree Days'], color='red', zorder=1, alpha=0.3)
+            ax.bar(df['Date'], df[parameter], color='red', zorder=1, alpha=0.3)
         else:
             if shade_anomaly == False:
-                ax.plot(df['Date'], df['Heating Degree Days'], color='black', zorder=1, alpha=0.3)
+                ax.plot(df['Date'], df[parameter], color='black', zorder=1, alpha=0.3)
             else:
                 ax.fill_between(df['Date'], 
                                 mean, 
-                                df['Heating Degree Days'], 
+                                df[parameter], 
                                 color='red', 
                                 alpha=0.3, 
-                                where=(df['Heating Degree Days'] > mean))
+                                where=(df[parameter] > mean))
                 ax.fill_between(df['Date'], 
                                 mean, 
-                                df['Heating Degree Days'], 
+                                df[parameter], 
                                 color='blue', 
                                 alpha=0.3, 
-                                where=(df['Heating Degree Days'] < mean))
+                                where=(df[parameter] < mean))
     else:
         ax.text(0.0008, 
                 1.07, 
-                f"MAX: {int(round(_np.nanmax(df['Heating Degree Days Detrended']), 0))}", 
+                f"MAX: {int(round(_np.nanmax(df[detrended_parameter]), 0))}", 
                 fontsize=9, 
                 fontweight='bold', 
                 color='white', 
@@ -3177,7 +3271,7 @@ def plot_heating_degree_day_summary(station,
         
         ax.text(0.175, 
                 1.07, 
-                f"MIN: {int(round(_np.nanmin(df['Heating Degree Days Detrended']), 0))}", 
+                f"MIN: {int(round(_np.nanmin(df[detrended_parameter]), 0))}", 
                 fontsize=9, 
                 fontweight='bold', 
                 color='white', 
@@ -3186,7 +3280,7 @@ def plot_heating_degree_day_summary(station,
         
         ax.text(0.35, 
                 1.07, 
-                f"MEAN: {int(round(_np.nanmean(df['Heating Degree Days Detrended']), 0))}", 
+                f"MEAN: {int(round(_np.nanmean(df[detrended_parameter]), 0))}", 
                 fontsize=9, 
                 fontweight='bold', 
                 color='white', 
@@ -3201,28 +3295,28 @@ def plot_heating_degree_day_summary(station,
                 bbox=_props, 
                 transform=ax.transAxes)
         
-        bar_colors = ['red' if t >= 0 else 'blue' for t in df['Heating Degree Days Detrended']]
-        ax.set_ylim((_np.nanmin(df['Heating Degree Days Detrended']) - 5), (_np.nanmax(df['Heating Degree Days Detrended']) + 5))
+        bar_colors = ['red' if t >= 0 else 'blue' for t in df[detrended_parameter]]
+        ax.set_ylim((_np.nanmin(df[detrended_parameter]) - 5), (_np.nanmax(df[detrended_parameter]) + 5))
         ax.xaxis.set_major_locator(_md.DayLocator(interval=x_axis_day_interval))
         if plot_type == 'bar':
-            ax.bar(df['Date'], df['Heating Degree Days Detrended'], color=bar_colors, zorder=1, alpha=0.3)
+            ax.bar(df['Date'], df[detrended_parameter], color=bar_colors, zorder=1, alpha=0.3)
         else:
             if shade_anomaly == False:
-                ax.plot(df['Date'], df['Heating Degree Days Detrended'], color='black', zorder=1, alpha=0.3)
+                ax.plot(df['Date'], df[detrended_parameter], color='black', zorder=1, alpha=0.3)
             else:
                 ax.fill_between(df['Date'], 
                                 mean, 
-                                df['Heating Degree Days Detrended'], 
+                                df[detrended_parameter], 
                                 color='red', 
                                 alpha=0.3, 
-                                where=(df['Heating Degree Days Detrended'] > mean))
+                                where=(df[detrended_parameter] > mean))
                 
                 ax.fill_between(df['Date'], 
                                 mean, 
-                                df['Heating Degree Days Detrended'], 
+                                df[detrended_parameter], 
                                 color='blue', 
                                 alpha=0.3, 
-                                where=(df['Heating Degree Days Detrended'] < mean))
+                                where=(df[detrended_parameter] < mean))
     
     if missing == 0:
         ax.text(0.865, 
@@ -3269,13 +3363,13 @@ def plot_heating_degree_day_summary(station,
         if detrend_series == True:
             
             run_mean = _analysis.running_mean(df, 
-                                        'Heating Degree Days Detrended',
+                                        detrended_parameter,
                                         interpolation_limit=interpolation_limit)
             df_max = _pd.DataFrame(run_mean, 
                                 columns=['MEAN'])        
         else:
             run_mean = _analysis.running_mean(df, 
-                                        'Heating Degree Days',
+                                        parameter,
                                         interpolation_limit=interpolation_limit)
             df_max = _pd.DataFrame(run_mean, 
                                 columns=['MEAN'])
@@ -3287,13 +3381,14 @@ def plot_heating_degree_day_summary(station,
         
     img_path = _update_image_file_paths(station, 
                                        product_type, 
-                                       'Heating Degree Days Summary', 
+                                       f"{parameter} Summary", 
                                        show_running_mean,
                                        detrend_series,
                                        detrend_type, 
                                        running_type='Mean')
     fname = f"{station.upper()} {product_type}.png"
-    fig.savefig(f"{img_path}/{fname}", bbox_inches='tight')
+    figure_span.end()
+    _save_figure(fig, img_path, fname)
     _plt.close(fig)
     print(f"Saved {fname} to {img_path}")
         
@@ -3301,13 +3396,14 @@ def plot_heating_degree_day_summary(station,
         
         _plt.axis('off')
         fig = _plt.figure(figsize=(12,8))
+        figure_span = _tracing.start('figure')
         fig.set_facecolor('aliceblue')
         
         if detrend_series == True:
     
-            fig.text(0, 1, f"""{station.upper()} Heating Degree Day Detrended Summary   Period Of Record: {df['Date'].iloc[0].strftime('%m/%d/%Y')} - {df['Date'].iloc[-1].strftime('%m/%d/%Y')}\n\nTop 5 Days: #1 {int(round(top5['Heating Degree Days Detrended'].iloc[0], 0))} - {top5['Date'].iloc[0].strftime('%m/%d/%Y')}   #2 {int(round(top5['Heating Degree Days Detrended'].iloc[1], 0))} - {top5['Date'].iloc[1].strftime('%m/%d/%Y')}   #3 {int(round(top5['Heating Degree Days Detrended'].iloc[2], 0))} - {top5['Date'].iloc[2].strftime('%m/%d/%Y')}   #4 {int(round(top5['Heating Degree Days Detrended'].iloc[3], 0))} - {top5['Date'].iloc[3].strftime('%m/%d/%Y')}   #5 {int(round(top5['Heating Degree Days Detrended'].iloc[4], 0))}  - {top5['Date'].iloc[4].strftime('%m/%d/%Y')}
+            fig.text(0, 1, f"""{station.upper()} {table_label} Detrended Summary   Period Of Record: {df['Date'].iloc[0].strftime('%m/%d/%Y')} - {df['Date'].iloc[-1].strftime('%m/%d/%Y')}\n\nTop 5 Days: #1 {int(round(top5[detrended_parameter].iloc[0], 0))} - {top5['Date'].iloc[0].strftime('%m/%d/%Y')}   #2 {int(round(top5[detrended_parameter].iloc[1], 0))} - {top5['Date'].iloc[1].strftime('%m/%d/%Y')}   #3 {int(round(top5[detrended_parameter].iloc[2], 0))} - {top5['Date'].iloc[2].strftime('%m/%d/%Y')}   #4 {int(round(top5[detrended_parameter].iloc[3], 0))} - {top5['Date'].iloc[3].strftime('%m/%d/%Y')}   #5 {int(round(top5[detrended_parameter].iloc[4], 0))}  - {top5['Date'].iloc[4].strftime('%m/%d/%Y')}
                     
-Bottom 5 Days: #1 {int(round(bot5['Heating Degree Days Detrended'].iloc[0], 0))} - {bot5['Date'].iloc[0].strftime('%m/%d/%Y')}   #2 {int(round(bot5['Heating Degree Days Detrended'].iloc[1], 0))}  - {bot5['Date'].iloc[1].strftime('%m/%d/%Y')}   #3 {int(round(bot5['Heating Degree Days Detrended'].iloc[2], 0))}  - {bot5['Date'].iloc[2].strftime('%m/%d/%Y')}   #4 {int(round(bot5['Heating Degree Days Detrended'].iloc[3], 0))}  - {bot5['Date'].iloc[3].strftime('%m/%d/%Y')}   #5 {int(round(bot5['Heating Degree Days Detrended'].iloc[4]))}  - {bot5['Date'].iloc[4].strftime('%m/%d/%Y')}
+Bottom 5 Days: #1 {int(round(bot5[detrended_parameter].iloc[0], 0))} - {bot5['Date'].iloc[0].strftime('%m/%d/%Y')}   #2 {int(round(bot5[detrended_parameter].iloc[1], 0))}  - {bot5['Date'].iloc[1].strftime('%m/%d/%Y')}   #3 {int(round(bot5[detrended_parameter].iloc[2], 0))}  - {bot5['Date'].iloc[2].strftime('%m/%d/%Y')}   #4 {int(round(bot5[detrended_parameter].iloc[3], 0))}  - {bot5['Date'].iloc[3].strftime('%m/%d/%Y')}   #5 {int(round(bot5[detrended_parameter].iloc[4]))}  - {bot5['Date'].iloc[4].strftime('%m/%d/%Y')}
                     
 Standard Deviation: {standard_deviation}   Variance: {variance}   Skewness: {skewness}   Kurtosis: {kurtosis}
                                         
@@ -3323,9 +3419,9 @@ Standard Deviation: {standard_deviation}   Variance: {variance}   Skewness: {ske
             
         else:
             
-            fig.text(0, 1, f"""{station.upper()} Heating Degree Day Summary   Period Of Record: {df['Date'].iloc[0].strftime('%m/%d/%Y')} - {df['Date'].iloc[-1].strftime('%m/%d/%Y')}\n\nTop 5 Days: #1 {int(round(top5['Heating Degree Days'].iloc[0], 0))}  - {top5['Date'].iloc[0].strftime('%m/%d/%Y')}   #2 {int(round(top5['Heating Degree Days'].iloc[1], 0))}  - {top5['Date'].iloc[1].strftime('%m/%d/%Y')}   #3 {int(round(top5['Heating Degree Days'].iloc[2], 0))}  - {top5['Date'].iloc[2].strftime('%m/%d/%Y')}   #4 {int(round(top5['Heating Degree Days'].iloc[3], 0))}  - {top5['Date'].iloc[3].strftime('%m/%d/%Y')}   #5 {int(round(top5['Heating Degree Days'].iloc[4], 0))}  - {top5['Date'].iloc[4].strftime('%m/%d/%Y')}
+            fig.text(0, 1, f"""{station.upper()} {table_label} Summary   Period Of Record: {df['Date'].iloc[0].strftime('%m/%d/%Y')} - {df['Date'].iloc[-1].strftime('%m/%d/%Y')}\n\nTop 5 Days: #1 {int(round(top5[parameter].iloc[0], 0))}  - {top5['Date'].iloc[0].strftime('%m/%d/%Y')}   #2 {int(round(top5[parameter].iloc[1], 0))}  - {top5['Date'].iloc[1].strftime('%m/%d/%Y')}   #3 {int(round(top5[parameter].iloc[2], 0))}  - {top5['Date'].iloc[2].strftime('%m/%d/%Y')}   #4 {int(round(top5[parameter].iloc[3], 0))}  - {top5['Date'].iloc[3].strftime('%m/%d/%Y')}   #5 {int(round(top5[parameter].iloc[4], 0))}  - {top5['Date'].iloc[4].strftime('%m/%d/%Y')}
                     
-Bottom 5 Days: #1 {int(round(bot5['Heating Degree Days'].iloc[0], 0))}  - {bot5['Date'].iloc[0].strftime('%m/%d/%Y')}   #2 {int(round(bot5['Heating Degree Days'].iloc[1], 0))}  - {bot5['Date'].iloc[1].strftime('%m/%d/%Y')}   #3 {int(round(bot5['Heating Degree Days'].iloc[2], 0))}  - {bot5['Date'].iloc[2].strftime('%m/%d/%Y')}   #4 {int(round(bot5['Heating Degree Days'].iloc[3], 0))}  - {bot5['Date'].iloc[3].strftime('%m/%d/%Y')}   #5 {int(round(bot5['Heating Degree Days'].iloc[4]))}  - {bot5['Date'].iloc[4].strftime('%m/%d/%Y')}
+Bottom 5 Days: #1 {int(round(bot5[parameter].iloc[0], 0))}  - {bot5['Date'].iloc[0].strftime('%m/%d/%Y')}   #2 {int(round(bot5[parameter].iloc[1], 0))}  - {bot5['Date'].iloc[1].strftime('%m/%d/%Y')}   #3 {int(round(bot5[parameter].iloc[2], 0))}  - {bot5['Date'].iloc[2].strftime('%m/%d/%Y')}   #4 {int(round(bot5[parameter].iloc[3], 0))}  - {bot5['Date'].iloc[3].strftime('%m/%d/%Y')}   #5 {int(round(bot5[parameter].iloc[4]))}  - {bot5['Date'].iloc[4].strftime('%m/%d/%Y')}
                     
 Standard Deviation: {standard_deviation}   Variance: {variance}   Skewness: {skewness}   Kurtosis: {kurtosis}
                                         
@@ -3340,16 +3436,18 @@ Standard Deviation: {standard_deviation}   Variance: {variance}   Skewness: {ske
 
         path = _update_image_file_paths(station, 
                                        product_type, 
-                                       'Heating Degree Days Summary', 
+                                       f"{parameter} Summary", 
                                        show_running_mean,
                                        detrend_series,
                                        detrend_type, 
                                        running_type='Mean')
         fname = f"{station.upper()} Stats Table.png"
-        fig.savefig(f"{path}/{fname}", bbox_inches='tight')
+        figure_span.end()
+        _save_figure(fig, path, fname)
         _plt.close(fig)
         print(f"Saved {fname} to {path}")
     
+@_tracing.traced('plot')
 def plot_cooling_degree_day_summary(station, 
                                product_type='Cooling Degree Days 30 Day Summary',
                                start_date=None,
@@ -3370,7 +3468,9 @@ def plot_cooling_degree_day_summary(station,
                                detrend_type='linear',
                                create_ranking_table=True,
                                plot_type='bar',
-                               shade_anomaly=True):
+                               shade_anomaly=True,
+                               parameter='Cooling Degree Days',
+                               df=None):
     
     """
     This function plots a graphic showing the Cooling Degree Day Summary for a given station for a given time period. 
@@ -3440,6 +3540,16 @@ def plot_cooling_degree_day_summary(station,
         
     20) shade_anomaly (Boolean) - Default=True. For line plots, users can shade the area under the curve. Set to False to not shade under the curve. 
     
+    21) parameter (String) - Default='Cooling Degree Days'. The degree day column to plot. 
+        To plot degree days for a different base temperature, pass a recomputed degree day column name 
+        (i.e. 'Cooling Degree Days Base 70'). 
+        Recomputed columns are computed from the maximum and minimum temperatures with xmacis2py.analysis_tools.degree_days.
+        A name that is not a cooling degree day column raises a ValueError.
+    
+    22) df (Pandas.DataFrame or None) - Default=None. The xmACIS2 data to plot. When set to None, the data is downloaded with get_data
+        using the arguments above. Pass a Pandas.DataFrame shaped like get_data (i.e. from the StationCache or synthetic_station)
+        to plot it without downloading.
+    
     Returns
     -------
     
@@ -3449,68 +3559,81 @@ def plot_cooling_degree_day_summary(station,
     plot_type = plot_type.lower()
 
 
-    df = _get_data(station,
-            start_date=start_date,
-            end_date=end_date,
-            from_when=from_when,
-            time_delta=time_delta,
-            proxies=proxies,
-            clear_recycle_bin=clear_recycle_bin,
-            to_csv=to_csv,
-            path=path,
-            filename=filename,
-            notifications=notifications)     
+    if _degree_days.is_degree_day_column(parameter, kind='cooling') == False:
+        raise ValueError(f"{parameter} is not a cooling degree day column. Pass 'Cooling Degree Days' or a recomputed column like 'Cooling Degree Days Base 60'.")
+
+    if df is None:
+        df = _get_data(station,
+                start_date=start_date,
+                end_date=end_date,
+                from_when=from_when,
+                time_delta=time_delta,
+                proxies=proxies,
+                clear_recycle_bin=clear_recycle_bin,
+                to_csv=to_csv,
+                path=path,
+                filename=filename,
+                notifications=notifications)
+    else:
+        df = df.copy()
+
+    if parameter not in df.columns:
+        df = _degree_days.add_degree_day_columns(df, parameter)
+
+    detrended_parameter = f"{parameter} Detrended"
+    # The stats table keeps the singular 'Degree Day' title of the service columns (i.e. 'Heating Degree Day Summary').
+    table_label = parameter.replace('Degree Days', 'Degree Day', 1)
 
     missing = _analysis.number_of_missing_days(df,
-                           'Cooling Degree Days')
+                           parameter)
     
     if detrend_series == True:
         
         df = _analysis.detrend_data(df,
-                 'Cooling Degree Days',
+                 parameter,
                  detrend_type=detrend_type)
         
         maxima = _analysis.period_maximum(df,
-                    'Cooling Degree Days Detrended')
+                    detrended_parameter)
         
         mean = _analysis.period_mean(df,
-                    'Cooling Degree Days Detrended',
+                    detrended_parameter,
                     round_value=True,
                     to_nearest=0,
                     data_type='integer')
         
         minima = _analysis.period_minimum(df,
-                    'Cooling Degree Days Detrended',
+                    detrended_parameter,
                     round_value=True,
                     to_nearest=0,
                     data_type='integer')
         
         standard_deviation = _analysis.period_standard_deviation(df,
-                                                        'Cooling Degree Days Detrended',
+                                                        detrended_parameter,
                                                         round_value=True,
                                                         to_nearest=1,
                                                         data_type='float')
         
         variance = _analysis.period_variance(df,
-                                    'Cooling Degree Days Detrended',
+                                    detrended_parameter,
                                     round_value=True,
                                     to_nearest=1,
                                     data_type='float')
         
         skewness = _analysis.period_skewness(df,
-                                    'Cooling Degree Days Detrended',
+                                    detrended_parameter,
                                     round_value=True,
                                     to_nearest=1,
                                     data_type='float')
         
         kurtosis = _analysis.period_kurtosis(df,
-                                    'Cooling Degree Days Detrended',
+                                    detrended_parameter,
                                     round_value=True,
                                     to_nearest=1,
                                     data_type='float')
         
         top5 = _analysis.period_rankings(df,
-                                'Cooling Degree Days Detrended',
+                                detrended_parameter,
                                 ascending=False,
                                 rank_subset='first',
                                 first=5,
@@ -3519,7 +3642,7 @@ def plot_cooling_degree_day_summary(station,
                                 date_name='Date')
         
         bot5 = _analysis.period_rankings(df,
-                                'Cooling Degree Days Detrended',
+                                detrended_parameter,
                                 ascending=False,
                                 rank_subset='last',
                                 first=5,
@@ -3531,46 +3654,46 @@ def plot_cooling_degree_day_summary(station,
     else:
     
         maxima = _analysis.period_maximum(df,
-                    'Cooling Degree Days')
+                    parameter)
         
         mean = _analysis.period_mean(df,
-                    'Cooling Degree Days',
+                    parameter,
                     round_value=True,
                     to_nearest=0,
                     data_type='integer')
         
         minima = _analysis.period_minimum(df,
-                    'Cooling Degree Days',
+                    parameter,
                     round_value=True,
                     to_nearest=0,
                     data_type='integer')
         
         standard_deviation = _analysis.period_standard_deviation(df,
-                                                        'Cooling Degree Days',
+                                                        parameter,
                                                         round_value=True,
                                                         to_nearest=1,
                                                         data_type='float')
         
         variance = _analysis.period_variance(df,
-                                    'Cooling Degree Days',
+                                    parameter,
                                     round_value=True,
                                     to_nearest=1,
                                     data_type='float')
         
         skewness = _analysis.period_skewness(df,
-                                    'Cooling Degree Days',
+                                    parameter,
                                     round_value=True,
                                     to_nearest=1,
                                     data_type='float')
         
         kurtosis = _analysis.period_kurtosis(df,
-                                    'Cooling Degree Days',
+                                    parameter,
                                     round_value=True,
                                     to_nearest=1,
                                     data_type='float')
         
         top5 = _analysis.period_rankings(df,
-                                'Cooling Degree Days',
+                                parameter,
                                 ascending=False,
                                 rank_subset='first',
                                 first=5,
@@ -3579,7 +3702,7 @@ def plot_cooling_degree_day_summary(station,
                                 date_name='Date')
         
         bot5 = _analysis.period_rankings(df,
-                                'Cooling Degree Days',
+                                parameter,
                                 ascending=False,
                                 rank_subset='last',
                                 first=5,
@@ -3589,12 +3712,13 @@ def plot_cooling_degree_day_summary(station,
             
         
     fig = _plt.figure(figsize=(12,8))
+    figure_span = _tracing.start('figure')
     fig.set_facecolor('aliceblue')
 
     ax = fig.add_subplot(1, 1, 1)
     ax.yaxis.set_major_locator(_MaxNLocator(integer=True))
     ax.xaxis.set_major_formatter(_md.DateFormatter(x_axis_date_format))
-    fig.suptitle(f"{station.upper()} Cooling Degree Days Summary    Period Of Record: {df['Date'].iloc[0].strftime('%m/%d/%Y')} - {df['Date'].iloc[-1].strftime('%m/%d/%Y')}", 
+    fig.suptitle(f"{station.upper()} {parameter} Summary    Period Of Record: {df['Date'].iloc[0].strftime('%m/%d/%Y')} - {df['Date'].iloc[-1].strftime('%m/%d/%Y')}", 
                  fontsize=14, 
                  y=1.06, 
                  fontweight='bold', 
@@ -3603,7 +3727,7 @@ def plot_cooling_degree_day_summary(station,
     if detrend_series == False:
         ax.text(0.0008, 
                 1.07, 
-                f"MAX: {int(round(_np.nanmax(df['Cooling Degree Days']), 0))}", 
+                f"MAX: {int(round(_np.nanmax(df[parameter]), 0))}", 
                 fontsize=9, 
                 fontweight='bold', 
                 color='white', 
@@ -3612,7 +3736,7 @@ def plot_cooling_degree_day_summary(station,
         
         ax.text(0.175, 
                 1.07, 
-                f"MIN: {int(round(_np.nanmin(df['Cooling Degree Days']), 0))}", 
+                f"MIN: {int(round(_np.nanmin(df[parameter]), 0))}", 
                 fontsize=9, 
                 fontweight='bold', 
                 color='white', 
@@ -3621,7 +3745,7 @@ def plot_cooling_degree_day_summary(station,
         
         ax.text(0.35, 
                 1.07, 
-                f"MEAN: {int(round(_np.nanmean(df['Cooling Degree Days']), 0))}", 
+                f"MEAN: {int(round(_np.nanmean(df[parameter]), 0))}", 
                 fontsize=9, 
                 fontweight='bold', 
                 color='white', 
@@ -3636,33 +3760,33 @@ def plot_cooling_degree_day_summary(station,
                 bbox=_props, 
                 transform=ax.transAxes)
         
-        if _np.nanmin(df['Cooling Degree Days']) >= 5:
-            ax.set_ylim((_np.nanmin(df['Cooling Degree Days']) - 5), (_np.nanmax(df['Cooling Degree Days']) + 5))
+        if _np.nanmin(df[parameter]) >= 5:
+            ax.set_ylim((_np.nanmin(df[parameter]) - 5), (_np.nanmax(df[parameter]) + 5))
         else:
-            ax.set_ylim(0, (_np.nanmax(df['Cooling Degree Days']) + 5))
+            ax.set_ylim(0, (_np.nanmax(df[parameter]) + 5))
         ax.xaxis.set_major_locator(_md.DayLocator(interval=x_axis_day_interval))
         if plot_type == 'bar':
-            ax.bar(df['Date'], df['Cooling Degree Days'], color='blue', zorder=1, alpha=0.3)
+            ax.bar(df['Date'], df[parameter], color='blue', zorder=1, alpha=0.3)
         else:
             if shade_anomaly == False:
-                ax.plot(df['Date'], df['Cooling Degree Days'], color='black', zorder=1, alpha=0.3)
+                ax.plot(df['Date'], df[parameter], color='black', zorder=1, alpha=0.3)
             else:
                 ax.fill_between(df['Date'], 
                                 mean, 
-                                df['Cooling Degree Days'], 
+                                df[parameter], 
                                 color='blue', 
                                 alpha=0.3, 
-                                where=(df['Cooling Degree Days'] > mean))
+                                where=(df[parameter] > mean))
                 ax.fill_between(df['Date'], 
                                 mean, 
-                                df['Cooling Degree Days'], 
+                                df[parameter], 
                                 color='red', 
                                 alpha=0.3, 
-                                where=(df['Cooling Degree Days'] < mean))
+                                where=(df[parameter] < mean))
     else:
         ax.text(0.0008, 
                 1.07, 
-                f"MAX: {int(round(_np.nanmax(df['Cooling Degree Days Detrended']), 0))}", 
+                f"MAX: {int(round(_np.nanmax(df[detrended_parameter]), 0))}", 
                 fontsize=9, 
                 fontweight='bold', 
                 color='white', 
@@ -3670,7 +3794,7 @@ def plot_cooling_degree_day_summary(station,
                 bbox=_cool)
         
         ax.text(0.175, 
-                1.07, f"MIN: {int(round(_np.nanmin(df['Cooling Degree Days Detrended']), 0))}", 
+                1.07, f"MIN: {int(round(_np.nanmin(df[detrended_parameter]), 0))}", 
                 fontsize=9, 
                 fontweight='bold', 
                 color='white', 
@@ -3679,7 +3803,7 @@ def plot_cooling_degree_day_summary(station,
         
         ax.text(0.35, 
                 1.07, 
-                f"MEAN: {int(round(_np.nanmean(df['Cooling Degree Days Detrended']), 0))}", 
+                f"MEAN: {int(round(_np.nanmean(df[detrended_parameter]), 0))}", 
                 fontsize=9, 
                 fontweight='bold', 
                 color='white', 
@@ -3693,27 +3817,27 @@ def plot_cooling_degree_day_summary(station,
                 bbox=_props, 
                 transform=ax.transAxes)
         
-        bar_colors = ['red' if t >= 0 else 'blue' for t in df['Cooling Degree Days Detrended']]
-        ax.set_ylim((_np.nanmin(df['Cooling Degree Days Detrended']) - 5), (_np.nanmax(df['Cooling Degree Days Detrended']) + 5))
+        bar_colors = ['red' if t >= 0 else 'blue' for t in df[detrended_parameter]]
+        ax.set_ylim((_np.nanmin(df[detrended_parameter]) - 5), (_np.nanmax(df[detrended_parameter]) + 5))
         ax.xaxis.set_major_locator(_md.DayLocator(interval=x_axis_day_interval))
         if plot_type == 'bar':
-            ax.bar(df['Date'], df['Cooling Degree Days Detrended'], color=bar_colors, zorder=1, alpha=0.3)
+            ax.bar(df['Date'], df[detrended_parameter], color=bar_colors, zorder=1, alpha=0.3)
         else:
             if shade_anomaly == False:
-                ax.plot(df['Date'], df['Cooling Degree Days Detrended'], color='black', zorder=1, alpha=0.3)
+                ax.plot(df['Date'], df[detrended_parameter], color='black', zorder=1, alpha=0.3)
             else:
                 ax.fill_between(df['Date'], 
                                 mean, 
-                                df['Cooling Degree Days Detrended'], 
+                                df[detrended_parameter], 
                                 color='blue', 
                                 alpha=0.3, 
-                                where=(df['Cooling Degree Days Detrended'] > mean))
+                                where=(df[detrended_parameter] > mean))
                 ax.fill_between(df['Date'], 
                                 mean, 
-                                df['Cooling Degree Days Detrended'], 
+                                df[detrended_parameter], 
                                 color='red', 
                                 alpha=0.3, 
-                                where=(df['Cooling Degree Days Detrended'] < mean))
+                                where=(df[detrended_parameter] < mean))
     
     if missing == 0:
         ax.text(0.865, 
@@ -3761,13 +3885,13 @@ def plot_cooling_degree_day_summary(station,
         if detrend_series == True:
             
             run_mean = _analysis.running_mean(df, 
-                                        'Cooling Degree Days Detrended',
+                                        detrended_parameter,
                                         interpolation_limit=interpolation_limit)
             df_max = _pd.DataFrame(run_mean, 
                                 columns=['MEAN'])        
         else:
             run_mean = _analysis.running_mean(df, 
-                                        'Cooling Degree Days',
+                                        parameter,
                                         interpolation_limit=interpolation_limit)
             df_max = _pd.DataFrame(run_mean, 
                                 columns=['MEAN'])
@@ -3779,13 +3903,14 @@ def plot_cooling_degree_day_summary(station,
         
     img_path = _update_image_file_paths(station, 
                                        product_type, 
-                                       'Cooling Degree Days Summary', 
+                                       f"{parameter} Summary", 
                                        show_running_mean,
                                        detrend_series,
                                        detrend_type, 
                                        running_type='Mean')
     fname = f"{station.upper()} {product_type}.png"
-    fig.savefig(f"{img_path}/{fname}", bbox_inches='tight')
+    figure_span.end()
+    _save_figure(fig, img_path, fname)
     _plt.close(fig)
     print(f"Saved {fname} to {img_path}")
         
@@ -3793,13 +3918,14 @@ def plot_cooling_degree_day_summary(station,
         
         _plt.axis('off')
         fig = _plt.figure(figsize=(12,8))
+        figure_span = _tracing.start('figure')
         fig.set_facecolor('aliceblue')
         
         if detrend_series == True:
     
-            fig.text(0, 1, f"""{station.upper()} Cooling Degree Day Detrended Summary   Period Of Record: {df['Date'].iloc[0].strftime('%m/%d/%Y')} - {df['Date'].iloc[-1].strftime('%m/%d/%Y')}\n\nTop 5 Days: #1 {int(round(top5['Cooling Degree Days Detrended'].iloc[0], 0))}  - {top5['Date'].iloc[0].strftime('%m/%d/%Y')}   #2 {int(round(top5['Cooling Degree Days Detrended'].iloc[1], 0))}  - {top5['Date'].iloc[1].strftime('%m/%d/%Y')}   #3 {int(round(top5['Cooling Degree Days Detrended'].iloc[2], 0))}  - {top5['Date'].iloc[2].strftime('%m/%d/%Y')}   #4 {int(round(top5['Cooling Degree Days Detrended'].iloc[3], 0))}  - {top5['Date'].iloc[3].strftime('%m/%d/%Y')}   #5 {int(round(top5['Cooling Degree Days Detrended'].iloc[4], 0))}  - {top5['Date'].iloc[4].strftime('%m/%d/%Y')}
+            fig.text(0, 1, f"""{station.upper()} {table_label} Detrended Summary   Period Of Record: {df['Date'].iloc[0].strftime('%m/%d/%Y')} - {df['Date'].iloc[-1].strftime('%m/%d/%Y')}\n\nTop 5 Days: #1 {int(round(top5[detrended_parameter].iloc[0], 0))}  - {top5['Date'].iloc[0].strftime('%m/%d/%Y')}   #2 {int(round(top5[detrended_parameter].iloc[1], 0))}  - {top5['Date'].iloc[1].strftime('%m/%d/%Y')}   #3 {int(round(top5[detrended_parameter].iloc[2], 0))}  - {top5['Date'].iloc[2].strftime('%m/%d/%Y')}   #4 {int(round(top5[detrended_parameter].iloc[3], 0))}  - {top5['Date'].iloc[3].strftime('%m/%d/%Y')}   #5 {int(round(top5[detrended_parameter].iloc[4], 0))}  - {top5['Date'].iloc[4].strftime('%m/%d/%Y')}
                     
-Bottom 5 Days: #1 {int(round(bot5['Cooling Degree Days Detrended'].iloc[0], 0))}  - {bot5['Date'].iloc[0].strftime('%m/%d/%Y')}   #2 {int(round(bot5['Cooling Degree Days Detrended'].iloc[1], 0))}  - {bot5['Date'].iloc[1].strftime('%m/%d/%Y')}   #3 {int(round(bot5['Cooling Degree Days Detrended'].iloc[2], 0))}  - {bot5['Date'].iloc[2].strftime('%m/%d/%Y')}   #4 {int(round(bot5['Cooling Degree Days Detrended'].iloc[3], 0))}  - {bot5['Date'].iloc[3].strftime('%m/%d/%Y')}   #5 {int(round(bot5['Cooling Degree Days Detrended'].iloc[4]))}  - {bot5['Date'].iloc[4].strftime('%m/%d/%Y')}
+Bottom 5 Days: #1 {int(round(bot5[detrended_parameter].iloc[0], 0))}  - {bot5['Date'].iloc[0].strftime('%m/%d/%Y')}   #2 {int(round(bot5[detrended_parameter].iloc[1], 0))}  - {bot5['Date'].iloc[1].strftime('%m/%d/%Y')}   #3 {int(round(bot5[detrended_parameter].iloc[2], 0))}  - {bot5['Date'].iloc[2].strftime('%m/%d/%Y')}   #4 {int(round(bot5[detrended_parameter].iloc[3], 0))}  - {bot5['Date'].iloc[3].strftime('%m/%d/%Y')}   #5 {int(round(bot5[detrended_parameter].iloc[4]))}  - {bot5['Date'].iloc[4].strftime('%m/%d/%Y')}
                     
 Standard Deviation: {standard_deviation}   Variance: {variance}   Skewness: {skewness}   Kurtosis: {kurtosis}
                                         
@@ -3815,9 +3941,9 @@ Standard Deviation: {standard_deviation}   Variance: {variance}   Skewness: {ske
             
         else:
             
-            fig.text(0, 1, f"""{station.upper()} Cooling Degree Day Summary   Period Of Record: {df['Date'].iloc[0].strftime('%m/%d/%Y')} - {df['Date'].iloc[-1].strftime('%m/%d/%Y')}\n\nTop 5 Days: #1 {int(round(top5['Cooling Degree Days'].iloc[0], 0))}  - {top5['Date'].iloc[0].strftime('%m/%d/%Y')}   #2 {int(round(top5['Cooling Degree Days'].iloc[1], 0))}  - {top5['Date'].iloc[1].strftime('%m/%d/%Y')}   #3 {int(round(top5['Cooling Degree Days'].iloc[2], 0))}  - {top5['Date'].iloc[2].strftime('%m/%d/%Y')}   #4 {int(round(top5['Cooling Degree Days'].iloc[3], 0))}  - {top5['Date'].iloc[3].strftime('%m/%d/%Y')}   #5 {int(round(top5['Cooling Degree Days'].iloc[4], 0))}  - {top5['Date'].iloc[4].strftime('%m/%d/%Y')}
+            fig.text(0, 1, f"""{station.upper()} {table_label} Summary   Period Of Record: {df['Date'].iloc[0].strftime('%m/%d/%Y')} - {df['Date'].iloc[-1].strftime('%m/%d/%Y')}\n\nTop 5 Days: #1 {int(round(top5[parameter].iloc[0], 0))}  - {top5['Date'].iloc[0].strftime('%m/%d/%Y')}   #2 {int(round(top5[parameter].iloc[1], 0))}  - {top5['Date'].iloc[1].strftime('%m/%d/%Y')}   #3 {int(round(top5[parameter].iloc[2], 0))}  - {top5['Date'].iloc[2].strftime('%m/%d/%Y')}   #4 {int(round(top5[parameter].iloc[3], 0))}  - {top5['Date'].iloc[3].strftime('%m/%d/%Y')}   #5 {int(round(top5[parameter].iloc[4], 0))}  - {top5['Date'].iloc[4].strftime('%m/%d/%Y')}
                     
-Bottom 5 Days: #1 {int(round(bot5['Cooling Degree Days'].iloc[0], 0))}  - {bot5['Date'].iloc[0].strftime('%m/%d/%Y')}   #2 {int(round(bot5['Cooling Degree Days'].iloc[1], 0))}  - {bot5['Date'].iloc[1].strftime('%m/%d/%Y')}   #3 {int(round(bot5['Cooling Degree Days'].iloc[2], 0))}  - {bot5['Date'].iloc[2].strftime('%m/%d/%Y')}   #4 {int(round(bot5['Cooling Degree Days'].iloc[3], 0))}  - {bot5['Date'].iloc[3].strftime('%m/%d/%Y')}   #5 {int(round(bot5['Cooling Degree Days'].iloc[4]))}  - {bot5['Date'].iloc[4].strftime('%m/%d/%Y')}
+Bottom 5 Days: #1 {int(round(bot5[parameter].iloc[0], 0))}  - {bot5['Date'].iloc[0].strftime('%m/%d/%Y')}   #2 {int(round(bot5[parameter].iloc[1], 0))}  - {bot5['Date'].iloc[1].strftime('%m/%d/%Y')}   #3 {int(round(bot5[parameter].iloc[2], 0))}  - {bot5['Date'].iloc[2].strftime('%m/%d/%Y')}   #4 {int(round(bot5[parameter].iloc[3], 0))}  - {bot5['Date'].iloc[3].strftime('%m/%d/%Y')}   #5 {int(round(bot5[parameter].iloc[4]))}  - {bot5['Date'].iloc[4].strftime('%m/%d/%Y')}
                     
 Standard Deviation: {standard_deviation}   Variance: {variance}   Skewness: {skewness}   Kurtosis: {kurtosis}
                                         
@@ -3832,16 +3958,18 @@ Standard Deviation: {standard_deviation}   Variance: {variance}   Skewness: {ske
 
         path = _update_image_file_paths(station, 
                                        product_type, 
-                                       'Cooling Degree Days Summary', 
+                                       f"{parameter} Summary", 
                                        show_running_mean,
                                        detrend_series,
                                        detrend_type, 
                                        running_type='Mean')
         fname = f"{station.upper()} Stats Table.png"
-        fig.savefig(f"{path}/{fname}", bbox_inches='tight')
+        figure_span.end()
+        _save_figure(fig, path, fname)
         _plt.close(fig)
         print(f"Saved {fname} to {path}")
     
+@_tracing.traced('plot')
 def plot_growing_degree_day_summary(station, 
                                product_type='Growing Degree Days 30 Day Summary',
                                start_date=None,
@@ -3862,7 +3990,9 @@ def plot_growing_degree_day_summary(station,
                                detrend_type='linear',
                                create_ranking_table=True,
                                plot_type='bar',
-                               shade_anomaly=True):
+                               shade_anomaly=True,
+                               parameter='Growing Degree Days',
+                               df=None):
     
     """
     This function plots a graphic showing the Growing Degree Day Summary for a given station for a given time period. 
@@ -3932,6 +4062,16 @@ def plot_growing_degree_day_summary(station,
         
     20) shade_anomaly (Boolean) - Default=True. For line plots, users can shade the area under the curve. Set to False to not shade under the curve. 
     
+    21) parameter (String) - Default='Growing Degree Days'. The degree day column to plot. 
+        To plot degree days for a different base temperature, pass a recomputed degree day column name 
+        (i.e. 'Growing Degree Days Base 50' or 'Growing Degree Days Base 50 Cap 86'). 
+        Recomputed columns are computed from the maximum and minimum temperatures with xmacis2py.analysis_tools.degree_days.
+        A name that is not a growing degree day column raises a ValueError.
+    
+    22) df (Pandas.DataFrame or None) - Default=None. The xmACIS2 data to plot. When set to None, the data is downloaded with get_data
+        using the arguments above. Pass a Pandas.DataFrame shaped like get_data (i.e. from the StationCache or synthetic_station)
+        to plot it without downloading.
+    
     Returns
     -------
     
@@ -3941,68 +4081,81 @@ def plot_growing_degree_day_summary(station,
     plot_type = plot_type.lower()
 
 
-    df = _get_data(station,
-            start_date=start_date,
-            end_date=end_date,
-            from_when=from_when,
-            time_delta=time_delta,
-            proxies=proxies,
-            clear_recycle_bin=clear_recycle_bin,
-            to_csv=to_csv,
-            path=path,
-            filename=filename,
-            notifications=notifications)     
+    if _degree_days.is_degree_day_column(parameter, kind='growing') == False:
+        raise ValueError(f"{parameter} is not a growing degree day column. Pass 'Growing Degree Days' or a recomputed column like 'Growing Degree Days Base 50'.")
+
+    if df is None:
+        df = _get_data(station,
+                start_date=start_date,
+                end_date=end_date,
+                from_when=from_when,
+                time_delta=time_delta,
+                proxies=proxies,
+                clear_recycle_bin=clear_recycle_bin,
+                to_csv=to_csv,
+                path=path,
+                filename=filename,
+                notifications=notifications)
+    else:
+        df = df.copy()
+
+    if parameter not in df.columns:
+        df = _degree_days.add_degree_day_columns(df, parameter)
+
+    detrended_parameter = f"{parameter} Detrended"
+    # The stats table keeps the singular 'Degree Day' title of the service columns (i.e. 'Heating Degree Day Summary').
+    table_label = parameter.replace('Degree Days', 'Degree Day', 1)
 
     missing = _analysis.number_of_missing_days(df,
-                           'Growing Degree Days')
+                           parameter)
     
     if detrend_series == True:
         
         df = _analysis.detrend_data(df,
-                 'Growing Degree Days',
+                 parameter,
                  detrend_type=detrend_type)
         
         maxima = _analysis.period_maximum(df,
-                    'Growing Degree Days Detrended')
+                    detrended_parameter)
         
         mean = _analysis.period_mean(df,
-                    'Growing Degree Days Detrended',
+                    detrended_parameter,
                     round_value=True,
                     to_nearest=0,
                     data_type='integer')
         
         minima = _analysis.period_minimum(df,
-                    'Growing Degree Days Detrended',
+                    detrended_parameter,
                     round_value=True,
                     to_nearest=0,
                     data_type='integer')
         
         standard_deviation = _analysis.period_standard_deviation(df,
-                                                        'Growing Degree Days Detrended',
+                                                        detrended_parameter,
                                                         round_value=True,
                                                         to_nearest=1,
                                                         data_type='float')
         
         variance = _analysis.period_variance(df,
-                                    'Growing Degree Days Detrended',
+                                    detrended_parameter,
                                     round_value=True,
                                     to_nearest=1,
                                     data_type='float')
         
         skewness = _analysis.period_skewness(df,
-                                    'Growing Degree Days Detrended',
+                                    detrended_parameter,
                                     round_value=True,
                                     to_nearest=1,
                                     data_type='float')
         
         kurtosis = _analysis.period_kurtosis(df,
-                                    'Growing Degree Days Detrended',
+                                    detrended_parameter,
                                     round_value=True,
                                     to_nearest=1,
                                     data_type='float')
         
         top5 = _analysis.period_rankings(df,
-                                'Growing Degree Days Detrended',
+                                detrended_parameter,
                                 ascending=False,
                                 rank_subset='first',
                                 first=5,
@@ -4011,7 +4164,7 @@ def plot_growing_degree_day_summary(station,
                                 date_name='Date')
         
         bot5 = _analysis.period_rankings(df,
-                                'Growing Degree Days Detrended',
+                                detrended_parameter,
                                 ascending=False,
                                 rank_subset='last',
                                 first=5,
@@ -4023,46 +4176,46 @@ def plot_growing_degree_day_summary(station,
     else:
     
         maxima = _analysis.period_maximum(df,
-                    'Growing Degree Days')
+                    parameter)
         
         mean = _analysis.period_mean(df,
-                    'Growing Degree Days',
+                    parameter,
                     round_value=True,
                     to_nearest=0,
                     data_type='integer')
         
         minima = _analysis.period_minimum(df,
-                    'Growing Degree Days',
+                    parameter,
                     round_value=True,
                     to_nearest=0,
                     data_type='integer')
         
         standard_deviation = _analysis.period_standard_deviation(df,
-                                                        'Growing Degree Days',
+                                                        parameter,
                                                         round_value=True,
                                                         to_nearest=1,
                                                         data_type='float')
         
         variance = _analysis.period_variance(df,
-                                    'Growing Degree Days',
+                                    parameter,
                                     round_value=True,
                                     to_nearest=1,
                                     data_type='float')
         
         skewness = _analysis.period_skewness(df,
-                                    'Growing Degree Days',
+                                    parameter,
                                     round_value=True,
                                     to_nearest=1,
                                     data_type='float')
         
         kurtosis = _analysis.period_kurtosis(df,
-                                    'Growing Degree Days',
+                                    parameter,
                                     round_value=True,
                                     to_nearest=1,
                                     data_type='float')
         
         top5 = _analysis.period_rankings(df,
-                                'Growing Degree Days',
+                                parameter,
                                 ascending=False,
                                 rank_subset='first',
                                 first=5,
@@ -4071,7 +4224,7 @@ def plot_growing_degree_day_summary(station,
                                 date_name='Date')
         
         bot5 = _analysis.period_rankings(df,
-                                'Growing Degree Days',
+                                parameter,
                                 ascending=False,
                                 rank_subset='last',
                                 first=5,
@@ -4081,12 +4234,13 @@ def plot_growing_degree_day_summary(station,
             
         
     fig = _plt.figure(figsize=(12,8))
+    figure_span = _tracing.start('figure')
     fig.set_facecolor('aliceblue')
 
     ax = fig.add_subplot(1, 1, 1)
     ax.yaxis.set_major_locator(_MaxNLocator(integer=True))
     ax.xaxis.set_major_formatter(_md.DateFormatter(x_axis_date_format))
-    fig.suptitle(f"{station.upper()} Growing Degree Days Summary    Period Of Record: {df['Date'].iloc[0].strftime('%m/%d/%Y')} - {df['Date'].iloc[-1].strftime('%m/%d/%Y')}", 
+    fig.suptitle(f"{station.upper()} {parameter} Summary    Period Of Record: {df['Date'].iloc[0].strftime('%m/%d/%Y')} - {df['Date'].iloc[-1].strftime('%m/%d/%Y')}", 
                  fontsize=14, 
                  y=1.06, 
                  fontweight='bold', 
@@ -4095,7 +4249,7 @@ def plot_growing_degree_day_summary(station,
     if detrend_series == False:
         ax.text(0.0008, 
                 1.07, 
-                f"MAX: {int(round(_np.nanmax(df['Growing Degree Days']), 0))}", 
+                f"MAX: {int(round(_np.nanmax(df[parameter]), 0))}", 
                 fontsize=9, 
                 fontweight='bold', 
                 color='white', 
@@ -4104,7 +4258,7 @@ def plot_growing_degree_day_summary(station,
         
         ax.text(0.175, 
                 1.07, 
-                f"MIN: {int(round(_np.nanmin(df['Growing Degree Days']), 0))}", 
+                f"MIN: {int(round(_np.nanmin(df[parameter]), 0))}", 
                 fontsize=9, 
                 fontweight='bold', 
                 color='white', 
@@ -4113,7 +4267,7 @@ def plot_growing_degree_day_summary(station,
         
         ax.text(0.35, 
                 1.07, 
-                f"MEAN: {int(round(_np.nanmean(df['Growing Degree Days']), 0))}", 
+                f"MEAN: {int(round(_np.nanmean(df[parameter]), 0))}", 
                 fontsize=9, 
                 fontweight='bold', 
                 color='white', 
@@ -4128,33 +4282,33 @@ def plot_growing_degree_day_summary(station,
                 bbox=_props, 
                 transform=ax.transAxes)
         
-        if _np.nanmin(df['Growing Degree Days']) >= 5:
-            ax.set_ylim((_np.nanmin(df['Growing Degree Days']) - 5), (_np.nanmax(df['Growing Degree Days']) + 5))
+        if _np.nanmin(df[parameter]) >= 5:
+            ax.set_ylim((_np.nanmin(df[parameter]) - 5), (_np.nanmax(df[parameter]) + 5))
         else:
-            ax.set_ylim(0, (_np.nanmax(df['Growing Degree Days']) + 5))
+            ax.set_ylim(0, (_np.nanmax(df[parameter]) + 5))
         ax.xaxis.set_major_locator(_md.DayLocator(interval=x_axis_day_interval))
         if plot_type == 'bar':
-            ax.bar(df['Date'], df['Growing Degree Days'], color='green', zorder=1, alpha=0.3)
+            ax.bar(df['Date'], df[parameter], color='green', zorder=1, alpha=0.3)
         else:
             if shade_anomaly == False:
-                ax.plot(df['Date'], df['Growing Degree Days'], color='black', zorder=1, alpha=0.3)
+                ax.plot(df['Date'], df[parameter], color='black', zorder=1, alpha=0.3)
             else:
                 ax.fill_between(df['Date'], 
                                 mean, 
-                                df['Growing Degree Days'], 
+                                df[parameter], 
                                 color='green', 
                                 alpha=0.3, 
-                                where=(df['Growing Degree Days'] > mean))
+                                where=(df[parameter] > mean))
                 ax.fill_between(df['Date'], 
                                 mean, 
-                                df['Growing Degree Days'], 
+                                df[parameter], 
                                 color='orange', 
                                 alpha=0.3, 
-                                where=(df['Growing Degree Days'] < mean))
+                                where=(df[parameter] < mean))
     else:
         ax.text(0.0008, 
                 1.07, 
-                f"MAX: {int(round(_np.nanmax(df['Growing Degree Days Detrended']), 0))}", 
+                f"MAX: {int(round(_np.nanmax(df[detrended_parameter]), 0))}", 
                 fontsize=9, 
                 fontweight='bold', 
                 color='white', 
@@ -4163,7 +4317,7 @@ def plot_growing_degree_day_summary(station,
         
         ax.text(0.175, 
                 1.07, 
-                f"MIN: {int(round(_np.nanmin(df['Growing Degree Days Detrended']), 0))}", 
+                f"MIN: {int(round(_np.nanmin(df[detrended_parameter]), 0))}", 
                 fontsize=9, 
                 fontweight='bold', 
                 color='white', 
@@ -4172,7 +4326,7 @@ def plot_growing_degree_day_summary(station,
         
         ax.text(0.35, 
                 1.07, 
-                f"MEAN: {int(round(_np.nanmean(df['Growing Degree Days Detrended']), 0))}", 
+                f"MEAN: {int(round(_np.nanmean(df[detrended_parameter]), 0))}", 
                 fontsize=9, 
                 fontweight='bold', 
                 color='white', 
@@ -4187,27 +4341,27 @@ def plot_growing_degree_day_summary(station,
                 bbox=_props, 
                 transform=ax.transAxes)
         
-        bar_colors = ['red' if t >= 0 else 'blue' for t in df['Growing Degree Days Detrended']]
-        ax.set_ylim((_np.nanmin(df['Growing Degree Days Detrended']) - 5), (_np.nanmax(df['Growing Degree Days Detrended']) + 5))
+        bar_colors = ['red' if t >= 0 else 'blue' for t in df[detrended_parameter]]
+        ax.set_ylim((_np.nanmin(df[detrended_parameter]) - 5), (_np.nanmax(df[detrended_parameter]) + 5))
         ax.xaxis.set_major_locator(_md.DayLocator(interval=x_axis_day_interval))
         if plot_type == 'bar':
-            ax.bar(df['Date'], df['Growing Degree Days Detrended'], color=bar_colors, zorder=1, alpha=0.3)
+            ax.bar(df['Date'], df[detrended_parameter], color=bar_colors, zorder=1, alpha=0.3)
         else:
             if shade_anomaly == False:
-                ax.plot(df['Date'], df['Growing Degree Days Detrended'], color='black', zorder=1, alpha=0.3)
+                ax.plot(df['Date'], df[detrended_parameter], color='black', zorder=1, alpha=0.3)
             else:
                 ax.fill_between(df['Date'], 
                                 mean, 
-                                df['Growing Degree Days Detrended'], 
+                                df[detrended_parameter], 
                                 color='green', 
                                 alpha=0.3, 
-                                where=(df['Growing Degree Days Detrended'] > mean))
+                                where=(df[detrended_parameter] > mean))
                 ax.fill_between(df['Date'], 
                                 mean, 
-                                df['Growing Degree Days Detrended'], 
+                                df[detrended_parameter], 
                                 color='orange', 
                                 alpha=0.3, 
-                                where=(df['Growing Degree Days Detrended'] < mean))
+                                where=(df[detrended_parameter] < mean))
     
     if missing == 0:
         ax.text(0.865, 
@@ -4254,13 +4408,13 @@ def plot_growing_degree_day_summary(station,
         if detrend_series == True:
             
             run_mean = _analysis.running_mean(df, 
-                                        'Growing Degree Days Detrended',
+                                        detrended_parameter,
                                         interpolation_limit=interpolation_limit)
             df_max = _pd.DataFrame(run_mean, 
                                 columns=['MEAN'])        
         else:
             run_mean = _analysis.running_mean(df, 
-                                        'Growing Degree Days',
+                                        parameter,
                                         interpolation_limit=interpolation_limit)
             df_max = _pd.DataFrame(run_mean, 
                                 columns=['MEAN'])
@@ -4272,13 +4426,14 @@ def plot_growing_degree_day_summary(station,
         
     img_path = _update_image_file_paths(station, 
                                        product_type, 
-                                       'Growing Degree Days Summary', 
+                                       f"{parameter} Summary", 
                                        show_running_mean,
                                        detrend_series,
                                        detrend_type, 
                                        running_type='Mean')
     fname = f"{station.upper()} {product_type}.png"
-    fig.savefig(f"{img_path}/{fname}", bbox_inches='tight')
+    figure_span.end()
+    _save_figure(fig, img_path, fname)
     _plt.close(fig)
     print(f"Saved {fname} to {img_path}")
         
@@ -4286,13 +4441,14 @@ def plot_growing_degree_day_summary(station,
         
         _plt.axis('off')
         fig = _plt.figure(figsize=(12,8))
+        figure_span = _tracing.start('figure')
         fig.set_facecolor('aliceblue')
         
         if detrend_series == True:
     
-            fig.text(0, 1, f"""{station.upper()} Growing Degree Day Detrended Summary   Period Of Record: {df['Date'].iloc[0].strftime('%m/%d/%Y')} - {df['Date'].iloc[-1].strftime('%m/%d/%Y')}\n\nTop 5 Days: #1 {int(round(top5['Growing Degree Days Detrended'].iloc[0], 0))}  - {top5['Date'].iloc[0].strftime('%m/%d/%Y')}   #2 {int(round(top5['Growing Degree Days Detrended'].iloc[1], 0))}  - {top5['Date'].iloc[1].strftime('%m/%d/%Y')}   #3 {int(round(top5['Growing Degree Days Detrended'].iloc[2], 0))}  - {top5['Date'].iloc[2].strftime('%m/%d/%Y')}   #4 {int(round(top5['Growing Degree Days Detrended'].iloc[3], 0))}  - {top5['Date'].iloc[3].strftime('%m/%d/%Y')}   #5 {int(round(top5['Growing Degree Days Detrended'].iloc[4], 0))}  - {top5['Date'].iloc[4].strftime('%m/%d/%Y')}
+            fig.text(0, 1, f"""{station.upper()} {table_label} Detrended Summary   Period Of Record: {df['Date'].iloc[0].strftime('%m/%d/%Y')} - {df['Date'].iloc[-1].strftime('%m/%d/%Y')}\n\nTop 5 Days: #1 {int(round(top5[detrended_parameter].iloc[0], 0))}  - {top5['Date'].iloc[0].strftime('%m/%d/%Y')}   #2 {int(round(top5[detrended_parameter].iloc[1], 0))}  - {top5['Date'].iloc[1].strftime('%m/%d/%Y')}   #3 {int(round(top5[detrended_parameter].iloc[2], 0))}  - {top5['Date'].iloc[2].strftime('%m/%d/%Y')}   #4 {int(round(top5[detrended_parameter].iloc[3], 0))}  - {top5['Date'].iloc[3].strftime('%m/%d/%Y')}   #5 {int(round(top5[detrended_parameter].iloc[4], 0))}  - {top5['Date'].iloc[4].strftime('%m/%d/%Y')}
                     
-Bottom 5 Days: #1 {int(round(bot5['Growing Degree Days Detrended'].iloc[0], 0))}  - {bot5['Date'].iloc[0].strftime('%m/%d/%Y')}   #2 {int(round(bot5['Growing Degree Days Detrended'].iloc[1], 0))}  - {bot5['Date'].iloc[1].strftime('%m/%d/%Y')}   #3 {int(round(bot5['Growing Degree Days Detrended'].iloc[2], 0))}  - {bot5['Date'].iloc[2].strftime('%m/%d/%Y')}   #4 {int(round(bot5['Growing Degree Days Detrended'].iloc[3], 0))}  - {bot5['Date'].iloc[3].strftime('%m/%d/%Y')}   #5 {int(round(bot5['Growing Degree Days Detrended'].iloc[4]))}  - {bot5['Date'].iloc[4].strftime('%m/%d/%Y')}
+Bottom 5 Days: #1 {int(round(bot5[detrended_parameter].iloc[0], 0))}  - {bot5['Date'].iloc[0].strftime('%m/%d/%Y')}   #2 {int(round(bot5[detrended_parameter].iloc[1], 0))}  - {bot5['Date'].iloc[1].strftime('%m/%d/%Y')}   #3 {int(round(bot5[detrended_parameter].iloc[2], 0))}  - {bot5['Date'].iloc[2].strftime('%m/%d/%Y')}   #4 {int(round(bot5[detrended_parameter].iloc[3], 0))}  - {bot5['Date'].iloc[3].strftime('%m/%d/%Y')}   #5 {int(round(bot5[detrended_parameter].iloc[4]))}  - {bot5['Date'].iloc[4].strftime('%m/%d/%Y')}
                     
 Standard Deviation: {standard_deviation}   Variance: {variance}   Skewness: {skewness}   Kurtosis: {kurtosis}
                                         
@@ -4308,9 +4464,9 @@ Standard Deviation: {standard_deviation}   Variance: {variance}   Skewness: {ske
             
         else:
             
-            fig.text(0, 1, f"""{station.upper()} Growing Degree Day Summary   Period Of Record: {df['Date'].iloc[0].strftime('%m/%d/%Y')} - {df['Date'].iloc[-1].strftime('%m/%d/%Y')}\n\nTop 5 Days: #1 {int(round(top5['Growing Degree Days'].iloc[0], 0))}  - {top5['Date'].iloc[0].strftime('%m/%d/%Y')}   #2 {int(round(top5['Growing Degree Days'].iloc[1], 0))}  - {top5['Date'].iloc[1].strftime('%m/%d/%Y')}   #3 {int(round(top5['Growing Degree Days'].iloc[2], 0))}  - {top5['Date'].iloc[2].strftime('%m/%d/%Y')}   #4 {int(round(top5['Growing Degree Days'].iloc[3], 0))}  - {top5['Date'].iloc[3].strftime('%m/%d/%Y')}   #5 {int(round(top5['Growing Degree Days'].iloc[4], 0))}  - {top5['Date'].iloc[4].strftime('%m/%d/%Y')}
+            fig.text(0, 1, f"""{station.upper()} {table_label} Summary   Period Of Record: {df['Date'].iloc[0].strftime('%m/%d/%Y')} - {df['Date'].iloc[-1].strftime('%m/%d/%Y')}\n\nTop 5 Days: #1 {int(round(top5[parameter].iloc[0], 0))}  - {top5['Date'].iloc[0].strftime('%m/%d/%Y')}   #2 {int(round(top5[parameter].iloc[1], 0))}  - {top5['Date'].iloc[1].strftime('%m/%d/%Y')}   #3 {int(round(top5[parameter].iloc[2], 0))}  - {top5['Date'].iloc[2].strftime('%m/%d/%Y')}   #4 {int(round(top5[parameter].iloc[3], 0))}  - {top5['Date'].iloc[3].strftime('%m/%d/%Y')}   #5 {int(round(top5[parameter].iloc[4], 0))}  - {top5['Date'].iloc[4].strftime('%m/%d/%Y')}
                     
-Bottom 5 Days: #1 {int(round(bot5['Growing Degree Days'].iloc[0], 0))}  - {bot5['Date'].iloc[0].strftime('%m/%d/%Y')}   #2 {int(round(bot5['Growing Degree Days'].iloc[1], 0))}  - {bot5['Date'].iloc[1].strftime('%m/%d/%Y')}   #3 {int(round(bot5['Growing Degree Days'].iloc[2], 0))}  - {bot5['Date'].iloc[2].strftime('%m/%d/%Y')}   #4 {int(round(bot5['Growing Degree Days'].iloc[3], 0))}  - {bot5['Date'].iloc[3].strftime('%m/%d/%Y')}   #5 {int(round(bot5['Growing Degree Days'].iloc[4]))}  - {bot5['Date'].iloc[4].strftime('%m/%d/%Y')}
+Bottom 5 Days: #1 {int(round(bot5[parameter].iloc[0], 0))}  - {bot5['Date'].iloc[0].strftime('%m/%d/%Y')}   #2 {int(round(bot5[parameter].iloc[1], 0))}  - {bot5['Date'].iloc[1].strftime('%m/%d/%Y')}   #3 {int(round(bot5[parameter].iloc[2], 0))}  - {bot5['Date'].iloc[2].strftime('%m/%d/%Y')}   #4 {int(round(bot5[parameter].iloc[3], 0))}  - {bot5['Date'].iloc[3].strftime('%m/%d/%Y')}   #5 {int(round(bot5[parameter].iloc[4]))}  - {bot5['Date'].iloc[4].strftime('%m/%d/%Y')}
                     
 Standard Deviation: {standard_deviation}   Variance: {variance}   Skewness: {skewness}   Kurtosis: {kurtosis}
                                         
@@ -4325,12 +4481,13 @@ Standard Deviation: {standard_deviation}   Variance: {variance}   Skewness: {ske
 
         path = _update_image_file_paths(station, 
                                        product_type, 
-                                       'Growing Degree Days Summary', 
+                                       f"{parameter} Summary", 
                                        show_running_mean,
                                        detrend_series,
                                        detrend_type, 
                                        running_type='Mean')
         fname = f"{station.upper()} Stats Table.png"
-        fig.savefig(f"{path}/{fname}", bbox_inches='tight')
+        figure_span.end()
+        _save_figure(fig, path, fname)
         _plt.close(fig)
         print(f"Saved {fname} to {path}")
@@ -0,0 +1,631 @@
+"""
+This file hosts the headless render service of xmACIS2Py.
+
+A single graphic made by a new Python process spends most of its time importing matplotlib, Pandas and xmACIS2Py and loading fonts,
+not rendering. The render service keeps a pool of worker processes that have already imported everything, loaded the fonts and
+rendered a warm-up graphic, and answers each request with a graphic from one of them.
+
+The service is a small HTTP server (Python standard library only) that listens on 127.0.0.1 by default.
+
+Endpoints
+---------
+
+GET /health - {"status":"ok", "workers":N}
+
+GET /products - The product names.
+
+GET /render?station=KRAL&product=maximum_temperature&days=30 - The PNG of the graphic.
+
+    station (Required) - The station ID.
+
+    product (Required) - The product name (see /products).
+
+    start, end - The start and end dates (YYYY-mm-dd). Otherwise days (default 30) ending at from_when (default yesterday).
+
+    image - Default=0. The image of the product to return: 0 is the summary graphic and 1 is the stats table (when the product has one).
+        'zip' returns every image of the product in a ZIP file.
+
+    Any other parameter of the plot function (i.e. plot_type=line, detrend_series=true, x_axis_day_interval=7).
+
+POST /render - The same with the parameters as a JSON object in the request body.
+
+Errors are answered as JSON {"error":...} with HTTP 400 (bad request), 500 (the graphic failed), 503 (every worker was busy, or the
+worker pool was restarted while the graphic was rendering, try again) or 504 (timed out).
+
+Stuck and Dead Workers
+----------------------
+
+A graphic that is running in a worker process cannot be stopped. When a request times out, the worker keeps going, so the service
+restarts the worker pool: a new pool is started (it warms up in the background) and the processes of the old pool are killed.
+The same happens when a worker process dies (i.e. it runs out of memory), which breaks the pool. The request that timed out is answered
+with HTTP 504 (or 500 for a dead worker), and other requests that were running on the old pool are answered with HTTP 503.
+
+Example
+-------
+
+with RenderService(workers=4) as service:
+    urllib.request.urlopen(f"{service.url}/render?station=KRAL&product=precipitation").read()
+
+From the command line: xmacis2py serve --port 8787 --workers 4
+
+(C) Eric J. Drewitz 2025-2026
+"""
+
+import concurrent.futures as _futures
+import concurrent.futures.process as _futures_process
+import contextlib as _contextlib
+import inspect as _inspect
+import io as _io
+import json as _json
+import multiprocessing as _multiprocessing
+import os as _os
+import shutil as _shutil
+import tempfile as _tempfile
+import threading as _threading
+import time as _time
+import traceback as _traceback
+import warnings as _warnings
+import zipfile as _zipfile
+_warnings.filterwarnings('ignore')
+
+from http.server import(
+    BaseHTTPRequestHandler as _BaseHTTPRequestHandler,
+    ThreadingHTTPServer as _ThreadingHTTPServer
+)
+from urllib.parse import(
+    parse_qsl as _parse_qsl,
+    urlsplit as _urlsplit
+)
+from xmacis2py.graphics.products import _products
+
+# Arguments of the plot functions that the service sets itself.
+_reserved = ['station',
+             'df',
+             'start_date',
+             'end_date',
+             'from_when',
+             'time_delta',
+             'proxies',
+             'clear_recycle_bin',
+             'to_csv',
+             'path',
+             'filename',
+             'notifications']
+
+_worker_settings = {
+    'proxies':None
+}
+
+def _plot_function(product):
+
+    """
+    This function returns the plot function of a product name.
+    """
+
+    import xmacis2py.graphics.temperature as _temperature
+    import xmacis2py.graphics.precipitation as _precipitation
+
+    module, function, label = _products[product]
+    if module == 'temperature':
+        return getattr(_temperature, function)
+
+    return getattr(_precipitation, function)
+
+def _warm_up():
+
+    """
+    This function renders a graphic of each kind on synthetic data so the fonts, the Agg renderer and the analysis code are loaded.
+    """
+
+    import matplotlib.pyplot as _plt
+    import xmacis2py.utils.file_funcs as _file_funcs
+    from xmacis2py.data_access.synthetic import synthetic_station as _synthetic_station
+
+    df = _synthetic_station('SYN00001', days=30)
+    folder = _tempfile.mkdtemp(prefix='xmacis2py-warm-')
+    saved_folder = _file_funcs.folder_modified
+    _file_funcs.folder_modified = folder
+    try:
+        with _contextlib.redirect_stdout(_io.StringIO()):
+            for product in ['maximum_temperature', 'precipitation']:
+                try:
+                    _plot_function(product)('SYN00001', df=df, notifications='off')
+                except Exception as e:
+                    pass
+                _plt.close('all')
+    finally:
+        _file_funcs.folder_modified = saved_folder
+        _shutil.rmtree(folder, ignore_errors=True)
+
+def _init_worker(proxies,
+                 warm):
+
+    """
+    This function sets up a worker process.
+    """
+
+    import matplotlib as _mpl
+    _mpl.use('Agg')
+    import matplotlib.font_manager as _font_manager
+    import xmacis2py.graphics.temperature
+    import xmacis2py.graphics.precipitation
+
+    _font_manager.findfont(_font_manager.FontProperties())
+    _worker_settings['proxies'] = proxies
+
+    if warm == True:
+        _warm_up()
+
+def _ready(delay):
+
+    """
+    This function is the task that starts the worker processes.
+    """
+
+    _time.sleep(delay)
+
+    return _os.getpid()
+
+def _render(request):
+
+    """
+    This function renders one request in a worker process.
+
+    Returns
+    -------
+
+    A list of (file name, PNG bytes) tuples in the order they were saved.
+    """
+
+    import matplotlib.pyplot as _plt
+    import xmacis2py.utils.file_funcs as _file_funcs
+    import xmacis2py.utils.tracing as _tracing
+
+    plot = _plot_function(request['product'])
+    kwargs = dict(request['options'])
+    if request['start'] != None:
+        kwargs['start_date'] = request['start']
+        kwargs['end_date'] = request['end']
+    else:
+        kwargs['time_delta'] = request['days']
+        if request['from_when'] != None:
+            kwargs['from_when'] = request['from_when']
+
+    folder = _tempfile.mkdtemp(prefix='xmacis2py-render-')
+    _file_funcs.folder_modified = folder
+    try:
+        with _tracing.recording() as recorder, _contextlib.redirect_stdout(_io.StringIO()):
+            try:
+                plot(request['station'],
+                     proxies=_worker_settings['proxies'],
+                     notifications='off',
+                     **kwargs)
+            finally:
+                _plt.close('all')
+
+        images = []
+        for record in recorder.records:
+            if record['kind'] == 'write':
+                with open(record['path'], 'rb') as f:
+                    images.append((record['file'], f.read()))
+    finally:
+        _shutil.rmtree(folder, ignore_errors=True)
+
+    return images
+
+def _parse_value(value):
+
+    """
+    This function converts a query string value to a Boolean, number or String.
+    """
+
+    if isinstance(value, str) == False:
+        return value
+    if value.lower() in ['true', 'false']:
+        return value.lower() == 'true'
+    for kind in [int, float]:
+        try:
+            return kind(value)
+        except Exception as e:
+            pass
+
+    return value
+
+def parse_request(params):
+
+    """
+    This function checks the parameters of a render request.
+
+    Required Arguments:
+
+    1) params (Dictionary) - The query string or JSON parameters.
+
+    Returns
+    -------
+
+    The request (Dictionary). Raises ValueError when the request is not valid.
+    """
+
+    params = dict(params)
+    station = str(params.pop('station', '')).strip().upper()
+    product = str(params.pop('product', '')).strip().lower()
+    if station == '':
+        raise ValueError("station is required.")
+    if product not in _products:
+        raise ValueError(f"Unknown product {product}. The products are: {', '.join(_products)}.")
+
+    start = params.pop('start', None)
+    end = params.pop('end', None)
+    if (start == None) != (end == None):
+        raise ValueError("Pass both start and end, or neither.")
+
+    from_when = params.pop('from_when', None)
+    days = _parse_value(params.pop('days', 30))
+    if isinstance(days, int) == False or days < 1:
+        raise ValueError("days must be a positive whole number.")
+
+    image = str(params.pop('image', '0')).lower()
+    if image != 'zip' and image.isdigit() == False:
+        raise ValueError("image must be a number or 'zip'.")
+
+    allowed = [name for name in _inspect.signature(_plot_function(product)).parameters if name not in _reserved]
+    options = {}
+    for name, value in params.items():
+        if name not in allowed:
+            raise ValueError(f"Unknown option {name} for {product}.")
+        options[name] = _parse_value(value)
+
+    return {
+        'station':station,
+        'product':product,
+        'start':start,
+        'end':end,
+        'days':days,
+        'from_when':from_when,
+        'image':image,
+        'options':options
+    }
+
+class _Handler(_BaseHTTPRequestHandler):
+
+    """
+    This class answers the requests of the render service.
+    """
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self,
+              status,
+              payload,
+              content_type='application/json',
+              headers={}):
+
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_json(self,
+                   status,
+                   value):
+
+        self._send(status, _json.dumps(value).encode())
+
+    def _handle(self,
+                endpoint,
+                params):
+
+        service = self.server.service
+
+        if endpoint == '/health':
+            self._send_json(200, {'status':'ok', 'workers':service.workers})
+            return
+        if endpoint == '/products':
+            self._send_json(200, list(_products))
+            return
+        if endpoint != '/render':
+            self._send_json(404, {'error':f"Unknown endpoint {endpoint}."})
+            return
+
+        try:
+            request = parse_request(params)
+        except Exception as e:
+            self._send_json(400, {'error':str(e)})
+            return
+
+        status, payload, content_type, headers = service._answer(request)
+        self._send(status, payload, content_type, headers)
+
+    def do_GET(self):
+
+        parts = _urlsplit(self.path)
+        self._handle(parts.path, dict(_parse_qsl(parts.query)))
+
+    def do_POST(self):
+
+        parts = _urlsplit(self.path)
+        raw = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        try:
+            params = _json.loads(raw) if len(raw) > 0 else {}
+            if isinstance(params, dict) == False:
+                raise ValueError("The body must be a JSON object.")
+        except Exception as e:
+            self._send_json(400, {'error':f"Bad JSON body: {e}"})
+            return
+
+        self._handle(parts.path, params)
+
+class RenderService:
+
+    """
+    This class is the headless render service: an HTTP server in front of a pool of warm worker processes.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) host (String) - Default='127.0.0.1'. The address the service listens on. Keep the default so only this machine can reach it.
+
+    2) port (Integer) - Default=8787. The port the service listens on. 0 picks a free port.
+
+    3) workers (Integer) - Default=None. The number of worker processes. When set to None, the number of CPUs up to 4.
+
+    4) warm (Boolean) - Default=True. When set to True, each worker renders a warm-up graphic on synthetic data when it starts.
+
+    5) proxies (dict or None) - Default=None. The proxies of the downloads (see get_data).
+
+    6) timeout (Float) - Default=120. The number of seconds a worker may take on a request before it is answered with HTTP 504.
+        The worker pool is then restarted, since the stuck worker cannot be stopped otherwise. The timeout starts when a worker takes
+        the request: a request that waits longer than the timeout for a free worker is answered with HTTP 503 and the pool is kept.
+
+    Attributes
+    ----------
+
+    url (String) - The address of the running service.
+
+    Methods
+    -------
+
+    start() - Starts the worker processes (waiting until they are warm) and the server in a background thread.
+
+    stop() - Stops the server and the worker processes.
+
+    serve_forever() - Starts the service and blocks until interrupted (Ctrl+C).
+
+    stats() - A dictionary with the number of 'requests', 'rendered', 'failed', 'timed_out' and 'restarts' (of the worker pool)
+        and the average 'seconds' of a rendered request.
+
+    The class is also a context manager that starts the service on entry and stops it on exit.
+    """
+
+    def __init__(self,
+                 host='127.0.0.1',
+                 port=8787,
+                 workers=None,
+                 warm=True,
+                 proxies=None,
+                 timeout=120):
+
+        if workers == None:
+            workers = min(_os.cpu_count(), 4)
+
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.warm = warm
+        self.proxies = proxies
+        self.timeout = timeout
+        self._executor = None
+        self._slots = None
+        self._server = None
+        self._thread = None
+        self._lock = _threading.Lock()
+        self._stats = {
+            'requests':0,
+            'rendered':0,
+            'failed':0,
+            'timed_out':0,
+            'restarts':0,
+            'render_seconds':0.0
+        }
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def _count(self,
+               name,
+               value=1):
+
+        with self._lock:
+            self._stats[name] += value
+
+    def _new_pool(self):
+
+        """
+        This method starts a pool of worker processes. It returns the pool and the futures of the tasks that start every worker.
+
+        The workers are started by a fork server (spawned where there is none) rather than forked, since the pool is restarted while
+        the threads of the server are running.
+        """
+
+        if 'forkserver' in _multiprocessing.get_all_start_methods():
+            context = _multiprocessing.get_context('forkserver')
+        else:
+            context = _multiprocessing.get_context('spawn')
+
+        executor = _futures.ProcessPoolExecutor(max_workers=self.workers,
+                                                mp_context=context,
+                                                initializer=_init_worker,
+                                                initargs=(self.proxies, self.warm))
+        # One task per worker at the same time, so every worker process is started and warm before the first request reaches it.
+        ready = [executor.submit(_ready, 0.1) for i in range(self.workers)]
+
+        return executor, ready
+
+    def _restart(self, executor):
+
+        """
+        This method replaces a pool that has a stuck or dead worker with a new pool and kills the processes of the old pool.
+
+        Returns
+        -------
+
+        True when the pool was restarted, False when another request already restarted it.
+        """
+
+        with self._lock:
+            if self._executor is not executor:
+                return False
+            self._executor, ready = self._new_pool()
+            self._slots = _threading.BoundedSemaphore(self.workers)
+            self._stats['restarts'] += 1
+
+        processes = list((executor._processes or {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            try:
+                process.kill()
+            except Exception as e:
+                pass
+
+        return True
+
+    def _answer(self, request):
+
+        """
+        This method renders a request in a worker and returns the (status, payload, content type, headers) of the response.
+
+        A request first waits (up to the timeout) for a free worker, so the timeout of the graphic only starts when a worker takes it.
+        """
+
+        self._count('requests')
+        start = _time.perf_counter()
+
+        with self._lock:
+            executor = self._executor
+            slots = self._slots
+
+        # All the workers are busy: the request is answered with 503 and the pool is left alone, since no worker is stuck on it.
+        if slots.acquire(timeout=self.timeout) == False:
+            self._count('failed')
+            error = f"Every worker was busy for {self.timeout} seconds. Try again."
+            return 503, _json.dumps({'error':error}).encode(), 'application/json', {'Retry-After':'1'}
+
+        try:
+            try:
+                future = executor.submit(_render, request)
+            except RuntimeError as e:
+                # The pool was shut down because another request restarted it while this one was waiting for a worker.
+                self._count('failed')
+                error = "The worker pool was restarted while the graphic was waiting. Try again."
+                return 503, _json.dumps({'error':error}).encode(), 'application/json', {'Retry-After':'1'}
+
+            try:
+                images = future.result(timeout=self.timeout)
+            except _futures.TimeoutError:
+                self._count('timed_out')
+                self._restart(executor)
+                return 504, _json.dumps({'error':f"The graphic took longer than {self.timeout} seconds."}).encode(), 'application/json', {}
+            except (_futures_process.BrokenProcessPool, _futures.CancelledError) as e:
+                self._count('failed')
+                # A pool that is broken or cancelled this request was restarted for another request while this one was rendering.
+                if self._restart(executor) == False:
+                    error = "The worker pool was restarted while the graphic was rendering. Try again."
+                    return 503, _json.dumps({'error':error}).encode(), 'application/json', {'Retry-After':'1'}
+                error = ''.join(_traceback.format_exception_only(type(e), e)).strip()
+                return 500, _json.dumps({'error':f"{error} The worker pool was restarted."}).encode(), 'application/json', {}
+            except Exception as e:
+                self._count('failed')
+                error = ''.join(_traceback.format_exception_only(type(e), e)).strip()
+                return 500, _json.dumps({'error':error}).encode(), 'application/json', {}
+        finally:
+            slots.release()
+
+        self._count('rendered')
+        self._count('render_seconds', _time.perf_counter() - start)
+
+        name = f"{request['station']} {request['product']}"
+        if request['image'] == 'zip':
+            buffer = _io.BytesIO()
+            with _zipfile.ZipFile(buffer, 'w', _zipfile.ZIP_STORED) as archive:
+                for fname, data in images:
+                    archive.writestr(fname, data)
+            return 200, buffer.getvalue(), 'application/zip', {'Content-Disposition':f'attachment; filename="{name}.zip"'}
+
+        index = int(request['image'])
+        if index >= len(images):
+            return 400, _json.dumps({'error':f"The product has {len(images)} images."}).encode(), 'application/json', {}
+        fname, data = images[index]
+
+        return 200, data, 'image/png', {'Content-Disposition':f'inline; filename="{fname}"'}
+
+    def start(self):
+
+        if self._server != None:
+            return self
+
+        self._executor, ready = self._new_pool()
+        self._slots = _threading.BoundedSemaphore(self.workers)
+        for future in ready:
+            future.result()
+
+        self._server = _ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._server.daemon_threads = True
+        self._server.service = self
+        self.port = self._server.server_address[1]
+        self._thread = _threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+        return self
+
+    def stop(self):
+
+        if self._server != None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+            self._thread = None
+
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor != None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def serve_forever(self):
+
+        self.start()
+        print(f"xmACIS2Py render service on {self.url} with {self.workers} workers. Press Ctrl+C to stop.")
+        try:
+            while True:
+                _time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def stats(self):
+
+        with self._lock:
+            stats = dict(self._stats)
+
+        seconds = stats.pop('render_seconds')
+        if stats['rendered'] > 0:
+            stats['seconds'] = seconds / stats['rendered']
+        else:
+            stats['seconds'] = None
+
+        return stats
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+        return False
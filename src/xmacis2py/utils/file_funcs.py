@@ -4,13 +4,20 @@ This file hosts the file management for the graphics.
 (C) Eric J. Drewitz 2025-2026
 
 """
+import contextlib as _contextlib
+import contextvars as _contextvars
+import io as _io
 import os
 import warnings
 warnings.filterwarnings('ignore')
+import xmacis2py.utils.tracing as _tracing
 
 folder = os.getcwd()
 folder_modified = folder.replace("\\", "/")
 
+# The function that receives the figures instead of the PNG files while capture_figures() is active.
+_figure_sink = _contextvars.ContextVar('xmacis2py_figure_sink', default=None)
+
 def update_csv_file_paths(station, 
                           product_type):
 
@@ -97,18 +104,154 @@ def update_image_file_paths(station,
     else:
         trend = f"{detrend_type.upper()} Detrending"
         
+    # While the figures are captured nothing is written to the folder, so it is not created.
+    if _figure_sink.get() == None:
+        try:
+            os.makedirs(f"{folder_modified}/ACIS Graphics/{station.upper()}/{product_type}/{plot_type} {text} {trend}")
+        except Exception as e:
+            pass
+
+    path = f"{folder_modified}/ACIS Graphics/{station.upper()}/{product_type}/{plot_type} {text} {trend}"
+
+    return path
+
+def update_profile_file_paths(station):
+
+    """
+    This function creates the file path for the profiles.
+
+    Required Arguments:
+
+    1) station (String) - The Station ID
+
+    Returns
+    -------
+
+    A file path for the profiles to save: f:ACIS Profiles/{station}
+    """
+
     try:
-        os.makedirs(f"{folder_modified}/ACIS Graphics/{station.upper()}/{product_type}/{plot_type} {text} {trend}")
+        os.makedirs(f"{folder_modified}/ACIS Profiles/{station.upper()}")
     except Exception as e:
         pass
 
-    path = f"{folder_modified}/ACIS Graphics/{station.upper()}/{product_type}/{plot_type} {text} {trend}"
+    path = f"{folder_modified}/ACIS Profiles/{station.upper()}"
 
     return path
 
+def update_dashboard_file_paths(product_type,
+                                parameter):
 
+    """
+    This function creates the file path for the multi-station dashboards.
 
+    Required Arguments:
+
+    1) product_type (String) - The type of dashboard (30 Day, 90 Day etc.)
+
+    2) parameter (String) - The parameter on the dashboard (i.e. Maximum Temperature)
+
+    Returns
+    -------
+
+    A file path for the dashboard to save: f:ACIS Graphics/DASHBOARDS/{product_type}/{parameter}
+    """
+
+    if _figure_sink.get() == None:
+        try:
+            os.makedirs(f"{folder_modified}/ACIS Graphics/DASHBOARDS/{product_type}/{parameter}")
+        except Exception as e:
+            pass
+
+    path = f"{folder_modified}/ACIS Graphics/DASHBOARDS/{product_type}/{parameter}"
+
+    return path
+
+def save_figure(fig,
+                path,
+                fname):
+
+    """
+    This function saves a figure as a PNG file.
+
+    The figure is rendered in memory first and then written to the file, so the rendering ('savefig') and the file write ('write')
+    are traced as separate spans.
+
+    While capture_figures() is active, the figure is passed to the sink of capture_figures() instead and no file is written.
+
+    Required Arguments:
 
+    1) fig (matplotlib.figure.Figure) - The figure.
 
+    2) path (String) - The folder (i.e. from update_image_file_paths).
 
+    3) fname (String) - The file name.
 
+    Returns
+    -------
+
+    The file path: f:{path}/{fname}
+    """
+
+    sink = _figure_sink.get()
+    if sink != None:
+        with _tracing.span('savefig', file=fname):
+            sink(fig, path, fname)
+        return f"{path}/{fname}"
+
+    with _tracing.span('savefig', file=fname):
+        buffer = _io.BytesIO()
+        fig.savefig(buffer, format='png', bbox_inches='tight')
+
+    with _tracing.span('write', file=fname, path=f"{path}/{fname}", bytes=buffer.getbuffer().nbytes):
+        with open(f"{path}/{fname}", 'wb') as f:
+            f.write(buffer.getbuffer())
+
+    return f"{path}/{fname}"
+
+@_contextlib.contextmanager
+def capture_figures(sink):
+
+    """
+    This function hands the figures of the plot functions to a function instead of saving them as PNG files while a block of code runs:
+
+    with capture_figures(pdf_pages_sink): plot_maximum_temperature_summary('KRAL')
+
+    The sink is called as sink(fig, path, fname) with the folder and file name the PNG file would have had, before the plot function
+    closes the figure. The folders of the PNG files are not created.
+
+    Required Arguments:
+
+    1) sink (Function) - The function that receives the figures.
+
+    Returns
+    -------
+
+    None
+    """
+
+    token = _figure_sink.set(sink)
+    try:
+        yield
+    finally:
+        _figure_sink.reset(token)
+
+def update_report_file_paths():
+
+    """
+    This function creates the file path for the reports.
+
+    Returns
+    -------
+
+    A file path for the reports to save: f:ACIS Reports
+    """
+
+    try:
+        os.makedirs(f"{folder_modified}/ACIS Reports")
+    except Exception as e:
+        pass
+
+    path = f"{folder_modified}/ACIS Reports"
+
+    return path
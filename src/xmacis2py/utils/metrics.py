@@ -0,0 +1,565 @@
+"""
+This file hosts the Prometheus metrics exporter of xmACIS2Py for batch jobs.
+
+The exporter is a tracing sink (see xmacis2py.utils.tracing): it turns the spans of get_data, the station cache, the analysis tools
+and the plot functions into counters and histograms and writes them in the Prometheus text format for the textfile collector
+of node_exporter.
+
+Metrics
+-------
+
+1) xmacis2py_fetch_duration_seconds (Histogram) - The latency of each upstream request to xmACIS2.
+
+2) xmacis2py_cache_requests_total{cache, result} (Counter) - The requests answered ('hit') or not ('miss') by the 'station' cache
+   and the 'analysis' cache.
+
+3) xmacis2py_rows_processed_total{stage} (Counter) - The rows downloaded ('fetch') and the rows passed to the analysis tools ('analysis').
+
+4) xmacis2py_render_duration_seconds{product, product_type} (Histogram) - The duration of each plot function call
+   (product is the plot function and product_type its product_type argument, i.e. 'Maximum Temperature 30 Day Summary').
+
+5) xmacis2py_failures_total{station, kind} (Counter) - The failed top level calls (a plot function, or get_data called directly)
+   of each station.
+
+6) xmacis2py_last_update_timestamp_seconds (Gauge) - When the metrics were last updated.
+
+Pool Workers
+------------
+
+Every process keeps its own metrics and saves them to its own state file ({fname}.d/{pid}-{token}.json) after each top level call.
+The token is drawn when the process starts its metrics, so a process that gets the process ID of an earlier one never overwrites
+its totals. The metrics file is written from all of the state files, so the processes of a pool add up to one set of metrics.
+Both files are written to a temporary file and renamed, so node_exporter never reads a partly written file.
+
+The state files of processes that have exited are merged into one baseline file ({fname}.d/baseline.json) and removed
+(on POSIX systems, where the exporter can tell whether a process is still running), so the state folder does not grow with every
+pool worker ever started and the counters never go backwards.
+
+Turning on the exporter in the parent process before the pool starts is enough when the workers are forked. Setting the environment
+variable XMACIS2PY_METRICS_FILE to the metrics file path turns on the exporter in every process, however the workers are started.
+
+Example
+-------
+
+from xmacis2py.utils import metrics
+
+metrics.enable_metrics('/var/lib/node_exporter/textfile/xmacis2py.prom', reset=True)
+
+Metrics Tools:
+
+- enable_metrics
+- disable_metrics
+- write_metrics
+- MetricsExporter
+
+(C) Eric J. Drewitz 2025-2026
+"""
+
+import atexit as _atexit
+import glob as _glob
+import json as _json
+import os as _os
+import secrets as _secrets
+import shutil as _shutil
+import threading as _threading
+import time as _time
+import warnings as _warnings
+_warnings.filterwarnings('ignore')
+
+import xmacis2py.utils.tracing as _tracing
+
+_fetch_buckets = [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60]
+_render_buckets = [0.1, 0.25, 0.5, 1, 2, 5, 10, 20, 60]
+
+_help = {
+    'xmacis2py_fetch_duration_seconds':('histogram', 'The latency of each upstream request to xmACIS2.'),
+    'xmacis2py_cache_requests_total':('counter', 'The cache requests by cache and result.'),
+    'xmacis2py_rows_processed_total':('counter', 'The rows downloaded and analyzed.'),
+    'xmacis2py_render_duration_seconds':('histogram', 'The duration of each plot function call by product and product type.'),
+    'xmacis2py_failures_total':('counter', 'The failed top level calls by station.'),
+    'xmacis2py_last_update_timestamp_seconds':('gauge', 'When the metrics were last updated.')
+}
+
+_baseline_name = 'baseline.json'
+_prune_lock_name = 'prune.lock'
+# A prune lock older than this (in seconds) was left by a process that died while pruning.
+_prune_lock_timeout = 60
+
+_exporter = None
+
+def _empty_state():
+
+    return {
+        'counters':{},
+        'histograms':{},
+        'updated':0.0
+    }
+
+def _key(name,
+         labels):
+
+    """
+    This function returns the key of a series: the metric name and its sorted labels as JSON.
+    """
+
+    return _json.dumps([name, sorted(labels.items())])
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_labels(labels):
+
+    if len(labels) == 0:
+        return ''
+
+    return '{' + ','.join([f'{label}="{_escape(value)}"' for label, value in labels]) + '}'
+
+def _format_value(value):
+
+    if value == int(value):
+        return str(int(value))
+    return repr(float(value))
+
+def _merge(states):
+
+    """
+    This function adds up the states of several processes.
+    """
+
+    merged = _empty_state()
+    for state in states:
+        for key, value in state['counters'].items():
+            merged['counters'][key] = merged['counters'].get(key, 0) + value
+        for key, histogram in state['histograms'].items():
+            if key not in merged['histograms']:
+                merged['histograms'][key] = {
+                    'buckets':list(histogram['buckets']),
+                    'counts':[0] * len(histogram['counts']),
+                    'sum':0.0,
+                    'count':0
+                }
+            target = merged['histograms'][key]
+            target['counts'] = [a + b for a, b in zip(target['counts'], histogram['counts'])]
+            target['sum'] += histogram['sum']
+            target['count'] += histogram['count']
+        merged['updated'] = max(merged['updated'], state['updated'])
+
+    return merged
+
+def _to_text(state):
+
+    """
+    This function formats a state in the Prometheus text format.
+    """
+
+    # The samples of each metric grouped by series, so the buckets of a histogram stay in order.
+    series = {name:{} for name in _help}
+    for key, value in state['counters'].items():
+        name, labels = _json.loads(key)
+        series[name][key] = [f"{name}{_format_labels(labels)} {_format_value(value)}"]
+
+    for key, histogram in state['histograms'].items():
+        name, labels = _json.loads(key)
+        samples = []
+        cumulative = 0
+        for bucket, count in zip(histogram['buckets'], histogram['counts']):
+            cumulative += count
+            samples.append(f"{name}_bucket{_format_labels(labels + [['le', _format_value(bucket)]])} {cumulative}")
+        samples.append(f"{name}_bucket{_format_labels(labels + [['le', '+Inf']])} {histogram['count']}")
+        samples.append(f"{name}_sum{_format_labels(labels)} {_format_value(histogram['sum'])}")
+        samples.append(f"{name}_count{_format_labels(labels)} {histogram['count']}")
+        series[name][key] = samples
+
+    if state['updated'] > 0:
+        series['xmacis2py_last_update_timestamp_seconds'][''] = [f"xmacis2py_last_update_timestamp_seconds {_format_value(round(state['updated'], 3))}"]
+
+    lines = []
+    for name, samples in series.items():
+        if len(samples) == 0:
+            continue
+        kind, text = _help[name]
+        lines.append(f"# HELP {name} {text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for key in sorted(samples):
+            lines = lines + samples[key]
+
+    return '\n'.join(lines) + '\n'
+
+def _write_atomic(fname,
+                  text):
+
+    """
+    This function writes a file through a temporary file in the same folder, so readers see the old or the new file and never a partial one.
+    """
+
+    temporary = f"{fname}.{_os.getpid()}.{_threading.get_ident()}.tmp"
+    with open(temporary, 'w') as f:
+        f.write(text)
+    _os.replace(temporary, fname)
+
+def _process_alive(pid):
+
+    """
+    This function checks whether a process is still running. Where that cannot be told safely (i.e. Windows), every process is
+    treated as running.
+    """
+
+    if _os.name != 'posix':
+        return True
+
+    try:
+        _os.kill(pid, 0)
+    except ProcessLookupError as e:
+        return False
+    except Exception as e:
+        return True
+
+    return True
+
+def _state_pid(fname):
+
+    """
+    This function returns the process ID of a state file ({pid}-{token}.json or {pid}.json) or None for other files.
+    """
+
+    name = _os.path.basename(fname)[:-len('.json')]
+    try:
+        return int(name.split('-')[0])
+    except ValueError as e:
+        return None
+
+def _read_json(fname):
+
+    try:
+        with open(fname, 'r') as f:
+            return _json.load(f)
+    except Exception as e:
+        return None
+
+class MetricsExporter:
+
+    """
+    This class is the tracing sink that keeps the metrics of a process and writes the metrics file.
+
+    Use enable_metrics() rather than creating it directly.
+
+    Required Arguments:
+
+    1) fname (String) - The metrics file (i.e. /var/lib/node_exporter/textfile/xmacis2py.prom).
+
+    Optional Arguments:
+
+    1) interval (Float) - Default=5. The metrics file is rewritten at most once every interval seconds while the job runs, and
+       always when the process exits.
+
+    2) fetch_buckets (Float List) - Default=[0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60]. The buckets in seconds of the fetch latency.
+
+    3) render_buckets (Float List) - Default=[0.1, 0.25, 0.5, 1, 2, 5, 10, 20, 60]. The buckets in seconds of the render duration.
+
+    Methods
+    -------
+
+    snapshot() - The metrics of this process.
+
+    flush() - Saves the metrics of this process to its state file.
+
+    write() - Saves the metrics of this process, merges the state files of exited processes into the baseline and writes the metrics file
+        from the baseline and the state files of all processes.
+    """
+
+    def __init__(self,
+                 fname,
+                 interval=5,
+                 fetch_buckets=_fetch_buckets,
+                 render_buckets=_render_buckets):
+
+        self.fname = fname
+        self.state_dir = f"{fname}.d"
+        self.interval = interval
+        self.fetch_buckets = list(fetch_buckets)
+        self.render_buckets = list(render_buckets)
+        self._lock = _threading.Lock()
+        self._pid = _os.getpid()
+        self._token = _secrets.token_hex(6)
+        self._state = _empty_state()
+        self._last_write = 0.0
+
+        try:
+            _os.makedirs(self.state_dir)
+        except Exception as e:
+            pass
+
+    def _own_state(self):
+
+        """
+        This method returns the state of this process. A forked worker starts from empty metrics instead of the copy of its parent's.
+        """
+
+        if _os.getpid() != self._pid:
+            self._pid = _os.getpid()
+            self._token = _secrets.token_hex(6)
+            self._state = _empty_state()
+            self._last_write = 0.0
+
+        return self._state
+
+    def _count(self,
+               state,
+               name,
+               labels,
+               value=1):
+
+        key = _key(name, labels)
+        state['counters'][key] = state['counters'].get(key, 0) + value
+
+    def _observe(self,
+                 state,
+                 name,
+                 labels,
+                 buckets,
+                 value):
+
+        key = _key(name, labels)
+        if key not in state['histograms']:
+            state['histograms'][key] = {
+                'buckets':buckets,
+                'counts':[0] * len(buckets),
+                'sum':0.0,
+                'count':0
+            }
+        histogram = state['histograms'][key]
+        for i, bucket in enumerate(histogram['buckets']):
+            if value <= bucket:
+                histogram['counts'][i] += 1
+                break
+        histogram['sum'] += value
+        histogram['count'] += 1
+
+    def __call__(self, record):
+
+        kind = record['kind']
+        with self._lock:
+
+            state = self._own_state()
+
+            if kind == 'fetch':
+                self._observe(state, 'xmacis2py_fetch_duration_seconds', {}, self.fetch_buckets, record['duration'])
+                if record.get('rows') != None:
+                    self._count(state, 'xmacis2py_rows_processed_total', {'stage':'fetch'}, record['rows'])
+
+            elif kind == 'station_cache' and record.get('cache') != None:
+                self._count(state, 'xmacis2py_cache_requests_total', {'cache':'station', 'result':record['cache']})
+
+            elif kind == 'analysis':
+                if record.get('cache') != None:
+                    self._count(state, 'xmacis2py_cache_requests_total', {'cache':'analysis', 'result':record['cache']})
+                if record.get('rows') != None:
+                    self._count(state, 'xmacis2py_rows_processed_total', {'stage':'analysis'}, record['rows'])
+
+            elif kind == 'plot':
+                labels = {'product':record['name'], 'product_type':record.get('product_type', '')}
+                self._observe(state, 'xmacis2py_render_duration_seconds', labels, self.render_buckets, record['duration'])
+
+            if record['parent_id'] == None and record['error'] != None:
+                self._count(state, 'xmacis2py_failures_total', {'station':record.get('station', ''), 'kind':record['name']})
+
+            state['updated'] = record['start'] + record['duration']
+            top_level = record['parent_id'] == None
+
+        if top_level == True:
+            self.flush()
+            if _time.time() - self._last_write >= self.interval:
+                self.write()
+
+    def snapshot(self):
+
+        with self._lock:
+            return _json.loads(_json.dumps(self._own_state()))
+
+    def _state_file(self):
+
+        with self._lock:
+            self._own_state()
+            return f"{self.state_dir}/{self._pid}-{self._token}.json"
+
+    def flush(self):
+
+        fname = self._state_file()
+        state = self.snapshot()
+        try:
+            _write_atomic(fname, _json.dumps(state))
+        except Exception as e:
+            pass
+
+    def _prune(self):
+
+        """
+        This method merges the state files of exited processes into the baseline file and removes them.
+
+        Only one process prunes at a time (the others skip pruning until their next write). The baseline lists the files it has merged,
+        so a process that read one of them just before it was removed does not count it twice.
+        """
+
+        lock = f"{self.state_dir}/{_prune_lock_name}"
+        try:
+            descriptor = _os.open(lock, _os.O_CREAT | _os.O_EXCL | _os.O_WRONLY)
+        except FileExistsError as e:
+            try:
+                if _time.time() - _os.path.getmtime(lock) > _prune_lock_timeout:
+                    _os.remove(lock)
+            except Exception as e:
+                pass
+            return
+        except Exception as e:
+            return
+
+        try:
+            baseline_file = f"{self.state_dir}/{_baseline_name}"
+            exited = []
+            for fname in _glob.glob(f"{self.state_dir}/*.json"):
+                pid = _state_pid(fname)
+                if pid != None and pid != _os.getpid() and _process_alive(pid) == False:
+                    exited.append(fname)
+
+            if len(exited) == 0:
+                return
+
+            baseline = _read_json(baseline_file)
+            if baseline == None:
+                baseline = {'state':_empty_state(), 'merged':[]}
+
+            states = [baseline['state']]
+            merged = []
+            for fname in exited:
+                # Already in the baseline (its removal failed last time).
+                if _os.path.basename(fname) in baseline['merged']:
+                    try:
+                        _os.remove(fname)
+                    except Exception as e:
+                        pass
+                    continue
+                state = _read_json(fname)
+                if state != None:
+                    states.append(state)
+                    merged.append(_os.path.basename(fname))
+
+            _write_atomic(baseline_file, _json.dumps({'state':_merge(states), 'merged':merged}))
+            for name in merged:
+                try:
+                    _os.remove(f"{self.state_dir}/{name}")
+                except Exception as e:
+                    pass
+        finally:
+            _os.close(descriptor)
+            try:
+                _os.remove(lock)
+            except Exception as e:
+                pass
+
+    def write(self):
+
+        self.flush()
+        self._prune()
+
+        # The state files are read before the baseline: a file merged into the baseline in between is listed in it and skipped.
+        states = {}
+        for fname in _glob.glob(f"{self.state_dir}/*.json"):
+            if _os.path.basename(fname) == _baseline_name:
+                continue
+            state = _read_json(fname)
+            # None when another process is replacing its state file. It is picked up on the next write.
+            if state != None:
+                states[_os.path.basename(fname)] = state
+
+        baseline = _read_json(f"{self.state_dir}/{_baseline_name}")
+        if baseline != None:
+            for name in baseline['merged']:
+                states.pop(name, None)
+            states[_baseline_name] = baseline['state']
+
+        _write_atomic(self.fname, _to_text(_merge(list(states.values()))))
+        self._last_write = _time.time()
+
+def enable_metrics(fname,
+                   reset=False,
+                   interval=5):
+
+    """
+    This function turns on the metrics exporter.
+
+    Required Arguments:
+
+    1) fname (String) - The metrics file. For node_exporter, a file ending in .prom in the folder of its --collector.textfile.directory.
+
+    Optional Arguments:
+
+    1) reset (Boolean) - Default=False. When set to True, the metrics saved by earlier runs are removed so the metrics file only counts this run.
+       Only reset from the parent process, never from the workers of a pool.
+
+    2) interval (Float) - Default=5. The metrics file is rewritten at most once every interval seconds while the job runs, and
+       always when the process exits.
+
+    Returns
+    -------
+
+    The MetricsExporter.
+    """
+
+    global _exporter
+
+    disable_metrics()
+
+    if reset == True:
+        _shutil.rmtree(f"{fname}.d", ignore_errors=True)
+
+    _exporter = _tracing.add_sink(MetricsExporter(fname, interval=interval))
+
+    return _exporter
+
+def disable_metrics():
+
+    """
+    This function turns off the metrics exporter after writing the metrics file one last time.
+
+    Returns
+    -------
+
+    None
+    """
+
+    global _exporter
+
+    if _exporter != None:
+        _tracing.remove_sink(_exporter)
+        try:
+            _exporter.write()
+        except Exception as e:
+            pass
+        _exporter = None
+
+def write_metrics():
+
+    """
+    This function writes the metrics file now (i.e. at the end of a job that does not exit afterwards).
+
+    Returns
+    -------
+
+    None
+    """
+
+    if _exporter != None:
+        _exporter.write()
+
+def _at_exit():
+
+    if _exporter != None:
+        try:
+            _exporter.write()
+        except Exception as e:
+            pass
+
+_atexit.register(_at_exit)
+
+if _os.environ.get('XMACIS2PY_METRICS_FILE', '') != '':
+    enable_metrics(_os.environ['XMACIS2PY_METRICS_FILE'])
@@ -0,0 +1,516 @@
+"""
+This file hosts the pipeline scheduler of xmACIS2Py.
+
+Downloading waits on the network, the analysis is light CPU work and rendering is heavy CPU work. A loop that downloads, analyzes and
+renders one station after another leaves the cores idle while it downloads and the network idle while it renders. A pipeline runs
+the stages at the same time: while station N renders, station N+1 is downloading.
+
+1) Each stage has its own workers: threads for work that waits (downloads) and processes for work that keeps a core busy (rendering).
+   The worker processes are started by a fork server (spawned where there is none) rather than forked, since the threads of the other
+   stages are already running and a forked worker can inherit a lock one of them holds.
+
+2) The stages are connected by bounded queues. When a stage falls behind, the queue in front of it fills up and the stages before it wait
+   (backpressure), so a fast download stage never piles up thousands of Pandas.DataFrames in memory.
+
+3) A stage can expand one item into many (i.e. one station into one render per product).
+
+4) A failed item is reported with the error and the stage that failed, and the other items keep going.
+
+Example
+-------
+
+from xmacis2py.utils.pipeline import station_pipeline
+from xmacis2py.graphics import temperature, precipitation
+
+pipeline = station_pipeline([temperature.plot_maximum_temperature_summary, precipitation.plot_precipitation_summary],
+                            fetch_workers=8,
+                            render_workers=16)
+
+for result in pipeline.run(['KRAL', 'KONT', 'KSAN']):
+    print(result['item'], result['error'])
+
+Pipeline Tools:
+
+- Stage
+- Pipeline
+- station_pipeline
+
+(C) Eric J. Drewitz 2025-2026
+"""
+
+import concurrent.futures as _futures
+import multiprocessing as _multiprocessing
+import os as _os
+import queue as _queue
+import threading as _threading
+import time as _time
+import traceback as _traceback
+import warnings as _warnings
+_warnings.filterwarnings('ignore')
+
+_done = object()
+
+class Stage:
+
+    """
+    This class is a stage of a pipeline.
+
+    Required Arguments:
+
+    1) name (String) - The name of the stage (i.e. 'fetch').
+
+    2) func (Callable) - Called with the output of the stage before (or an input item for the first stage). It returns the input of the
+       next stage. With processes=True, func and its input and output must be picklable (i.e. a module level function) and the module
+       must be importable by the worker processes, since they are not forked.
+
+    Optional Arguments:
+
+    1) workers (Integer) - Default=1. The number of items the stage works on at the same time.
+
+    2) processes (Boolean) - Default=False. When set to True, the stage runs in a pool of worker processes. Otherwise it runs in threads.
+
+    3) expand (Boolean) - Default=False. When set to True, func returns a list (or any iterable) and each of its values goes on to the
+       next stage separately.
+
+    4) initializer (Callable) - Default=None. With processes=True, called once in each worker process when it starts.
+       It must be picklable like func.
+
+    5) initargs (Tuple) - Default=(). The arguments of initializer. They must be picklable.
+    """
+
+    def __init__(self,
+                 name,
+                 func,
+                 workers=1,
+                 processes=False,
+                 expand=False,
+                 initializer=None,
+                 initargs=()):
+
+        self.name = name
+        self.func = func
+        self.workers = max(int(workers), 1)
+        self.processes = processes
+        self.expand = expand
+        self.initializer = initializer
+        self.initargs = initargs
+
+def _process_context():
+
+    """
+    This function returns the start method of the worker processes: a fork server, or spawn where there is no fork server.
+    """
+
+    if 'forkserver' in _multiprocessing.get_all_start_methods():
+        return _multiprocessing.get_context('forkserver')
+
+    return _multiprocessing.get_context('spawn')
+
+def _error_text(e):
+    return ''.join(_traceback.format_exception_only(type(e), e)).strip()
+
+class Pipeline:
+
+    """
+    This class runs items through stages connected by bounded queues, with every stage working at the same time.
+
+    Required Arguments:
+
+    1) stages (List) - The stages (Stage) in order.
+
+    Optional Arguments:
+
+    1) queue_size (Integer) - Default=None. The number of items that can wait in front of each stage. When set to None, it is twice the
+       number of workers of the stage.
+
+    Methods
+    -------
+
+    run(items) - Runs the items through the stages. It is a generator of results in the order they finish. Each result is a dictionary:
+
+        {'item':the input item, 'value':the output of the last stage or None, 'error':None or the error (String),
+         'stage':None or the name of the stage that failed, 'seconds':{stage name:seconds}}
+
+        Stopping the iteration early stops the pipeline. When iterating the items raises an error, run() raises it after the results
+        of the items before it.
+
+    stats() - A dictionary per stage of the number of 'items' and 'errors', the 'busy' seconds of its workers and the 'utilization'
+        (busy seconds / (workers x elapsed seconds)) of the last run. A stage with a utilization near 1 is the bottleneck.
+    """
+
+    def __init__(self,
+                 stages,
+                 queue_size=None):
+
+        if len(stages) == 0:
+            raise ValueError("A pipeline needs at least one stage.")
+
+        self.stages = list(stages)
+        self.queue_size = queue_size
+        self._stats = {}
+        self._elapsed = 0.0
+
+    def _queue_for(self, stage):
+
+        if self.queue_size == None:
+            return _queue.Queue(maxsize=2 * stage.workers)
+
+        return _queue.Queue(maxsize=max(self.queue_size, 1))
+
+    def _put(self,
+             target,
+             value,
+             stop):
+
+        """
+        This method puts a value on a queue, waiting while the queue is full (backpressure) unless the pipeline is stopping.
+        """
+
+        while stop.is_set() == False:
+            try:
+                target.put(value, timeout=0.1)
+                return True
+            except _queue.Full:
+                pass
+
+        return False
+
+    def _worker(self,
+                index,
+                inbox,
+                outbox,
+                executor,
+                remaining,
+                lock,
+                stop):
+
+        """
+        This method is one worker of a stage: it takes items from the queue in front of the stage and puts the results on the next queue.
+        """
+
+        stage = self.stages[index]
+        last = index == len(self.stages) - 1
+        stats = self._stats[stage.name]
+
+        while True:
+
+            envelope = inbox.get()
+            if envelope is _done:
+                break
+            if stop.is_set() == True:
+                continue
+
+            item, value, seconds = envelope
+            start = _time.perf_counter()
+            try:
+                if executor != None:
+                    output = executor.submit(stage.func, value).result()
+                else:
+                    output = stage.func(value)
+                if stage.expand == True:
+                    output = list(output)
+                error = None
+            except Exception as e:
+                error = _error_text(e)
+            elapsed = _time.perf_counter() - start
+
+            with lock:
+                stats['items'] += 1
+                stats['busy'] += elapsed
+                if error != None:
+                    stats['errors'] += 1
+
+            seconds = dict(seconds)
+            seconds[stage.name] = seconds.get(stage.name, 0.0) + elapsed
+
+            if error != None:
+                self._put(self._results, {
+                    'item':item,
+                    'value':None,
+                    'error':error,
+                    'stage':stage.name,
+                    'seconds':seconds
+                }, stop)
+                continue
+
+            if stage.expand == True:
+                outputs = output
+            else:
+                outputs = [output]
+
+            for output in outputs:
+                if last == True:
+                    self._put(self._results, {
+                        'item':item,
+                        'value':output,
+                        'error':None,
+                        'stage':None,
+                        'seconds':seconds
+                    }, stop)
+                else:
+                    self._put(outbox, (item, output, seconds), stop)
+
+        # The last worker of a stage to finish tells the workers of the next stage that there are no more items.
+        with lock:
+            remaining[index] -= 1
+            finished = remaining[index] == 0
+        if finished == True:
+            if last == True:
+                self._results.put(_done)
+            else:
+                for i in range(self.stages[index + 1].workers):
+                    outbox.put(_done)
+
+    def _feed(self,
+              items,
+              inbox,
+              stop):
+
+        """
+        This method puts the input items on the queue of the first stage.
+
+        An error raised by the items is kept and raised by run() once the items before it are finished.
+        """
+
+        try:
+            for item in items:
+                if self._put(inbox, (item, item, {}), stop) == False:
+                    break
+        except Exception as e:
+            self._feed_error = e
+        finally:
+            for i in range(self.stages[0].workers):
+                inbox.put(_done)
+
+    def run(self, items):
+
+        self._stats = {stage.name:{'items':0, 'errors':0, 'busy':0.0} for stage in self.stages}
+        self._results = _queue.Queue()
+        self._feed_error = None
+        queues = [self._queue_for(stage) for stage in self.stages]
+        # The last stage puts its results on the unbounded result queue, so the workers never wait on a slow consumer.
+        queues.append(self._results)
+
+        stop = _threading.Event()
+        lock = _threading.Lock()
+        remaining = [stage.workers for stage in self.stages]
+        executors = []
+        threads = []
+        start = _time.perf_counter()
+
+        try:
+            # Every pool is created before the first thread starts.
+            stage_executors = []
+            for stage in self.stages:
+                executor = None
+                if stage.processes == True:
+                    executor = _futures.ProcessPoolExecutor(max_workers=stage.workers,
+                                                            mp_context=_process_context(),
+                                                            initializer=stage.initializer,
+                                                            initargs=stage.initargs)
+                    executors.append(executor)
+                stage_executors.append(executor)
+
+            for index, stage in enumerate(self.stages):
+                executor = stage_executors[index]
+                for i in range(stage.workers):
+                    thread = _threading.Thread(target=self._worker,
+                                               args=(index, queues[index], queues[index + 1], executor, remaining, lock, stop),
+                                               name=f"xmacis2py-pipeline-{stage.name}-{i}",
+                                               daemon=True)
+                    thread.start()
+                    threads.append(thread)
+
+            feeder = _threading.Thread(target=self._feed,
+                                       args=(items, queues[0], stop),
+                                       name='xmacis2py-pipeline-feed',
+                                       daemon=True)
+            feeder.start()
+            threads.append(feeder)
+
+            while True:
+                result = self._results.get()
+                if result is _done:
+                    break
+                yield result
+
+            if self._feed_error != None:
+                raise self._feed_error
+
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+            for executor in executors:
+                executor.shutdown(wait=True, cancel_futures=True)
+            self._elapsed = _time.perf_counter() - start
+
+    def stats(self):
+
+        stats = {}
+        for stage in self.stages:
+            stage_stats = dict(self._stats.get(stage.name, {'items':0, 'errors':0, 'busy':0.0}))
+            if self._elapsed > 0:
+                stage_stats['utilization'] = stage_stats['busy'] / (stage.workers * self._elapsed)
+            else:
+                stage_stats['utilization'] = 0.0
+            stats[stage.name] = stage_stats
+
+        return stats
+
+class _Fetch:
+
+    """
+    This class is the fetch stage of station_pipeline: station -> (station, df).
+    """
+
+    def __init__(self, data_kwargs):
+
+        self.data_kwargs = dict(data_kwargs)
+        self.data_kwargs.setdefault('notifications', 'off')
+
+    def __call__(self, station):
+
+        from xmacis2py.data_access.get_data import get_data as _get_data
+
+        return station, _get_data(station, **self.data_kwargs)
+
+class _Analyze:
+
+    """
+    This class is the analysis stage of station_pipeline: (station, df) -> (station, df, analysis).
+    """
+
+    def __init__(self, analyze):
+
+        self.analyze = analyze
+
+    def __call__(self, value):
+
+        station, df = value
+        if self.analyze == None:
+            return station, df, None
+
+        return station, df, self.analyze(station, df)
+
+class _Plan:
+
+    """
+    This class expands a station into one render per product.
+    """
+
+    def __init__(self,
+                 products,
+                 plot_kwargs):
+
+        self.products = products
+        self.plot_kwargs = plot_kwargs
+
+    def __call__(self, value):
+
+        station, df, analysis = value
+
+        return [(station, product, df, analysis, self.plot_kwargs) for product in self.products]
+
+def _render_product(task):
+
+    """
+    This function renders one product of one station (in a render process).
+
+    Returns
+    -------
+
+    A dictionary with the keys 'station', 'product' and 'analysis'.
+    """
+
+    import matplotlib.pyplot as _plt
+
+    station, product, df, analysis, plot_kwargs = task
+    kwargs = dict(plot_kwargs)
+    kwargs.setdefault('notifications', 'off')
+    try:
+        product(station, df=df, **kwargs)
+    finally:
+        _plt.close('all')
+
+    return {
+        'station':station,
+        'product':product.__name__,
+        'analysis':analysis
+    }
+
+def _init_render_process(folder):
+
+    import matplotlib as _mpl
+    _mpl.use('Agg')
+
+    import xmacis2py.utils.file_funcs as _file_funcs
+    _file_funcs.folder_modified = folder
+
+def station_pipeline(products,
+                     fetch_workers=8,
+                     analysis_workers=2,
+                     render_workers=None,
+                     analyze=None,
+                     data_kwargs={},
+                     plot_kwargs={},
+                     queue_size=None):
+
+    """
+    This function builds the fetch -> analyze -> render pipeline of a batch of stations.
+
+    1) fetch - Downloads the data of each station with get_data in fetch_workers threads.
+
+    2) analyze - Runs analyze(station, df) in analysis_workers threads (the data passes straight through when analyze is None).
+
+    3) render - Renders each product of each station in render_workers processes. The graphics are saved under the folder of
+       xmacis2py.utils.file_funcs (folder_modified) at the time the pipeline is built.
+
+    Required Arguments:
+
+    1) products (List) - The plot functions (i.e. [temperature.plot_maximum_temperature_summary, precipitation.plot_precipitation_summary]).
+
+    Optional Arguments:
+
+    1) fetch_workers (Integer) - Default=8. The number of concurrent downloads.
+
+    2) analysis_workers (Integer) - Default=2. The number of analysis threads.
+
+    3) render_workers (Integer) - Default=None. The number of render processes. When set to None, the number of CPUs.
+
+    4) analyze (Callable) - Default=None. Called as analyze(station, df) for each station. Its return value is in the 'analysis' of the
+       results of the station (i.e. a dictionary of period statistics for a table).
+
+    5) data_kwargs (Dictionary) - Default=Blank Dictionary. The arguments of get_data (i.e. {'time_delta':90, 'proxies':proxies}).
+
+    6) plot_kwargs (Dictionary) - Default=Blank Dictionary. The arguments of the plot functions (i.e. {'plot_type':'line'}).
+
+    7) queue_size (Integer) - Default=None. The number of items that can wait in front of each stage. When set to None, it is twice
+       the number of workers of the stage.
+
+    Returns
+    -------
+
+    A Pipeline. Run it with pipeline.run(stations). The value of each result is a dictionary with the keys 'station', 'product' and 'analysis'.
+    """
+
+    import xmacis2py.utils.file_funcs as _file_funcs
+
+    if render_workers == None:
+        render_workers = _os.cpu_count()
+
+    if analyze == None:
+        analysis_workers = 1
+
+    stages = [Stage('fetch', _Fetch(data_kwargs), workers=fetch_workers)]
+    stages.append(Stage('analyze', _Analyze(analyze), workers=analysis_workers))
+    stages.append(Stage('plan', _Plan(list(products), dict(plot_kwargs)), workers=1, expand=True))
+    # The render processes are not forked, so they are handed the folder the graphics are saved in.
+    stages.append(Stage('render',
+                        _render_product,
+                        workers=render_workers,
+                        processes=True,
+                        initializer=_init_render_process,
+                        initargs=(_file_funcs.folder_modified,)))
+
+    return Pipeline(stages, queue_size=queue_size)
@@ -0,0 +1,323 @@
+"""
+This file hosts the opt-in profiler of xmACIS2Py.
+
+While profiling is on, every call of a plot function or an analysis tool is profiled and saves three files:
+
+1) {name}.prof - The CPU profile (cProfile). Open it with pstats, snakeviz or any other cProfile viewer.
+
+2) {name}.tracemalloc - The allocation snapshot at the end of the call. Load it with tracemalloc.Snapshot.load().
+
+3) {name}.txt - A summary: the time and peak memory of the call, the functions with the most time and the lines with the most memory.
+
+The files are saved to ACIS Profiles/{station} (or output_dir/{station}) and named {station} {function} {product_type or parameter} {time} {pid}.
+Analysis tools called directly (with no station) are saved under 'ANALYSIS'.
+
+Only the outermost call is profiled: the analysis tools a plot function calls are part of the profile of the plot function.
+Python allows one profiler at a time, so while one thread is profiling a call, calls in other threads run without being profiled.
+
+The memory snapshot slows the call down a lot and that time shows up in the CPU profile. Profile the CPU with memory=False to get
+the most accurate times.
+
+Setting the environment variable XMACIS2PY_PROFILE_DIR to a folder (or 'default') before xmACIS2Py is imported turns on profiling
+for the whole process.
+
+Example
+-------
+
+from xmacis2py.utils import profiling
+
+with profiling.profiling() as files:
+    plot_comprehensive_summary('KRAL')
+
+print(files)
+
+Profiling Tools:
+
+- enable_profiling
+- disable_profiling
+- profiling
+
+(C) Eric J. Drewitz 2025-2026
+"""
+
+import contextlib as _contextlib
+import cProfile as _cProfile
+import io as _io
+import itertools as _itertools
+import os as _os
+import pstats as _pstats
+import re as _re
+import threading as _threading
+import time as _time
+import tracemalloc as _tracemalloc
+import warnings as _warnings
+_warnings.filterwarnings('ignore')
+
+import xmacis2py.utils.tracing as _tracing
+import xmacis2py.utils.file_funcs as _file_funcs
+
+_busy = _threading.Lock()
+_ids = _itertools.count(1)
+_settings = {
+    'output_dir':None,
+    'cpu':True,
+    'memory':True,
+    'kinds':['plot', 'analysis'],
+    'top':25,
+    'files':None
+}
+
+def _clean(text):
+
+    """
+    This function makes text safe for a file name.
+    """
+
+    return _re.sub(r'[^A-Za-z0-9._-]+', '_', str(text)).strip('_')
+
+def _profile_path(station,
+                  output_dir):
+
+    """
+    This function returns the folder of the profiles of a station.
+    """
+
+    if output_dir == 'default':
+        return _file_funcs.update_profile_file_paths(station)
+
+    path = f"{output_dir}/{station.upper()}"
+    try:
+        _os.makedirs(path)
+    except Exception as e:
+        pass
+
+    return path
+
+class _Profile:
+
+    """
+    This class profiles one call.
+    """
+
+    def __init__(self,
+                 kind,
+                 name,
+                 labels,
+                 settings):
+
+        self.kind = kind
+        self.name = name
+        self.labels = labels
+        self.settings = settings
+        self._profiler = None
+        self._started_tracemalloc = False
+        self._acquired = False
+
+    def __enter__(self):
+
+        # Python allows one profiler at a time. A call that finds one running (a nested call or another thread) is not profiled.
+        if _busy.acquire(blocking=False) == False:
+            return self
+        self._acquired = True
+
+        if self.settings['memory'] == True:
+            if _tracemalloc.is_tracing() == False:
+                _tracemalloc.start(25)
+                self._started_tracemalloc = True
+            _tracemalloc.reset_peak()
+
+        if self.settings['cpu'] == True:
+            self._profiler = _cProfile.Profile()
+            try:
+                self._profiler.enable()
+            except Exception as e:
+                # Another profiling tool is running.
+                self._profiler = None
+
+        self._start = _time.perf_counter()
+
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+
+        if self._acquired == False:
+            return False
+
+        try:
+            duration = _time.perf_counter() - self._start
+            if self._profiler != None:
+                self._profiler.disable()
+
+            snapshot = None
+            peak = None
+            if self.settings['memory'] == True:
+                peak = _tracemalloc.get_traced_memory()[1]
+                snapshot = _tracemalloc.take_snapshot()
+                if self._started_tracemalloc == True:
+                    _tracemalloc.stop()
+
+            self._save(duration, snapshot, peak, exc_type)
+        finally:
+            _busy.release()
+
+        return False
+
+    def _save(self,
+              duration,
+              snapshot,
+              peak,
+              exc_type):
+
+        """
+        This method saves the profile, the snapshot and the summary.
+        """
+
+        station = self.labels.get('station')
+        if isinstance(station, str) == False or station == '':
+            station = 'ANALYSIS'
+        detail = self.labels.get('product_type', self.labels.get('parameter'))
+
+        parts = [station.upper(), self.name]
+        if detail != None:
+            parts.append(detail)
+        parts.append(_time.strftime('%Y%m%d-%H%M%S'))
+        parts.append(f"{_os.getpid()}-{next(_ids)}")
+        path = _profile_path(station, self.settings['output_dir'])
+        base = f"{path}/{' '.join([_clean(part) for part in parts])}"
+
+        files = []
+        summary = _io.StringIO()
+        summary.write(f"{self.name} ({self.kind})\n")
+        for label, value in self.labels.items():
+            summary.write(f"{label}: {value}\n")
+        summary.write(f"Time: {duration:.3f} s\n")
+        if peak != None:
+            summary.write(f"Peak Memory: {peak / 1024 ** 2:.1f} MiB\n")
+        if exc_type != None:
+            summary.write(f"Error: {exc_type.__name__}\n")
+
+        if self._profiler != None:
+            self._profiler.dump_stats(f"{base}.prof")
+            files.append(f"{base}.prof")
+            summary.write(f"\nTop {self.settings['top']} functions by cumulative time\n\n")
+            stats = _pstats.Stats(self._profiler, stream=summary)
+            stats.sort_stats('cumulative').print_stats(self.settings['top'])
+
+        if snapshot != None:
+            snapshot.dump(f"{base}.tracemalloc")
+            files.append(f"{base}.tracemalloc")
+            snapshot = snapshot.filter_traces([_tracemalloc.Filter(False, _tracemalloc.__file__)])
+            summary.write(f"\nTop {self.settings['top']} lines by memory held at the end of the call\n\n")
+            for statistic in snapshot.statistics('lineno')[:self.settings['top']]:
+                summary.write(f"{statistic}\n")
+
+        with open(f"{base}.txt", 'w') as f:
+            f.write(summary.getvalue())
+        files.append(f"{base}.txt")
+
+        if self.settings['files'] != None:
+            self.settings['files'].extend(files)
+
+def _hook(kind,
+          name,
+          labels):
+
+    """
+    This function is the tracing hook that profiles the calls of the profiled kinds.
+    """
+
+    if kind not in _settings['kinds'] or _busy.locked() == True:
+        return None
+
+    return _Profile(kind, name, dict(labels), dict(_settings))
+
+def enable_profiling(output_dir='default',
+                     cpu=True,
+                     memory=True,
+                     kinds=['plot', 'analysis'],
+                     top=25):
+
+    """
+    This function turns on profiling for every call of the plot functions and analysis tools.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) output_dir (String) - Default='default'. If set to 'default' the profiles are saved to "ACIS Profiles/{station}".
+       Otherwise the profiles are saved to "{output_dir}/{station}".
+
+    2) cpu (Boolean) - Default=True. When set to True, the CPU profile (cProfile) is saved.
+
+    3) memory (Boolean) - Default=True. When set to True, the allocation snapshot (tracemalloc) is saved.
+
+    4) kinds (String List) - Default=['plot', 'analysis']. The kinds of calls profiled: 'plot' for the plot functions, 'analysis' for the
+       analysis tools and 'get_data' for get_data.
+
+    5) top (Integer) - Default=25. The number of functions and lines in the summary.
+
+    Returns
+    -------
+
+    None
+    """
+
+    _settings['output_dir'] = output_dir
+    _settings['cpu'] = cpu
+    _settings['memory'] = memory
+    _settings['kinds'] = list(kinds)
+    _settings['top'] = top
+
+    _tracing.remove_hook(_hook)
+    _tracing.add_hook(_hook)
+
+def disable_profiling():
+
+    """
+    This function turns off profiling.
+
+    Returns
+    -------
+
+    None
+    """
+
+    _tracing.remove_hook(_hook)
+
+@_contextlib.contextmanager
+def profiling(output_dir='default',
+              cpu=True,
+              memory=True,
+              kinds=['plot', 'analysis'],
+              top=25):
+
+    """
+    This function profiles the calls in a block of code: with profiling() as files: plot_comprehensive_summary('KRAL')
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) output_dir through 5) top - The same as enable_profiling.
+
+    Returns
+    -------
+
+    A list that receives the file paths of the saved profiles while the block runs.
+    """
+
+    previous = dict(_settings)
+    was_enabled = _hook in _tracing._hooks
+    files = []
+
+    enable_profiling(output_dir=output_dir, cpu=cpu, memory=memory, kinds=kinds, top=top)
+    _settings['files'] = files
+    try:
+        yield files
+    finally:
+        _settings.update(previous)
+        if was_enabled == False:
+            disable_profiling()
+
+if _os.environ.get('XMACIS2PY_PROFILE_DIR', '') != '':
+    enable_profiling(output_dir=_os.environ['XMACIS2PY_PROFILE_DIR'])
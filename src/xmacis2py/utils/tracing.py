@@ -0,0 +1,535 @@
+"""
+This file hosts the tracing instrumentation of xmACIS2Py.
+
+xmACIS2Py records spans (a named, timed piece of work with labels) around:
+
+1) 'plot' - Each plot function (labels: station, product_type).
+
+2) 'get_data' - Each get_data call (labels: station) and 'fetch' - each upstream request to xmACIS2 (labels: station, rows).
+
+3) 'analysis' - Each analysis tool call (labels: parameter, rows).
+
+4) 'figure' - Building a figure, from creating it to saving it.
+
+5) 'savefig' - Rendering a figure to PNG and 'write' - writing the PNG file (labels: file, path, bytes).
+
+6) 'station_cache' - Each StationCache request (labels: station, cache ('hit' or 'miss')).
+
+Analysis tool spans also carry cache='hit' or 'miss' while the analysis cache is enabled.
+
+A span inherits the labels of the span it runs inside, so the analysis, figure and file spans of a plot carry the station and the
+product of the plot. Every finished span is handed to the sinks as a flat dictionary:
+
+{'kind', 'name', 'start' (Unix time), 'duration' (seconds), 'span_id', 'parent_id', 'pid', 'thread', 'error', plus the labels}
+
+Tracing is off until a sink is added. With no sinks, a span is a shared do-nothing object, so the instrumentation costs about one
+function call per span. Setting the environment variable XMACIS2PY_TRACE_FILE to a file path before xmACIS2Py is imported appends every
+span to that file as JSON lines.
+
+Example
+-------
+
+from xmacis2py.utils import tracing
+
+with tracing.recording() as recorder:
+    plot_maximum_temperature_summary('KRAL')
+
+df = recorder.to_dataframe()
+df.groupby(['kind', 'station'])['duration'].sum()
+
+Tracing Tools:
+
+- add_sink
+- remove_sink
+- add_hook
+- remove_hook
+- enabled
+- span
+- start
+- traced
+- annotate
+- recording
+- SpanRecorder
+- JsonLinesSink
+
+(C) Eric J. Drewitz 2025-2026
+"""
+
+import contextlib as _contextlib
+import contextvars as _contextvars
+import functools as _functools
+import inspect as _inspect
+import itertools as _itertools
+import json as _json
+import os as _os
+import threading as _threading
+import time as _time
+import warnings as _warnings
+_warnings.filterwarnings('ignore')
+
+_lock = _threading.Lock()
+_sinks = ()
+_hooks = ()
+_ids = _itertools.count(1)
+_current = _contextvars.ContextVar('xmacis2py_span', default=None)
+
+def add_sink(sink):
+
+    """
+    This function adds a sink that receives every finished span. Tracing is on while there is at least one sink.
+
+    Required Arguments:
+
+    1) sink (Callable) - Called with the record (Dictionary) of each finished span. Errors raised by a sink are ignored.
+
+    Returns
+    -------
+
+    The sink.
+    """
+
+    global _sinks
+    with _lock:
+        _sinks = _sinks + (sink,)
+
+    return sink
+
+def remove_sink(sink):
+
+    """
+    This function removes a sink.
+
+    Required Arguments:
+
+    1) sink (Callable) - The sink.
+
+    Returns
+    -------
+
+    None
+    """
+
+    global _sinks
+    with _lock:
+        _sinks = tuple([s for s in _sinks if s is not sink])
+
+def add_hook(hook):
+
+    """
+    This function adds a hook that runs around every call of a traced function (i.e. the profiler of xmacis2py.utils.profiling).
+
+    Required Arguments:
+
+    1) hook (Callable) - Called as hook(kind, name, labels) before each call. It returns a context manager that is entered around the call,
+        or None to leave the call alone.
+
+    Returns
+    -------
+
+    The hook.
+    """
+
+    global _hooks
+    with _lock:
+        _hooks = _hooks + (hook,)
+
+    return hook
+
+def remove_hook(hook):
+
+    """
+    This function removes a hook.
+
+    Required Arguments:
+
+    1) hook (Callable) - The hook.
+
+    Returns
+    -------
+
+    None
+    """
+
+    global _hooks
+    with _lock:
+        _hooks = tuple([h for h in _hooks if h is not hook])
+
+def enabled():
+
+    """
+    This function checks if tracing is on.
+
+    Returns
+    -------
+
+    True if there is at least one sink and False otherwise.
+    """
+
+    return len(_sinks) > 0
+
+class _NullSpan:
+
+    """
+    This class is the span handed out while tracing is off. It does nothing.
+    """
+
+    def set(self, **labels):
+        return self
+
+    def end(self, error=None):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+_null_span = _NullSpan()
+
+class Span:
+
+    """
+    This class is a span that is being recorded. Use span(), start() or traced() rather than creating it directly.
+
+    Methods
+    -------
+
+    set(**labels) - Adds labels to the span (i.e. the number of rows once they are known).
+
+    end(error=None) - Ends the span and hands its record to the sinks. Ending a span twice does nothing.
+
+    The span is also a context manager that ends it on exit (recording the exception if one was raised).
+    """
+
+    __slots__ = ('kind', 'name', 'labels', 'span_id', 'parent_id', '_start', '_clock', '_token', '_ended')
+
+    def __init__(self,
+                 kind,
+                 name,
+                 labels):
+
+        parent = _current.get()
+        if parent != None:
+            inherited = dict(parent.labels)
+            inherited.update(labels)
+            labels = inherited
+            self.parent_id = parent.span_id
+        else:
+            self.parent_id = None
+
+        self.kind = kind
+        self.name = name
+        self.labels = labels
+        self.span_id = next(_ids)
+        self._ended = False
+        self._start = _time.time()
+        self._clock = _time.perf_counter()
+        self._token = _current.set(self)
+
+    def set(self, **labels):
+
+        self.labels.update(labels)
+
+        return self
+
+    def end(self, error=None):
+
+        if self._ended == True:
+            return
+        self._ended = True
+        duration = _time.perf_counter() - self._clock
+
+        try:
+            _current.reset(self._token)
+        except Exception as e:
+            # Ended in a different context than it started (i.e. another thread). The parent span restores the context.
+            pass
+
+        record = {
+            'kind':self.kind,
+            'name':self.name,
+            'start':self._start,
+            'duration':duration,
+            'span_id':self.span_id,
+            'parent_id':self.parent_id,
+            'pid':_os.getpid(),
+            'thread':_threading.current_thread().name,
+            'error':error
+        }
+        for label, value in self.labels.items():
+            if label not in record:
+                record[label] = value
+
+        for sink in _sinks:
+            try:
+                sink(record)
+            except Exception as e:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+
+        if exc_type != None:
+            self.end(error=f"{exc_type.__name__}: {exc}")
+        else:
+            self.end()
+
+        return False
+
+def start(kind,
+          name=None,
+          **labels):
+
+    """
+    This function starts a span that is ended by calling its end() method.
+
+    Use it when the work does not fit in one block of code (i.e. building a figure). Otherwise use span().
+
+    Required Arguments:
+
+    1) kind (String) - The kind of work (i.e. 'fetch', 'analysis', 'figure').
+
+    Optional Arguments:
+
+    1) name (String) - Default=None. The name of the span. When set to None, the name is the kind.
+
+    2) **labels - Labels of the span (i.e. station='KRAL').
+
+    Returns
+    -------
+
+    The span (a do-nothing span when tracing is off).
+    """
+
+    if len(_sinks) == 0:
+        return _null_span
+
+    if name == None:
+        name = kind
+
+    return Span(kind, name, labels)
+
+def span(kind,
+         name=None,
+         **labels):
+
+    """
+    This function returns a span to use as a context manager: with span('fetch', station='KRAL') as s: ...
+
+    Required Arguments:
+
+    1) kind (String) - The kind of work (i.e. 'fetch', 'analysis', 'figure').
+
+    Optional Arguments:
+
+    1) name (String) - Default=None. The name of the span. When set to None, the name is the kind.
+
+    2) **labels - Labels of the span (i.e. station='KRAL').
+
+    Returns
+    -------
+
+    The span (a do-nothing span when tracing is off).
+    """
+
+    return start(kind, name, **labels)
+
+def traced(kind,
+           labels=['station', 'product_type', 'parameter']):
+
+    """
+    This function is a decorator that records a span around every call of a function and runs the hooks around it.
+
+    The span is named after the function. The labels are read from the arguments of the same names,
+    and when the function takes a df argument its number of rows is recorded as 'rows'.
+
+    Required Arguments:
+
+    1) kind (String) - The kind of work (i.e. 'analysis', 'plot').
+
+    Optional Arguments:
+
+    1) labels (String List) - Default=['station', 'product_type', 'parameter']. The arguments recorded as labels.
+        Arguments the function does not have are skipped.
+
+    Returns
+    -------
+
+    The decorator.
+    """
+
+    def decorator(func):
+
+        parameters = list(_inspect.signature(func).parameters.values())
+        positions = {}
+        defaults = {}
+        for i, parameter in enumerate(parameters):
+            if parameter.name in labels or parameter.name == 'df':
+                positions[parameter.name] = i
+                if parameter.default is not _inspect.Parameter.empty:
+                    defaults[parameter.name] = parameter.default
+
+        @_functools.wraps(func)
+        def wrapper(*args, **kwargs):
+
+            if len(_sinks) == 0 and len(_hooks) == 0:
+                return func(*args, **kwargs)
+
+            values = {}
+            for name, i in positions.items():
+                if name in kwargs:
+                    values[name] = kwargs[name]
+                elif i < len(args):
+                    values[name] = args[i]
+                elif name in defaults:
+                    values[name] = defaults[name]
+
+            df = values.pop('df', None)
+            if df is not None:
+                try:
+                    values['rows'] = len(df)
+                except Exception as e:
+                    pass
+            if isinstance(values.get('station'), str):
+                values['station'] = values['station'].upper()
+
+            with _contextlib.ExitStack() as stack:
+                for hook in _hooks:
+                    context = hook(kind, func.__name__, values)
+                    if context != None:
+                        stack.enter_context(context)
+                if len(_sinks) > 0:
+                    stack.enter_context(Span(kind, func.__name__, values))
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+def annotate(**labels):
+
+    """
+    This function adds labels to the span that is running (i.e. whether a cache answered the call).
+
+    Nothing happens when no span is running or tracing is off.
+
+    Required Arguments:
+
+    1) **labels - The labels (i.e. cache='hit').
+
+    Returns
+    -------
+
+    None
+    """
+
+    current = _current.get()
+    if current != None:
+        current.labels.update(labels)
+
+class SpanRecorder:
+
+    """
+    This class is a sink that keeps the spans in memory.
+
+    Attributes
+    ----------
+
+    records (List) - The span records.
+
+    Methods
+    -------
+
+    to_dataframe() - The records as a Pandas.DataFrame (one row per span).
+
+    to_jsonl(fname) - Saves the records as JSON lines.
+
+    clear() - Forgets the records.
+    """
+
+    def __init__(self):
+
+        self.records = []
+        self._lock = _threading.Lock()
+
+    def __call__(self, record):
+
+        with self._lock:
+            self.records.append(record)
+
+    def to_dataframe(self):
+
+        import pandas as _pd
+
+        with self._lock:
+            return _pd.DataFrame(list(self.records))
+
+    def to_jsonl(self, fname):
+
+        with self._lock:
+            records = list(self.records)
+
+        with open(fname, 'w') as f:
+            for record in records:
+                f.write(_json.dumps(record, default=str) + '\n')
+
+    def clear(self):
+
+        with self._lock:
+            self.records = []
+
+class JsonLinesSink:
+
+    """
+    This class is a sink that appends every span to a file as one JSON object per line.
+
+    The file is opened in append mode for each span, so several processes can write to the same file.
+
+    Required Arguments:
+
+    1) fname (String) - The file path.
+    """
+
+    def __init__(self, fname):
+
+        self.fname = fname
+        self._lock = _threading.Lock()
+
+    def __call__(self, record):
+
+        line = _json.dumps(record, default=str) + '\n'
+        with self._lock:
+            with open(self.fname, 'a') as f:
+                f.write(line)
+
+@_contextlib.contextmanager
+def recording():
+
+    """
+    This function records the spans of a block of code: with recording() as recorder: ...
+
+    Returns
+    -------
+
+    A SpanRecorder that receives the spans while the block runs.
+    """
+
+    recorder = add_sink(SpanRecorder())
+    try:
+        yield recorder
+    finally:
+        remove_sink(recorder)
+
+if _os.environ.get('XMACIS2PY_TRACE_FILE', '') != '':
+    add_sink(JsonLinesSink(_os.environ['XMACIS2PY_TRACE_FILE']))
+
+if _os.environ.get('XMACIS2PY_METRICS_FILE', '') != '':
+    # The metrics exporter is a sink, so it is turned on with the tracing (see xmacis2py.utils.metrics).
+    import xmacis2py.utils.metrics
+
+if _os.environ.get('XMACIS2PY_PROFILE_DIR', '') != '':
+    # The profiler is a hook, so it is turned on with the tracing (see xmacis2py.utils.profiling).
+    import xmacis2py.utils.profiling
@@ -0,0 +1,48 @@
+"""
+Shared fixtures of the xmACIS2Py tests.
+
+The tests run offline: the data comes from the synthetic station generator or from a ReplayServer in synthetic mode.
+
+(C) Eric J. Drewitz 2025-2026
+"""
+import os
+
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+import pytest
+
+import xmacis2py.utils.file_funcs as _file_funcs
+from xmacis2py.data_access.synthetic import synthetic_station
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+
+    """
+    The ACIS Data, ACIS Graphics and ACIS Reports folders of a test are created in its own temporary folder.
+    """
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(_file_funcs, 'folder_modified', str(tmp_path).replace("\\", "/"))
+
+    return tmp_path
+
+@pytest.fixture
+def station_df():
+
+    """
+    30 days of synthetic data for the station KTST.
+    """
+
+    return synthetic_station('KTST', days=30)
+
+@pytest.fixture
+def replay_server(workdir):
+
+    """
+    A ReplayServer serving synthetic data. Pass proxies=replay_server.proxies to get_data.
+    """
+
+    from xmacis2py.data_access.replay import ReplayServer
+
+    with ReplayServer(mode='replay', synthetic=True) as server:
+        yield server
@@ -0,0 +1,84 @@
+"""
+Round trip tests of the memory-mapped station archive.
+
+(C) Eric J. Drewitz 2025-2026
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from xmacis2py.data_access.archive import (
+    open_archive,
+    write_archive
+)
+
+def test_archive_round_trip(workdir, station_df):
+
+    write_archive(station_df, 'KTST')
+    archive = open_archive('KTST')
+
+    assert archive.station == 'KTST'
+    assert archive.length == len(station_df)
+    assert archive.origin == station_df['Date'].min()
+    assert archive.parameters == [c for c in station_df.columns if c != 'Date']
+
+    window = archive.window()
+    pd.testing.assert_frame_equal(window, station_df.reset_index(drop=True), check_freq=False, check_index_type=False)
+
+def test_archive_window_slices_by_date(workdir, station_df):
+
+    write_archive(station_df, 'KTST')
+    archive = open_archive('KTST')
+
+    start = station_df['Date'].iloc[5]
+    end = station_df['Date'].iloc[14]
+    window = archive.window(start_date=start, end_date=end, parameters=['Precipitation'])
+    expected = station_df[(station_df['Date'] >= start) & (station_df['Date'] <= end)]
+
+    assert list(window.columns) == ['Date', 'Precipitation']
+    assert list(window['Date']) == list(expected['Date'])
+    np.testing.assert_array_equal(window['Precipitation'].to_numpy(), expected['Precipitation'].to_numpy())
+
+def test_archive_window_clips_to_the_record(workdir, station_df):
+
+    write_archive(station_df, 'KTST')
+    archive = open_archive('KTST')
+
+    before = archive.window(end_date=archive.origin - pd.Timedelta(days=10))
+    after = archive.window(start_date=archive.end + pd.Timedelta(days=1))
+    wide = archive.window(start_date='1900-01-01', end_date='2100-01-01')
+
+    assert len(before) == 0
+    assert len(after) == 0
+    assert len(wide) == archive.length
+
+def test_archive_stores_missing_days_as_nan(workdir, station_df):
+
+    gaps = station_df.drop(index=[3, 4, 10])
+    write_archive(gaps, 'KTST')
+    archive = open_archive('KTST')
+
+    column = archive.column('Maximum Temperature')
+    assert len(column) == len(station_df)
+    assert np.isnan(column[[3, 4, 10]]).all()
+    np.testing.assert_array_equal(column[gaps.index.to_numpy()], gaps['Maximum Temperature'].to_numpy())
+
+def test_archive_columns_are_read_only(workdir, station_df):
+
+    write_archive(station_df, 'KTST')
+    column = open_archive('KTST').column('Snowfall')
+
+    with pytest.raises(ValueError):
+        column[0] = 1.0
+
+def test_open_archive_without_an_archive(workdir):
+
+    with pytest.raises(FileNotFoundError):
+        open_archive('KNONE')
+
+def test_archive_column_that_is_not_archived(workdir, station_df):
+
+    write_archive(station_df, 'KTST')
+
+    with pytest.raises(KeyError):
+        open_archive('KTST').column('Wind Speed')
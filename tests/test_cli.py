@@ -0,0 +1,89 @@
+"""
+Tests of the xmacis2py render command, run offline against a ReplayServer in synthetic mode.
+
+(C) Eric J. Drewitz 2025-2026
+"""
+import json
+import os
+
+from xmacis2py import cli
+from xmacis2py.utils import metrics
+from xmacis2py.utils import tracing
+
+def _render(server, workdir, *options):
+
+    return cli.main(['render',
+                     '--stations', 'KTST,KABC',
+                     '--products', 'maximum_temperature,precipitation',
+                     '--start', '2025-01-01',
+                     '--end', '2025-01-31',
+                     '--jobs', '1',
+                     '--fetch-jobs', '2',
+                     '--proxy', server.url,
+                     '--output-dir', str(workdir),
+                     '--quiet'] + list(options))
+
+def _manifest(workdir):
+
+    with open(workdir / 'ACIS Graphics' / 'render_manifest.json', 'r') as f:
+        return json.load(f)
+
+def test_render_skips_up_to_date_products(replay_server, workdir, capsys):
+
+    assert _render(replay_server, workdir, '--skip-up-to-date') == 0
+    assert 'Rendered 4, skipped 0 and failed 0 of 4 products for 2 stations' in capsys.readouterr().out
+
+    manifest = _manifest(workdir)
+    assert len(manifest) == 4
+    files = [fname for entry in manifest.values() for fname in entry['files']]
+    assert len(files) >= 4
+    assert all(os.path.exists(fname) and fname.startswith(str(workdir)) for fname in files)
+
+    assert _render(replay_server, workdir, '--skip-up-to-date') == 0
+    assert 'Rendered 0, skipped 4 and failed 0 of 4 products for 2 stations' in capsys.readouterr().out
+
+def test_render_redraws_products_whose_files_are_gone(replay_server, workdir, capsys):
+
+    _render(replay_server, workdir, '--skip-up-to-date')
+    capsys.readouterr()
+
+    removed = [entry['files'][0] for key, entry in _manifest(workdir).items() if key.startswith('KTST | precipitation')]
+    os.remove(removed[0])
+
+    assert _render(replay_server, workdir, '--skip-up-to-date') == 0
+    assert 'Rendered 1, skipped 3 and failed 0 of 4 products' in capsys.readouterr().out
+    assert os.path.exists(removed[0])
+
+def test_render_without_skipping_redraws_everything(replay_server, workdir, capsys):
+
+    _render(replay_server, workdir)
+    _render(replay_server, workdir)
+
+    assert 'Rendered 4, skipped 0 and failed 0 of 4 products' in capsys.readouterr().out.splitlines()[-1]
+
+def test_render_with_the_cache_downloads_once(replay_server, workdir, capsys):
+
+    _render(replay_server, workdir, '--skip-up-to-date', '--cache')
+    requests = replay_server.stats()['requests']
+    _render(replay_server, workdir, '--skip-up-to-date', '--cache')
+
+    assert requests == 2
+    assert replay_server.stats()['requests'] == requests
+    assert 'skipped 4' in capsys.readouterr().out.splitlines()[-1]
+
+def test_render_writes_metrics_and_turns_them_off(replay_server, workdir, tmp_path):
+
+    fname = str(tmp_path / 'render.prom')
+    assert _render(replay_server, workdir, '--metrics', fname) == 0
+
+    assert metrics._exporter == None
+    assert all(isinstance(sink, metrics.MetricsExporter) == False for sink in tracing._sinks)
+    with open(fname, 'r') as f:
+        text = f.read()
+    assert 'xmacis2py_render_duration_seconds_count{product="plot_precipitation_summary"' in text
+    assert 'xmacis2py_fetch_duration_seconds_count 2' in text
+
+def test_render_rejects_a_half_window(workdir, capsys):
+
+    assert cli.main(['render', '--stations', 'KTST', '--start', '2025-01-01']) == 1
+    assert 'Pass both --start and --end' in capsys.readouterr().err
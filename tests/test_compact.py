@@ -0,0 +1,73 @@
+"""
+Round trip tests of the compact in-memory form of the xmACIS2 data.
+
+(C) Eric J. Drewitz 2025-2026
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from xmacis2py.data_access.get_data import get_data
+from xmacis2py.data_access.compact import (
+    compact_dataframe,
+    expand_dataframe,
+    flag_mask
+)
+
+def test_compact_round_trip(station_df):
+
+    compact = compact_dataframe(station_df)
+    expanded = expand_dataframe(compact)
+
+    pd.testing.assert_frame_equal(expanded, station_df, check_dtype=False)
+    assert list(expanded.columns) == list(station_df.columns)
+    assert 'Missing Flags' not in expanded.columns and 'Trace Flags' not in expanded.columns
+
+def test_compact_dtypes(station_df):
+
+    compact = compact_dataframe(station_df)
+
+    assert str(compact['Maximum Temperature'].dtype) == 'Int16'
+    assert compact['Precipitation'].dtype == np.float32
+    assert compact['Missing Flags'].dtype == np.uint16 and compact['Trace Flags'].dtype == np.uint16
+    # The parameters with their flags take well under half the memory of the float64 parameters.
+    parameters = [column for column in station_df.columns if column != 'Date']
+    assert compact.drop(columns=['Date']).memory_usage(index=False).sum() < station_df[parameters].memory_usage(index=False).sum() / 2
+
+def test_missing_and_trace_flags():
+
+    df = pd.DataFrame({'Date':pd.date_range('2025-01-01', periods=5),
+                       'Maximum Temperature':[70.0, np.nan, 72.0, 73.0, np.nan],
+                       'Precipitation':[0.0, 0.001, np.nan, 0.25, 0.001],
+                       'Snowfall':[0.001, 0.0, 0.0, np.nan, 1.5]})
+    compact = compact_dataframe(df)
+
+    # Bit 0 is 'Maximum Temperature', bit 6 is 'Precipitation' and bit 7 is 'Snowfall'.
+    assert list(compact['Missing Flags']) == [0, 1, 1 << 6, 1 << 7, 1]
+    assert list(compact['Trace Flags']) == [1 << 7, 1 << 6, 0, 0, 1 << 6]
+    assert list(compact['Precipitation'].fillna(-1)) == [0.0, 0.0, -1.0, 0.25, 0.0]
+
+    for form in [df, compact]:
+        assert list(flag_mask(form, 'Precipitation', 'T')) == [False, True, False, False, True]
+        assert list(flag_mask(form, 'Maximum Temperature', 'M')) == [False, True, False, False, True]
+    with pytest.raises(ValueError):
+        flag_mask(compact, 'Precipitation', 'X')
+
+    expanded = expand_dataframe(compact)
+    pd.testing.assert_frame_equal(expanded, df, check_dtype=False)
+    assert expanded['Precipitation'].iloc[1] == 0.001
+
+def test_forms_are_left_alone(station_df):
+
+    compact = compact_dataframe(station_df)
+
+    assert compact_dataframe(compact) is compact
+    assert expand_dataframe(station_df) is station_df
+
+def test_get_data_returns_the_compact_form(replay_server):
+
+    df = get_data('KTST', start_date='2025-01-01', end_date='2025-01-31', proxies=replay_server.proxies)
+    compact = get_data('KTST', start_date='2025-01-01', end_date='2025-01-31', proxies=replay_server.proxies, compact=True)
+
+    assert 'Missing Flags' in compact.columns
+    pd.testing.assert_frame_equal(expand_dataframe(compact), df, check_dtype=False)
@@ -0,0 +1,42 @@
+"""
+Tests of the multi-station dashboards.
+
+(C) Eric J. Drewitz 2025-2026
+"""
+import matplotlib
+matplotlib.use('Agg')
+
+import numpy as np
+import pytest
+
+from xmacis2py.data_access.synthetic import synthetic_station
+from xmacis2py.graphics.dashboard import plot_station_dashboard
+from xmacis2py.utils.file_funcs import capture_figures
+
+def _capture(data, parameter, share_y=True):
+
+    figures = []
+    with capture_figures(lambda fig, path, fname: figures.append(fig.axes[0].get_ylim())):
+        plot_station_dashboard(list(data.keys()), parameter=parameter, data=data, share_y=share_y)
+
+    return figures
+
+@pytest.mark.parametrize('parameter', ['Maximum Temperature', 'Precipitation'])
+def test_shared_y_with_every_value_missing(workdir, parameter):
+
+    data = {}
+    for station in ['KAAA', 'KBBB']:
+        df = synthetic_station(station, days=10)
+        df[parameter] = np.nan
+        data[station] = df
+
+    assert len(_capture(data, parameter)) == 1
+
+def test_shared_y_covers_every_station(workdir):
+
+    data = {station:synthetic_station(station, days=10) for station in ['KAAA', 'KBBB']}
+    data['KBBB']['Maximum Temperature'] = np.nan
+
+    low, high = _capture(data, 'Maximum Temperature')[0]
+    values = data['KAAA']['Maximum Temperature'].astype(float)
+    assert low <= values.min() and high >= values.max()
@@ -0,0 +1,51 @@
+import pytest
+
+import xmacis2py.analysis_tools.degree_days as degree_days
+import xmacis2py.graphics.temperature as temperature
+
+from xmacis2py.utils.file_funcs import capture_figures
+
+def _figure_texts(plot, *args, **kwargs):
+
+    texts = []
+
+    def sink(fig, path, fname):
+        texts.extend([text.get_text() for text in fig.texts])
+
+    with capture_figures(sink):
+        plot(*args, **kwargs)
+
+    return texts
+
+def test_is_degree_day_column():
+
+    assert degree_days.is_degree_day_column('Heating Degree Days') == True
+    assert degree_days.is_degree_day_column('Growing Degree Days Base 50 Cap 86', kind='growing') == True
+    assert degree_days.is_degree_day_column('Cooling Degree Days Base 70', kind='heating') == False
+    assert degree_days.is_degree_day_column('Maximum Temperature') == False
+
+@pytest.mark.parametrize('plot, parameter', [
+    (temperature.plot_heating_degree_day_summary, 'Maximum Temperature'),
+    (temperature.plot_cooling_degree_day_summary, 'Heating Degree Days'),
+    (temperature.plot_growing_degree_day_summary, 'Growing Degree Days Base fifty'),
+])
+def test_degree_day_summary_rejects_other_columns(workdir, station_df, plot, parameter):
+
+    with pytest.raises(ValueError):
+        plot('KTST', df=station_df, parameter=parameter)
+
+def test_degree_day_stats_table_keeps_default_title(workdir, station_df):
+
+    texts = _figure_texts(temperature.plot_heating_degree_day_summary, 'KTST', df=station_df, notifications='off')
+
+    assert any([text.startswith('KTST Heating Degree Day Summary   ') for text in texts])
+
+def test_degree_day_summary_recomputed_column(workdir, station_df):
+
+    texts = _figure_texts(temperature.plot_growing_degree_day_summary,
+                          'KTST',
+                          df=station_df,
+                          parameter='Growing Degree Days Base 50 Cap 86',
+                          notifications='off')
+
+    assert any([text.startswith('KTST Growing Degree Day Base 50 Cap 86 Summary   ') for text in texts])
@@ -0,0 +1,141 @@
+"""
+Tests of the Prometheus metrics exporter.
+
+(C) Eric J. Drewitz 2025-2026
+"""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import xmacis2py.graphics.temperature as temperature
+from xmacis2py.utils import metrics
+from xmacis2py.utils import tracing
+from xmacis2py.utils.file_funcs import capture_figures
+
+@pytest.fixture
+def metrics_file(tmp_path):
+
+    fname = str(tmp_path / 'xmacis2py.prom')
+    yield fname
+    metrics.disable_metrics()
+
+def _samples(fname, prefix):
+
+    with open(fname, 'r') as f:
+        return [line for line in f.read().splitlines() if line.startswith(prefix)]
+
+def test_render_duration_is_labelled_by_product_type(workdir, station_df, metrics_file):
+
+    metrics.enable_metrics(metrics_file, reset=True)
+    with capture_figures(lambda fig, path, fname: None):
+        temperature.plot_maximum_temperature_summary('KTST', df=station_df, notifications='off')
+        temperature.plot_maximum_temperature_summary('KTST', df=station_df, product_type='Custom Summary', notifications='off')
+    metrics.write_metrics()
+
+    counts = _samples(metrics_file, 'xmacis2py_render_duration_seconds_count')
+    assert sorted(counts) == [
+        'xmacis2py_render_duration_seconds_count{product="plot_maximum_temperature_summary",product_type="Custom Summary"} 1',
+        'xmacis2py_render_duration_seconds_count{product="plot_maximum_temperature_summary",product_type="Maximum Temperature 30 Day Summary"} 1'
+    ]
+    assert _samples(metrics_file, 'xmacis2py_failures_total') == []
+
+def _exited_pid():
+
+    process = subprocess.Popen([sys.executable, '-c', 'pass'])
+    process.wait()
+
+    return process.pid
+
+def _write_state(fname, rows):
+
+    state = {
+        'counters':{metrics._key('xmacis2py_rows_processed_total', {'stage':'fetch'}):rows},
+        'histograms':{},
+        'updated':1.0
+    }
+    with open(fname, 'w') as f:
+        json.dump(state, f)
+
+def _fetch_rows(fname):
+
+    return _samples(fname, 'xmacis2py_rows_processed_total{stage="fetch"}')
+
+def test_state_files_are_keyed_by_process_and_token(metrics_file):
+
+    exporter = metrics.enable_metrics(metrics_file, reset=True)
+    exporter.write()
+
+    names = os.listdir(f"{metrics_file}.d")
+    assert len(names) == 1
+    pid, token = names[0][:-len('.json')].split('-')
+    assert int(pid) == os.getpid()
+    assert len(token) == 12
+
+def test_reused_process_id_does_not_overwrite_totals(metrics_file):
+
+    exporter = metrics.enable_metrics(metrics_file, reset=True)
+    # An earlier process that had the same process ID.
+    _write_state(f"{metrics_file}.d/{os.getpid()}-000000000000.json", 7)
+    _write_state(f"{metrics_file}.d/{os.getpid()}.json", 3)
+
+    exporter.write()
+
+    assert _fetch_rows(metrics_file) == ['xmacis2py_rows_processed_total{stage="fetch"} 10']
+
+@pytest.mark.skipif(os.name != 'posix', reason='exited processes are only pruned on POSIX systems')
+def test_exited_processes_are_merged_into_the_baseline(metrics_file):
+
+    exporter = metrics.enable_metrics(metrics_file, reset=True)
+    first, second = _exited_pid(), _exited_pid()
+    _write_state(f"{metrics_file}.d/{first}-aaaaaaaaaaaa.json", 5)
+    _write_state(f"{metrics_file}.d/{second}-bbbbbbbbbbbb.json", 6)
+
+    exporter.write()
+
+    assert sorted(os.listdir(f"{metrics_file}.d")) == sorted(['baseline.json', os.path.basename(exporter._state_file())])
+    assert _fetch_rows(metrics_file) == ['xmacis2py_rows_processed_total{stage="fetch"} 11']
+
+    # A later worker that exits is added to the baseline, and the totals never go backwards.
+    _write_state(f"{metrics_file}.d/{_exited_pid()}-cccccccccccc.json", 4)
+    exporter.write()
+    exporter.write()
+
+    assert _fetch_rows(metrics_file) == ['xmacis2py_rows_processed_total{stage="fetch"} 15']
+    assert len(os.listdir(f"{metrics_file}.d")) == 2
+
+def test_merged_state_files_are_not_counted_twice(metrics_file):
+
+    exporter = metrics.enable_metrics(metrics_file, reset=True)
+    # A state file that was merged into the baseline but not removed yet.
+    _write_state(f"{metrics_file}.d/99999999-dddddddddddd.json", 5)
+    with open(f"{metrics_file}.d/99999999-dddddddddddd.json", 'r') as f:
+        state = json.load(f)
+    with open(f"{metrics_file}.d/baseline.json", 'w') as f:
+        json.dump({'state':state, 'merged':['99999999-dddddddddddd.json']}, f)
+
+    exporter.write()
+
+    assert _fetch_rows(metrics_file) == ['xmacis2py_rows_processed_total{stage="fetch"} 5']
+
+def test_stale_prune_lock_is_cleared(metrics_file):
+
+    exporter = metrics.enable_metrics(metrics_file, reset=True)
+    lock = f"{metrics_file}.d/prune.lock"
+    open(lock, 'w').close()
+    os.utime(lock, (0, 0))
+
+    exporter.write()
+
+    assert os.path.exists(lock) == False
+
+def test_disable_metrics_removes_the_exporter(metrics_file):
+
+    exporter = metrics.enable_metrics(metrics_file, reset=True)
+    metrics.disable_metrics()
+
+    assert metrics._exporter == None
+    assert exporter not in tracing._sinks
+    assert os.path.exists(metrics_file)
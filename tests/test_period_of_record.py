@@ -0,0 +1,95 @@
+"""
+Tests of the resumable chunked period of record downloader.
+
+(C) Eric J. Drewitz 2025-2026
+"""
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from xmacis2py.data_access import period_of_record
+
+class _Server:
+
+    """
+    A stand-in for get_data that records the chunks it was asked for, fails the chunks in fail and leaves out the dates in drop.
+    """
+
+    def __init__(self, fail=(), drop=()):
+
+        self.calls = []
+        self.fail = list(fail)
+        self.drop = pd.DatetimeIndex(drop)
+
+    def __call__(self, station, start_date=None, end_date=None, proxies=None, notifications='off'):
+
+        self.calls.append((start_date, end_date))
+        if start_date in self.fail:
+            raise ConnectionError(f"The chunk starting {start_date} failed.")
+
+        dates = pd.date_range(start_date, end_date, freq='D').difference(self.drop)
+
+        return pd.DataFrame({'Date':dates, 'Maximum Temperature':np.arange(len(dates), dtype=float)})
+
+def _get(station='KTST', **kwargs):
+
+    return period_of_record.get_period_of_record(station, '1995-06-01', '2012-03-31', backoff=0, notifications='off', **kwargs)
+
+def test_chunks_are_aligned_to_decades(workdir, monkeypatch):
+
+    server = _Server()
+    monkeypatch.setattr(period_of_record, '_get_data', server)
+
+    df = _get()
+
+    assert sorted(server.calls) == [('1995-06-01', '1999-12-31'), ('2000-01-01', '2009-12-31'), ('2010-01-01', '2012-03-31')]
+    assert list(df['Date']) == list(pd.date_range('1995-06-01', '2012-03-31'))
+    assert df['Maximum Temperature'].isna().sum() == 0
+    assert len(os.listdir(os.path.join(workdir, 'ACIS Data', 'KTST', 'Chunks'))) == 3
+
+def test_interrupted_download_resumes_from_the_checkpoints(workdir, monkeypatch):
+
+    server = _Server(fail=['2000-01-01'])
+    monkeypatch.setattr(period_of_record, '_get_data', server)
+
+    with pytest.raises(RuntimeError, match='1 chunks failed'):
+        _get(retries=1)
+    # The failed chunk was tried twice and the other chunks were saved.
+    assert server.calls.count(('2000-01-01', '2009-12-31')) == 2
+    assert len(os.listdir(os.path.join(workdir, 'ACIS Data', 'KTST', 'Chunks'))) == 2
+
+    server = _Server()
+    monkeypatch.setattr(period_of_record, '_get_data', server)
+    df = _get()
+
+    assert server.calls == [('2000-01-01', '2009-12-31')]
+    assert len(df) == len(pd.date_range('1995-06-01', '2012-03-31'))
+
+def test_gaps_become_missing_days_unless_strict(workdir, monkeypatch):
+
+    server = _Server(drop=['2001-02-03', '2011-07-04'])
+    monkeypatch.setattr(period_of_record, '_get_data', server)
+
+    df = _get()
+
+    assert list(df['Date']) == list(pd.date_range('1995-06-01', '2012-03-31'))
+    missing = df.loc[df['Maximum Temperature'].isna(), 'Date']
+    assert list(missing) == [pd.Timestamp('2001-02-03'), pd.Timestamp('2011-07-04')]
+
+    # The saved chunks still have the gaps, so the strict check fails without downloading them again.
+    with pytest.raises(ValueError, match='2 dates are missing'):
+        _get(strict=True)
+    assert len(server.calls) == 3
+
+def test_chunk_with_dates_outside_it_is_not_saved(workdir, monkeypatch):
+
+    def get_data(station, start_date=None, end_date=None, proxies=None, notifications='off'):
+        return pd.DataFrame({'Date':pd.date_range('1990-01-01', periods=3), 'Maximum Temperature':[1.0, 2.0, 3.0]})
+
+    monkeypatch.setattr(period_of_record, '_get_data', get_data)
+
+    with pytest.raises(RuntimeError, match='dates outside the chunk'):
+        _get(retries=0)
+    assert os.listdir(os.path.join(workdir, 'ACIS Data', 'KTST', 'Chunks')) == []
@@ -0,0 +1,81 @@
+"""
+Tests of the pipeline scheduler.
+
+(C) Eric J. Drewitz 2025-2026
+"""
+import multiprocessing
+import os
+
+import pytest
+
+from xmacis2py.graphics import precipitation
+from xmacis2py.utils.pipeline import (
+    Pipeline,
+    Stage,
+    station_pipeline
+)
+
+def _square(value):
+
+    if value == 3:
+        raise ValueError('three')
+
+    return value * value
+
+def _parent_id(value):
+
+    return os.getppid()
+
+def test_pipeline_runs_process_stages_next_to_threads():
+
+    pipeline = Pipeline([Stage('double', lambda value: [value, value + 10], workers=2, expand=True),
+                         Stage('square', _square, workers=2, processes=True)])
+    results = list(pipeline.run(range(5)))
+
+    values = sorted([result['value'] for result in results if result['error'] == None])
+    errors = [result for result in results if result['error'] != None]
+    assert values == sorted([v * v for v in [0, 1, 2, 4, 10, 11, 12, 13, 14]])
+    assert len(errors) == 1
+    assert errors[0]['item'] == 3 and errors[0]['stage'] == 'square' and 'three' in errors[0]['error']
+    assert pipeline.stats()['square']['items'] == 10
+
+def test_pipeline_raises_the_error_of_the_items():
+
+    def items():
+        yield 1
+        yield 2
+        raise OSError('the stations file went away')
+
+    pipeline = Pipeline([Stage('square', _square, workers=2)])
+    results = []
+    with pytest.raises(OSError, match='went away'):
+        for result in pipeline.run(items()):
+            results.append(result)
+
+    assert sorted([result['value'] for result in results]) == [1, 4]
+
+@pytest.mark.skipif('forkserver' not in multiprocessing.get_all_start_methods(), reason='needs the forkserver start method')
+def test_process_stage_workers_are_not_forked():
+
+    # A forked worker is a child of this process, while a worker of the fork server is a child of the fork server.
+    pipeline = Pipeline([Stage('fetch', lambda value: value, workers=2),
+                         Stage('parent', _parent_id, workers=1, processes=True)])
+    results = list(pipeline.run([1, 2]))
+
+    assert [result['error'] for result in results] == [None, None]
+    assert all(result['value'] != os.getpid() for result in results)
+
+def test_station_pipeline_renders_into_the_output_folder(replay_server, workdir):
+
+    pipeline = station_pipeline([precipitation.plot_precipitation_summary],
+                                fetch_workers=2,
+                                render_workers=1,
+                                analyze=lambda station, df: len(df),
+                                data_kwargs={'start_date':'2025-01-01', 'end_date':'2025-01-31', 'proxies':replay_server.proxies})
+    results = list(pipeline.run(['KTST', 'KABC']))
+
+    assert [result['error'] for result in results] == [None, None]
+    assert sorted([result['value']['station'] for result in results]) == ['KABC', 'KTST']
+    assert all(result['value']['analysis'] == 31 for result in results)
+    for station in ['KTST', 'KABC']:
+        assert os.path.isdir(workdir / 'ACIS Graphics' / station)
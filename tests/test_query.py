@@ -0,0 +1,79 @@
+"""
+Tests of the deferred query API against the single-function analysis tools.
+
+(C) Eric J. Drewitz 2025-2026
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+import xmacis2py.analysis_tools.analysis as analysis
+
+from xmacis2py.data_access.synthetic import synthetic_station
+
+_df = synthetic_station('KTST', days=365)
+
+_moments = {
+    'mean':analysis.period_mean,
+    'std':analysis.period_standard_deviation,
+    'var':analysis.period_variance,
+    'skew':analysis.period_skewness,
+    'kurt':analysis.period_kurtosis,
+    'max':analysis.period_maximum,
+    'min':analysis.period_minimum,
+    'sum':analysis.period_sum,
+    'median':analysis.period_median
+}
+
+@pytest.mark.parametrize('parameter', ['Maximum Temperature', 'Precipitation'])
+def test_query_matches_the_analysis_tools(parameter):
+
+    query = analysis.query(_df).param(parameter)
+    for name in _moments.keys():
+        getattr(query, name)()
+    results = query.missing().percentile([0.1, 0.9]).mode().collect()[parameter]
+
+    for name, function in _moments.items():
+        assert results[name] == pytest.approx(function(_df, parameter), nan_ok=True), name
+    assert results['missing'] == analysis.number_of_missing_days(_df, parameter)
+    for p in [0.1, 0.9]:
+        assert results[f"percentile_{p}"] == pytest.approx(analysis.period_percentile(_df, parameter, percentile=p))
+
+    mode = analysis.period_mode(_df, parameter)
+    assert np.array_equal(np.atleast_1d(results['mode']), np.atleast_1d(mode))
+
+def test_query_counts_match_the_analysis_tools():
+
+    results = (analysis.query(_df)
+               .param('Precipitation').count_above('T').count_at_or_above(0.5).count_at(0)
+               .param('Maximum Temperature').count_below(60).count_at_or_below(60)
+               .collect())
+
+    assert results['Precipitation']['count_above_T'] == analysis.number_of_days_above_value(_df, 'Precipitation', 'T')
+    assert results['Precipitation']['count_at_or_above_0.5'] == analysis.number_of_days_at_or_above_value(_df, 'Precipitation', 0.5)
+    assert results['Precipitation']['count_at_0'] == analysis.number_of_days_at_value(_df, 'Precipitation', 0)
+    assert results['Maximum Temperature']['count_below_60'] == analysis.number_of_days_below_value(_df, 'Maximum Temperature', 60)
+    assert results['Maximum Temperature']['count_at_or_below_60'] == analysis.number_of_days_at_or_below_value(_df, 'Maximum Temperature', 60)
+
+@pytest.mark.parametrize('ascending', [False, True])
+def test_query_rankings_match_period_rankings(ascending):
+
+    results = (analysis.query(_df)
+               .param('Maximum Temperature')
+               .rank(first=5, ascending=ascending)
+               .rank(between=[3, 8], ascending=ascending, name='between')
+               .collect())['Maximum Temperature']
+
+    first = analysis.period_rankings(_df, 'Maximum Temperature', ascending=ascending, rank_subset='first', first=5)
+    between = analysis.period_rankings(_df, 'Maximum Temperature', ascending=ascending, rank_subset='between', between=[3, 8])
+    name = 'rank_first_5_ascending' if ascending == True else 'rank_first_5'
+    for ranked, reference in [(results[name], first), (results['between'], between)]:
+        assert list(pd.to_datetime(ranked['Date'])) == list(pd.to_datetime(reference['Date']))
+        assert list(ranked['Maximum Temperature']) == list(reference['Maximum Temperature'].astype(float))
+
+def test_query_needs_a_parameter():
+
+    with pytest.raises(ValueError):
+        analysis.query(_df).mean()
+    with pytest.raises(KeyError):
+        analysis.query(_df).param('Wind Speed')
@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import xmacis2py.analysis_tools.analysis as analysis
+
+from xmacis2py.data_access.synthetic import synthetic_station
+
+def _tied_df():
+
+    dates = pd.date_range('2025-07-01', periods=12)
+    values = [90, 95, 95, np.nan, 88, 95, 90, 88, 101, 90, np.nan, 88]
+
+    return pd.DataFrame({'Date':dates, 'Maximum Temperature':values})
+
+def _reference(df, parameter, ascending):
+
+    # The ranking of the original period_rankings: a Pandas sort that keeps tied values in date order.
+    ranked = df.sort_values([parameter], ascending=ascending, kind='stable')
+
+    return ranked[ranked[parameter].notna()]
+
+@pytest.mark.parametrize('ascending', [False, True])
+@pytest.mark.parametrize('df', [_tied_df(), synthetic_station('KTST', days=365)])
+def test_rankings_keep_ties_in_date_order(df, ascending):
+
+    parameter = 'Maximum Temperature'
+    reference = _reference(df, parameter, ascending)
+
+    ranked = analysis.period_rankings(df, parameter, ascending=ascending)
+    assert list(ranked['Date']) == list(pd.to_datetime(reference['Date']))
+    assert list(ranked[parameter]) == list(reference[parameter])
+
+    top = analysis.period_rankings(df, parameter, ascending=ascending, rank_subset='first', first=5)
+    assert list(top['Date']) == list(pd.to_datetime(reference['Date'].iloc[:5]))
+
+    middle = analysis.period_rankings(df, parameter, ascending=ascending, rank_subset='between', between=[2, 7])
+    assert list(middle['Date']) == list(pd.to_datetime(reference['Date'].iloc[2:7]))
+
+    bottom = analysis.period_rankings(df, parameter, ascending=ascending, rank_subset='last', last=5)
+    assert list(bottom['Date']) == list(pd.to_datetime(reference['Date'].iloc[::-1].iloc[:5]))
+
+def test_top_ties_are_listed_earliest_first():
+
+    top = analysis.period_rankings(_tied_df(), 'Maximum Temperature', rank_subset='first', first=4)
+
+    assert list(top['Maximum Temperature']) == [101, 95, 95, 95]
+    assert list(top['Date'].dt.day) == [9, 2, 3, 6]
+
+def test_clear_drops_the_shared_sorts(station_df):
+
+    from xmacis2py.analysis_tools import order_statistics
+
+    first = order_statistics.sorted_column(station_df, 'Maximum Temperature')
+    assert order_statistics.sorted_column(station_df, 'Maximum Temperature') is first
+
+    order_statistics.clear()
+
+    again = order_statistics.sorted_column(station_df, 'Maximum Temperature')
+    assert again is not first
+    np.testing.assert_array_equal(again.order, first.order)
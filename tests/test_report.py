@@ -0,0 +1,59 @@
+"""
+Tests of the multi-page PDF report builder, run offline on synthetic data.
+
+(C) Eric J. Drewitz 2025-2026
+"""
+import os
+import re
+
+import pytest
+
+from xmacis2py.data_access.synthetic import synthetic_station
+from xmacis2py.graphics import precipitation
+from xmacis2py.graphics.report import build_report
+
+_products = ['maximum_temperature', 'precipitation']
+
+@pytest.fixture
+def data():
+
+    return {station:synthetic_station(station, days=20) for station in ['KAAA', 'KBBB']}
+
+def _pdf_pages(fname):
+
+    with open(fname, 'rb') as f:
+        return len(re.findall(rb'/Type\s*/Page\b', f.read()))
+
+def _png_files(folder):
+
+    return [fname for root, dirs, files in os.walk(folder) for fname in files if fname.endswith('.png')]
+
+def test_report_pages(workdir, data):
+
+    report = build_report(None, products=_products, data=data, title='Test Report')
+
+    # The cover page, one dashboard per product and the graphic and stats table of each product of each station.
+    assert report['pages'] == 1 + len(_products) + len(data) * len(_products) * 2
+    assert _pdf_pages(report['file']) == report['pages']
+    assert report['failures'] == []
+    assert os.path.basename(report['file']) == 'Test Report.pdf'
+
+def test_report_writes_no_png_files(workdir, data):
+
+    build_report(None, products=_products, data=data)
+
+    assert _png_files(workdir) == []
+    assert os.path.exists(os.path.join(workdir, 'ACIS Graphics')) == False
+
+def test_failed_product_is_on_the_failures_page(workdir, data, monkeypatch):
+
+    def plot_precipitation_summary(*args, **kwargs):
+        raise ValueError('no precipitation')
+
+    monkeypatch.setattr(precipitation, 'plot_precipitation_summary', plot_precipitation_summary)
+    report = build_report(None, products=_products, data=data, dashboards=False, create_ranking_table=False)
+
+    assert report['failures'] == [(station, 'precipitation', 'ValueError: no precipitation') for station in data]
+    # The cover page, the maximum temperature graphic of each station and the failures page.
+    assert report['pages'] == 1 + len(data) + 1
+    assert _pdf_pages(report['file']) == report['pages']
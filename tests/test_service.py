@@ -0,0 +1,183 @@
+"""
+Tests of the endpoints of the headless render service, run offline against a ReplayServer in synthetic mode.
+
+(C) Eric J. Drewitz 2025-2026
+"""
+import io
+import json
+import urllib.error
+import urllib.request
+import zipfile
+
+import pytest
+
+from xmacis2py import service as render_service
+from xmacis2py.data_access.replay import ReplayServer
+
+_png = b'\x89PNG\r\n\x1a\n'
+
+@pytest.fixture(scope='module')
+def replay(tmp_path_factory):
+
+    with ReplayServer(mode='replay', synthetic=True, path=str(tmp_path_factory.mktemp('fixtures'))) as server:
+        yield server
+
+@pytest.fixture(scope='module')
+def service(replay):
+
+    with render_service.RenderService(port=0, workers=1, warm=False, proxies=replay.proxies, timeout=60) as service:
+        yield service
+
+def _get(service, path):
+
+    try:
+        with urllib.request.urlopen(f"{service.url}{path}", timeout=120) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, e.read()
+
+def _post(service, path, body):
+
+    request = urllib.request.Request(f"{service.url}{path}", data=body, method='POST', headers={'Content-Type':'application/json'})
+    try:
+        with urllib.request.urlopen(request, timeout=120) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, e.read()
+
+def test_health_and_products(service):
+
+    status, headers, body = _get(service, '/health')
+    assert status == 200
+    assert json.loads(body) == {'status':'ok', 'workers':1}
+
+    status, headers, body = _get(service, '/products')
+    assert status == 200
+    assert 'maximum_temperature' in json.loads(body) and 'precipitation' in json.loads(body)
+
+def test_render_returns_the_png(service):
+
+    status, headers, body = _get(service, '/render?station=ktst&product=precipitation&start=2025-01-01&end=2025-01-31')
+
+    assert status == 200
+    assert headers['Content-Type'] == 'image/png'
+    assert body.startswith(_png)
+    assert 'KTST' in headers['Content-Disposition']
+
+def test_render_returns_every_image_as_a_zip(service):
+
+    status, headers, body = _get(service, '/render?station=KTST&product=maximum_temperature&days=20&image=zip&plot_type=line')
+
+    assert status == 200
+    assert headers['Content-Type'] == 'application/zip'
+    with zipfile.ZipFile(io.BytesIO(body)) as archive:
+        names = archive.namelist()
+        assert len(names) == 2
+        assert all(archive.read(name).startswith(_png) for name in names)
+
+def test_render_with_a_json_body(service):
+
+    status, headers, body = _post(service, '/render', json.dumps({'station':'KTST',
+                                                                  'product':'maximum_temperature',
+                                                                  'days':20,
+                                                                  'image':1}).encode())
+
+    assert status == 200
+    assert body.startswith(_png)
+
+@pytest.mark.parametrize('path, message', [
+    ('/render?product=precipitation', 'station is required'),
+    ('/render?station=KTST&product=wind', 'Unknown product wind'),
+    ('/render?station=KTST&product=precipitation&start=2025-01-01', 'Pass both start and end'),
+    ('/render?station=KTST&product=precipitation&days=0', 'days must be a positive whole number'),
+    ('/render?station=KTST&product=precipitation&image=last', "image must be a number or 'zip'"),
+    ('/render?station=KTST&product=precipitation&color=red', 'Unknown option color'),
+    ('/render?station=KTST&product=precipitation&days=10&image=5', 'The product has'),
+])
+def test_bad_requests(service, path, message):
+
+    status, headers, body = _get(service, path)
+
+    assert status == 400
+    assert message in json.loads(body)['error']
+
+def test_bad_json_body_and_unknown_endpoint(service):
+
+    status, headers, body = _post(service, '/render', b'[1, 2]')
+    assert status == 400
+    assert 'Bad JSON body' in json.loads(body)['error']
+
+    status, headers, body = _get(service, '/graphics')
+    assert status == 404
+
+def test_dead_worker_restarts_the_pool(service):
+
+    restarts = service.stats()['restarts']
+    for process in list(service._executor._processes.values()):
+        process.kill()
+        process.join()
+
+    status, headers, body = _get(service, '/render?station=KTST&product=precipitation&days=10')
+    assert status == 500
+    assert 'The worker pool was restarted' in json.loads(body)['error']
+
+    status, headers, body = _get(service, '/render?station=KTST&product=precipitation&days=10')
+    assert status == 200
+    assert service.stats()['restarts'] == restarts + 1
+
+def test_timed_out_request_restarts_the_pool(workdir):
+
+    with ReplayServer(mode='replay', synthetic=True, latency=5) as replay:
+        with render_service.RenderService(port=0, workers=1, warm=False, proxies=replay.proxies, timeout=1) as service:
+            status, headers, body = _get(service, '/render?station=KTST&product=precipitation&days=10')
+            assert status == 504
+
+            # The stuck worker was killed, so the next request does not wait behind it.
+            replay.latency = 0
+            service.timeout = 60
+            status, headers, body = _get(service, '/render?station=KTST&product=precipitation&days=10')
+            assert status == 200
+            assert body.startswith(_png)
+
+            stats = service.stats()
+            assert stats['timed_out'] == 1 and stats['restarts'] == 1 and stats['rendered'] == 1
+
+def test_queued_requests_do_not_time_out(workdir):
+
+    import concurrent.futures
+
+    with ReplayServer(mode='replay', synthetic=True, latency=1.5) as replay:
+        with render_service.RenderService(port=0, workers=1, proxies=replay.proxies, timeout=3) as service:
+            paths = [f"/render?station={station}&product=precipitation&days=10" for station in ['KAAA', 'KBBB', 'KCCC']]
+            with concurrent.futures.ThreadPoolExecutor(len(paths)) as pool:
+                responses = list(pool.map(lambda path: _get(service, path), paths))
+
+            statuses = [status for status, headers, body in responses]
+            # The requests waiting behind a busy worker are answered with 503 and the healthy worker is kept.
+            assert 200 in statuses and set(statuses) <= {200, 503}
+            for status, headers, body in responses:
+                if status == 503:
+                    assert headers['Retry-After'] == '1'
+            assert service.stats()['timed_out'] == 0 and service.stats()['restarts'] == 0
+
+def test_failed_graphic_keeps_the_pool(monkeypatch):
+
+    import concurrent.futures
+    import threading
+
+    def _render(request):
+        raise RecursionError('maximum recursion depth exceeded')
+
+    monkeypatch.setattr(render_service, '_render', _render)
+    service = render_service.RenderService(workers=1)
+    service._executor = concurrent.futures.ThreadPoolExecutor(1)
+    service._slots = threading.BoundedSemaphore(1)
+    try:
+        status, payload, content_type, headers = service._answer({'station':'KTST', 'product':'precipitation', 'image':'0'})
+    finally:
+        service._executor.shutdown()
+
+    assert status == 500
+    error = json.loads(payload)['error']
+    assert 'RecursionError' in error and 'restarted' not in error
+    assert service.stats()['restarts'] == 0 and service.stats()['failed'] == 1
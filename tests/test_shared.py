@@ -0,0 +1,105 @@
+"""
+Round trip tests of the shared memory handoff to process pool workers.
+
+(C) Eric J. Drewitz 2025-2026
+"""
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from xmacis2py.data_access import shared
+
+def _column_sum(spec, column):
+
+    df = shared.attach_dataframe(spec)
+    total = float(np.nansum(df[column].to_numpy()))
+    shared.detach_all()
+
+    return total, len(df), str(df['Date'].dtype)
+
+def test_shared_round_trip(station_df):
+
+    with shared.share_dataframe(station_df) as block:
+        df = shared.attach_dataframe(block.spec)
+        pd.testing.assert_frame_equal(df, station_df.reset_index(drop=True), check_index_type=False)
+        del df
+        shared.detach_dataframe(block.spec)
+
+def test_shared_columns_are_read_only_views(station_df):
+
+    with shared.share_dataframe(station_df, columns=['Date', 'Precipitation']) as block:
+        df = shared.attach_dataframe(block.spec, columns=['Precipitation'])
+
+        assert list(df.columns) == ['Precipitation']
+        with pytest.raises(ValueError):
+            df['Precipitation'].to_numpy()[0] = 1.0
+        del df
+        shared.detach_all()
+
+def test_shared_nullable_columns_become_float(station_df):
+
+    df = station_df[['Date']].copy()
+    df['Count'] = pd.array([1, None] * (len(df) // 2), dtype='Int64')
+
+    with shared.share_dataframe(df) as block:
+        attached = shared.attach_dataframe(block.spec)
+
+        assert attached['Count'].dtype == np.float64
+        assert np.isnan(attached['Count'].iloc[1])
+        assert attached['Count'].iloc[0] == 1.0
+        del attached
+        shared.detach_all()
+
+def test_shared_block_reaches_worker_processes(station_df):
+
+    context = multiprocessing.get_context('spawn')
+    with shared.share_dataframe(station_df) as block:
+        with ProcessPoolExecutor(max_workers=2, mp_context=context) as pool:
+            results = list(pool.map(_column_sum, [block.spec] * 4, ['Maximum Temperature'] * 4))
+
+    expected = float(np.nansum(station_df['Maximum Temperature'].to_numpy()))
+    for total, length, dtype in results:
+        assert total == expected
+        assert length == len(station_df)
+        assert dtype == str(station_df['Date'].dtype)
+
+def test_closed_block_cannot_be_attached(station_df):
+
+    block = shared.share_dataframe(station_df)
+    spec = block.spec
+    block.close()
+    block.close()
+
+    with pytest.raises(FileNotFoundError):
+        shared.attach_dataframe(spec)
+
+def test_attach_in_another_process_does_not_unlink_the_block(station_df):
+
+    script = ("import sys, json\n"
+              "from xmacis2py.data_access import shared\n"
+              "df = shared.attach_dataframe(json.loads(sys.argv[1]))\n"
+              "print(len(df))\n"
+              "del df\n"
+              "shared.detach_all()\n")
+    source = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+    env = dict(os.environ, PYTHONPATH=source)
+
+    with shared.share_dataframe(station_df) as block:
+        spec = json.dumps(block.spec)
+        result = subprocess.run([sys.executable, '-c', script, spec], capture_output=True, text=True, env=env, timeout=120)
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == str(len(station_df))
+        # The other process exited without unlinking the block, so the owner can still attach it.
+        assert 'leaked shared_memory' not in result.stderr
+        df = shared.attach_dataframe(block.spec)
+        assert len(df) == len(station_df)
+        del df
+        shared.detach_all()
@@ -0,0 +1,126 @@
+"""
+Tests of the request coalescing (single-flight) of get_data and get_data_async.
+
+(C) Eric J. Drewitz 2025-2026
+"""
+import asyncio
+import importlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from xmacis2py.data_access import single_flight
+
+# xmacis2py.data_access re-exports the get_data function under the name of its module.
+gd = importlib.import_module('xmacis2py.data_access.get_data')
+
+@pytest.fixture(autouse=True)
+def _reset_async_limit():
+
+    yield
+    gd.set_async_concurrency_limit(8)
+
+def _fetch(server, station='KTST', start_date='2025-01-01', end_date='2025-01-31'):
+
+    return gd.get_data(station, start_date=start_date, end_date=end_date, proxies=server.proxies, notifications='off')
+
+def test_concurrent_requests_share_one_fetch(replay_server):
+
+    replay_server.latency = 0.5
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        frames = list(pool.map(lambda i: _fetch(replay_server), range(8)))
+
+    assert replay_server.stats()['requests'] == 1
+    assert single_flight.in_flight() == 0
+    for df in frames[1:]:
+        pd.testing.assert_frame_equal(df, frames[0])
+    assert len({id(df) for df in frames}) == len(frames)
+
+def test_window_inside_a_flight_joins_it(replay_server):
+
+    replay_server.latency = 0.5
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        wide = pool.submit(_fetch, replay_server)
+        time.sleep(0.1)
+        narrow = pool.submit(_fetch, replay_server, start_date='2025-01-10', end_date='2025-01-12')
+        wide, narrow = wide.result(), narrow.result()
+
+    assert replay_server.stats()['requests'] == 1
+    assert list(narrow['Date']) == list(pd.date_range('2025-01-10', '2025-01-12'))
+    pd.testing.assert_frame_equal(narrow, wide[(wide['Date'] >= '2025-01-10') & (wide['Date'] <= '2025-01-12')].reset_index(drop=True))
+
+def test_other_stations_do_not_coalesce(replay_server):
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        list(pool.map(lambda station: _fetch(replay_server, station=station), ['KAAA', 'KBBB', 'KCCC']))
+
+    assert replay_server.stats()['requests'] == 3
+
+def test_async_requests_share_one_fetch(replay_server):
+
+    replay_server.latency = 0.3
+
+    async def main():
+        return await asyncio.gather(*[gd.get_data_async('KTST',
+                                                        start_date='2025-01-01',
+                                                        end_date='2025-01-31',
+                                                        proxies=replay_server.proxies,
+                                                        notifications='off') for i in range(5)])
+
+    frames = asyncio.run(main())
+
+    assert replay_server.stats()['requests'] == 1
+    assert all(len(df) == 31 for df in frames)
+
+def test_cancelled_flight_waiting_for_its_turn_is_settled(replay_server):
+
+    replay_server.latency = 0.5
+    gd.set_async_concurrency_limit(1)
+
+    async def main():
+        holder = asyncio.ensure_future(gd.get_data_async('KAAA', start_date='2025-01-01', end_date='2025-01-31',
+                                                         proxies=replay_server.proxies, notifications='off'))
+        await asyncio.sleep(0.1)
+        tasks = set(gd._async_tasks)
+        waiter = asyncio.ensure_future(gd.get_data_async('KBBB', start_date='2025-01-01', end_date='2025-01-31',
+                                                         proxies=replay_server.proxies, notifications='off'))
+        await asyncio.sleep(0.05)
+        assert single_flight.in_flight() == 2
+
+        # The flight of KBBB is still waiting for the semaphore held by KAAA.
+        flight = (gd._async_tasks - tasks).pop()
+        flight.cancel()
+
+        # wrap_future() turns the CancelledError of the flight into an asyncio.CancelledError.
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert single_flight.in_flight() == 1
+
+        return await holder
+
+    assert len(asyncio.run(main())) == 31
+    assert single_flight.in_flight() == 0
+    assert replay_server.stats()['requests'] == 1
+
+    # A later request for the cancelled station starts a new flight instead of waiting forever.
+    assert len(_fetch(replay_server, station='KBBB')) == 31
+
+def test_event_loop_shutdown_settles_waiting_flights(replay_server):
+
+    replay_server.latency = 0.3
+    gd.set_async_concurrency_limit(1)
+
+    async def main():
+        for station in ['KAAA', 'KBBB', 'KCCC']:
+            asyncio.ensure_future(gd.get_data_async(station, start_date='2025-01-01', end_date='2025-01-31',
+                                                    proxies=replay_server.proxies, notifications='off'))
+        await asyncio.sleep(0.05)
+
+    # asyncio.run cancels the flights still waiting for the semaphore when main() returns.
+    asyncio.run(main())
+
+    assert single_flight.in_flight() <= 1
+    df = _fetch(replay_server, station='KCCC')
+    assert len(df) == 31
@@ -0,0 +1,108 @@
+"""
+Tests of the quantile sketches saved with the station cache.
+
+(C) Eric J. Drewitz 2025-2026
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from xmacis2py.analysis_tools import sketch
+from xmacis2py.data_access.station_cache import StationCache
+
+def _window():
+
+    end = pd.Timestamp.now().normalize() - pd.Timedelta(days=1)
+    start = end - pd.Timedelta(days=20)
+
+    return start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')
+
+def test_pooled_sketch_is_saved_with_the_cache(replay_server):
+
+    start, end = _window()
+    cache = StationCache(proxies=replay_server.proxies)
+
+    merged = sketch.pooled_sketch(['KTST', 'KABC'], 'Maximum Temperature', start, end, cache=cache)
+
+    for station in ['KTST', 'KABC']:
+        saved = [f for f in os.listdir(cache.folder(station)) if f.endswith('.npz')]
+        assert len(saved) == 1
+
+    values = np.concatenate([cache.get(s, start_date=start, end_date=end)['Maximum Temperature'].to_numpy() for s in ['KTST', 'KABC']])
+    values = values[np.isnan(values) == False]
+    assert merged.count == len(values)
+    assert merged.quantile(0.5) == np.percentile(values, 50)
+
+def test_saved_sketch_is_reused_while_the_cache_is_fresh(replay_server):
+
+    start, end = _window()
+    cache = StationCache(proxies=replay_server.proxies)
+
+    first = sketch.pooled_sketch(['KTST'], 'Maximum Temperature', start, end, cache=cache)
+    refreshes = cache.stats()['refreshes']
+    second = sketch.pooled_sketch(['KTST'], 'Maximum Temperature', start, end, cache=cache)
+
+    assert cache.stats()['refreshes'] == refreshes
+    assert second.quantile([0.1, 0.9]) == first.quantile([0.1, 0.9])
+
+def test_sketch_is_rebuilt_when_the_cache_refreshes(replay_server, monkeypatch):
+
+    start, end = _window()
+    cache = StationCache(proxies=replay_server.proxies)
+    sketch.pooled_sketch(['KTST'], 'Maximum Temperature', start, end, cache=cache)
+
+    built = []
+    original = sketch.build_sketch
+    monkeypatch.setattr(sketch, 'build_sketch', lambda *args, **kwargs: built.append(1) or original(*args, **kwargs))
+
+    # Every day of the window is inside the horizon, so a negative time to live expires all of them.
+    cache.ttl = -1
+    sketch.pooled_sketch(['KTST'], 'Maximum Temperature', start, end, cache=cache)
+
+    assert len(built) == 1
+    assert cache.stats()['refreshes'] == 2
+
+def test_refresh_removes_saved_sketches(replay_server):
+
+    start, end = _window()
+    cache = StationCache(proxies=replay_server.proxies, ttl=-1)
+    sketch.pooled_sketch(['KTST'], 'Maximum Temperature', start, end, cache=cache, use_saved=False)
+    fname = sketch._sketch_path('KTST', 'Maximum Temperature', f"{start} {end} 1", cache.folder('KTST'))
+    assert os.path.exists(fname)
+
+    cache.get('KTST', start_date=start, end_date=end)
+
+    assert os.path.exists(fname) == False
+
+def test_saved_sketch_without_a_cache_expires(replay_server, monkeypatch):
+
+    start, end = _window()
+    sketch.pooled_sketch(['KTST'], 'Maximum Temperature', start, end, proxies=replay_server.proxies)
+    fname = sketch._sketch_path('KTST', 'Maximum Temperature', f"{start} {end} 1", 'default')
+
+    built = []
+    original = sketch.build_sketch
+    monkeypatch.setattr(sketch, 'build_sketch', lambda *args, **kwargs: built.append(1) or original(*args, **kwargs))
+
+    sketch.pooled_sketch(['KTST'], 'Maximum Temperature', start, end, proxies=replay_server.proxies)
+    assert len(built) == 0
+
+    # The window is inside the horizon, so the sketch is rebuilt once it is older than the time to live.
+    old = os.path.getmtime(fname) - 7 * 3600
+    os.utime(fname, (old, old))
+    sketch.pooled_sketch(['KTST'], 'Maximum Temperature', start, end, proxies=replay_server.proxies)
+    assert len(built) == 1
+
+def test_saved_sketch_of_an_old_period_never_expires(replay_server, monkeypatch):
+
+    sketch.pooled_sketch(['KTST'], 'Maximum Temperature', '2000-01-01', '2000-01-31', proxies=replay_server.proxies)
+    fname = sketch._sketch_path('KTST', 'Maximum Temperature', '2000-01-01 2000-01-31 1', 'default')
+    old = os.path.getmtime(fname) - 30 * 86400
+    os.utime(fname, (old, old))
+
+    built = []
+    monkeypatch.setattr(sketch, 'build_sketch', lambda *args, **kwargs: built.append(1))
+    sketch.pooled_sketch(['KTST'], 'Maximum Temperature', '2000-01-01', '2000-01-31', proxies=replay_server.proxies)
+
+    assert len(built) == 0
@@ -0,0 +1,125 @@
+"""
+Tests of the freshness policy of the station cache.
+
+(C) Eric J. Drewitz 2025-2026
+"""
+import time
+import types
+
+import pandas as pd
+import pytest
+
+from xmacis2py.data_access import station_cache
+from xmacis2py.data_access.station_cache import StationCache
+
+_day = 86400
+
+@pytest.fixture
+def clock(monkeypatch):
+
+    """
+    A clock the cache reads instead of time.time(). Move it with clock.now += seconds.
+    """
+
+    clock = types.SimpleNamespace(now=time.time())
+    monkeypatch.setattr(station_cache, '_time', types.SimpleNamespace(time=lambda: clock.now))
+
+    return clock
+
+def _days_ago(days):
+
+    return (pd.Timestamp.now().normalize() - pd.Timedelta(days=days)).strftime('%Y-%m-%d')
+
+def test_second_request_is_a_hit(replay_server, clock):
+
+    cache = StationCache(proxies=replay_server.proxies)
+    first = cache.get('KTST', start_date=_days_ago(20), end_date=_days_ago(1))
+    second = cache.get('KTST', start_date=_days_ago(20), end_date=_days_ago(1))
+
+    pd.testing.assert_frame_equal(first, second)
+    assert cache.stats() == {'hits':1, 'refreshes':1, 'days_downloaded':20}
+    assert replay_server.stats()['requests'] == 1
+
+def test_only_missing_days_are_downloaded(replay_server, clock):
+
+    cache = StationCache(proxies=replay_server.proxies)
+    cache.get('KTST', start_date=_days_ago(300), end_date=_days_ago(201))
+    df = cache.get('KTST', start_date=_days_ago(310), end_date=_days_ago(191))
+
+    assert len(df) == 120
+    assert cache.stats()['days_downloaded'] == 120
+    assert replay_server.stats()['requests'] == 3
+
+def test_recent_days_expire_after_the_ttl(replay_server, clock):
+
+    cache = StationCache(proxies=replay_server.proxies, ttl=3600)
+    cache.get('KTST', start_date=_days_ago(10), end_date=_days_ago(1))
+
+    clock.now += 1800
+    assert cache.fresh('KTST', start_date=_days_ago(10), end_date=_days_ago(1)) == True
+
+    clock.now += 3600
+    assert cache.fresh('KTST', start_date=_days_ago(10), end_date=_days_ago(1)) == False
+    cache.get('KTST', start_date=_days_ago(10), end_date=_days_ago(1))
+    assert cache.stats()['refreshes'] == 2
+
+def test_days_older_than_the_horizon_when_fetched_never_expire(replay_server, clock):
+
+    cache = StationCache(proxies=replay_server.proxies, horizon_days=60, ttl=3600)
+    cache.get('KTST', start_date=_days_ago(200), end_date=_days_ago(100))
+
+    clock.now += 365 * _day
+    cache.get('KTST', start_date=_days_ago(200), end_date=_days_ago(100))
+
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['refreshes'] == 1
+
+def test_recent_days_aged_past_the_horizon_are_downloaded_again(replay_server, clock):
+
+    cache = StationCache(proxies=replay_server.proxies, horizon_days=60, ttl=3600)
+    cache.get('KTST', start_date=_days_ago(10), end_date=_days_ago(1))
+
+    # 100 days later the days are older than the horizon, but they were downloaded while they could still be revised.
+    clock.now += 100 * _day
+    assert cache.fresh('KTST', start_date=_days_ago(10), end_date=_days_ago(1)) == False
+    cache.get('KTST', start_date=_days_ago(10), end_date=_days_ago(1))
+    assert cache.stats()['refreshes'] == 2
+    assert cache.stats()['days_downloaded'] == 20
+
+    # The new copy was downloaded after the days left the horizon, so it is permanent.
+    clock.now += 365 * _day
+    cache.get('KTST', start_date=_days_ago(10), end_date=_days_ago(1))
+    assert cache.stats()['hits'] == 1
+
+def test_only_days_inside_the_horizon_when_fetched_expire(replay_server, clock):
+
+    cache = StationCache(proxies=replay_server.proxies, horizon_days=60, ttl=3600)
+    cache.get('KTST', start_date=_days_ago(80), end_date=_days_ago(41))
+
+    clock.now += 7200
+    assert cache.fresh('KTST', start_date=_days_ago(80), end_date=_days_ago(65)) == True
+    assert cache.fresh('KTST', start_date=_days_ago(55), end_date=_days_ago(41)) == False
+
+    cache.get('KTST', start_date=_days_ago(80), end_date=_days_ago(41))
+    refreshed = cache.stats()['days_downloaded'] - 40
+    assert 15 <= refreshed <= 20
+
+def test_cache_survives_a_new_instance(replay_server, clock):
+
+    StationCache(proxies=replay_server.proxies).get('KTST', start_date=_days_ago(200), end_date=_days_ago(100))
+
+    cache = StationCache(proxies=replay_server.proxies)
+    df = cache.get('KTST', start_date=_days_ago(200), end_date=_days_ago(100))
+
+    assert len(df) == 101
+    assert cache.stats()['hits'] == 1
+    assert df['Date'].dtype.kind == 'M'
+
+def test_invalidate_removes_the_station(replay_server, clock):
+
+    cache = StationCache(proxies=replay_server.proxies)
+    cache.get('KTST', start_date=_days_ago(200), end_date=_days_ago(100))
+    cache.invalidate('ktst')
+    cache.get('KTST', start_date=_days_ago(200), end_date=_days_ago(100))
+
+    assert cache.stats()['refreshes'] == 2